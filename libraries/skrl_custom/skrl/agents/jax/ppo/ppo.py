@@ -240,7 +240,8 @@ class PPO(Agent):
         :raises KeyError: If the models dictionary is missing a required key
         """
         # _cfg = copy.deepcopy(PPO_DEFAULT_CONFIG)  # TODO: TypeError: cannot pickle 'jax.Device' object
-        _cfg = PPO_DEFAULT_CONFIG
+        # shallow copy: agents (e.g. the adversary and the protagonist) must not share their configuration
+        _cfg = copy.copy(PPO_DEFAULT_CONFIG)
         _cfg.update(cfg if cfg is not None else {})
         super().__init__(
             models=models,
@@ -1,4 +1,4 @@
-from typing import Any, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 
 import collections
 import copy
@@ -14,6 +14,9 @@ from torch.utils.tensorboard import SummaryWriter
 from skrl import config, logger
 from skrl.memories.torch import Memory
 from skrl.models.torch import Model
+from skrl.utils.checkpoint_writer import CheckpointWriter
+from skrl.utils.metrics import MetricsAccumulator, RollingWindow
+from skrl.utils.scalar_writer import CSVScalarSink, ScalarWriter, TensorBoardScalarSink
 
 
 class Agent:
@@ -65,9 +68,17 @@ class Agent:
 
         self.tracking_data = collections.defaultdict(list)
         self.write_interval = self.cfg.get("experiment", {}).get("write_interval", "auto")
-
-        self._track_rewards = collections.deque(maxlen=100)
-        self._track_timesteps = collections.deque(maxlen=100)
+        self.tracking_formats = self.cfg.get("experiment", {}).get("tracking_formats", ["tensorboard"])
+        self.background_tracking = self.cfg.get("experiment", {}).get("background_tracking", False)
+        self.scalar_writer = None
+
+        # device-resident tracking data (tensors are accumulated without synchronizing with the host)
+        self.tracking_metrics = MetricsAccumulator(device=self.device)
+        # accumulated tags written with their maximum, minimum and mean (e.g. 'Reward / Instantaneous reward (max)')
+        self._summarized_tags = {"Reward / Instantaneous reward"}
+        # total rewards and timesteps of the last 100 finished episodes
+        self._track_rewards = RollingWindow(size=100, device=self.device)
+        self._track_timesteps = RollingWindow(size=100, device=self.device)
         self._cumulative_rewards = None
         self._cumulative_timesteps = None
 
@@ -78,6 +89,11 @@ class Agent:
         self.checkpoint_interval = self.cfg.get("experiment", {}).get("checkpoint_interval", "auto")
         self.checkpoint_store_separately = self.cfg.get("experiment", {}).get("store_separately", False)
         self.checkpoint_best_modules = {"timestep": 0, "reward": -(2**31), "saved": False, "modules": {}}
+        # checkpoints are written atomically, optionally from a background thread (snapshots in pinned host memory)
+        self.checkpoint_writer = CheckpointWriter(
+            asynchronous=self.cfg.get("experiment", {}).get("async_checkpoints", False),
+            keep=self.cfg.get("experiment", {}).get("keep_checkpoints", 0),
+        )
 
         # experiment directory
         directory = self.cfg.get("experiment", {}).get("directory", "")
@@ -170,7 +186,16 @@ class Agent:
         if self.write_interval == "auto":
             self.write_interval = int(trainer_cfg.get("timesteps", 0) / 100)
         if self.write_interval > 0:
-            self.writer = SummaryWriter(log_dir=self.experiment_dir)
+            sinks = []
+            for tracking_format in self.tracking_formats:
+                if tracking_format == "tensorboard":
+                    self.writer = SummaryWriter(log_dir=self.experiment_dir)
+                    sinks.append(TensorBoardScalarSink(self.writer))
+                elif tracking_format == "csv":
+                    sinks.append(CSVScalarSink(self.experiment_dir))
+                else:
+                    raise ValueError(f"Invalid tracking format: {tracking_format} (supported formats: tensorboard, csv)")
+            self.scalar_writer = ScalarWriter(sinks, background=self.background_tracking)
 
         if self.checkpoint_interval == "auto":
             self.checkpoint_interval = int(trainer_cfg.get("timesteps", 0) / 10)
@@ -180,14 +205,18 @@ class Agent:
     def track_data(self, tag: str, value: float) -> None:
         """Track data to TensorBoard
 
-        Currently only scalar data are supported
+        Currently only scalar data are supported. Tensors are accumulated on their device
+        (see :py:class:`skrl.utils.metrics.MetricsAccumulator`) and transferred to the host only when writing
 
         :param tag: Data identifier (e.g. 'Loss / policy loss')
         :type tag: str
         :param value: Value to track
-        :type value: float
+        :type value: float or torch.Tensor
         """
-        self.tracking_data[tag].append(value)
+        if isinstance(value, torch.Tensor):
+            self.tracking_metrics.add(tag, value)
+        else:
+            self.tracking_data[tag].append(value)
 
     def write_tracking_data(self, timestep: int, timesteps: int) -> None:
         """Write tracking data to TensorBoard
@@ -197,17 +226,45 @@ class Agent:
         :param timesteps: Number of timesteps
         :type timesteps: int
         """
+        # reduce the tracking data and hand the scalars to the (optionally background) writer
+        scalars = {}
         for k, v in self.tracking_data.items():
             if k.endswith("(min)"):
-                self.writer.add_scalar(k, np.min(v), timestep)
+                scalars[k] = float(np.min(v))
             elif k.endswith("(max)"):
-                self.writer.add_scalar(k, np.max(v), timestep)
+                scalars[k] = float(np.max(v))
             else:
-                self.writer.add_scalar(k, np.mean(v), timestep)
+                scalars[k] = float(np.mean(v))
+        # device-resident data (single transfer to the host)
+        for k, v in self.tracking_metrics.compute().items():
+            if k in self._summarized_tags:
+                scalars[f"{k} (max)"] = v["max"]
+                scalars[f"{k} (min)"] = v["min"]
+                scalars[f"{k} (mean)"] = v["mean"]
+            elif k.endswith("(min)"):
+                scalars[k] = v["min"]
+            elif k.endswith("(max)"):
+                scalars[k] = v["max"]
+            else:
+                scalars[k] = v["mean"]
+        # rolling statistics of the last 100 finished episodes
+        windows = {"Reward / Total reward": self._track_rewards, "Episode / Total timesteps": self._track_timesteps}
+        for k, window in windows.items():
+            v = window.compute()
+            if v is not None:
+                scalars[f"{k} (max)"] = v["max"]
+                scalars[f"{k} (min)"] = v["min"]
+                scalars[f"{k} (mean)"] = v["mean"]
+        self.scalar_writer.write(scalars, timestep)
         # reset data containers for next iteration
-        self._track_rewards.clear()
-        self._track_timesteps.clear()
         self.tracking_data.clear()
+        self.tracking_metrics.reset()
+
+    def synchronize_writers(self) -> None:
+        """Wait until the pending (background) checkpoints and tracking data are written to disk"""
+        self.checkpoint_writer.synchronize()
+        if self.scalar_writer is not None:
+            self.scalar_writer.flush()
 
     def write_checkpoint(self, timestep: int, timesteps: int) -> None:
         """Write checkpoint (modules) to disk
@@ -221,35 +278,33 @@ class Agent:
         :type timesteps: int
         """
         tag = str(timestep if timestep is not None else datetime.datetime.now().strftime("%y-%m-%d_%H-%M-%S-%f"))
+        directory = os.path.join(self.experiment_dir, "checkpoints")
         # separated modules
         if self.checkpoint_store_separately:
             for name, module in self.checkpoint_modules.items():
-                torch.save(
-                    self._get_internal_value(module),
-                    os.path.join(self.experiment_dir, "checkpoints", f"{name}_{tag}.pt"),
+                self.checkpoint_writer.save(
+                    self._get_internal_value(module), os.path.join(directory, f"{name}_{tag}.pt"), group=name
                 )
         # whole agent
         else:
-            modules = {}
-            for name, module in self.checkpoint_modules.items():
-                modules[name] = self._get_internal_value(module)
-            torch.save(modules, os.path.join(self.experiment_dir, "checkpoints", f"agent_{tag}.pt"))
+            self.checkpoint_writer.save(self.state_dict(), os.path.join(directory, f"agent_{tag}.pt"), group="agent")
 
-        # best modules
+        # best modules (already snapshotted)
         if self.checkpoint_best_modules["modules"] and not self.checkpoint_best_modules["saved"]:
             # separated modules
             if self.checkpoint_store_separately:
                 for name, module in self.checkpoint_modules.items():
-                    torch.save(
+                    self.checkpoint_writer.save(
                         self.checkpoint_best_modules["modules"][name],
-                        os.path.join(self.experiment_dir, "checkpoints", f"best_{name}.pt"),
+                        os.path.join(directory, f"best_{name}.pt"),
+                        snapshot=False,
                     )
             # whole agent
             else:
                 modules = {}
                 for name, module in self.checkpoint_modules.items():
                     modules[name] = self.checkpoint_best_modules["modules"][name]
-                torch.save(modules, os.path.join(self.experiment_dir, "checkpoints", "best_agent.pt"))
+                self.checkpoint_writer.save(modules, os.path.join(directory, "best_agent.pt"), snapshot=False)
             self.checkpoint_best_modules["saved"] = True
 
     def act(self, states: torch.Tensor, timestep: int, timesteps: int) -> torch.Tensor:
@@ -314,34 +369,17 @@ class Agent:
             self._cumulative_rewards.add_(rewards)
             self._cumulative_timesteps.add_(1)
 
-            # check ended episodes
-            finished_episodes = (terminated + truncated).nonzero(as_tuple=False)
-            if finished_episodes.numel():
-
-                # storage cumulative rewards and timesteps
-                self._track_rewards.extend(self._cumulative_rewards[finished_episodes][:, 0].reshape(-1).tolist())
-                self._track_timesteps.extend(self._cumulative_timesteps[finished_episodes][:, 0].reshape(-1).tolist())
-
-                # reset the cumulative rewards and timesteps
-                self._cumulative_rewards[finished_episodes] = 0
-                self._cumulative_timesteps[finished_episodes] = 0
-
-            # record data
-            self.tracking_data["Reward / Instantaneous reward (max)"].append(torch.max(rewards).item())
-            self.tracking_data["Reward / Instantaneous reward (min)"].append(torch.min(rewards).item())
-            self.tracking_data["Reward / Instantaneous reward (mean)"].append(torch.mean(rewards).item())
-
-            if len(self._track_rewards):
-                track_rewards = np.array(self._track_rewards)
-                track_timesteps = np.array(self._track_timesteps)
+            # record data (accumulated on the device, without synchronizing with the host)
+            self.tracking_metrics.add("Reward / Instantaneous reward", rewards)
 
-                self.tracking_data["Reward / Total reward (max)"].append(np.max(track_rewards))
-                self.tracking_data["Reward / Total reward (min)"].append(np.min(track_rewards))
-                self.tracking_data["Reward / Total reward (mean)"].append(np.mean(track_rewards))
+            # storage cumulative rewards and timesteps of the ended episodes
+            finished_episodes = torch.logical_or(terminated, truncated).view_as(self._cumulative_rewards)
+            self._track_rewards.extend(self._cumulative_rewards, mask=finished_episodes)
+            self._track_timesteps.extend(self._cumulative_timesteps, mask=finished_episodes)
 
-                self.tracking_data["Episode / Total timesteps (max)"].append(np.max(track_timesteps))
-                self.tracking_data["Episode / Total timesteps (min)"].append(np.min(track_timesteps))
-                self.tracking_data["Episode / Total timesteps (mean)"].append(np.mean(track_timesteps))
+            # reset the cumulative rewards and timesteps
+            self._cumulative_rewards.masked_fill_(finished_episodes, 0)
+            self._cumulative_timesteps.masked_fill_(finished_episodes, 0)
 
     def set_mode(self, mode: str) -> None:
         """Set the model mode (training or evaluation)
@@ -370,10 +408,35 @@ class Agent:
         :param path: Path to save the model to
         :type path: str
         """
-        modules = {}
-        for name, module in self.checkpoint_modules.items():
-            modules[name] = self._get_internal_value(module)
-        torch.save(modules, path)
+        torch.save(self.state_dict(), path)
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Get the state (modules' state/value) of the agent
+
+        :return: Agent's state, indexed by the name of the checkpoint modules
+        :rtype: dict
+        """
+        return {name: self._get_internal_value(module) for name, module in self.checkpoint_modules.items()}
+
+    def load_state_dict(self, state_dict: Mapping[str, Any]) -> None:
+        """Load the state of the agent (see :py:meth:`state_dict`)
+
+        :param state_dict: Agent's state, indexed by the name of the checkpoint modules
+        :type state_dict: dict
+
+        :raises NotImplementedError: If a module's state cannot be loaded
+        """
+        for name, data in state_dict.items():
+            module = self.checkpoint_modules.get(name, None)
+            if module is not None:
+                if hasattr(module, "load_state_dict"):
+                    module.load_state_dict(data)
+                    if hasattr(module, "eval"):
+                        module.eval()
+                else:
+                    raise NotImplementedError
+            else:
+                logger.warning(f"Cannot load the {name} module. The agent doesn't have such an instance")
 
     def load(self, path: str) -> None:
         """Load the model from the specified path
@@ -388,17 +451,7 @@ class Agent:
         else:
             modules = torch.load(path, map_location=self.device)
         if type(modules) is dict:
-            for name, data in modules.items():
-                module = self.checkpoint_modules.get(name, None)
-                if module is not None:
-                    if hasattr(module, "load_state_dict"):
-                        module.load_state_dict(data)
-                        if hasattr(module, "eval"):
-                            module.eval()
-                    else:
-                        raise NotImplementedError
-                else:
-                    logger.warning(f"Cannot load the {name} module. The agent doesn't have such an instance")
+            self.load_state_dict(modules)
 
     def migrate(
         self,
@@ -665,14 +718,13 @@ class Agent:
         # update best models and write checkpoints
         if timestep > 1 and self.checkpoint_interval > 0 and not timestep % self.checkpoint_interval:
             # update best models
-            reward = np.mean(self.tracking_data.get("Reward / Total reward (mean)", -(2**31)))
+            track_rewards = self._track_rewards.compute()
+            reward = -(2**31) if track_rewards is None else track_rewards["mean"]
             if reward > self.checkpoint_best_modules["reward"]:
                 self.checkpoint_best_modules["timestep"] = timestep
                 self.checkpoint_best_modules["reward"] = reward
                 self.checkpoint_best_modules["saved"] = False
-                self.checkpoint_best_modules["modules"] = {
-                    k: copy.deepcopy(self._get_internal_value(v)) for k, v in self.checkpoint_modules.items()
-                }
+                self.checkpoint_best_modules["modules"] = self.checkpoint_writer.snapshot(self.state_dict())
             # write checkpoints
             self.write_checkpoint(timestep, timesteps)
 
@@ -0,0 +1,118 @@
+from typing import Union
+
+import torch
+
+
+GAE_METHODS = ("loop", "scan")
+
+
+def gae_loop(
+    rewards: torch.Tensor,
+    dones: torch.Tensor,
+    values: torch.Tensor,
+    next_values: Union[torch.Tensor, float],
+    discount_factor: float = 0.99,
+    lambda_coefficient: float = 0.95,
+) -> torch.Tensor:
+    """Compute the Generalized Advantage Estimator (GAE) with a reversed loop over the rollouts
+
+    :param rewards: Rewards obtained by the agent. Shape is (memory size, number of environments, 1)
+    :type rewards: torch.Tensor
+    :param dones: Signals to indicate that episodes have ended
+    :type dones: torch.Tensor
+    :param values: Values obtained by the agent
+    :type values: torch.Tensor
+    :param next_values: Values of the states that follow the last rollout
+    :type next_values: torch.Tensor or float
+    :param discount_factor: Discount factor
+    :type discount_factor: float
+    :param lambda_coefficient: Lambda coefficient
+    :type lambda_coefficient: float
+
+    :return: Advantages (not normalized)
+    :rtype: torch.Tensor
+    """
+    advantage = 0
+    advantages = torch.zeros_like(rewards)
+    not_dones = dones.logical_not()
+    memory_size = rewards.shape[0]
+
+    for i in reversed(range(memory_size)):
+        next_value = values[i + 1] if i < memory_size - 1 else next_values
+        advantage = (
+            rewards[i] - values[i] + discount_factor * not_dones[i] * (next_value + lambda_coefficient * advantage)
+        )
+        advantages[i] = advantage
+    return advantages
+
+
+def gae_scan(
+    rewards: torch.Tensor,
+    dones: torch.Tensor,
+    values: torch.Tensor,
+    next_values: Union[torch.Tensor, float],
+    discount_factor: float = 0.99,
+    lambda_coefficient: float = 0.95,
+) -> torch.Tensor:
+    """Compute the Generalized Advantage Estimator (GAE) with a parallel scan over the rollouts
+
+    The advantages follow the linear recurrence ``A[t] = delta[t] + c[t] * A[t + 1]``, with the TD errors
+    ``delta[t] = r[t] - V[t] + gamma * (1 - done[t]) * V[t + 1]`` and the coefficients ``c[t] = gamma * lambda * (1 - done[t])``.
+    All TD errors are computed at once and the recurrence is solved with a reverse (Hillis-Steele) scan:
+    ``log2(memory size)`` steps, each one combining every rollout with the one ``2^step`` rollouts later.
+    The number of kernel launches grows logarithmically (instead of linearly) with the number of rollouts.
+    No division is involved, so episode ends (zero coefficients) are handled exactly
+
+    See :py:func:`gae_loop` for the parameters
+
+    :return: Advantages (not normalized)
+    :rtype: torch.Tensor
+    """
+    not_dones = dones.logical_not().to(values.dtype)
+    memory_size = rewards.shape[0]
+
+    # values of the next states for every rollout
+    shifted_values = torch.empty_like(values)
+    shifted_values[:-1] = values[1:]
+    shifted_values[-1] = next_values
+
+    advantages = rewards - values + discount_factor * not_dones * shifted_values
+    coefficients = (discount_factor * lambda_coefficient) * not_dones
+
+    # after each step, advantages[t] accumulates the TD errors of rollouts t to t + 2 * shift - 1
+    # and coefficients[t] is the product of the coefficients of those rollouts
+    # (right-hand sides are evaluated before the in-place updates of the overlapping slices)
+    shift = 1
+    while shift < memory_size:
+        advantages[:-shift] += coefficients[:-shift] * advantages[shift:]
+        coefficients[:-shift] = coefficients[:-shift] * coefficients[shift:]
+        shift *= 2
+    return advantages
+
+
+def compute_advantages(
+    rewards: torch.Tensor,
+    dones: torch.Tensor,
+    values: torch.Tensor,
+    next_values: Union[torch.Tensor, float],
+    discount_factor: float = 0.99,
+    lambda_coefficient: float = 0.95,
+    method: str = "loop",
+) -> torch.Tensor:
+    """Compute the Generalized Advantage Estimator (GAE) with the given method
+
+    See :py:func:`gae_loop` and :py:func:`gae_scan` for the parameters
+
+    :param method: GAE computation method: ``"loop"`` or ``"scan"`` (default: ``"loop"``)
+    :type method: str
+
+    :raises ValueError: If the method is not supported
+
+    :return: Advantages (not normalized)
+    :rtype: torch.Tensor
+    """
+    if method == "loop":
+        return gae_loop(rewards, dones, values, next_values, discount_factor, lambda_coefficient)
+    elif method == "scan":
+        return gae_scan(rewards, dones, values, next_values, discount_factor, lambda_coefficient)
+    raise ValueError(f"Invalid GAE method: {method} (supported methods: {', '.join(GAE_METHODS)})")
@@ -1,5 +1,6 @@
-from typing import Any, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, ContextManager, Mapping, Optional, Tuple, Union
 
+import contextlib
 import copy
 import itertools
 import gymnasium
@@ -11,9 +12,11 @@ import torch.nn.functional as F
 
 from skrl import config, logger
 from skrl.agents.torch import Agent
+from skrl.agents.torch.ppo.gae import GAE_METHODS, compute_advantages
 from skrl.memories.torch import Memory
 from skrl.models.torch import Model
 from skrl.resources.schedulers.torch import KLAdaptiveLR
+from skrl.utils.compiled import CompiledFunction
 
 
 # fmt: off
@@ -22,9 +25,11 @@ PPO_DEFAULT_CONFIG = {
     "rollouts": 16,                 # number of rollouts before updating
     "learning_epochs": 8,           # number of learning epochs during each update
     "mini_batches": 2,              # number of mini batches during each learning epoch
+    "shuffle_mini_batches": False,  # shuffle the samples (on the memory's device) at each learning epoch (RandomMemory only)
 
     "discount_factor": 0.99,        # discount factor (gamma)
     "lambda": 0.95,                 # TD(lambda) coefficient (lam) for computing returns and advantages
+    "gae_method": "loop",           # GAE computation: "loop" (reversed loop over rollouts) or "scan" (parallel scan)
 
     "learning_rate": 1e-3,                  # learning rate
     "learning_rate_scheduler": None,        # learning rate scheduler class (see torch.optim.lr_scheduler)
@@ -34,6 +39,7 @@ PPO_DEFAULT_CONFIG = {
     "state_preprocessor_kwargs": {},        # state preprocessor's kwargs (e.g. {"size": env.observation_space})
     "value_preprocessor": None,             # value preprocessor class (see skrl.resources.preprocessors)
     "value_preprocessor_kwargs": {},        # value preprocessor's kwargs (e.g. {"size": 1})
+    "fold_state_preprocessor": False,       # fold the state preprocessor (RunningStandardScaler) into the models' first linear layer outside the update
 
     "random_timesteps": 0,          # random exploration steps
     "learning_starts": 0,           # learning starts after this many steps
@@ -53,13 +59,20 @@ PPO_DEFAULT_CONFIG = {
 
     "mixed_precision": False,       # enable automatic mixed precision for higher performance
 
+    "compile_update": False,        # compile (torch.compile) the mini-batch losses computation for fixed-shape mini-batches
+    "compile_update_kwargs": {},    # torch.compile's kwargs (e.g. {"mode": "reduce-overhead"} to capture CUDA graphs)
+
     "experiment": {
         "directory": "",            # experiment's parent directory
         "experiment_name": "",      # experiment name
         "write_interval": "auto",   # TensorBoard writing interval (timesteps)
+        "tracking_formats": ["tensorboard"],    # tracking data formats: "tensorboard" and/or "csv" (scalars.csv file)
+        "background_tracking": False,           # write the tracking data from a background thread (bounded queue)
 
         "checkpoint_interval": "auto",      # interval for checkpoints (timesteps)
         "store_separately": False,          # whether to store checkpoints separately
+        "async_checkpoints": False,         # whether to write checkpoints from a background thread (pinned host snapshots)
+        "keep_checkpoints": 0,              # number of most recent checkpoints to keep (0: keep all)
 
         "wandb": False,             # whether to use Weights & Biases
         "wandb_kwargs": {}          # wandb kwargs (see https://docs.wandb.ai/ref/python/init)
@@ -152,6 +165,9 @@ class PPO(Agent):
 
         self._discount_factor = self.cfg["discount_factor"]
         self._lambda = self.cfg["lambda"]
+        self._gae_method = self.cfg["gae_method"]
+        if self._gae_method not in GAE_METHODS:
+            raise ValueError(f"Invalid GAE method: {self._gae_method} (supported methods: {', '.join(GAE_METHODS)})")
 
         self._random_timesteps = self.cfg["random_timesteps"]
         self._learning_starts = self.cfg["learning_starts"]
@@ -161,6 +177,16 @@ class PPO(Agent):
 
         self._mixed_precision = self.cfg["mixed_precision"]
 
+        self._shuffle_mini_batches = self.cfg["shuffle_mini_batches"]
+        if self._shuffle_mini_batches and self.memory is not None and not hasattr(self.memory, "sample_shuffled"):
+            raise ValueError(f"Shuffled mini-batches are not supported by {type(self.memory).__name__}")
+
+        # set up the (opt-in) compiled mini-batch losses computation
+        if self.cfg["compile_update"]:
+            self._mini_batch_losses = CompiledFunction(self._compute_losses, **self.cfg["compile_update_kwargs"])
+        else:
+            self._mini_batch_losses = self._compute_losses
+
         # set up automatic mixed precision
         self._device_type = torch.device(device).type
         if version.parse(torch.__version__) >= version.parse("2.4"):
@@ -190,6 +216,10 @@ class PPO(Agent):
         else:
             self._state_preprocessor = self._empty_preprocessor
 
+        self._fold_state_preprocessor = self.cfg["fold_state_preprocessor"]
+        if self._fold_state_preprocessor and not hasattr(self._state_preprocessor, "folded"):
+            raise ValueError(f"The state preprocessor ({type(self._state_preprocessor).__name__}) cannot be folded")
+
         if self._value_preprocessor:
             self._value_preprocessor = self._value_preprocessor(**self.cfg["value_preprocessor_kwargs"])
             self.checkpoint_modules["value_preprocessor"] = self._value_preprocessor
@@ -220,6 +250,22 @@ class PPO(Agent):
         self._current_log_prob = None
         self._current_next_states = None
 
+    def _folded_state_preprocessor(self, model: Model) -> ContextManager[Callable[[torch.Tensor], torch.Tensor]]:
+        """Context providing the state preprocessing function for the inputs of the given model
+
+        If ``fold_state_preprocessor`` is enabled, the state preprocessor is folded into the model's first linear layer
+        within the context and the preprocessing function is the identity
+
+        :param model: Model
+        :type model: skrl.models.torch.Model
+
+        :return: Context manager
+        :rtype: ContextManager
+        """
+        if self._fold_state_preprocessor:
+            return self._state_preprocessor.folded(model)
+        return contextlib.nullcontext(self._state_preprocessor)
+
     def act(self, states: torch.Tensor, timestep: int, timesteps: int) -> torch.Tensor:
         """Process the environment's states to make a decision (actions) using the main policy
 
@@ -242,7 +288,8 @@ class PPO(Agent):
 
         # sample stochastic actions
         with torch.autocast(device_type=self._device_type, enabled=self._mixed_precision):
-            actions, log_prob, outputs = self.policy.act({"states": self._state_preprocessor(states)}, role="policy")
+            with self._folded_state_preprocessor(self.policy) as preprocessor:
+                actions, log_prob, outputs = self.policy.act({"states": preprocessor(states)}, role="policy")
             self._current_log_prob = log_prob
 
         return actions, log_prob, outputs
@@ -258,6 +305,7 @@ class PPO(Agent):
         infos: Any,
         timestep: int,
         timesteps: int,
+        log_prob: Optional[torch.Tensor] = None,
     ) -> None:
         """Record an environment transition in memory
 
@@ -279,6 +327,9 @@ class PPO(Agent):
         :type timestep: int
         :param timesteps: Number of timesteps
         :type timesteps: int
+        :param log_prob: Log probabilities of the actions (default: ``None``).
+                         If ``None``, the log probabilities computed by the last call to :py:meth:`act` are used
+        :type log_prob: torch.Tensor, optional
         """
         super().record_transition(
             states, actions, rewards, next_states, terminated, truncated, infos, timestep, timesteps
@@ -286,6 +337,8 @@ class PPO(Agent):
 
         if self.memory is not None:
             self._current_next_states = next_states
+            if log_prob is None:
+                log_prob = self._current_log_prob
 
             # reward shaping
             if self._rewards_shaper is not None:
@@ -293,7 +346,8 @@ class PPO(Agent):
 
             # compute values
             with torch.autocast(device_type=self._device_type, enabled=self._mixed_precision):
-                values, _, _ = self.value.act({"states": self._state_preprocessor(states)}, role="value")
+                with self._folded_state_preprocessor(self.value) as preprocessor:
+                    values, _, _ = self.value.act({"states": preprocessor(states)}, role="value")
                 values = self._value_preprocessor(values, inverse=True)
 
             # time-limit (truncation) bootstrapping
@@ -308,7 +362,7 @@ class PPO(Agent):
                 next_states=next_states,
                 terminated=terminated,
                 truncated=truncated,
-                log_prob=self._current_log_prob,
+                log_prob=log_prob,
                 values=values,
             )
             for memory in self.secondary_memories:
@@ -319,7 +373,7 @@ class PPO(Agent):
                     next_states=next_states,
                     terminated=terminated,
                     truncated=truncated,
-                    log_prob=self._current_log_prob,
+                    log_prob=log_prob,
                     values=values,
                 )
 
@@ -350,6 +404,66 @@ class PPO(Agent):
         # write tracking data and checkpoints
         super().post_interaction(timestep, timesteps)
 
+    def _compute_losses(
+        self,
+        sampled_states: torch.Tensor,
+        sampled_actions: torch.Tensor,
+        sampled_log_prob: torch.Tensor,
+        sampled_values: torch.Tensor,
+        sampled_returns: torch.Tensor,
+        sampled_advantages: torch.Tensor,
+    ) -> Tuple[torch.Tensor, Union[torch.Tensor, int], torch.Tensor, torch.Tensor]:
+        """Compute the losses of a mini-batch
+
+        This method is compiled (for fixed-shape mini-batches) if ``compile_update`` is enabled
+
+        :param sampled_states: Mini-batch states (already preprocessed)
+        :type sampled_states: torch.Tensor
+        :param sampled_actions: Mini-batch actions
+        :type sampled_actions: torch.Tensor
+        :param sampled_log_prob: Mini-batch log probabilities of the actions
+        :type sampled_log_prob: torch.Tensor
+        :param sampled_values: Mini-batch values
+        :type sampled_values: torch.Tensor
+        :param sampled_returns: Mini-batch returns
+        :type sampled_returns: torch.Tensor
+        :param sampled_advantages: Mini-batch advantages
+        :type sampled_advantages: torch.Tensor
+
+        :return: Policy loss, entropy loss, value loss and approximate KL divergence
+        :rtype: tuple of torch.Tensor
+        """
+        _, next_log_prob, _ = self.policy.act({"states": sampled_states, "taken_actions": sampled_actions}, role="policy")
+
+        # compute approximate KL divergence
+        with torch.no_grad():
+            ratio = next_log_prob - sampled_log_prob
+            kl_divergence = ((torch.exp(ratio) - 1) - ratio).mean()
+
+        # compute entropy loss
+        if self._entropy_loss_scale:
+            entropy_loss = -self._entropy_loss_scale * self.policy.get_entropy(role="policy").mean()
+        else:
+            entropy_loss = 0
+
+        # compute policy loss
+        ratio = torch.exp(next_log_prob - sampled_log_prob)
+        surrogate = sampled_advantages * ratio
+        surrogate_clipped = sampled_advantages * torch.clip(ratio, 1.0 - self._ratio_clip, 1.0 + self._ratio_clip)
+
+        policy_loss = -torch.min(surrogate, surrogate_clipped).mean()
+
+        # compute value loss
+        predicted_values, _, _ = self.value.act({"states": sampled_states}, role="value")
+
+        if self._clip_predicted_values:
+            predicted_values = sampled_values + torch.clip(
+                predicted_values - sampled_values, min=-self._value_clip, max=self._value_clip
+            )
+        value_loss = self._value_loss_scale * F.mse_loss(sampled_returns, predicted_values)
+
+        return policy_loss, entropy_loss, value_loss, kl_divergence
+
     def _update(self, timestep: int, timesteps: int) -> None:
         """Algorithm's main update step
 
@@ -385,20 +499,16 @@ class PPO(Agent):
             :return: Generalized Advantage Estimator
             :rtype: torch.Tensor
             """
-            advantage = 0
-            advantages = torch.zeros_like(rewards)
-            not_dones = dones.logical_not()
-            memory_size = rewards.shape[0]
-
             # advantages computation
-            for i in reversed(range(memory_size)):
-                next_values = values[i + 1] if i < memory_size - 1 else last_values
-                advantage = (
-                    rewards[i]
-                    - values[i]
-                    + discount_factor * not_dones[i] * (next_values + lambda_coefficient * advantage)
-                )
-                advantages[i] = advantage
+            advantages = compute_advantages(
+                rewards=rewards,
+                dones=dones,
+                values=values,
+                next_values=next_values,
+                discount_factor=discount_factor,
+                lambda_coefficient=lambda_coefficient,
+                method=self._gae_method,
+            )
             # returns computation
             returns = advantages + values
             # normalize advantages
@@ -412,9 +522,10 @@ class PPO(Agent):
             if self._current_next_states == None:
                 last_values = 0
             else:
-                last_values, _, _ = self.value.act(
-                    {"states": self._state_preprocessor(self._current_next_states.float())}, role="value"
-                )
+                with self._folded_state_preprocessor(self.value) as preprocessor:
+                    last_values, _, _ = self.value.act(
+                        {"states": preprocessor(self._current_next_states.float())}, role="value"
+                    )
             self.value.train(True)
             last_values = self._value_preprocessor(last_values, inverse=True)
 
@@ -432,8 +543,9 @@ class PPO(Agent):
         self.memory.set_tensor_by_name("returns", self._value_preprocessor(returns, train=True))
         self.memory.set_tensor_by_name("advantages", advantages)
 
-        # sample mini-batches from memory
-        sampled_batches = self.memory.sample_all(names=self._tensors_names, mini_batches=self._mini_batches)
+        # sample mini-batches from memory (shuffled at each learning epoch, if enabled)
+        if not self._shuffle_mini_batches:
+            sampled_batches = self.memory.sample_all(names=self._tensors_names, mini_batches=self._mini_batches)
 
         cumulative_policy_loss = 0
         cumulative_entropy_loss = 0
@@ -442,6 +554,8 @@ class PPO(Agent):
         # learning epochs
         for epoch in range(self._learning_epochs):
             kl_divergences = []
+            if self._shuffle_mini_batches:
+                sampled_batches = self.memory.sample_shuffled(names=self._tensors_names, mini_batches=self._mini_batches)
 
             # mini-batches loop
             for (
@@ -457,44 +571,21 @@ class PPO(Agent):
 
                     sampled_states = self._state_preprocessor(sampled_states, train=not epoch)
 
-                    _, next_log_prob, _ = self.policy.act(
-                        {"states": sampled_states, "taken_actions": sampled_actions}, role="policy"
+                    policy_loss, entropy_loss, value_loss, kl_divergence = self._mini_batch_losses(
+                        sampled_states,
+                        sampled_actions,
+                        sampled_log_prob,
+                        sampled_values,
+                        sampled_returns,
+                        sampled_advantages,
                     )
-
-                    # compute approximate KL divergence
-                    with torch.no_grad():
-                        ratio = next_log_prob - sampled_log_prob
-                        kl_divergence = ((torch.exp(ratio) - 1) - ratio).mean()
-                        kl_divergences.append(kl_divergence)
+                    # clone the KL divergence: outputs of CUDA graphs are overwritten by the next replay
+                    kl_divergences.append(kl_divergence.clone())
 
                     # early stopping with KL divergence
                     if self._kl_threshold and kl_divergence > self._kl_threshold:
                         break
 
-                    # compute entropy loss
-                    if self._entropy_loss_scale:
-                        entropy_loss = -self._entropy_loss_scale * self.policy.get_entropy(role="policy").mean()
-                    else:
-                        entropy_loss = 0
-
-                    # compute policy loss
-                    ratio = torch.exp(next_log_prob - sampled_log_prob)
-                    surrogate = sampled_advantages * ratio
-                    surrogate_clipped = sampled_advantages * torch.clip(
-                        ratio, 1.0 - self._ratio_clip, 1.0 + self._ratio_clip
-                    )
-
-                    policy_loss = -torch.min(surrogate, surrogate_clipped).mean()
-
-                    # compute value loss
-                    predicted_values, _, _ = self.value.act({"states": sampled_states}, role="value")
-
-                    if self._clip_predicted_values:
-                        predicted_values = sampled_values + torch.clip(
-                            predicted_values - sampled_values, min=-self._value_clip, max=self._value_clip
-                        )
-                    value_loss = self._value_loss_scale * F.mse_loss(sampled_returns, predicted_values)
-
                 # optimization step
                 self.optimizer.zero_grad()
                 self.scaler.scale(policy_loss + entropy_loss + value_loss).backward()
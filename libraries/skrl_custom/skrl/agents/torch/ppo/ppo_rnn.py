@@ -11,6 +11,7 @@ import torch.nn.functional as F
 
 from skrl import config, logger
 from skrl.agents.torch import Agent
+from skrl.agents.torch.ppo.gae import GAE_METHODS, compute_advantages
 from skrl.memories.torch import Memory
 from skrl.models.torch import Model
 from skrl.resources.schedulers.torch import KLAdaptiveLR
@@ -25,6 +26,7 @@ PPO_DEFAULT_CONFIG = {
 
     "discount_factor": 0.99,        # discount factor (gamma)
     "lambda": 0.95,                 # TD(lambda) coefficient (lam) for computing returns and advantages
+    "gae_method": "loop",           # GAE computation: "loop" (reversed loop over rollouts) or "scan" (parallel scan)
 
     "learning_rate": 1e-3,                  # learning rate
     "learning_rate_scheduler": None,        # learning rate scheduler class (see torch.optim.lr_scheduler)
@@ -152,6 +154,9 @@ class PPO_RNN(Agent):
 
         self._discount_factor = self.cfg["discount_factor"]
         self._lambda = self.cfg["lambda"]
+        self._gae_method = self.cfg["gae_method"]
+        if self._gae_method not in GAE_METHODS:
+            raise ValueError(f"Invalid GAE method: {self._gae_method} (supported methods: {', '.join(GAE_METHODS)})")
 
         self._random_timesteps = self.cfg["random_timesteps"]
         self._learning_starts = self.cfg["learning_starts"]
@@ -465,20 +470,16 @@ class PPO_RNN(Agent):
             :return: Generalized Advantage Estimator
             :rtype: torch.Tensor
             """
-            advantage = 0
-            advantages = torch.zeros_like(rewards)
-            not_dones = dones.logical_not()
-            memory_size = rewards.shape[0]
-
             # advantages computation
-            for i in reversed(range(memory_size)):
-                next_values = values[i + 1] if i < memory_size - 1 else last_values
-                advantage = (
-                    rewards[i]
-                    - values[i]
-                    + discount_factor * not_dones[i] * (next_values + lambda_coefficient * advantage)
-                )
-                advantages[i] = advantage
+            advantages = compute_advantages(
+                rewards=rewards,
+                dones=dones,
+                values=values,
+                next_values=next_values,
+                discount_factor=discount_factor,
+                lambda_coefficient=lambda_coefficient,
+                method=self._gae_method,
+            )
             # returns computation
             returns = advantages + values
             # normalize advantages
@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple, Union
+from typing import Any, List, Mapping, Optional, Tuple, Union
 
 import csv
 import datetime
@@ -11,6 +11,7 @@ import numpy as np
 import torch
 
 from skrl import config
+from skrl.memories.torch.storage import StorageCodec, create_storage_codec
 from skrl.utils.spaces.torch import compute_space_size
 
 
@@ -23,6 +24,8 @@ class Memory:
         export: bool = False,
         export_format: str = "pt",
         export_directory: str = "",
+        storage_dtypes: Optional[Mapping[str, Union[str, dict, StorageCodec]]] = None,
+        share_next_states: bool = False,
     ) -> None:
         """Base class representing a memory with circular buffers
 
@@ -45,6 +48,22 @@ class Memory:
         :param export_directory: Directory where the memory will be exported (default: ``""``).
                                  If empty, the agent's experiment directory will be used
         :type export_directory: str, optional
+        :param storage_dtypes: Compact storage format of the tensors, by name (default: ``None``).
+                               Supported formats: ``"float16"``/``"bfloat16"`` (e.g. values, advantages),
+                               ``"uint8"`` (e.g. image observations, decoded to their [low, high] range) and ``"bits"``
+                               (boolean tensors, e.g. terminated/truncated flags, packed 8 values per byte).
+                               See :py:func:`skrl.memories.torch.storage.create_storage_codec` for the parameters.
+                               Compact tensors are decoded only when (and only the samples) read
+        :type storage_dtypes: dict, optional
+        :param share_next_states: Store the ``next_states`` tensor as a view of the ``states`` tensor (default: ``False``).
+                                  The next states of a sample are the states of the following memory row,
+                                  except for the last recorded row, whose next states are stored separately
+                                  (see :py:meth:`get_last_next_states`). Where a sample's next states differ from the
+                                  following row's states (e.g. environment resets), the ``next_states_reset`` tensor is set
+                                  and the reconstructed next states are the following row's states.
+                                  Samples must be recorded for all the environments at once, states included.
+                                  It only saves memory for agents that store next states (e.g. SAC, TD3 or DDPG)
+        :type share_next_states: bool, optional
 
         :raises ValueError: The export format is not supported
         """
@@ -61,6 +80,14 @@ class Memory:
         self.tensors_view = {}
         self.tensors_keep_dimensions = {}
 
+        # compact storage
+        self.storage_dtypes = storage_dtypes if storage_dtypes is not None else {}
+        self.storage_codecs = {}
+
+        # next states shared with the states
+        self.share_next_states = share_next_states
+        self._last_next_states = None
+
         self.sampling_indexes = None
         self.all_sequence_indexes = np.concatenate(
             [np.arange(i, memory_size * num_envs + i, num_envs) for i in range(num_envs)]
@@ -97,6 +124,8 @@ class Memory:
         :return: Tensor names without internal prefix (_tensor_)
         :rtype: tuple of strings
         """
+        if self._last_next_states is not None:
+            return sorted([*self.tensors.keys(), "next_states"])
         return sorted(self.tensors.keys())
 
     def get_tensor_by_name(self, name: str, keepdim: bool = True) -> torch.Tensor:
@@ -110,9 +139,15 @@ class Memory:
 
         :raises KeyError: The tensor does not exist
 
-        :return: Tensor
+        :return: Tensor. Tensors with compact storage and shared next states are returned decoded (as a copy)
         :rtype: torch.Tensor
         """
+        if name == "next_states" and self._last_next_states is not None:
+            tensor = self._gather_next_states(slice(None))
+            return tensor.view(self.memory_size, self.num_envs, *tensor.shape[1:]) if keepdim else tensor
+        if name in self.storage_codecs:
+            tensor = self.storage_codecs[name].decode(self.tensors[name])
+            return tensor if keepdim else tensor.view(-1, *tensor.shape[2:])
         return self.tensors[name] if keepdim else self.tensors_view[name]
 
     def set_tensor_by_name(self, name: str, tensor: torch.Tensor) -> None:
@@ -126,7 +161,10 @@ class Memory:
         :raises KeyError: The tensor does not exist
         """
         with torch.no_grad():
-            self.tensors[name].copy_(tensor)
+            if name in self.storage_codecs:
+                self.tensors[name].copy_(self.storage_codecs[name].encode(tensor))
+            else:
+                self.tensors[name].copy_(tensor)
 
     def create_tensor(
         self,
@@ -159,19 +197,38 @@ class Memory:
         # compute data size
         if not keep_dimensions:
             size = compute_space_size(size, occupied_size=True)
+        # next states shared with the states: only the last next states are stored
+        if name == "next_states" and self.share_next_states:
+            if self._last_next_states is not None:
+                return False
+            shape = (self.num_envs, *size) if keep_dimensions else (self.num_envs, size)
+            self._last_next_states = torch.zeros(shape, device=self.device, dtype=dtype)
+            self._no_reset = torch.zeros((self.num_envs, 1), device=self.device, dtype=torch.bool)
+            self.create_tensor(name="next_states_reset", size=1, dtype=torch.bool)
+            return True
         # check dtype and size if the tensor exists
         if name in self.tensors:
             tensor = self.tensors[name]
             if tensor.size(-1) != size:
                 raise ValueError(f"Size of tensor {name} ({size}) doesn't match the existing one ({tensor.size(-1)})")
-            if dtype is not None and tensor.dtype != dtype:
-                raise ValueError(f"Dtype of tensor {name} ({dtype}) doesn't match the existing one ({tensor.dtype})")
+            existing_dtype = self.storage_codecs[name].dtype if name in self.storage_codecs else tensor.dtype
+            if dtype is not None and existing_dtype != dtype:
+                raise ValueError(f"Dtype of tensor {name} ({dtype}) doesn't match the existing one ({existing_dtype})")
             return False
         # define tensor shape
         tensor_shape = (
             (self.memory_size, self.num_envs, *size) if keep_dimensions else (self.memory_size, self.num_envs, size)
         )
         view_shape = (-1, *size) if keep_dimensions else (-1, size)
+        # compact storage
+        if name in self.storage_dtypes:
+            codec = create_storage_codec(self.storage_dtypes[name])
+            if dtype is not None and dtype != codec.dtype:
+                raise ValueError(f"Storage format of tensor {name} doesn't support the dtype {dtype}")
+            self.storage_codecs[name] = codec
+            tensor_shape = (self.memory_size, *codec.storage_shape(tensor_shape[1:]))
+            view_shape = (-1, *tensor_shape[2:])
+            dtype = codec.storage_dtype
         # create tensor (_tensor_<name>) and add it to the internal storage
         setattr(self, f"_tensor_{name}", torch.zeros(tensor_shape, device=self.device, dtype=dtype))
         # update internal variables
@@ -231,18 +288,22 @@ class Memory:
         tmp = tensors.get("states", tensors[next(iter(tensors))])  # ask for states first
         dim, shape = tmp.ndim, tmp.shape
 
+        # next states shared with the states
+        if self._last_next_states is not None and "next_states" in tensors:
+            self._record_next_states(tensors.get("states"), tensors.pop("next_states"))
+
         # multi environment (number of environments equals num_envs)
         if dim > 1 and shape[0] == self.num_envs:
             for name, tensor in tensors.items():
                 if name in self.tensors:
-                    self.tensors[name][self.memory_index].copy_(tensor)
+                    self._write(name, (self.memory_index,), tensor)
             self.memory_index += 1
         # multi environment (number of environments less than num_envs)
         elif dim > 1 and shape[0] < self.num_envs:
             for name, tensor in tensors.items():
                 if name in self.tensors:
-                    self.tensors[name][self.memory_index, self.env_index : self.env_index + tensor.shape[0]].copy_(
-                        tensor
+                    self._write(
+                        name, (self.memory_index, slice(self.env_index, self.env_index + tensor.shape[0])), tensor
                     )
             self.env_index += tensor.shape[0]
         # single environment - multi sample (number of environments greater than num_envs (num_envs = 1))
@@ -252,19 +313,21 @@ class Memory:
                     num_samples = min(shape[0], self.memory_size - self.memory_index)
                     remaining_samples = shape[0] - num_samples
                     # copy the first n samples
-                    self.tensors[name][self.memory_index : self.memory_index + num_samples].copy_(
-                        tensor[:num_samples].unsqueeze(dim=1)
+                    self._write(
+                        name,
+                        (slice(self.memory_index, self.memory_index + num_samples),),
+                        tensor[:num_samples].unsqueeze(dim=1),
                     )
                     self.memory_index += num_samples
                     # storage remaining samples
                     if remaining_samples > 0:
-                        self.tensors[name][:remaining_samples].copy_(tensor[num_samples:].unsqueeze(dim=1))
+                        self._write(name, (slice(0, remaining_samples),), tensor[num_samples:].unsqueeze(dim=1))
                         self.memory_index = remaining_samples
         # single environment
         elif dim == 1:
             for name, tensor in tensors.items():
                 if name in self.tensors:
-                    self.tensors[name][self.memory_index, self.env_index].copy_(tensor)
+                    self._write(name, (self.memory_index, self.env_index), tensor)
             self.env_index += 1
         else:
             raise ValueError(f"Expected shape (number of environments = {self.num_envs}, data size), got {shape}")
@@ -321,8 +384,8 @@ class Memory:
         """
         if mini_batches > 1:
             batches = np.array_split(indexes, mini_batches)
-            return [[self.tensors_view[name][batch] for name in names] for batch in batches]
-        return [[self.tensors_view[name][indexes] for name in names]]
+            return [[self._gather(name, batch) for name in names] for batch in batches]
+        return [[self._gather(name, indexes) for name in names]]
 
     def sample_all(
         self, names: Tuple[str], mini_batches: int = 1, sequence_length: int = 1
@@ -344,15 +407,95 @@ class Memory:
         if sequence_length > 1:
             if mini_batches > 1:
                 batches = np.array_split(self.all_sequence_indexes, mini_batches)
-                return [[self.tensors_view[name][batch] for name in names] for batch in batches]
-            return [[self.tensors_view[name][self.all_sequence_indexes] for name in names]]
+                return [[self._gather(name, batch) for name in names] for batch in batches]
+            return [[self._gather(name, self.all_sequence_indexes) for name in names]]
 
         # default order
         if mini_batches > 1:
             batch_size = (self.memory_size * self.num_envs) // mini_batches
             batches = [(batch_size * i, batch_size * (i + 1)) for i in range(mini_batches)]
-            return [[self.tensors_view[name][batch[0] : batch[1]] for name in names] for batch in batches]
-        return [[self.tensors_view[name] for name in names]]
+            return [[self._gather(name, slice(batch[0], batch[1])) for name in names] for batch in batches]
+        return [[self._gather(name, slice(None)) for name in names]]
+
+    def _write(self, name: str, index: Tuple[Any, ...], tensor: torch.Tensor) -> None:
+        """Write samples into an internal tensor (encoding them if the tensor has compact storage)
+
+        :param name: Tensor name
+        :type name: str
+        :param index: Memory index (int or slice) optionally followed by an environment index
+        :type index: tuple
+        :param tensor: Samples
+        :type tensor: torch.Tensor
+        """
+        if name in self.storage_codecs:
+            self.storage_codecs[name].write(self.tensors[name], index, tensor)
+        else:
+            self.tensors[name][index].copy_(tensor)
+
+    def _record_next_states(self, states: Optional[torch.Tensor], next_states: torch.Tensor) -> None:
+        """Record the next states when they are shared with the states (before recording the states)
+
+        :param states: States of all the environments
+        :type states: torch.Tensor or None
+        :param next_states: Next states of all the environments
+        :type next_states: torch.Tensor
+
+        :raises ValueError: If the samples are not recorded for all the environments, states included
+        """
+        if states is None or states.ndim < 2 or states.shape[0] != self.num_envs or self.env_index:
+            raise ValueError("Shared next states require recording the states of all the environments at once")
+        # flag the previous row's samples whose next states are not the states being recorded
+        if len(self):
+            previous = (self.memory_index - 1) % self.memory_size
+            reset = (states.view(self.num_envs, -1) != self._last_next_states.view(self.num_envs, -1)).any(dim=-1)
+            self._write("next_states_reset", (previous,), reset.view(-1, 1))
+        # the next states of the row being recorded are stored separately (exact)
+        self._write("next_states_reset", (self.memory_index,), self._no_reset)
+        self._last_next_states.copy_(next_states)
+
+    def _gather_next_states(self, indexes: Any) -> torch.Tensor:
+        """Gather next states by their flat indexes when they are shared with the states
+
+        :param indexes: Flat indexes (memory index * number of environments + environment index) or slice
+        :type indexes: tuple or list, numpy.ndarray, torch.Tensor or slice
+
+        :return: Next states. Shape is (number of indexes, data size)
+        :rtype: torch.Tensor
+        """
+        if isinstance(indexes, slice):
+            indexes = torch.arange(self.memory_size * self.num_envs, device=self.device)[indexes]
+        else:
+            indexes = torch.as_tensor(indexes, dtype=torch.long, device=self.device)
+        rows, envs = indexes // self.num_envs, indexes % self.num_envs
+        next_states = self._gather("states", ((rows + 1) % self.memory_size) * self.num_envs + envs)
+        # the next states of the last recorded row are not in the states tensor
+        last = (rows == (self.memory_index - 1) % self.memory_size).view(-1, *([1] * (next_states.dim() - 1)))
+        return torch.where(last, self._last_next_states[envs].to(next_states.dtype), next_states)
+
+    def get_last_next_states(self) -> Optional[torch.Tensor]:
+        """Get the next states of the last recorded samples when they are shared with the states
+
+        :return: Next states of all the environments (``None`` if the next states are not shared)
+        :rtype: torch.Tensor or None
+        """
+        return self._last_next_states
+
+    def _gather(self, name: str, indexes: Any) -> torch.Tensor:
+        """Gather samples by their flat indexes (decoding them if the tensor has compact storage)
+
+        :param name: Tensor name
+        :type name: str
+        :param indexes: Flat indexes (memory index * number of environments + environment index) or slice
+        :type indexes: tuple or list, numpy.ndarray, torch.Tensor or slice
+
+        :return: Samples. Shape is (number of indexes, data size)
+        :rtype: torch.Tensor
+        """
+        if name == "next_states" and self._last_next_states is not None:
+            return self._gather_next_states(indexes)
+        if name in self.storage_codecs:
+            return self.storage_codecs[name].gather(self.tensors[name], indexes)
+        return self.tensors_view[name][indexes]
 
     def get_sampling_indexes(self) -> Union[tuple, np.ndarray, torch.Tensor]:
         """Get the last indexes used for sampling
@@ -390,23 +533,26 @@ class Memory:
 
         # torch
         if format == "pt":
-            torch.save({name: self.tensors[name] for name in self.get_tensor_names()}, memory_path)
+            torch.save({name: self.get_tensor_by_name(name) for name in self.get_tensor_names()}, memory_path)
         # numpy
         elif format == "npz":
-            np.savez(memory_path, **{name: self.tensors[name].cpu().numpy() for name in self.get_tensor_names()})
+            np.savez(
+                memory_path, **{name: self.get_tensor_by_name(name).cpu().numpy() for name in self.get_tensor_names()}
+            )
         # comma-separated values
         elif format == "csv":
             # open csv writer # TODO: support keeping the dimensions
             with open(memory_path, "a") as file:
                 writer = csv.writer(file)
                 names = self.get_tensor_names()
+                views = {name: self.get_tensor_by_name(name, keepdim=False) for name in names}
                 # write headers
-                headers = [[f"{name}.{i}" for i in range(self.tensors_view[name].shape[-1])] for name in names]
+                headers = [[f"{name}.{i}" for i in range(views[name].shape[-1])] for name in names]
                 writer.writerow([item for sublist in headers for item in sublist])
                 # write rows
                 for i in range(len(self)):
                     writer.writerow(
-                        functools.reduce(operator.iconcat, [self.tensors_view[name][i].tolist() for name in names], [])
+                        functools.reduce(operator.iconcat, [views[name][i].tolist() for name in names], [])
                     )
         # unsupported format
         else:
@@ -1,8 +1,9 @@
-from typing import List, Optional, Tuple, Union
+from typing import List, Mapping, Optional, Tuple, Union
 
 import torch
 
 from skrl.memories.torch import Memory
+from skrl.memories.torch.storage import StorageCodec
 
 
 class RandomMemory(Memory):
@@ -15,6 +16,8 @@ class RandomMemory(Memory):
         export_format: str = "pt",
         export_directory: str = "",
         replacement=True,
+        storage_dtypes: Optional[Mapping[str, Union[str, dict, StorageCodec]]] = None,
+        share_next_states: bool = False,
     ) -> None:
         """Random sampling memory
 
@@ -40,13 +43,25 @@ class RandomMemory(Memory):
                             Replacement implies that a value can be selected multiple times (the batch size is always guaranteed).
                             Sampling without replacement will return a batch of maximum memory size if the memory size is less than the requested batch size
         :type replacement: bool, optional
+        :param storage_dtypes: Compact storage format of the tensors, by name (default: ``None``).
+                               See :py:class:`skrl.memories.torch.Memory` for the supported formats
+        :type storage_dtypes: dict, optional
+        :param share_next_states: Store the next states as a view of the states (default: ``False``).
+                                  See :py:class:`skrl.memories.torch.Memory`
+        :type share_next_states: bool, optional
 
         :raises ValueError: The export format is not supported
         """
-        super().__init__(memory_size, num_envs, device, export, export_format, export_directory)
+        super().__init__(
+            memory_size, num_envs, device, export, export_format, export_directory, storage_dtypes, share_next_states
+        )
 
         self._replacement = replacement
 
+        # preallocated buffers of the shuffled sampling (see .sample_shuffled())
+        self._shuffled_indexes = None
+        self._shuffled_buffers = {}
+
     def sample(
         self, names: Tuple[str], batch_size: int, mini_batches: int = 1, sequence_length: int = 1
     ) -> List[List[torch.Tensor]]:
@@ -85,3 +100,60 @@ class RandomMemory(Memory):
 
         self.sampling_indexes = indexes
         return self.sample_by_index(names=names, indexes=indexes, mini_batches=mini_batches)
+
+    def sample_shuffled(self, names: Tuple[str], mini_batches: int = 1) -> List[List[torch.Tensor]]:
+        """Sample all data from memory in a random order, split into equally sized mini-batches
+
+        A permutation of the memory is generated on the memory's device and each named tensor is gathered,
+        with a single indexing operation, into a preallocated buffer that is reused by subsequent calls.
+        The mini-batches are contiguous slices (views) of the buffers, so they are overwritten by the next call.
+        This method is intended to be called once per learning epoch.
+        If the memory size is not a multiple of the number of mini-batches, the remaining samples
+        (different ones each call) are left out, as in :py:meth:`sample_all`.
+        Tensors with compact storage are gathered in their storage format and decoded per mini-batch
+
+        :param names: Tensors names from which to obtain the samples
+        :type names: tuple or list of strings
+        :param mini_batches: Number of mini-batches to sample (default: ``1``)
+        :type mini_batches: int, optional
+
+        :return: Sampled data from memory.
+                 The sampled tensors will have the following shape: (memory size * number of environments // mini-batches, data size)
+        :rtype: list of torch.Tensor list
+        """
+        size = self.memory_size * self.num_envs
+        batch_size = size // mini_batches
+
+        # generate the permutation on the memory's device
+        if self._shuffled_indexes is None:
+            self._shuffled_indexes = torch.empty(size, dtype=torch.long, device=self.device)
+        torch.randperm(size, out=self._shuffled_indexes)
+        indexes = self._shuffled_indexes[: batch_size * mini_batches]
+        self.sampling_indexes = indexes
+
+        # gather the samples into the (reused) buffers
+        batches = [[] for _ in range(mini_batches)]
+        for name in names:
+            # shared next states are gathered (and decoded) from the states
+            if name == "next_states" and self._last_next_states is not None:
+                samples = self._gather_next_states(indexes)
+                for i, batch in enumerate(batches):
+                    batch.append(samples[batch_size * i : batch_size * (i + 1)])
+                continue
+            codec = self.storage_codecs.get(name)
+            if codec is not None and not codec.elementwise:
+                # packed formats are decoded before gathering
+                tensor = codec.decode(self.tensors[name]).view(-1, *codec.row_shape[1:])
+                codec = None
+            else:
+                tensor = self.tensors_view[name]
+            buffer = self._shuffled_buffers.get(name)
+            if buffer is None or buffer.shape[0] != indexes.shape[0]:
+                buffer = torch.empty((indexes.shape[0], *tensor.shape[1:]), dtype=tensor.dtype, device=self.device)
+                self._shuffled_buffers[name] = buffer
+            with torch.no_grad():
+                torch.index_select(tensor, 0, indexes, out=buffer)
+            for i, batch in enumerate(batches):
+                mini_batch = buffer[batch_size * i : batch_size * (i + 1)]
+                batch.append(mini_batch if codec is None else codec.decode(mini_batch))
+        return batches
@@ -0,0 +1,203 @@
+from typing import Any, Mapping, Sequence, Tuple, Union
+
+import math
+
+import torch
+
+
+class StorageCodec:
+    def __init__(self) -> None:
+        """Base class of the compact storage formats of the memory's tensors
+
+        A codec converts a block of rows of a tensor (shape: (..., number of environments, data size)) to its
+        storage representation (:py:meth:`encode`) and back (:py:meth:`decode`).
+        Codecs are configured for the row shape of a single tensor (:py:meth:`storage_shape`)
+        """
+        self.dtype = torch.float32
+        self.storage_dtype = torch.float32
+        self.row_shape = None
+
+    @property
+    def elementwise(self) -> bool:
+        """Whether each element is stored independently (storage shape equals the tensor shape)"""
+        return True
+
+    def storage_shape(self, row_shape: Sequence[int]) -> Tuple[int, ...]:
+        """Configure the codec for the given row shape and compute the storage shape of a row
+
+        :param row_shape: Shape of a memory row: (number of environments, data size)
+        :type row_shape: tuple of int
+
+        :return: Storage shape of a memory row
+        :rtype: tuple of int
+        """
+        self.row_shape = tuple(row_shape)
+        return self.row_shape
+
+    def encode(self, tensor: torch.Tensor) -> torch.Tensor:
+        """Convert a tensor to its storage representation
+
+        :param tensor: Tensor
+        :type tensor: torch.Tensor
+
+        :return: Storage representation
+        :rtype: torch.Tensor
+        """
+        return tensor.to(self.storage_dtype)
+
+    def decode(self, storage: torch.Tensor) -> torch.Tensor:
+        """Convert a storage representation back to a tensor
+
+        :param storage: Storage representation
+        :type storage: torch.Tensor
+
+        :return: Tensor
+        :rtype: torch.Tensor
+        """
+        return storage.to(self.dtype)
+
+    def write(self, storage: torch.Tensor, index: Tuple[Any, ...], tensor: torch.Tensor) -> None:
+        """Write a tensor at the given (memory index, environment index) position of the storage
+
+        :param storage: Storage tensor. Shape is (memory size, storage row shape)
+        :type storage: torch.Tensor
+        :param index: Memory index (int or slice) optionally followed by an environment index
+        :type index: tuple
+        :param tensor: Tensor to write
+        :type tensor: torch.Tensor
+        """
+        storage[index].copy_(self.encode(tensor))
+
+    def gather(self, storage: torch.Tensor, indexes: Any) -> torch.Tensor:
+        """Gather and decode the samples of the given flat (memory index * number of environments + environment index) indexes
+
+        Only the gathered samples are decoded
+
+        :param storage: Storage tensor. Shape is (memory size, storage row shape)
+        :type storage: torch.Tensor
+        :param indexes: Flat indexes (tensor, array or slice)
+        :type indexes: Any
+
+        :return: Samples. Shape is (number of indexes, data size)
+        :rtype: torch.Tensor
+        """
+        return self.decode(storage.view(-1, *storage.shape[2:])[indexes])
+
+
+class CastCodec(StorageCodec):
+    def __init__(self, storage_dtype: torch.dtype) -> None:
+        """Store floating point tensors with a lower precision data type (e.g. ``torch.bfloat16``)
+
+        :param storage_dtype: Storage data type
+        :type storage_dtype: torch.dtype
+        """
+        super().__init__()
+        self.storage_dtype = storage_dtype
+
+
+class QuantizedCodec(StorageCodec):
+    def __init__(self, low: float = 0.0, high: float = 255.0) -> None:
+        """Store floating point tensors as 8-bit unsigned integers (e.g. image observations)
+
+        Values in the range [low, high] are mapped to [0, 255] (values outside the range are clipped)
+        and decoded back to [low, high]. To normalize the inputs of the models, use the agent's state preprocessor,
+        which applies identically to the states of the rollouts and of the updates
+
+        :param low: Lower bound of the values (default: ``0.0``)
+        :type low: float, optional
+        :param high: Upper bound of the values (default: ``255.0``)
+        :type high: float, optional
+        """
+        super().__init__()
+        self.storage_dtype = torch.uint8
+        self.low = low
+        self.high = high
+
+    def encode(self, tensor: torch.Tensor) -> torch.Tensor:
+        scale = 255.0 / (self.high - self.low)
+        return ((tensor.to(torch.float32) - self.low) * scale).round_().clamp_(0, 255).to(torch.uint8)
+
+    def decode(self, storage: torch.Tensor) -> torch.Tensor:
+        return storage.to(self.dtype).mul_((self.high - self.low) / 255.0).add_(self.low)
+
+
+class BitCodec(StorageCodec):
+    def __init__(self) -> None:
+        """Store boolean tensors (e.g. terminated/truncated flags) packed into bits, 8 values per byte
+
+        The values of each memory row (all environments) are packed together
+        """
+        super().__init__()
+        self.dtype = torch.bool
+        self.storage_dtype = torch.uint8
+        self._num_values = 0
+        self._shifts = {}
+
+    @property
+    def elementwise(self) -> bool:
+        return False
+
+    def storage_shape(self, row_shape: Sequence[int]) -> Tuple[int, ...]:
+        self.row_shape = tuple(row_shape)
+        self._num_values = math.prod(self.row_shape)
+        return (math.ceil(self._num_values / 8),)
+
+    def _bit_shifts(self, device: torch.device) -> torch.Tensor:
+        if device not in self._shifts:
+            self._shifts[device] = torch.arange(8, dtype=torch.uint8, device=device)
+        return self._shifts[device]
+
+    def encode(self, tensor: torch.Tensor) -> torch.Tensor:
+        leading_shape = tensor.shape[: tensor.dim() - len(self.row_shape)]
+        values = tensor.to(torch.uint8).reshape(*leading_shape, self._num_values)
+        padding = -self._num_values % 8
+        if padding:
+            values = torch.nn.functional.pad(values, (0, padding))
+        values = values.view(*leading_shape, -1, 8) << self._bit_shifts(tensor.device)
+        return values.sum(dim=-1, dtype=torch.uint8)
+
+    def decode(self, storage: torch.Tensor) -> torch.Tensor:
+        values = (storage.unsqueeze(-1) >> self._bit_shifts(storage.device)) & 1
+        values = values.view(*storage.shape[:-1], -1)[..., : self._num_values]
+        return values.view(*storage.shape[:-1], *self.row_shape).to(torch.bool)
+
+    def write(self, storage: torch.Tensor, index: Tuple[Any, ...], tensor: torch.Tensor) -> None:
+        # bits of different environments share bytes: read, modify and write the whole rows
+        rows = self.decode(storage[index[0]])
+        rows[index[1:]] = tensor.to(torch.bool)
+        storage[index[0]] = self.encode(rows)
+
+    def gather(self, storage: torch.Tensor, indexes: Any) -> torch.Tensor:
+        return self.decode(storage).view(-1, *self.row_shape[1:])[indexes]
+
+
+STORAGE_CODECS = {
+    "float16": lambda: CastCodec(torch.float16),
+    "bfloat16": lambda: CastCodec(torch.bfloat16),
+    "uint8": QuantizedCodec,
+    "bits": BitCodec,
+}
+
+
+def create_storage_codec(spec: Union[str, Mapping[str, Any], StorageCodec]) -> StorageCodec:
+    """Create a storage codec from its specification
+
+    :param spec: Codec (returned as is), codec name (``"float16"``, ``"bfloat16"``, ``"uint8"`` or ``"bits"``)
+                 or dictionary with the codec name (``"dtype"`` key) and its parameters
+                 (e.g. ``{"dtype": "uint8", "low": 0.0, "high": 1.0}``)
+    :type spec: str, dict or StorageCodec
+
+    :raises ValueError: If the codec is not supported
+
+    :return: Storage codec
+    :rtype: StorageCodec
+    """
+    if isinstance(spec, StorageCodec):
+        return spec
+    kwargs = {}
+    if isinstance(spec, Mapping):
+        kwargs = {k: v for k, v in spec.items() if k != "dtype"}
+        spec = spec.get("dtype")
+    if spec not in STORAGE_CODECS:
+        raise ValueError(f"Unsupported storage dtype: {spec} (supported: {', '.join(STORAGE_CODECS)})")
+    return STORAGE_CODECS[spec](**kwargs)
@@ -1,14 +1,95 @@
-from typing import Optional, Tuple, Union
+from typing import Callable, Iterator, Optional, Tuple, Union
 
+import contextlib
 import gymnasium
 
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 
 from skrl import config
+from skrl.utils.compiled import CompiledFunction
 from skrl.utils.spaces.torch import compute_space_size
 
 
+def _update_and_normalize(
+    x: torch.Tensor,
+    running_mean: torch.Tensor,
+    running_variance: torch.Tensor,
+    current_count: torch.Tensor,
+    epsilon: float,
+    clip_threshold: float,
+) -> torch.Tensor:
+    """Update the running statistics (in-place) with the input data and standardize it
+
+    Running statistics are updated using the parallel algorithm for computing variance
+    (https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm)
+
+    :param x: Input tensor. Shape is (batch size, size) or (memory size, number of environments, size)
+    :type x: torch.Tensor
+    :param running_mean: Running mean
+    :type running_mean: torch.Tensor
+    :param running_variance: Running variance
+    :type running_variance: torch.Tensor
+    :param current_count: Number of samples of the running statistics
+    :type current_count: torch.Tensor
+    :param epsilon: Small number to avoid division by zero
+    :type epsilon: float
+    :param clip_threshold: Threshold to clip the data
+    :type clip_threshold: float
+
+    :return: Standardized tensor
+    :rtype: torch.Tensor
+    """
+    dim = (0, 1) if x.dim() == 3 else 0
+    input_count = x.shape[0] * x.shape[1] if x.dim() == 3 else x.shape[0]
+    input_var, input_mean = torch.var_mean(x.detach(), dim=dim)
+
+    delta = input_mean - running_mean
+    total_count = current_count + input_count
+    M2 = (
+        (running_variance * current_count)
+        + (input_var * input_count)
+        + delta**2 * current_count * input_count / total_count
+    )
+    running_mean.add_(delta * input_count / total_count)
+    running_variance.copy_(M2 / total_count)
+    current_count.copy_(total_count)
+
+    return torch.clamp(
+        (x - running_mean.float()) / (torch.sqrt(running_variance.float()) + epsilon),
+        min=-clip_threshold,
+        max=clip_threshold,
+    )
+
+
+class FoldedLinear(nn.Module):
+    def __init__(self, weight: torch.Tensor, bias: torch.Tensor, low: torch.Tensor, high: torch.Tensor) -> None:
+        """Linear layer with a folded (frozen) standardization of its inputs
+
+        Computes ``linear(clamp(x, low, high))``, which is equal to ``linear(clamp((x - mean) / std, -c, c))``
+        of the original layer when ``weight`` and ``bias`` absorb the mean and the standard deviation and the clipping
+        bounds are mapped back to the input space (``low = mean - c * std`` and ``high = mean + c * std``)
+
+        :param weight: Folded weight. Shape is (output size, input size)
+        :type weight: torch.Tensor
+        :param bias: Folded bias. Shape is (output size)
+        :type bias: torch.Tensor
+        :param low: Lower clipping bound of the inputs. Shape is (input size)
+        :type low: torch.Tensor
+        :param high: Upper clipping bound of the inputs. Shape is (input size)
+        :type high: torch.Tensor
+        """
+        super().__init__()
+        self.register_buffer("weight", weight)
+        self.register_buffer("bias", bias)
+        self.register_buffer("low", low)
+        self.register_buffer("high", high)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return F.linear(torch.clamp(x, min=self.low, max=self.high), self.weight, self.bias)
+
+
 class RunningStandardScaler(nn.Module):
     def __init__(
         self,
@@ -16,6 +97,7 @@ class RunningStandardScaler(nn.Module):
         epsilon: float = 1e-8,
         clip_threshold: float = 5.0,
         device: Optional[Union[str, torch.device]] = None,
+        fused: bool = False,
     ) -> None:
         """Standardize the input data by removing the mean and scaling by the standard deviation
 
@@ -40,6 +122,9 @@ class RunningStandardScaler(nn.Module):
         :param device: Device on which a tensor/array is or will be allocated (default: ``None``).
                        If None, the device will be either ``"cuda"`` if available or ``"cpu"``
         :type device: str or torch.device, optional
+        :param fused: Whether to compile (``torch.compile``) the update of the running statistics and the
+                      standardization of the training data into fused kernels (default: ``False``)
+        :type fused: bool, optional
         """
         super().__init__()
 
@@ -54,6 +139,9 @@ class RunningStandardScaler(nn.Module):
         self.register_buffer("running_variance", torch.ones(size, dtype=torch.float64, device=self.device))
         self.register_buffer("current_count", torch.ones((), dtype=torch.float64, device=self.device))
 
+        self._update_and_normalize = CompiledFunction(_update_and_normalize) if fused else _update_and_normalize
+        self._folded_layers = {}
+
     def _parallel_variance(self, input_mean: torch.Tensor, input_var: torch.Tensor, input_count: int) -> None:
         """Update internal variables using the parallel algorithm for computing variance
 
@@ -74,10 +162,10 @@ class RunningStandardScaler(nn.Module):
             + delta**2 * self.current_count * input_count / total_count
         )
 
-        # update internal variables
-        self.running_mean = self.running_mean + delta * input_count / total_count
-        self.running_variance = M2 / total_count
-        self.current_count = total_count
+        # update internal variables (in-place, to keep track of their versions)
+        self.running_mean.add_(delta * input_count / total_count)
+        self.running_variance.copy_(M2 / total_count)
+        self.current_count.copy_(total_count)
 
     def _compute(self, x: torch.Tensor, train: bool = False, inverse: bool = False) -> torch.Tensor:
         """Compute the standardization of the input data
@@ -92,6 +180,11 @@ class RunningStandardScaler(nn.Module):
         :return: Standardized tensor
         :rtype: torch.Tensor
         """
+        # update the running statistics and standardize the data
+        if train and not inverse:
+            return self._update_and_normalize(
+                x, self.running_mean, self.running_variance, self.current_count, self.epsilon, self.clip_threshold
+            )
         if train:
             if x.dim() == 3:
                 self._parallel_variance(torch.mean(x, dim=(0, 1)), torch.var(x, dim=(0, 1)), x.shape[0] * x.shape[1])
@@ -151,3 +244,77 @@ class RunningStandardScaler(nn.Module):
             with torch.no_grad():
                 return self._compute(x, train, inverse)
         return self._compute(x, train, inverse)
+
+    def fold(self, linear: nn.Linear) -> FoldedLinear:
+        """Fold the current (frozen) standardization into a linear layer that consumes the standardized data
+
+        The folded layer is cached and only recomputed when the running statistics or the layer's parameters change
+
+        :param linear: Linear layer whose inputs are the standardized data
+        :type linear: torch.nn.Linear
+
+        :raises ValueError: If the layer's input size does not match the size of the standardizer
+
+        :return: Linear layer that consumes the raw (not standardized) data
+        :rtype: FoldedLinear
+        """
+        if linear.in_features != self.running_mean.numel() or self.running_mean.dim() != 1:
+            raise ValueError(
+                f"Unable to fold the standardizer (size: {tuple(self.running_mean.shape)}) "
+                f"into a linear layer with {linear.in_features} input features"
+            )
+        parameters = (self.running_mean, self.running_variance, linear.weight, linear.bias)
+        versions = tuple((id(p), p._version) if p is not None else None for p in parameters)
+        cached = self._folded_layers.get(id(linear))
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+
+        with torch.no_grad():
+            std = torch.sqrt(self.running_variance) + self.epsilon
+            weight = linear.weight.double() / std
+            bias = -(weight @ self.running_mean)
+            if linear.bias is not None:
+                bias += linear.bias.double()
+            folded = FoldedLinear(
+                weight=weight.to(linear.weight.dtype),
+                bias=bias.to(linear.weight.dtype),
+                low=(self.running_mean - self.clip_threshold * std).float(),
+                high=(self.running_mean + self.clip_threshold * std).float(),
+            )
+        self._folded_layers[id(linear)] = (versions, folded)
+        return folded
+
+    @contextlib.contextmanager
+    def folded(self, model: nn.Module) -> Iterator[Callable[[torch.Tensor], torch.Tensor]]:
+        """Context in which the standardization is folded into the first linear layer of a model
+
+        Within the context, the first linear layer of the model (that must consume the standardized data)
+        is replaced by its folded version (see :py:meth:`fold`), so the model has to be fed with the raw data.
+        The standardization is assumed to be frozen (i.e.: no training) within the context
+
+        Example::
+
+            >>> with running_standard_scaler.folded(policy) as preprocessor:
+            ...     actions, log_prob, outputs = policy.act({"states": preprocessor(states)}, role="policy")
+
+        :param model: Model
+        :type model: torch.nn.Module
+
+        :raises ValueError: If the model has no linear layer or its input size does not match
+
+        :return: Preprocessing function of the raw data (identity) within the context
+        :rtype: callable
+        """
+        for name, module in model.named_modules():
+            if isinstance(module, nn.Linear):
+                break
+        else:
+            raise ValueError(f"Unable to fold the standardizer: {type(model).__name__} has no linear layer")
+        parent_name, _, attribute = name.rpartition(".")
+        parent = model.get_submodule(parent_name)
+
+        setattr(parent, attribute, self.fold(module))
+        try:
+            yield lambda x: x
+        finally:
+            setattr(parent, attribute, module)
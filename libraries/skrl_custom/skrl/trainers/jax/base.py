@@ -1,13 +1,92 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import atexit
 import contextlib
+import functools
+import os
 import sys
+import gymnasium
 import tqdm
 
+import flax.linen as nn
+import jax
+import jax.numpy as jnp
+import numpy as np
+
 from skrl import config, logger
 from skrl.agents.jax import Agent
+from skrl.agents.jax.ppo import PPO
 from skrl.envs.wrappers.jax import Wrapper
+from skrl.envs.wrappers.jax.isaaclab_envs import _jax2torch
+from skrl.memories.jax import RandomMemory
+from skrl.models.jax import DeterministicMixin, GaussianMixin, Model
+from skrl.trainers.jax.positioning import PositioningStrategy, create_positioning_strategy
+from skrl.utils.bc_dataset import BCDatasetReader, BCDatasetWriter, EpisodePrefetcher
+from skrl.utils.chunk_store import ChunkedArrayReader, ChunkedArrayWriter
+from skrl.utils.host_copy import AsyncHostCopier
+
+
+# adversary models: same architecture as the torch trainer's SharedModel, with separate
+# policy and value networks since the JAX agents don't support shared models
+class AdversaryPolicy(GaussianMixin, Model):
+    def __init__(self, observation_space, action_space, device=None, clip_actions=False,
+                 clip_log_std=True, min_log_std=-20, max_log_std=2, reduction="sum", **kwargs):
+        Model.__init__(self, observation_space, action_space, device, **kwargs)
+        GaussianMixin.__init__(self, clip_actions, clip_log_std, min_log_std, max_log_std, reduction)
+
+    @nn.compact
+    def __call__(self, inputs, role):
+        x = nn.elu(nn.Dense(32)(inputs["states"]))
+        x = nn.elu(nn.Dense(32)(x))
+        log_std_parameter = self.param("log_std_parameter", lambda _: jnp.zeros(self.num_actions))
+        return nn.Dense(self.num_actions)(x), log_std_parameter, {}
+
+
+class AdversaryValue(DeterministicMixin, Model):
+    def __init__(self, observation_space, action_space, device=None, clip_actions=False, **kwargs):
+        Model.__init__(self, observation_space, action_space, device, **kwargs)
+        DeterministicMixin.__init__(self, clip_actions)
+
+    @nn.compact
+    def __call__(self, inputs, role):
+        x = nn.elu(nn.Dense(32)(inputs["states"]))
+        x = nn.elu(nn.Dense(32)(x))
+        return nn.Dense(1)(x), {}
+
+
+# https://jax.readthedocs.io/en/latest/faq.html#strategy-1-jit-compiled-helper-function
+@jax.jit
+def _discount_episode_rewards(episode_rewards, rewards):
+    return 0.98 * episode_rewards + rewards
+
+
+@jax.jit
+def _range_penalty(adversary_action):
+    # penalizes for action values outside [-1,1] range
+    return jnp.sum(jnp.maximum(adversary_action**2 - 1, 0), axis=1, keepdims=True)
+
+
+@functools.partial(jax.jit, static_argnames=("regret_rollouts",))
+def _parallel_regret_rewards(episode_rewards, range_penalty, regret_rollouts):
+    # regret of each group: max minus mean over the group's rollouts of its placement
+    grouped_adversary_rewards = (-1 * episode_rewards).reshape(-1, regret_rollouts)
+    regret = grouped_adversary_rewards.max(axis=1, keepdims=True) - grouped_adversary_rewards.mean(
+        axis=1, keepdims=True
+    )
+    return regret - range_penalty[::regret_rollouts]
+
+
+@functools.partial(jax.jit, static_argnames=("policy_act",))
+def _update_behavior_cloning(policy_act, policy_state_dict, states, bc_actions):
+    # compute behavior cloning loss
+    def _bc_loss(params):
+        # mean actions: the policy's sampling key is fixed when the function is traced
+        _, _, outputs = policy_act({"states": states}, "policy", params)
+        return jnp.mean((bc_actions - outputs["mean_actions"]) ** 2)
+
+    bc_loss, grad = jax.value_and_grad(_bc_loss)(policy_state_dict.params)
+
+    return grad, bc_loss
 
 
 def generate_equally_spaced_scopes(num_envs: int, num_simultaneous_agents: int) -> List[int]:
@@ -66,11 +145,17 @@ class Trainer:
         self.stochastic_evaluation = self.cfg.get("stochastic_evaluation", False)
 
         self.initial_timestep = 0
+        self._jax = config.jax.backend == "jax"
 
         # setup agents
         self.num_simultaneous_agents = 0
         self._setup_agents()
 
+        # experimental: adversarial placement of the objects of an Isaac Lab environment (see single_agent_train)
+        self.adversarial_training = self.cfg.get("adversarial_training", False)
+        if self.adversarial_training:
+            self._setup_adversary()
+
         # register environment closing if configured
         if self.close_environment_at_exit:
 
@@ -147,6 +232,90 @@ class Trainer:
         else:
             self.num_simultaneous_agents = 1
 
+    def _setup_adversary(self) -> None:
+        """Setup the adversary that places the objects of the Isaac Lab environment (experimental)
+
+        :raises ValueError: Unsupported configuration
+        """
+        logger.warning("The adversarial training loop of the JAX trainers is experimental")
+
+        # set local variables
+        self.positioning_strategy = self._isaaclab_env().cfg.positioning_strategy
+        self.adversary_active = self.positioning_strategy == "pure_adversary" or self.positioning_strategy == "regret_adversary"
+        self.log_training = True
+        self.regret_rollouts = 5
+        self.regret_parallel = self.cfg.get("regret_parallel", False)
+        self.log_chunk_size = self.cfg.get("log_chunk_size", 64)
+        self.log_flush_interval = self.cfg.get("log_flush_interval", 0)
+
+        self.train_mode = self._isaaclab_env().cfg.train_mode
+        self.train_actions_path = self._isaaclab_env().cfg.train_actions_path
+        self.train_positions_path = self._isaaclab_env().cfg.train_positions_path
+        self.async_reset = self._isaaclab_env().cfg.async_reset
+
+        # placements are sampled for all the environments at once (see skrl.trainers.jax.positioning)
+        if self.async_reset:
+            raise ValueError("Asynchronous resets are not supported by the JAX trainers")
+
+        # parallel regret estimation runs each adversary placement at the same time in a group of
+        # regret_rollouts consecutive environments, instead of in regret_rollouts sequential episodes
+        if self.regret_parallel:
+            if self.positioning_strategy != "regret_adversary":
+                raise ValueError("Parallel regret estimation requires the regret_adversary positioning strategy")
+            if self.env.num_envs % self.regret_rollouts:
+                raise ValueError(
+                    f"The number of environments ({self.env.num_envs}) must be a multiple of the number of regret rollouts ({self.regret_rollouts}) for parallel regret estimation"
+                )
+        self.adversary_num_envs = self.env.num_envs // self.regret_rollouts if self.regret_parallel else self.env.num_envs
+
+        if self.cfg.get("adversary_population_size", 1) > 1:
+            raise ValueError("Adversary populations are not supported by the JAX trainers")
+
+        # disable learning for agent if we are just collecting data
+        if self.train_mode == "bc_datacollect" or self.train_mode == "bc_train":
+            self.agents._learning_starts = self.timesteps + 1
+
+        # setup adversary
+        self.adversary_num_inputs = 4 # arbitrary number of inputs, is a noise vector to condition on
+        num_outputs = (self._isaaclab_env().num_clutter_objects + 1) * 3 # clutter + main object
+
+        adversary_rollouts = 1 if self.positioning_strategy == "regret_adversary" else self.regret_rollouts
+        adversary_memsize = 25 // self.regret_rollouts if self.positioning_strategy == "regret_adversary" else 25
+        adversary_cfg = {
+            "rollouts": adversary_rollouts, # make it fair
+            "learning_starts": adversary_memsize - 1, # subtracting 1 because of off-by-1 indexing in SKRL PPO
+            "memory_size": adversary_memsize, # passed into RandomMemory manually, must be <= learning_starts
+            "learning_rate": 1e-4,
+            "experiment": {"write_interval": 0, "checkpoint_interval": 0},
+        }
+
+        # the JAX models sample their spaces to initialize their parameters
+        observation_space = gymnasium.spaces.Box(low=-np.inf, high=np.inf, shape=(self.adversary_num_inputs,))
+        action_space = gymnasium.spaces.Box(low=-np.inf, high=np.inf, shape=(num_outputs,))
+        models = {
+            "policy": AdversaryPolicy(observation_space, action_space, device=self.env.device),
+            "value": AdversaryValue(observation_space, gymnasium.spaces.Box(low=-np.inf, high=np.inf, shape=(1,)), device=self.env.device),
+        }
+        for role, model in models.items():
+            model.init_state_dict(role)
+        self.adversary = PPO(
+            models=models,
+            device=self.env.device,
+            observation_space=observation_space,
+            action_space=action_space,
+            memory=RandomMemory(
+                num_envs=self.adversary_num_envs, memory_size=adversary_cfg["memory_size"], device=self.env.device
+            ),
+            cfg=adversary_cfg,
+        )
+        # jit-compile the adversary's models (its update functions are already jit-compiled)
+        self.adversary.init()
+        # save (and load) the adversary's models with the agent's checkpoints
+        if isinstance(self.agents, Agent):
+            self.agents.checkpoint_modules["adversary_policy"] = self.adversary.policy
+            self.agents.checkpoint_modules["adversary_value"] = self.adversary.value
+        self._key = config.jax.key
+
     def train(self) -> None:
         """Train the agents
 
@@ -173,7 +342,14 @@ class Trainer:
         - Record transitions
         - Post-interaction
         - Reset environments
+
+        With the (experimental) ``adversarial_training`` configuration, the objects of the Isaac Lab environment
+        are placed by the adversary (see :py:meth:`_single_agent_adversarial_train`)
         """
+        if self.adversarial_training:
+            self._single_agent_adversarial_train()
+            return
+
         assert self.num_simultaneous_agents == 1, "This method is not allowed for simultaneous agents"
         assert self.env.num_agents == 1, "This method is not allowed for multi-agents"
 
@@ -224,6 +400,293 @@ class Trainer:
                 else:
                     states = next_states
 
+    def _single_agent_adversarial_train(self) -> None:
+        """Train agent against the adversary that places the objects (experimental)
+
+        This method executes the following steps in loop:
+
+        - Pre-interaction
+        - Compute actions
+        - Interact with the environments
+        - Render scene
+        - Record transitions
+        - Post-interaction
+        - Reset environments
+
+        The adversary (placement of the objects) is sampled and updated once per episode,
+        as in :py:meth:`skrl.trainers.torch.Trainer.single_agent_train`
+        """
+        assert self.num_simultaneous_agents == 1, "This method is not allowed for simultaneous agents"
+        assert self.env.num_agents == 1, "This method is not allowed for multi-agents"
+
+        # useful constants
+        NUM_ENVS = self.env.num_envs
+        MAX_EPISODE_LENGTH = self._isaaclab_env().max_episode_length
+        NUM_ADVERSARY_ENVS = self.adversary_num_envs
+        ENV_DEVICE = self._isaaclab_env().device
+        # episodes per regret adversary transition: with parallel regret estimation the rollouts
+        # of a placement run at the same time, so the adversary gets a transition every episode
+        REGRET_EPISODES = 1 if self.regret_parallel else self.regret_rollouts
+
+        # initialize bc positions and actions if applicable
+        bc_positions, bc_prefetcher, bc_dataset = None, None, None
+        if self.train_mode == "bc_train":
+            bc_positions, bc_prefetcher = self._open_bc_data(MAX_EPISODE_LENGTH)
+        elif self.train_mode == "bc_datacollect":
+            bc_dataset = BCDatasetWriter(
+                os.path.join(self.agents.experiment_dir, "training_logs", "bc_dataset"),
+                episodes_per_shard=self.cfg.get("bc_episodes_per_shard", 16),
+                metadata={"max_episode_length": MAX_EPISODE_LENGTH, "num_envs": NUM_ENVS},
+            )
+        positioning = self._create_positioning_strategy(bc_positions)
+
+        # reset env
+        rand_state = self._sample_rand_state()
+        adversary_action = positioning.sample(rand_state=rand_state, timestep=0)
+        episode_rewards = jnp.zeros((NUM_ENVS, 1))
+
+        # the Isaac Lab environment reads the placements as a torch tensor
+        self._isaaclab_env().adversary_action = _jax2torch(adversary_action, ENV_DEVICE)
+        states, infos = self.env.reset()
+
+        # set up regret adversary state, if applicable
+        regret_trials = REGRET_EPISODES - 1
+        max_adversary_rewards = jnp.zeros((NUM_ENVS, 1))
+        total_adversary_rewards = jnp.zeros((NUM_ENVS, 1))
+        total_adversary_penalty = jnp.zeros((NUM_ENVS, 1))
+
+        # start training loop
+        training_logs = self._open_training_logs() if self.log_training else {}
+        host_copier = AsyncHostCopier()
+        protagonist_action_buffer = []
+        for timestep in tqdm.tqdm(
+            range(self.initial_timestep, self.timesteps), disable=self.disable_progressbar, file=sys.stdout
+        ):
+            # reset buffer at start of episode if we are behavior cloning expert actions
+            # (the episode has been loaded in the background while the previous one was running)
+            if timestep % MAX_EPISODE_LENGTH == 0 and self.train_mode == "bc_train":
+                protagonist_action_buffer = jnp.asarray(bc_prefetcher.get(timestep // MAX_EPISODE_LENGTH))
+
+            # record the positions of the episode if we are collecting behavior cloning data
+            if timestep % MAX_EPISODE_LENGTH == 0 and self.train_mode == "bc_datacollect":
+                host_copier.copy(
+                    "protagonist_position", self._isaaclab_env().adversary_action, bc_dataset.append_position
+                )
+
+            # take next action from adversary if at the end of an episode
+            if timestep % MAX_EPISODE_LENGTH == MAX_EPISODE_LENGTH - 1:
+                if self.positioning_strategy != "regret_adversary" or regret_trials <= 0:
+                    rand_state = self._sample_rand_state()
+                adversary_action = positioning.sample(
+                    rand_state=rand_state, timestep=timestep, rewards=rewards, regret_trials=regret_trials
+                )
+                self._isaaclab_env().adversary_action = _jax2torch(adversary_action, ENV_DEVICE)
+
+                # reset regret trials if applicable
+                if self.positioning_strategy == "regret_adversary":
+                    regret_trials -= 1
+                    if regret_trials < 0:
+                        regret_trials += REGRET_EPISODES
+
+                # reset episode rewards
+                episode_rewards = jnp.zeros((NUM_ENVS, 1))
+
+            # pre-interaction
+            self.agents.pre_interaction(timestep=timestep, timesteps=self.timesteps)
+
+            if self.train_mode == "bc_train":
+                # case 1: behavior cloning, use expert actions
+                # step the environments
+                bc_actions = protagonist_action_buffer[timestep % MAX_EPISODE_LENGTH]
+                next_states, rewards, terminated, truncated, infos = self.env.step(bc_actions)
+
+                # update episode rewards
+                # skip reward from last episode
+                if timestep % MAX_EPISODE_LENGTH != MAX_EPISODE_LENGTH - 1:
+                    episode_rewards = _discount_episode_rewards(episode_rewards, rewards) # Discount rewards
+
+                # render scene
+                if not self.headless:
+                    self.env.render()
+
+                # optimization step
+                grad, bc_loss = _update_behavior_cloning(
+                    self.agents.policy.act,
+                    self.agents.policy.state_dict,
+                    self.agents._state_preprocessor(states),
+                    bc_actions,
+                )
+                self.agents.track_data("Loss / BC MSE Loss", bc_loss)
+
+                if config.jax.is_distributed:
+                    grad = self.agents.policy.reduce_parameters(grad)
+                self.agents.policy_optimizer = self.agents.policy_optimizer.step(
+                    grad,
+                    self.agents.policy,
+                    self.agents._learning_rate if self.agents._learning_rate_scheduler else None,
+                )
+            else:
+                # case 2: not behavior cloning, use RL
+                # compute actions
+                actions = self.agents.act(states, timestep=timestep, timesteps=self.timesteps)[0]
+                if self.train_mode == "bc_datacollect":
+                    host_copier.copy(
+                        "protagonist_action", _jax2torch(actions, ENV_DEVICE, self._jax), protagonist_action_buffer.append
+                    )
+
+                # step the environments
+                next_states, rewards, terminated, truncated, infos = self.env.step(actions)
+
+                # update episode rewards
+                # skip reward from last episode
+                if timestep % MAX_EPISODE_LENGTH != MAX_EPISODE_LENGTH - 1:
+                    episode_rewards = _discount_episode_rewards(episode_rewards, rewards) # Discount rewards
+
+                # render scene
+                if not self.headless:
+                    self.env.render()
+
+                # record the environments' transitions
+                self.agents.record_transition(
+                    states=states,
+                    actions=actions,
+                    rewards=rewards,
+                    next_states=next_states,
+                    terminated=terminated,
+                    truncated=truncated,
+                    infos=infos,
+                    timestep=timestep,
+                    timesteps=self.timesteps,
+                )
+
+                # log environment info (Isaac Lab's info values are torch tensors)
+                if self.environment_info in infos:
+                    for k, v in infos[self.environment_info].items():
+                        if hasattr(v, "numel") and v.numel() == 1:
+                            self.agents.track_data(f"Info / {k}", v.item())
+
+            # agents post interaction
+            self.agents.post_interaction(timestep=timestep, timesteps=self.timesteps)
+
+            # update adversary at end of episode
+            # called at second last episode step to allow for adversary action to be taken at the last step
+            # due to software engineering limitations, we skip the last step of the episode, which is negligible
+            states = next_states
+            if timestep % MAX_EPISODE_LENGTH == MAX_EPISODE_LENGTH - 2:
+                if self.adversary_active:
+                    # update adversary
+                    # compute range penalty: penalizes for action values outside [-1,1] range
+                    range_penalty = _range_penalty(adversary_action)
+
+                    # compute reward, split by cases for different agents
+                    if self.regret_parallel:
+                        adversary_rewards = _parallel_regret_rewards(episode_rewards, range_penalty, self.regret_rollouts)
+                        self.adversary.record_transition(
+                            states=rand_state,
+                            actions=adversary_action[::self.regret_rollouts],
+                            rewards=adversary_rewards,
+                            next_states=rand_state,
+                            terminated=jnp.ones((NUM_ADVERSARY_ENVS, 1)),
+                            truncated=jnp.ones((NUM_ADVERSARY_ENVS, 1)),
+                            infos={},
+                            timestep=(timestep // MAX_EPISODE_LENGTH),
+                            timesteps=(self.timesteps // MAX_EPISODE_LENGTH),
+                        )
+                    elif self.positioning_strategy == "regret_adversary":
+                        adversary_rewards = -1 * episode_rewards
+
+                        # update regret adversary state
+                        if regret_trials >= REGRET_EPISODES - 1:
+                            max_adversary_rewards = adversary_rewards
+                        else:
+                            max_adversary_rewards = jnp.maximum(max_adversary_rewards, adversary_rewards)
+                        total_adversary_rewards += adversary_rewards
+                        total_adversary_penalty += range_penalty
+
+                        # unsure about assignment of states and next_states
+                        if regret_trials <= 0:
+                            mean_adversary_rewards = total_adversary_rewards / self.regret_rollouts
+                            mean_adversary_penalty = total_adversary_penalty / self.regret_rollouts
+                            self.adversary.record_transition(
+                                states=rand_state,
+                                actions=adversary_action,
+                                rewards=(max_adversary_rewards - mean_adversary_rewards - mean_adversary_penalty),
+                                next_states=rand_state,
+                                terminated=jnp.ones((NUM_ENVS, 1)),
+                                truncated=jnp.ones((NUM_ENVS, 1)),
+                                infos={},
+                                timestep=(timestep // MAX_EPISODE_LENGTH // REGRET_EPISODES),
+                                timesteps=(self.timesteps // MAX_EPISODE_LENGTH // REGRET_EPISODES),
+                            )
+                    else:
+                        adversary_rewards = (-1 * episode_rewards) - range_penalty
+                        self.adversary.record_transition(
+                            states=rand_state,
+                            actions=adversary_action,
+                            rewards=adversary_rewards,
+                            next_states=rand_state,
+                            terminated=jnp.ones((NUM_ENVS, 1)),
+                            truncated=jnp.ones((NUM_ENVS, 1)),
+                            infos={},
+                            timestep=(timestep // MAX_EPISODE_LENGTH),
+                            timesteps=(self.timesteps // MAX_EPISODE_LENGTH),
+                        )
+
+                    # adversary post interaction
+                    if self.positioning_strategy == "regret_adversary":
+                        if regret_trials <= 0:
+                            self.adversary.post_interaction(
+                                timestep=(timestep // MAX_EPISODE_LENGTH // REGRET_EPISODES),
+                                timesteps=(self.timesteps // MAX_EPISODE_LENGTH // REGRET_EPISODES)
+                            )
+
+                            max_adversary_rewards = jnp.zeros((NUM_ENVS, 1))
+                            total_adversary_rewards = jnp.zeros((NUM_ENVS, 1))
+                            total_adversary_penalty = jnp.zeros((NUM_ENVS, 1))
+                    else:
+                        self.adversary.post_interaction(
+                            timestep=(timestep // MAX_EPISODE_LENGTH),
+                            timesteps=(self.timesteps // MAX_EPISODE_LENGTH)
+                        )
+
+                # log adversary data as necessary
+                if self.log_training:
+                    host_copier.copy(
+                        "adversary_action", self._isaaclab_env().adversary_action, training_logs["adversary_action_log"].append
+                    )
+                    if self.adversary_active:
+                        host_copier.copy(
+                            "adversary_reward",
+                            _jax2torch(adversary_rewards.flatten(), ENV_DEVICE),
+                            training_logs["adversary_reward_log"].append,
+                        )
+
+            # post-episode cleanup
+            if timestep % MAX_EPISODE_LENGTH == MAX_EPISODE_LENGTH - 1:
+                # log protagonist reward data as necessary
+                if self.log_training:
+                    host_copier.copy(
+                        "protagonist_successmap",
+                        infos["log"]["success_map"],
+                        training_logs["protagonist_successmap_log"].append,
+                    )
+
+                # append protagonist actions to the bc dataset at end of every episode
+                # (by the copier thread once the episode's actions have been copied to the host)
+                if self.train_mode == "bc_datacollect":
+                    host_copier.call(functools.partial(bc_dataset.append_actions, protagonist_action_buffer))
+                    protagonist_action_buffer = []
+
+        # wait for the pending copies and dump adversary logs
+        host_copier.close()
+        if bc_prefetcher is not None:
+            bc_prefetcher.close()
+        if bc_dataset is not None:
+            bc_dataset.close()
+            logger.info(f"Behavior cloning dataset ({len(bc_dataset)} episodes) dumped to file")
+        if self.log_training:
+            self._close_training_logs(training_logs)
+
     def single_agent_eval(self) -> None:
         """Evaluate agent
 
@@ -418,3 +881,108 @@ class Trainer:
             else:
                 states = next_states
                 shared_states = shared_next_states
+
+    def _sample_rand_state(self) -> jax.Array:
+        """Sample the noise vectors the adversary is conditioned on
+
+        :return: Noise vectors. Shape is (number of adversary environments, number of adversary inputs)
+        :rtype: jax.Array
+        """
+        self._key, subkey = jax.random.split(self._key)
+        return jax.random.normal(subkey, (self.adversary_num_envs, self.adversary_num_inputs))
+
+    def _create_positioning_strategy(self, bc_positions: Optional[np.ndarray] = None) -> PositioningStrategy:
+        """Create the positioning strategy that samples the adversary actions (placements)
+
+        :param bc_positions: Behavior cloning positions, used in ``bc_train`` mode (default: ``None``)
+        :type bc_positions: np.ndarray, optional
+
+        :raises ValueError: If the positioning strategy is not registered
+
+        :return: Positioning strategy
+        :rtype: skrl.trainers.jax.positioning.PositioningStrategy
+        """
+        return create_positioning_strategy(
+            "behavior_cloning" if self.train_mode == "bc_train" else self.positioning_strategy,
+            num_envs=self.env.num_envs,
+            action_size=self._isaaclab_env().adversary_action.shape[-1],
+            cfg={
+                "adversary": self.adversary,
+                "max_episode_length": self._isaaclab_env().max_episode_length,
+                "timesteps": self.timesteps,
+                "regret_rollouts": self.regret_rollouts,
+                "regret_parallel": self.regret_parallel,
+                "positions": bc_positions,
+            },
+        )
+
+    def _open_bc_data(self, max_episode_length: int) -> Tuple[np.ndarray, EpisodePrefetcher]:
+        """Open the behavior cloning positions and actions
+
+        See :py:meth:`skrl.trainers.torch.Trainer._open_bc_data`
+
+        :param max_episode_length: Episode length
+        :type max_episode_length: int
+
+        :raises ValueError: If no positions are available
+
+        :return: Positions of all the episodes and prefetcher of the episodes' actions
+        :rtype: tuple of np.ndarray and skrl.utils.bc_dataset.EpisodePrefetcher
+        """
+        start = self.initial_timestep // max_episode_length
+        if BCDatasetReader.is_dataset(self.train_actions_path):
+            dataset = BCDatasetReader(self.train_actions_path)
+            load_actions = dataset.load_actions
+            positions = dataset.positions() if self.train_positions_path is None else None
+        else:
+            load_actions = lambda episode: np.load(
+                os.path.join(self.train_actions_path, f"protagonist_action_log_{episode}.npy")
+            )
+            positions = None
+        if positions is None:
+            if self.train_positions_path is None:
+                raise ValueError("Behavior cloning positions are not provided (train_positions_path)")
+            positions = np.load(self.train_positions_path)
+        return positions, EpisodePrefetcher(load_actions, start=start, num_prefetch=2)
+
+    def _open_training_logs(self) -> dict:
+        """Open the streaming stores of the adversary/protagonist training logs
+
+        See :py:meth:`skrl.trainers.torch.Trainer._open_training_logs`
+
+        :return: Stores indexed by log name
+        :rtype: dict of skrl.utils.chunk_store.ChunkedArrayWriter
+        """
+        directory = os.path.join(self.agents.experiment_dir, "training_logs")
+        return {
+            name: ChunkedArrayWriter(
+                os.path.join(directory, name), chunk_size=self.log_chunk_size, flush_interval=self.log_flush_interval
+            )
+            for name in ["adversary_action_log", "adversary_reward_log", "protagonist_successmap_log"]
+        }
+
+    def _close_training_logs(self, training_logs: dict) -> None:
+        """Flush the streaming stores and export each log to a single ``.npy`` file next to its store
+
+        :param training_logs: Stores indexed by log name
+        :type training_logs: dict of skrl.utils.chunk_store.ChunkedArrayWriter
+        """
+        for name, writer in training_logs.items():
+            writer.close()
+            path = os.path.join(os.path.dirname(writer.directory), f"{name}.npy")
+            if len(writer):
+                ChunkedArrayReader(writer.directory).export_npy(path)
+            else:
+                np.save(path, np.array([]))
+            logger.info(f"Training log {name} dumped to file")
+
+    def _isaaclab_env(self) -> Wrapper:
+        """Get the Isaac Lab environment through all the wrappers
+
+        :return: Environment
+        :rtype: AdversarialManagerBasedRLEnv
+        """
+        res = self.env._env.env
+        if hasattr(res, "env"):
+            res = res.env
+        return res
@@ -0,0 +1,274 @@
+from typing import Callable, Dict, Optional, Type
+
+import functools
+
+import jax
+import jax.numpy as jnp
+
+from skrl import config
+
+
+POSITIONING_STRATEGIES: Dict[str, Type["PositioningStrategy"]] = {}
+
+
+def register_positioning_strategy(name: str) -> Callable[[Type["PositioningStrategy"]], Type["PositioningStrategy"]]:
+    """Register a positioning strategy class under the given name
+
+    :param name: Name of the strategy (e.g.: value of the ``--positioning`` command line argument)
+    :type name: str
+
+    :raises ValueError: If a strategy is already registered under the given name
+
+    :return: Class decorator
+    :rtype: callable
+
+    Example::
+
+        >>> @register_positioning_strategy("center")
+        ... class CenterStrategy(PositioningStrategy):
+        ...     def _sample(self, rand_state, timestep, rewards, regret_trials):
+        ...         return jnp.zeros_like(self.actions)
+    """
+
+    def decorator(cls: Type["PositioningStrategy"]) -> Type["PositioningStrategy"]:
+        if name in POSITIONING_STRATEGIES:
+            raise ValueError(f"Positioning strategy already registered: {name}")
+        POSITIONING_STRATEGIES[name] = cls
+        return cls
+
+    return decorator
+
+
+def create_positioning_strategy(
+    name: str, num_envs: int, action_size: int, cfg: Optional[dict] = None
+) -> "PositioningStrategy":
+    """Instantiate a registered positioning strategy
+
+    :param name: Name of the strategy
+    :type name: str
+    :param num_envs: Number of environments
+    :type num_envs: int
+    :param action_size: Size of the adversary action (placement)
+    :type action_size: int
+    :param cfg: Strategy configuration (default: ``None``). See :py:class:`PositioningStrategy`
+    :type cfg: dict, optional
+
+    :raises ValueError: If no strategy is registered under the given name
+
+    :return: Positioning strategy
+    :rtype: PositioningStrategy
+    """
+    if name not in POSITIONING_STRATEGIES:
+        raise ValueError(f"Invalid positioning strategy: {name}")
+    return POSITIONING_STRATEGIES[name](num_envs=num_envs, action_size=action_size, cfg=cfg)
+
+
+# https://jax.readthedocs.io/en/latest/faq.html#strategy-1-jit-compiled-helper-function
+@functools.partial(jax.jit, static_argnames=("shape", "restricted"))
+def _uniform_placements(key, shape, restricted):
+    if restricted:
+        # y direction is stretched to range [-1,1], x direction is unchanged in [0,1]
+        placements = jax.random.uniform(key, shape, minval=0, maxval=1)
+        return placements.at[:, 0].set(placements[:, 0] * 2 - 1)
+    return jax.random.uniform(key, shape, minval=-1, maxval=1)
+
+
+@jax.jit
+def _boosted_placements(key, previous, rewards):
+    # perturb and re-learn from past placement if agent performed poorly
+    noise = jax.random.uniform(key, previous.shape, minval=-1, maxval=1)
+    mask = (rewards < jnp.median(rewards)).reshape(-1, 1)
+    return jnp.where(mask, previous + noise * 0.05, noise)
+
+
+class PositioningStrategy:
+    def __init__(self, num_envs: int, action_size: int, cfg: Optional[dict] = None) -> None:
+        """Base class of the strategies that sample the adversary action (placement of the objects)
+
+        JAX counterpart of :py:class:`skrl.trainers.torch.positioning.PositioningStrategy`.
+        Arrays are immutable, so :py:meth:`sample` returns new placements (also kept in :py:attr:`actions`)
+        for all the environments, computed by jit-compiled functions. Subclasses implement :py:meth:`_sample`
+
+        :param num_envs: Number of environments
+        :type num_envs: int
+        :param action_size: Size of the adversary action (placement)
+        :type action_size: int
+        :param cfg: Strategy configuration (default: ``None``). Supported keys, used by the strategies that need them:
+                    ``adversary`` (adversary agent), ``max_episode_length`` (environment episode length),
+                    ``timesteps`` (training timesteps), ``regret_rollouts`` (episodes per regret estimate),
+                    ``regret_parallel`` (whether the regret rollouts run in parallel groups of environments),
+                    ``positions`` (behavior cloning positions) and ``key`` (PRNG key, default: ``config.jax.key``)
+        :type cfg: dict, optional
+        """
+        self.num_envs = num_envs
+        self.action_size = action_size
+        self.cfg = cfg if cfg is not None else {}
+
+        self.actions = jnp.zeros((num_envs, action_size))
+        self._key = self.cfg.get("key", None)
+        if self._key is None:
+            self._key = config.jax.key
+
+    def sample(
+        self,
+        rand_state: Optional[jax.Array] = None,
+        timestep: int = 0,
+        rewards: Optional[jax.Array] = None,
+        regret_trials: int = 0,
+    ) -> jax.Array:
+        """Sample new placements for all the environments
+
+        :param rand_state: Noise vectors the adversary is conditioned on (default: ``None``)
+        :type rand_state: jax.Array, optional
+        :param timestep: Current training timestep (default: ``0``)
+        :type timestep: int, optional
+        :param rewards: Rewards of the last episode, for all environments (default: ``None``)
+        :type rewards: jax.Array, optional
+        :param regret_trials: Remaining replays of the current placement for regret estimation (default: ``0``)
+        :type regret_trials: int, optional
+
+        :return: Placements of all the environments (:py:attr:`actions`)
+        :rtype: jax.Array
+        """
+        self.actions = self._sample(rand_state, timestep, rewards, regret_trials)
+        return self.actions
+
+    def _sample(
+        self,
+        rand_state: Optional[jax.Array],
+        timestep: int,
+        rewards: Optional[jax.Array],
+        regret_trials: int,
+    ) -> jax.Array:
+        """Compute the placements of all the environments
+
+        See :py:meth:`sample` for the parameters
+
+        :raises NotImplementedError: Not implemented
+        """
+        raise NotImplementedError
+
+    def _next_key(self) -> jax.Array:
+        """Split the strategy's PRNG key and return a new subkey"""
+        self._key, subkey = jax.random.split(self._key)
+        return subkey
+
+    def _cfg(self, key: str):
+        """Get a required configuration value
+
+        :param key: Configuration key
+        :type key: str
+
+        :raises ValueError: If the key is not configured
+        """
+        if self.cfg.get(key) is None:
+            raise ValueError(f"The {type(self).__name__} positioning strategy requires the '{key}' configuration")
+        return self.cfg[key]
+
+
+@register_positioning_strategy("domain_rand")
+class DomainRandStrategy(PositioningStrategy):
+    def _sample(self, rand_state, timestep, rewards, regret_trials) -> jax.Array:
+        # randomly sample every action dimension from -1 to 1
+        return _uniform_placements(self._next_key(), self.actions.shape, False)
+
+
+@register_positioning_strategy("domain_rand_restricted")
+class DomainRandRestrictedStrategy(PositioningStrategy):
+    def _sample(self, rand_state, timestep, rewards, regret_trials) -> jax.Array:
+        # randomly sample every action dimension from a subrange smaller than -1 to 1
+        return _uniform_placements(self._next_key(), self.actions.shape, True)
+
+
+@register_positioning_strategy("boosting_adversary")
+class BoostingStrategy(PositioningStrategy):
+    def _sample(self, rand_state, timestep, rewards, regret_trials) -> jax.Array:
+        """Boost the placements that the agent performs poorly on
+
+        Placements of environments whose reward is below the median are perturbed instead of resampled
+        """
+        if timestep > 0 and rewards is not None:
+            return _boosted_placements(self._next_key(), self.actions, rewards)
+        return _uniform_placements(self._next_key(), self.actions.shape, False)
+
+
+@register_positioning_strategy("pure_adversary")
+class PureAdversaryStrategy(PositioningStrategy):
+    def __init__(self, num_envs: int, action_size: int, cfg: Optional[dict] = None) -> None:
+        """Sample placements from the adversary policy, updated every episode
+
+        The adversary's policy is jit-compiled by the agent's initialization
+
+        See :py:class:`PositioningStrategy` for the parameters
+        """
+        super().__init__(num_envs, action_size, cfg)
+        self.adversary = self._cfg("adversary")
+        self.max_episode_length = self._cfg("max_episode_length")
+        self.timesteps = self.cfg.get("timesteps", 0)
+        self.episodes_per_update = 1
+
+    def _act(self, rand_state: jax.Array, timestep: int) -> jax.Array:
+        """Compute the adversary policy's actions
+
+        :param rand_state: Noise vectors the adversary is conditioned on
+        :type rand_state: jax.Array
+        :param timestep: Current training timestep
+        :type timestep: int
+
+        :return: Actions
+        :rtype: jax.Array
+        """
+        adversary_timestep = (timestep + 1) // self.max_episode_length // self.episodes_per_update
+        adversary_timesteps = self.timesteps // self.max_episode_length // self.episodes_per_update
+
+        # pre interaction for the adversary
+        self.adversary.pre_interaction(timestep=adversary_timestep, timesteps=adversary_timesteps)
+
+        # choose an action from a purely adversarial network
+        return self.adversary.act(rand_state, timestep=adversary_timestep, timesteps=adversary_timesteps)[0]
+
+    def _sample(self, rand_state, timestep, rewards, regret_trials) -> jax.Array:
+        return jnp.asarray(self._act(rand_state, timestep))
+
+
+@register_positioning_strategy("regret_adversary")
+class RegretAdversaryStrategy(PureAdversaryStrategy):
+    def __init__(self, num_envs: int, action_size: int, cfg: Optional[dict] = None) -> None:
+        """Sample placements from the adversary policy, each one evaluated for ``regret_rollouts`` episodes
+
+        With ``regret_parallel``, the rollouts of a placement run at the same time in a group of
+        ``regret_rollouts`` consecutive environments: the adversary acts once per group (``rand_state`` has
+        one row per group) and every environment of a group gets the group's placement.
+        Otherwise, the placement is kept (not resampled) while ``regret_trials`` is positive
+
+        See :py:class:`PositioningStrategy` for the parameters
+        """
+        super().__init__(num_envs, action_size, cfg)
+        self.regret_rollouts = self.cfg.get("regret_rollouts", 1)
+        self.regret_parallel = self.cfg.get("regret_parallel", False)
+        self.episodes_per_update = 1 if self.regret_parallel else self.regret_rollouts
+
+    def _sample(self, rand_state, timestep, rewards, regret_trials) -> jax.Array:
+        if regret_trials > 0:
+            # keep the current placement
+            return self.actions
+        actions = jnp.asarray(self._act(rand_state, timestep))
+        if self.regret_parallel:
+            # every environment of a group gets the group's placement
+            return jnp.repeat(actions, self.regret_rollouts, axis=0)
+        return actions
+
+
+@register_positioning_strategy("behavior_cloning")
+class BehaviorCloningStrategy(PositioningStrategy):
+    def __init__(self, num_envs: int, action_size: int, cfg: Optional[dict] = None) -> None:
+        """Replay the placements of a behavior cloning dataset, one set of placements per episode
+
+        See :py:class:`PositioningStrategy` for the parameters
+        """
+        super().__init__(num_envs, action_size, cfg)
+        self.positions = self._cfg("positions")
+        self.max_episode_length = self._cfg("max_episode_length")
+
+    def _sample(self, rand_state, timestep, rewards, regret_trials) -> jax.Array:
+        return jnp.asarray(self.positions[(timestep + 1) // self.max_episode_length])
@@ -21,6 +21,7 @@ SEQUENTIAL_TRAINER_DEFAULT_CONFIG = {
     "close_environment_at_exit": True,   # whether to close the environment on normal program termination
     "environment_info": "episode",       # key used to get and log environment info
     "stochastic_evaluation": False,      # whether to use actions rather than (deterministic) mean actions during evaluation
+    "adversarial_training": False,       # (experimental) whether to run the adversarial training loop (Isaac Lab environments)
 }
 # [end-config-dict-jax]
 # fmt: on
@@ -1,4 +1,5 @@
 from skrl.trainers.torch.base import Trainer, generate_equally_spaced_scopes  # isort:skip
+from skrl.trainers.torch.positioning import PositioningStrategy, register_positioning_strategy  # isort:skip
 
 from skrl.trainers.torch.parallel import ParallelTrainer
 from skrl.trainers.torch.sequential import SequentialTrainer
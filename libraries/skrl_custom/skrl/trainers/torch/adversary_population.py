@@ -0,0 +1,202 @@
+from typing import Any, List, Mapping, Optional, Tuple, Union
+
+import copy
+
+import torch
+from torch.distributions import Normal
+
+from skrl.agents.torch import Agent
+from skrl.models.torch import Model
+
+
+class _PolicyCompute(torch.nn.Module):
+    def __init__(self, model: Model) -> None:
+        """Module whose forward pass is the model's ``compute`` method for the ``"policy"`` role
+
+        :param model: Model
+        :type model: skrl.models.torch.Model
+        """
+        super().__init__()
+        self.model = model
+
+    def forward(self, states: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        mean_actions, log_std, _ = self.model.compute({"states": states}, role="policy")
+        return mean_actions, log_std
+
+
+class AdversaryPopulation:
+    def __init__(self, members: List[Agent]) -> None:
+        """Population of adversary agents, each one acting on (and learning from) a slice of the environments
+
+        The environments handled by the population are split into as many equally sized contiguous slices as
+        members. Each member has its own memory (whose number of environments must be the slice size) and is updated
+        independently, while the population exposes the interface of a single agent (``pre_interaction``, ``act``,
+        ``record_transition``, ``post_interaction``) over all the environments.
+
+        Gaussian policies are evaluated for all the members at once by stacking their parameters
+        and vectorizing (``torch.func.vmap``) the forward pass over the members
+
+        :param members: Initialized agents (e.g. PPO) with the same model architecture
+        :type members: list of skrl.agents.torch.Agent
+
+        :raises ValueError: If the population is empty or if the members' memories have different number of environments
+        """
+        if not members:
+            raise ValueError("The adversary population must have at least one member")
+        num_envs = [member.memory.num_envs for member in members]
+        if len(set(num_envs)) != 1:
+            raise ValueError(f"The members' memories must have the same number of environments (got {num_envs})")
+
+        self.members = members
+        self.num_members = len(members)
+        self.slice_size = num_envs[0]
+        self.num_envs = self.num_members * self.slice_size
+        self.scopes = [(i * self.slice_size, (i + 1) * self.slice_size) for i in range(self.num_members)]
+
+        self._current_log_prob = None
+
+        # stateless copy of the policy used as the template of the vectorized forward pass
+        self._policy_template = _PolicyCompute(copy.deepcopy(members[0].policy).to("meta"))
+
+    def pre_interaction(self, timestep: int, timesteps: int) -> None:
+        """Callback called before the interaction with the environment
+
+        :param timestep: Current timestep
+        :type timestep: int
+        :param timesteps: Number of timesteps
+        :type timesteps: int
+        """
+        for member in self.members:
+            member.pre_interaction(timestep=timestep, timesteps=timesteps)
+
+    def act(
+        self, states: torch.Tensor, timestep: int, timesteps: int
+    ) -> Tuple[torch.Tensor, Optional[torch.Tensor], Mapping[str, Union[torch.Tensor, Any]]]:
+        """Process the environment's states to make a decision (actions) using the members' policies
+
+        :param states: Environment's states. Shape is (number of environments, observation size)
+        :type states: torch.Tensor
+        :param timestep: Current timestep
+        :type timestep: int
+        :param timesteps: Number of timesteps
+        :type timesteps: int
+
+        :return: Actions of all the environments, log of the probability density function and model outputs
+        :rtype: tuple of torch.Tensor, torch.Tensor or None, and dict
+        """
+        first_member = self.members[0]
+        # members that are still sampling random actions (or non-Gaussian policies) act one after the other
+        if timestep < first_member._random_timesteps or not hasattr(first_member.policy, "_g_clip_log_std"):
+            return self._act_sequentially(states, timestep, timesteps)
+
+        states = states.to(first_member.device).view(self.num_members, self.slice_size, -1)
+        states = torch.stack([member._state_preprocessor(s) for member, s in zip(self.members, states)])
+
+        # evaluate all the members' policies in a single vectorized forward pass
+        params, buffers = torch.func.stack_module_state([member.policy for member in self.members])
+        params = {f"model.{name}": value for name, value in params.items()}
+        buffers = {f"model.{name}": value for name, value in buffers.items()}
+
+        def compute(params, buffers, states):
+            return torch.func.functional_call(self._policy_template, (params, buffers), (states,))
+
+        with torch.autocast(device_type=first_member._device_type, enabled=first_member._mixed_precision):
+            mean_actions, log_std = torch.func.vmap(compute)(params, buffers, states)
+
+            # sample the actions as skrl.models.torch.GaussianMixin.act does
+            policy = first_member.policy
+            if policy._g_clip_log_std:
+                log_std = torch.clamp(log_std, policy._g_log_std_min, policy._g_log_std_max)
+            distribution = Normal(mean_actions, log_std.exp().view(self.num_members, 1, -1))
+            actions = distribution.rsample()
+            if policy._g_clip_actions:
+                actions = torch.clamp(actions, min=policy._g_clip_actions_min, max=policy._g_clip_actions_max)
+            log_prob = distribution.log_prob(actions)
+            if policy._g_reduction is not None:
+                log_prob = policy._g_reduction(log_prob, dim=-1)
+            if log_prob.dim() != actions.dim():
+                log_prob = log_prob.unsqueeze(-1)
+
+        actions, log_prob = actions.view(self.num_envs, -1), log_prob.view(self.num_envs, -1)
+        self._current_log_prob = log_prob
+        return actions, log_prob, {"mean_actions": mean_actions.view(self.num_envs, -1)}
+
+    def record_transition(
+        self,
+        states: torch.Tensor,
+        actions: torch.Tensor,
+        rewards: torch.Tensor,
+        next_states: torch.Tensor,
+        terminated: torch.Tensor,
+        truncated: torch.Tensor,
+        infos: Any,
+        timestep: int,
+        timesteps: int,
+        log_prob: Optional[torch.Tensor] = None,
+    ) -> None:
+        """Record the environments' transitions, each slice in the memory of its member
+
+        If ``log_prob`` is ``None``, the log probabilities of the actions computed by the last call
+        to :py:meth:`act` are used
+
+        See :py:meth:`skrl.agents.torch.ppo.PPO.record_transition` for the parameters
+        """
+        if log_prob is None:
+            log_prob = self._current_log_prob
+        for member, (start, stop) in zip(self.members, self.scopes):
+            member.record_transition(
+                states=states[start:stop],
+                actions=actions[start:stop],
+                rewards=rewards[start:stop],
+                next_states=next_states[start:stop],
+                terminated=terminated[start:stop],
+                truncated=truncated[start:stop],
+                infos=infos,
+                timestep=timestep,
+                timesteps=timesteps,
+                log_prob=None if log_prob is None else log_prob[start:stop],
+            )
+
+    def post_interaction(self, timestep: int, timesteps: int) -> None:
+        """Callback called after the interaction with the environment (members are updated independently)
+
+        :param timestep: Current timestep
+        :type timestep: int
+        :param timesteps: Number of timesteps
+        :type timesteps: int
+        """
+        for member in self.members:
+            member.post_interaction(timestep=timestep, timesteps=timesteps)
+
+    def state_dict(self) -> Mapping[str, Any]:
+        """Get the state of the members (see :py:meth:`skrl.agents.torch.Agent.state_dict`)
+
+        :return: Members' states, indexed by the member index (as string)
+        :rtype: dict
+        """
+        return {str(i): member.state_dict() for i, member in enumerate(self.members)}
+
+    def load_state_dict(self, state_dict: Mapping[str, Any]) -> None:
+        """Load the state of the members (see :py:meth:`state_dict`)
+
+        :param state_dict: Members' states, indexed by the member index (as string)
+        :type state_dict: dict
+        """
+        for i, member in enumerate(self.members):
+            member.load_state_dict(state_dict[str(i)])
+
+    def _act_sequentially(
+        self, states: torch.Tensor, timestep: int, timesteps: int
+    ) -> Tuple[torch.Tensor, Optional[torch.Tensor], Mapping[str, Union[torch.Tensor, Any]]]:
+        """Make a decision with each member for its slice of the environments, one member after the other
+
+        See :py:meth:`act` for the parameters and return value
+        """
+        outputs = [
+            member.act(states[start:stop], timestep=timestep, timesteps=timesteps)
+            for member, (start, stop) in zip(self.members, self.scopes)
+        ]
+        actions = torch.cat([output[0] for output in outputs])
+        log_prob = None if outputs[0][1] is None else torch.cat([output[1] for output in outputs])
+        self._current_log_prob = log_prob
+        return actions, log_prob, {}
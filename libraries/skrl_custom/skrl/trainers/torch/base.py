@@ -1,6 +1,7 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import atexit
+import functools
 import sys
 import tqdm
 
@@ -16,6 +17,11 @@ from skrl.envs.wrappers.torch import Wrapper
 from skrl.agents.torch.ppo import PPO
 from skrl.models.torch import Model, GaussianMixin, DeterministicMixin
 from skrl.memories.torch import RandomMemory
+from skrl.trainers.torch.adversary_population import AdversaryPopulation
+from skrl.trainers.torch.positioning import PositioningStrategy, create_positioning_strategy
+from skrl.utils.bc_dataset import BCDatasetReader, BCDatasetWriter, EpisodePrefetcher
+from skrl.utils.chunk_store import ChunkedArrayReader, ChunkedArrayWriter
+from skrl.utils.host_copy import AsyncHostCopier
 
 
 # TODO: find better way to import this without hard coding it here
@@ -43,6 +49,7 @@ class SharedModel(GaussianMixin, DeterministicMixin, Model):
 
         # Shared value is 0
         self._shared_output = None
+        self._shared_states = None
 
     # override the .act(...) method to disambiguate its call
     def act(self, inputs, role):
@@ -54,13 +61,20 @@ class SharedModel(GaussianMixin, DeterministicMixin, Model):
     # forward the input to compute model output according to the specified role
     def compute(self, inputs, role):
         if role == "policy":
-            # save shared layers/network output to perform a single forward-pass
+            # save shared layers/network output (and its states) to perform a single forward-pass
             self._shared_output = self.net(inputs["states"])
+            self._shared_states = inputs["states"]
             return self.mean_layer(self._shared_output), self.log_std_parameter, {}
         elif role == "value":
-            # use saved shared layers/network output to perform a single forward-pass, if it was saved
-            shared_output = self.net(inputs["states"]) if self._shared_output is None else self._shared_output
-            self._shared_output = None  # reset saved shared output to prevent the use of erroneous data in subsequent steps
+            # use saved shared layers/network output to perform a single forward-pass, if it was saved for the same states
+            # (with asynchronous resets, the policy is also called on the placements sampled for a subset of environments)
+            if self._shared_output is not None and inputs["states"] is self._shared_states:
+                shared_output = self._shared_output
+            else:
+                shared_output = self.net(inputs["states"])
+            # reset saved shared output to prevent the use of erroneous data in subsequent steps
+            self._shared_output = None
+            self._shared_states = None
             return self.value_layer(shared_output), {}
 
 def generate_equally_spaced_scopes(num_envs: int, num_simultaneous_agents: int) -> List[int]:
@@ -117,6 +131,8 @@ class Trainer:
         self.close_environment_at_exit = self.cfg.get("close_environment_at_exit", True)
         self.environment_info = self.cfg.get("environment_info", "episode")
         self.stochastic_evaluation = self.cfg.get("stochastic_evaluation", False)
+        self.log_chunk_size = self.cfg.get("log_chunk_size", 64)
+        self.log_flush_interval = self.cfg.get("log_flush_interval", 0)
 
         self.initial_timestep = 0
 
@@ -129,10 +145,41 @@ class Trainer:
         self.adversary_active = self.positioning_strategy == "pure_adversary" or self.positioning_strategy == "regret_adversary"
         self.log_training = True
         self.regret_rollouts = 5
+        self.regret_parallel = self.cfg.get("regret_parallel", False)
 
         self.train_mode = self._isaaclab_env().cfg.train_mode
         self.train_actions_path = self._isaaclab_env().cfg.train_actions_path
         self.train_positions_path = self._isaaclab_env().cfg.train_positions_path
+        self.async_reset = self._isaaclab_env().cfg.async_reset
+
+        # asynchronous resets sample placements per environment, which is incompatible with placements
+        # replayed in lockstep (regret estimation) or indexed by synchronized episodes (behavior cloning)
+        if self.async_reset:
+            if self.positioning_strategy == "regret_adversary":
+                raise ValueError("Asynchronous resets are not supported with the regret_adversary positioning strategy")
+            if self.train_mode != "train":
+                raise ValueError(f"Asynchronous resets are not supported in {self.train_mode} mode")
+
+        # parallel regret estimation runs each adversary placement at the same time in a group of
+        # regret_rollouts consecutive environments, instead of in regret_rollouts sequential episodes
+        if self.regret_parallel:
+            if self.positioning_strategy != "regret_adversary":
+                raise ValueError("Parallel regret estimation requires the regret_adversary positioning strategy")
+            if self.env.num_envs % self.regret_rollouts:
+                raise ValueError(
+                    f"The number of environments ({self.env.num_envs}) must be a multiple of the number of regret rollouts ({self.regret_rollouts}) for parallel regret estimation"
+                )
+        self.adversary_num_envs = self.env.num_envs // self.regret_rollouts if self.regret_parallel else self.env.num_envs
+
+        # adversary population: each member acts on (and learns from) its own slice of the adversary environments
+        self.adversary_population_size = self.cfg.get("adversary_population_size", 1)
+        if self.adversary_population_size > 1:
+            if self.adversary_num_envs % self.adversary_population_size:
+                raise ValueError(
+                    f"The number of adversary environments ({self.adversary_num_envs}) must be a multiple of the adversary population size ({self.adversary_population_size})"
+                )
+            if self.async_reset:
+                raise ValueError("Asynchronous resets are not supported with an adversary population")
 
         # disable learning for agent if we are just collecting data
         if self.train_mode == "bc_datacollect" or self.train_mode == "bc_train":
@@ -146,11 +193,6 @@ class Trainer:
         # setup adversary
         self.adversary_num_inputs = 4 # arbitrary number of inputs, is a noise vector to condition on
         num_outputs = (self._isaaclab_env().num_clutter_objects + 1) * 3 # clutter + main object
-        adversary_shared_model = SharedModel(self.adversary_num_inputs, num_outputs, device=env.device)
-        models = { # TODO: not sure if this is supposed to be shared
-            "policy": adversary_shared_model,
-            "value": adversary_shared_model
-        }
 
         adversary_rollouts = 1 if self.positioning_strategy == "regret_adversary" else self.regret_rollouts
         adversary_memsize = 25 // self.regret_rollouts if self.positioning_strategy == "regret_adversary" else 25
@@ -158,22 +200,35 @@ class Trainer:
             "rollouts": adversary_rollouts, # make it fair
             "learning_starts": adversary_memsize - 1, # subtracting 1 because of off-by-1 indexing in SKRL PPO
             "memory_size": adversary_memsize, # passed into RandomMemory manually, must be <= learning_starts
-            "learning_rate": 1e-4
+            "learning_rate": 1e-4,
+            "compile_update": self.cfg.get("adversary_compile_update", False) # compiled mini-batch update of the small adversary MLP
         }
 
-        self.adversary = PPO(
-            models=models,
-            device=env.device,
-            observation_space=self.adversary_num_inputs,
-            action_space=num_outputs,
-            memory=RandomMemory(
-                num_envs=self.env.num_envs,
-                memory_size=adversary_cfg["memory_size"],
-                device=env.device
-            ),
-            cfg=adversary_cfg
-        )
-        self.adversary.init()
+        adversaries = []
+        for _ in range(self.adversary_population_size):
+            adversary_shared_model = SharedModel(self.adversary_num_inputs, num_outputs, device=env.device)
+            models = { # TODO: not sure if this is supposed to be shared
+                "policy": adversary_shared_model,
+                "value": adversary_shared_model
+            }
+            adversary = PPO(
+                models=models,
+                device=env.device,
+                observation_space=self.adversary_num_inputs,
+                action_space=num_outputs,
+                memory=RandomMemory(
+                    num_envs=self.adversary_num_envs // self.adversary_population_size,
+                    memory_size=adversary_cfg["memory_size"],
+                    device=env.device
+                ),
+                cfg=adversary_cfg
+            )
+            adversary.init()
+            adversaries.append(adversary)
+        self.adversary = adversaries[0] if len(adversaries) == 1 else AdversaryPopulation(adversaries)
+        # save (and load) the adversary with the agent's checkpoints
+        if isinstance(self.agents, Agent):
+            self.agents.checkpoint_modules["adversary"] = self.adversary
 
         # register environment closing if configured
         if self.close_environment_at_exit:
@@ -283,117 +338,66 @@ class Trainer:
 
         # useful constants
         NUM_ENVS = self.env.num_envs
-        ADVERSARY_ACTION_SPACE = self._isaaclab_env().adversary_action.shape[-1]
         MAX_EPISODE_LENGTH = self._isaaclab_env().max_episode_length
-
-        # utility function to get an adversary action given the sampling strategy
-        def get_adversary_action(
-            rand_state: torch.Tensor,
-            device: torch.device,
-            timestep=0,
-            regret_trials=0,
-            rewards=None,
-            prev_action=None,
-            bc_positions=None
-        ) -> torch.Tensor:
-            result_action = None
-            if self.train_mode == "bc_train":
-                # Behavior cloning, use previous positions
-                assert bc_positions is not None, "Behavior cloning positions are not provided"
-                result_action = torch.from_numpy(bc_positions[(timestep+1) // MAX_EPISODE_LENGTH]).to(device)
-            elif self.positioning_strategy == "domain_rand":
-                # Randomly sample every action dimension from -1 to 1
-                result_action = torch.rand((NUM_ENVS, ADVERSARY_ACTION_SPACE), device=device) * 2 - 1
-            elif self.positioning_strategy == "domain_rand_restricted":
-                # Randomly sample every action dimension from a subrange smaller than -1 to 1
-                result_action = torch.rand((NUM_ENVS, ADVERSARY_ACTION_SPACE), device=device)
-                result_action[:,0] = result_action[:,0] * 2 - 1 # y direction is stretched to range [-1,1]
-                result_action[:,1] = result_action[:,1] # x direction is unchaged, in range [0,1]
-            elif self.positioning_strategy == "boosting_adversary":
-                # Boost samples that the agent performs poorly on
-                result_action = torch.rand((NUM_ENVS, ADVERSARY_ACTION_SPACE), device=device) * 2 - 1
-                if timestep > 0:
-                    # Perturb and re-learn from past action if agent performed poorly
-                    if rewards is not None and prev_action is not None:
-                        mask = (rewards < rewards.median()).flatten()
-                        if torch.sum(mask).item() > 0:
-                            result_action[mask] = prev_action[mask] + result_action[mask] * 0.05
-            elif self.positioning_strategy == "pure_adversary":
-                # Pre interaction for the adversary
-                self.adversary.pre_interaction(
-                    timestep=((timestep+1) // MAX_EPISODE_LENGTH),
-                    timesteps=(self.timesteps // MAX_EPISODE_LENGTH)
-                )
-
-                # Choose an action from a purely adversarial network
-                with torch.no_grad():
-                    result_action = self.adversary.act(
-                        rand_state,
-                        timestep=((timestep+1) // MAX_EPISODE_LENGTH),
-                        timesteps=(self.timesteps // MAX_EPISODE_LENGTH)
-                    )[0]
-            elif self.positioning_strategy == "regret_adversary":
-                if regret_trials <= 0:
-                    # Pre interaction for the adversary
-                    self.adversary.pre_interaction(
-                        timestep=((timestep+1) // MAX_EPISODE_LENGTH // self.regret_rollouts),
-                        timesteps=(self.timesteps // MAX_EPISODE_LENGTH // self.regret_rollouts)
-                    )
-
-                    # Choose an action from a purely adversarial network
-                    with torch.no_grad():
-                        result_action = self.adversary.act(
-                            rand_state,
-                            timestep=((timestep+1) // MAX_EPISODE_LENGTH // self.regret_rollouts),
-                            timesteps=(self.timesteps // MAX_EPISODE_LENGTH // self.regret_rollouts)
-                        )[0]
-                else:
-                    result_action = prev_action
-            else:
-                raise ValueError(f"Invalid positioning strategy: {self.positioning_strategy}")
-            return result_action
-
-        # initialize bc positions if applicable
-        bc_positions = np.load(self.train_positions_path) if self.train_mode == "bc_train" else None
+        NUM_ADVERSARY_ENVS = self.adversary_num_envs
+        # episodes per regret adversary transition: with parallel regret estimation the rollouts
+        # of a placement run at the same time, so the adversary gets a transition every episode
+        REGRET_EPISODES = 1 if self.regret_parallel else self.regret_rollouts
+
+        # reset each environment as soon as its episode ends
+        if self.async_reset:
+            self._single_agent_train_async(self._create_positioning_strategy())
+            return
+
+        # initialize bc positions and actions if applicable
+        bc_positions, bc_prefetcher, bc_dataset = None, None, None
+        if self.train_mode == "bc_train":
+            bc_positions, bc_prefetcher = self._open_bc_data(MAX_EPISODE_LENGTH)
+        elif self.train_mode == "bc_datacollect":
+            bc_dataset = BCDatasetWriter(
+                os.path.join(self.agents.experiment_dir, "training_logs", "bc_dataset"),
+                episodes_per_shard=self.cfg.get("bc_episodes_per_shard", 16),
+                metadata={"max_episode_length": MAX_EPISODE_LENGTH, "num_envs": NUM_ENVS},
+            )
+        positioning = self._create_positioning_strategy(bc_positions)
 
         # reset env
-        rand_state = torch.randn((NUM_ENVS, self.adversary_num_inputs), device=self.env.device)
-        adversary_action = get_adversary_action(rand_state, self.env.device, timestep=0, bc_positions=bc_positions)
+        rand_state = torch.randn((NUM_ADVERSARY_ENVS, self.adversary_num_inputs), device=self.env.device)
+        adversary_action = positioning.sample(rand_state=rand_state, timestep=0)
         episode_rewards = torch.zeros((NUM_ENVS, 1), device=self.env.device)
 
         self._isaaclab_env().adversary_action = adversary_action
         states, infos = self.env.reset()
 
         # set up regret adversary state, if applicable
-        regret_trials = self.regret_rollouts - 1
+        regret_trials = REGRET_EPISODES - 1
         max_adversary_rewards = torch.zeros((NUM_ENVS, 1), device=self.env.device)
         total_adversary_rewards = torch.zeros((NUM_ENVS, 1), device=self.env.device)
         total_adversary_penalty = torch.zeros((NUM_ENVS, 1), device=self.env.device)
 
         # start training loop
-        adversary_action_log = []
-        adversary_reward_log = []
-        protagonist_successmap_log = []
+        training_logs = self._open_training_logs() if self.log_training else {}
+        host_copier = AsyncHostCopier()
         protagonist_action_buffer = []
         for timestep in tqdm.tqdm(
             range(self.initial_timestep, self.timesteps), disable=self.disable_progressbar, file=sys.stdout
         ):
             # reset buffer at start of episode if we are behavior cloning expert actions
+            # (the episode has been loaded in the background while the previous one was running)
             if timestep % MAX_EPISODE_LENGTH == 0 and self.train_mode == "bc_train":
-                protagonist_action_buffer = np.load(os.path.join(self.train_actions_path, f"protagonist_action_log_{timestep // MAX_EPISODE_LENGTH}.npy"))
+                protagonist_action_buffer = torch.from_numpy(bc_prefetcher.get(timestep // MAX_EPISODE_LENGTH))
+                protagonist_action_buffer = protagonist_action_buffer.to(self.env.device)
+
+            # record the positions of the episode if we are collecting behavior cloning data
+            if timestep % MAX_EPISODE_LENGTH == 0 and self.train_mode == "bc_datacollect":
+                host_copier.copy("protagonist_position", adversary_action, bc_dataset.append_position)
 
             # take next action from adversary if at the end of an episode
             if timestep % MAX_EPISODE_LENGTH == MAX_EPISODE_LENGTH - 1:
                 if self.positioning_strategy != "regret_adversary" or regret_trials <= 0:
-                    rand_state = torch.randn((NUM_ENVS, self.adversary_num_inputs), device=self.env.device)
-                adversary_action = get_adversary_action(
-                    rand_state,
-                    self.env.device,
-                    timestep=timestep,
-                    regret_trials=regret_trials,
-                    rewards=rewards,
-                    prev_action=adversary_action,
-                    bc_positions=bc_positions
+                    rand_state = torch.randn((NUM_ADVERSARY_ENVS, self.adversary_num_inputs), device=self.env.device)
+                adversary_action = positioning.sample(
+                    rand_state=rand_state, timestep=timestep, rewards=rewards, regret_trials=regret_trials
                 )
                 self._isaaclab_env().adversary_action = adversary_action
 
@@ -401,7 +405,7 @@ class Trainer:
                 if self.positioning_strategy == "regret_adversary":
                     regret_trials -= 1
                     if regret_trials < 0:
-                        regret_trials += self.regret_rollouts
+                        regret_trials += REGRET_EPISODES
 
                 # reset episode rewards
                 episode_rewards = torch.zeros((NUM_ENVS, 1), device=self.env.device)
@@ -414,7 +418,7 @@ class Trainer:
                 actions = self.agents.act(states, timestep=timestep, timesteps=self.timesteps)[0]
 
                 # step the environments
-                bc_actions = torch.from_numpy(protagonist_action_buffer[timestep % MAX_EPISODE_LENGTH]).to(self.env.device)
+                bc_actions = protagonist_action_buffer[timestep % MAX_EPISODE_LENGTH]
                 with torch.no_grad():
                     next_states, rewards, terminated, truncated, infos = self.env.step(bc_actions)
                 
@@ -429,7 +433,7 @@ class Trainer:
 
                 # optimization step
                 bc_loss = torch.mean((bc_actions - actions) ** 2)
-                self.agents.track_data("Loss / BC MSE Loss", bc_loss.item())
+                self.agents.track_data("Loss / BC MSE Loss", bc_loss.detach())
                 
                 self.agent_optimizer.zero_grad()
                 self.agent_scaler.scale(bc_loss).backward()
@@ -446,7 +450,7 @@ class Trainer:
                     # compute actions
                     actions = self.agents.act(states, timestep=timestep, timesteps=self.timesteps)[0]
                     if self.train_mode == "bc_datacollect":
-                        protagonist_action_buffer.append(actions.cpu().numpy())
+                        host_copier.copy("protagonist_action", actions, protagonist_action_buffer.append)
 
                     # step the environments
                     next_states, rewards, terminated, truncated, infos = self.env.step(actions)
@@ -477,7 +481,7 @@ class Trainer:
                 if self.environment_info in infos:
                     for k, v in infos[self.environment_info].items():
                         if isinstance(v, torch.Tensor) and v.numel() == 1:
-                            self.agents.track_data(f"Info / {k}", v.item())
+                            self.agents.track_data(f"Info / {k}", v)
             
             # agents post interaction
             self.agents.post_interaction(timestep=timestep, timesteps=self.timesteps)
@@ -487,9 +491,6 @@ class Trainer:
             # due to software engineering limitations, we skip the last step of the episode, which is negligible
             states = next_states
             if timestep % MAX_EPISODE_LENGTH == MAX_EPISODE_LENGTH - 2:
-                # reset_env_ids is currently not used but it should be equivalent to range(NUM_ENVS)
-                reset_env_ids = self.env.reset_buf.nonzero(as_tuple=False).squeeze(-1)
-                
                 if self.adversary_active:
                     # update adversary
                     with torch.no_grad():                    
@@ -500,11 +501,28 @@ class Trainer:
                         ), dim=1, keepdim=True)
 
                         # compute reward, split by cases for different agents
-                        if self.positioning_strategy == "regret_adversary":
+                        if self.regret_parallel:
+                            # regret of each group: max minus mean over the group's rollouts of its placement
+                            grouped_adversary_rewards = (-1 * episode_rewards).view(NUM_ADVERSARY_ENVS, self.regret_rollouts)
+                            regret = grouped_adversary_rewards.amax(dim=1, keepdim=True) \
+                                - grouped_adversary_rewards.mean(dim=1, keepdim=True)
+                            adversary_rewards = regret - range_penalty[::self.regret_rollouts]
+                            self.adversary.record_transition(
+                                states=rand_state,
+                                actions=adversary_action[::self.regret_rollouts],
+                                rewards=adversary_rewards,
+                                next_states=rand_state,
+                                terminated=torch.ones((NUM_ADVERSARY_ENVS, 1), device=self.env.device),
+                                truncated=torch.ones((NUM_ADVERSARY_ENVS, 1), device=self.env.device),
+                                infos={},
+                                timestep=(timestep // MAX_EPISODE_LENGTH),
+                                timesteps=(self.timesteps // MAX_EPISODE_LENGTH),
+                            )
+                        elif self.positioning_strategy == "regret_adversary":
                             adversary_rewards = (-1 * episode_rewards)
 
                             # update regret adversary state
-                            if regret_trials >= self.regret_rollouts - 1:
+                            if regret_trials >= REGRET_EPISODES - 1:
                                 max_adversary_rewards = adversary_rewards.clone()
                             else:
                                 max_adversary_rewards = torch.maximum(max_adversary_rewards, adversary_rewards)
@@ -523,8 +541,8 @@ class Trainer:
                                     terminated=torch.ones(terminated.shape, device=self.env.device),
                                     truncated=torch.ones(truncated.shape, device=self.env.device),
                                     infos={},
-                                    timestep=(timestep // MAX_EPISODE_LENGTH // self.regret_rollouts),
-                                    timesteps=(self.timesteps // MAX_EPISODE_LENGTH // self.regret_rollouts),
+                                    timestep=(timestep // MAX_EPISODE_LENGTH // REGRET_EPISODES),
+                                    timesteps=(self.timesteps // MAX_EPISODE_LENGTH // REGRET_EPISODES),
                                 )
                         else:
                             adversary_rewards = (-1 * episode_rewards) - range_penalty
@@ -544,8 +562,8 @@ class Trainer:
                     if self.positioning_strategy == "regret_adversary":
                         if regret_trials <= 0:
                             self.adversary.post_interaction(
-                                timestep=(timestep // MAX_EPISODE_LENGTH // self.regret_rollouts),
-                                timesteps=(self.timesteps // MAX_EPISODE_LENGTH // self.regret_rollouts)
+                                timestep=(timestep // MAX_EPISODE_LENGTH // REGRET_EPISODES),
+                                timesteps=(self.timesteps // MAX_EPISODE_LENGTH // REGRET_EPISODES)
                             )
 
                             max_adversary_rewards = torch.zeros((NUM_ENVS, 1), device=self.env.device)
@@ -559,45 +577,231 @@ class Trainer:
                 
                 # log adversary data as necessary
                 if self.log_training:
-                    adversary_action_log.append(adversary_action.cpu().numpy())
+                    host_copier.copy("adversary_action", adversary_action, training_logs["adversary_action_log"].append)
                     if self.adversary_active:
-                        adversary_reward_log.append(adversary_rewards.flatten().cpu().numpy())
+                        host_copier.copy(
+                            "adversary_reward", adversary_rewards.flatten(), training_logs["adversary_reward_log"].append
+                        )
 
             # post-episode cleanup
             if timestep % MAX_EPISODE_LENGTH == MAX_EPISODE_LENGTH - 1:
                 # log protagonist reward data as necessary
                 if self.log_training:
-                    protagonist_successmap_log.append(infos["log"]["success_map"].cpu().numpy())
+                    host_copier.copy(
+                        "protagonist_successmap",
+                        infos["log"]["success_map"],
+                        training_logs["protagonist_successmap_log"].append,
+                    )
             
-                # dump protagonist action log to .npy file at end of every episode
+                # append protagonist actions to the bc dataset at end of every episode
+                # (by the copier thread once the episode's actions have been copied to the host)
                 if self.train_mode == "bc_datacollect":
-                    RESULT_DIR = os.path.join(self.agents.experiment_dir, "training_logs", "bc_actions")
-                    os.makedirs(RESULT_DIR, exist_ok=True)
-
-                    protagonist_action_buffer = np.array(protagonist_action_buffer)
-                    np.save(os.path.join(RESULT_DIR, f"protagonist_action_log_{timestep // MAX_EPISODE_LENGTH}.npy"), protagonist_action_buffer)
+                    host_copier.call(functools.partial(bc_dataset.append_actions, protagonist_action_buffer))
                     protagonist_action_buffer = []
 
-        # dump adversary logs
+        # wait for the pending (background) checkpoints and tracking data and dump adversary logs
+        self.agents.synchronize_writers()
+        host_copier.close()
+        if bc_prefetcher is not None:
+            bc_prefetcher.close()
+        if bc_dataset is not None:
+            bc_dataset.close()
+            logger.info(f"Behavior cloning dataset ({len(bc_dataset)} episodes) dumped to file")
         if self.log_training:
-            RESULT_DIR = os.path.join(self.agents.experiment_dir, "training_logs")
-            os.makedirs(RESULT_DIR, exist_ok=True)
+            self._close_training_logs(training_logs)
+
+    def _single_agent_train_async(self, positioning: PositioningStrategy) -> None:
+        """Train agent resetting each environment as soon as its episode ends
+
+        The environment queries a new adversary action for the environments it resets, while the episode
+        boundaries are tracked per environment from the terminated/truncated signals instead of the timestep.
+        Every finished placement (episode) is queued, and the adversary records the queued placements in its memory,
+        ``num_envs`` at a time (in the order the episodes finished), so environments that finish their episodes
+        sooner contribute more placements
+
+        :param positioning: Strategy that samples the adversary actions (placements) for the given environments
+        :type positioning: skrl.trainers.torch.positioning.PositioningStrategy
+        """
+        # useful constants
+        NUM_ENVS = self.env.num_envs
+        ADVERSARY_ACTION_SPACE = self._isaaclab_env().adversary_action.shape[-1]
+        MAX_EPISODE_LENGTH = self._isaaclab_env().max_episode_length
+        device = self.env.device
+
+        # placements of the running episodes and placements sampled for the episodes about to start
+        rand_state = torch.zeros((NUM_ENVS, self.adversary_num_inputs), device=device)
+        adversary_action = torch.zeros((NUM_ENVS, ADVERSARY_ACTION_SPACE), device=device)
+        adversary_log_prob = torch.zeros((NUM_ENVS, 1), device=device)
+        next_rand_state = torch.zeros_like(rand_state)
+        next_adversary_action = torch.zeros_like(adversary_action)
+        next_adversary_log_prob = torch.zeros_like(adversary_log_prob)
+        episode_rewards = torch.zeros((NUM_ENVS, 1), device=device)
+
+        # queue of the finished placements waiting to be recorded, with room for the placements
+        # of the environments that finish in the step that fills it (at most NUM_ENVS)
+        num_queued = 0
+        queued_rand_state = torch.zeros((2 * NUM_ENVS, self.adversary_num_inputs), device=device)
+        queued_adversary_action = torch.zeros((2 * NUM_ENVS, ADVERSARY_ACTION_SPACE), device=device)
+        queued_adversary_log_prob = torch.zeros((2 * NUM_ENVS, 1), device=device)
+        queued_adversary_rewards = torch.zeros((2 * NUM_ENVS, 1), device=device)
+        queued_successmap = torch.zeros(2 * NUM_ENVS, dtype=torch.bool, device=device)
+        queues = [
+            queued_rand_state,
+            queued_adversary_action,
+            queued_adversary_log_prob,
+            queued_adversary_rewards,
+            queued_successmap,
+        ]
+        adversary_timestep = 0
+        timestep = self.initial_timestep
+
+        # called by the environment when resetting the given environments
+        def sample_placements(env_ids: torch.Tensor) -> torch.Tensor:
+            next_rand_state[env_ids] = torch.randn((len(env_ids), self.adversary_num_inputs), device=device)
+            next_adversary_action[env_ids] = positioning.sample(
+                env_ids, rand_state=next_rand_state, timestep=timestep, rewards=episode_rewards
+            )[env_ids]
+            if self.adversary_active:
+                next_adversary_log_prob[env_ids] = positioning.log_prob
+            return next_adversary_action[env_ids]
+
+        def start_episodes(env_ids: torch.Tensor) -> None:
+            rand_state[env_ids] = next_rand_state[env_ids]
+            adversary_action[env_ids] = next_adversary_action[env_ids]
+            adversary_log_prob[env_ids] = next_adversary_log_prob[env_ids]
+            episode_rewards[env_ids] = 0
+
+        # reset env
+        self._isaaclab_env().adversary_action_sampler = sample_placements
+        states, infos = self.env.reset()
+        start_episodes(torch.arange(NUM_ENVS, device=device))
+
+        # start training loop
+        training_logs = self._open_training_logs() if self.log_training else {}
+        host_copier = AsyncHostCopier()
+        for timestep in tqdm.tqdm(
+            range(self.initial_timestep, self.timesteps), disable=self.disable_progressbar, file=sys.stdout
+        ):
+            # pre-interaction
+            self.agents.pre_interaction(timestep=timestep, timesteps=self.timesteps)
+
+            with torch.no_grad():
+                # compute actions
+                actions = self.agents.act(states, timestep=timestep, timesteps=self.timesteps)[0]
+
+                # step the environments (finished environments are reset with new placements)
+                next_states, rewards, terminated, truncated, infos = self.env.step(actions)
 
-            # dump adversary log to .npy file
-            adversary_action_log = np.array(adversary_action_log)
-            np.save(os.path.join(RESULT_DIR, "adversary_action_log.npy"), adversary_action_log)
-            logger.info("Adversary action log dumped to file")
+                # update episode rewards
+                episode_rewards = 0.98 * episode_rewards + rewards # Discount rewards
 
-            # dump adversary reward log to .npy file
-            adversary_reward_log = np.array(adversary_reward_log)
-            np.save(os.path.join(RESULT_DIR, "adversary_reward_log.npy"), adversary_reward_log)
-            logger.info("Adversary reward log dumped to file")
+                # render scene
+                if not self.headless:
+                    self.env.render()
 
-            # dump protagonist successmap log to .npy file
-            protagonist_successmap_log = np.array(protagonist_successmap_log)
-            np.save(os.path.join(RESULT_DIR, "protagonist_successmap_log.npy"), protagonist_successmap_log)
-            logger.info("Protagonist successmap log dumped to file")
+                # record the environments' transitions
+                self.agents.record_transition(
+                    states=states,
+                    actions=actions,
+                    rewards=rewards,
+                    next_states=next_states,
+                    terminated=terminated,
+                    truncated=truncated,
+                    infos=infos,
+                    timestep=timestep,
+                    timesteps=self.timesteps,
+                )
 
+            # log environment info
+            if self.environment_info in infos:
+                for k, v in infos[self.environment_info].items():
+                    if isinstance(v, torch.Tensor) and v.numel() == 1:
+                        self.agents.track_data(f"Info / {k}", v)
+
+            # agents post interaction
+            self.agents.post_interaction(timestep=timestep, timesteps=self.timesteps)
+            states = next_states
+
+            # per-environment episode boundaries
+            done_env_ids = (terminated | truncated).view(-1).nonzero(as_tuple=False).squeeze(-1)
+            if not len(done_env_ids):
+                continue
+
+            with torch.no_grad():
+                # queue the finished placements
+                # range penalty: penalizes for action values outside [-1,1] range
+                range_penalty = torch.sum(
+                    torch.clamp(adversary_action[done_env_ids] ** 2 - 1, min=0), dim=1, keepdim=True
+                )
+                queued = slice(num_queued, num_queued + len(done_env_ids))
+                queued_rand_state[queued] = rand_state[done_env_ids]
+                queued_adversary_action[queued] = adversary_action[done_env_ids]
+                queued_adversary_log_prob[queued] = adversary_log_prob[done_env_ids]
+                queued_adversary_rewards[queued] = (-1 * episode_rewards[done_env_ids]) - range_penalty
+                # the success map only covers the environments reset during this step (in the same order)
+                if "success_map" in infos.get("log", {}):
+                    queued_successmap[queued] = infos["log"]["success_map"].view(-1)
+                else:
+                    queued_successmap[queued] = False
+                num_queued += len(done_env_ids)
+                start_episodes(done_env_ids)
+
+                # wait until NUM_ENVS placements are queued
+                if num_queued < NUM_ENVS:
+                    continue
+
+                # update adversary
+                if self.adversary_active:
+                    self.adversary.record_transition(
+                        states=queued_rand_state[:NUM_ENVS],
+                        actions=queued_adversary_action[:NUM_ENVS],
+                        rewards=queued_adversary_rewards[:NUM_ENVS],
+                        next_states=queued_rand_state[:NUM_ENVS],
+                        terminated=torch.ones((NUM_ENVS, 1), device=device),
+                        truncated=torch.ones((NUM_ENVS, 1), device=device),
+                        infos={},
+                        timestep=adversary_timestep,
+                        timesteps=(self.timesteps // MAX_EPISODE_LENGTH),
+                        log_prob=queued_adversary_log_prob[:NUM_ENVS],
+                    )
+            if self.adversary_active:
+                self.adversary.post_interaction(
+                    timestep=adversary_timestep, timesteps=(self.timesteps // MAX_EPISODE_LENGTH)
+                )
+            adversary_timestep += 1
+
+            # log adversary and protagonist data as necessary
+            if self.log_training:
+                host_copier.copy(
+                    "adversary_action",
+                    queued_adversary_action[:NUM_ENVS],
+                    training_logs["adversary_action_log"].append,
+                )
+                if self.adversary_active:
+                    host_copier.copy(
+                        "adversary_reward",
+                        queued_adversary_rewards[:NUM_ENVS].flatten(),
+                        training_logs["adversary_reward_log"].append,
+                    )
+                host_copier.copy(
+                    "protagonist_successmap",
+                    queued_successmap[:NUM_ENVS],
+                    training_logs["protagonist_successmap_log"].append,
+                )
+
+            # move the placements left in the queue to its front
+            num_queued -= NUM_ENVS
+            with torch.no_grad():
+                for queue in queues:
+                    queue[:num_queued] = queue[NUM_ENVS : NUM_ENVS + num_queued]
+
+        self._isaaclab_env().adversary_action_sampler = None
+
+        # wait for the pending (background) checkpoints and tracking data and dump adversary logs
+        self.agents.synchronize_writers()
+        host_copier.close()
+        if self.log_training:
+            self._close_training_logs(training_logs)
 
     def single_agent_eval(self) -> None:
         """Evaluate agent
@@ -651,7 +855,7 @@ class Trainer:
                 if self.environment_info in infos:
                     for k, v in infos[self.environment_info].items():
                         if isinstance(v, torch.Tensor) and v.numel() == 1:
-                            self.agents.track_data(f"Info / {k}", v.item())
+                            self.agents.track_data(f"Info / {k}", v)
 
             # post-interaction
             super(type(self.agents), self.agents).post_interaction(timestep=timestep, timesteps=self.timesteps)
@@ -724,7 +928,7 @@ class Trainer:
                 if self.environment_info in infos:
                     for k, v in infos[self.environment_info].items():
                         if isinstance(v, torch.Tensor) and v.numel() == 1:
-                            self.agents.track_data(f"Info / {k}", v.item())
+                            self.agents.track_data(f"Info / {k}", v)
 
             # post-interaction
             self.agents.post_interaction(timestep=timestep, timesteps=self.timesteps)
@@ -798,7 +1002,7 @@ class Trainer:
                 if self.environment_info in infos:
                     for k, v in infos[self.environment_info].items():
                         if isinstance(v, torch.Tensor) and v.numel() == 1:
-                            self.agents.track_data(f"Info / {k}", v.item())
+                            self.agents.track_data(f"Info / {k}", v)
 
             # post-interaction
             super(type(self.agents), self.agents).post_interaction(timestep=timestep, timesteps=self.timesteps)
@@ -812,6 +1016,98 @@ class Trainer:
                 states = next_states
                 shared_states = shared_next_states
 
+    def _create_positioning_strategy(self, bc_positions: Optional[np.ndarray] = None) -> PositioningStrategy:
+        """Create the strategy that samples the adversary actions (placements)
+
+        :param bc_positions: Positions to replay in ``bc_train`` mode (default: ``None``)
+        :type bc_positions: np.ndarray, optional
+
+        :raises ValueError: If the positioning strategy is not registered
+
+        :return: Positioning strategy
+        :rtype: skrl.trainers.torch.positioning.PositioningStrategy
+        """
+        return create_positioning_strategy(
+            "behavior_cloning" if self.train_mode == "bc_train" else self.positioning_strategy,
+            num_envs=self.env.num_envs,
+            action_size=self._isaaclab_env().adversary_action.shape[-1],
+            device=self.env.device,
+            cfg={
+                "adversary": self.adversary,
+                "max_episode_length": self._isaaclab_env().max_episode_length,
+                "timesteps": self.timesteps,
+                "regret_rollouts": self.regret_rollouts,
+                "regret_parallel": self.regret_parallel,
+                "positions": bc_positions,
+            },
+        )
+
+    def _open_bc_data(self, max_episode_length: int) -> Tuple[np.ndarray, EpisodePrefetcher]:
+        """Open the behavior cloning positions and actions
+
+        ``train_actions_path`` can be either a dataset written in ``bc_datacollect`` mode
+        (see :py:class:`skrl.utils.bc_dataset.BCDatasetWriter`) or a directory of per-episode
+        ``protagonist_action_log_<episode>.npy`` files. Positions are loaded from ``train_positions_path``
+        if given, otherwise from the dataset
+
+        :param max_episode_length: Episode length
+        :type max_episode_length: int
+
+        :raises ValueError: If no positions are available
+
+        :return: Positions of all the episodes and prefetcher of the episodes' actions
+        :rtype: tuple of np.ndarray and skrl.utils.bc_dataset.EpisodePrefetcher
+        """
+        start = self.initial_timestep // max_episode_length
+        if BCDatasetReader.is_dataset(self.train_actions_path):
+            dataset = BCDatasetReader(self.train_actions_path)
+            load_actions = dataset.load_actions
+            positions = dataset.positions() if self.train_positions_path is None else None
+        else:
+            load_actions = lambda episode: np.load(
+                os.path.join(self.train_actions_path, f"protagonist_action_log_{episode}.npy")
+            )
+            positions = None
+        if positions is None:
+            if self.train_positions_path is None:
+                raise ValueError("Behavior cloning positions are not provided (train_positions_path)")
+            positions = np.load(self.train_positions_path)
+        return positions, EpisodePrefetcher(load_actions, start=start, num_prefetch=2)
+
+    def _open_training_logs(self) -> dict:
+        """Open the streaming stores of the adversary/protagonist training logs
+
+        Each log is appended, in chunks of ``log_chunk_size`` entries, to ``training_logs/<name>/`` in the
+        experiment directory. Full chunks are written as they fill up (and, if ``log_flush_interval`` is positive,
+        the partial chunk every ``log_flush_interval`` entries), so the written chunks can be read
+        (see :py:class:`skrl.utils.chunk_store.ChunkedArrayReader`) while training is still running
+
+        :return: Stores indexed by log name
+        :rtype: dict of skrl.utils.chunk_store.ChunkedArrayWriter
+        """
+        directory = os.path.join(self.agents.experiment_dir, "training_logs")
+        return {
+            name: ChunkedArrayWriter(
+                os.path.join(directory, name), chunk_size=self.log_chunk_size, flush_interval=self.log_flush_interval
+            )
+            for name in ["adversary_action_log", "adversary_reward_log", "protagonist_successmap_log"]
+        }
+
+    def _close_training_logs(self, training_logs: dict) -> None:
+        """Flush the streaming stores and export each log to a single ``.npy`` file next to its store
+
+        :param training_logs: Stores indexed by log name
+        :type training_logs: dict of skrl.utils.chunk_store.ChunkedArrayWriter
+        """
+        for name, writer in training_logs.items():
+            writer.close()
+            path = os.path.join(os.path.dirname(writer.directory), f"{name}.npy")
+            if len(writer):
+                ChunkedArrayReader(writer.directory).export_npy(path)
+            else:
+                np.save(path, np.array([]))
+            logger.info(f"Training log {name} dumped to file")
+
     def _isaaclab_env(self) -> Wrapper:
         """Get the Isaac Lab environment through all the wrappers
 
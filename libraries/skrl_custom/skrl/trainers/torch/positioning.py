@@ -0,0 +1,291 @@
+from typing import Callable, Dict, Optional, Type
+
+import torch
+
+
+POSITIONING_STRATEGIES: Dict[str, Type["PositioningStrategy"]] = {}
+
+
+def register_positioning_strategy(name: str) -> Callable[[Type["PositioningStrategy"]], Type["PositioningStrategy"]]:
+    """Register a positioning strategy class under the given name
+
+    :param name: Name of the strategy (e.g.: value of the ``--positioning`` command line argument)
+    :type name: str
+
+    :raises ValueError: If a strategy is already registered under the given name
+
+    :return: Class decorator
+    :rtype: callable
+
+    Example::
+
+        >>> @register_positioning_strategy("center")
+        ... class CenterStrategy(PositioningStrategy):
+        ...     def _sample(self, output, env_ids, rand_state, timestep, rewards, regret_trials):
+        ...         output.zero_()
+    """
+
+    def decorator(cls: Type["PositioningStrategy"]) -> Type["PositioningStrategy"]:
+        if name in POSITIONING_STRATEGIES:
+            raise ValueError(f"Positioning strategy already registered: {name}")
+        POSITIONING_STRATEGIES[name] = cls
+        return cls
+
+    return decorator
+
+
+def create_positioning_strategy(
+    name: str, num_envs: int, action_size: int, device: torch.device, cfg: Optional[dict] = None
+) -> "PositioningStrategy":
+    """Instantiate a registered positioning strategy
+
+    :param name: Name of the strategy
+    :type name: str
+    :param num_envs: Number of environments
+    :type num_envs: int
+    :param action_size: Size of the adversary action (placement)
+    :type action_size: int
+    :param device: Device on which the placements are allocated
+    :type device: torch.device
+    :param cfg: Strategy configuration (default: ``None``). See :py:class:`PositioningStrategy`
+    :type cfg: dict, optional
+
+    :raises ValueError: If no strategy is registered under the given name
+
+    :return: Positioning strategy
+    :rtype: PositioningStrategy
+    """
+    if name not in POSITIONING_STRATEGIES:
+        raise ValueError(f"Invalid positioning strategy: {name}")
+    return POSITIONING_STRATEGIES[name](num_envs=num_envs, action_size=action_size, device=device, cfg=cfg)
+
+
+class PositioningStrategy:
+    def __init__(self, num_envs: int, action_size: int, device: torch.device, cfg: Optional[dict] = None) -> None:
+        """Base class of the strategies that sample the adversary action (placement of the objects)
+
+        Placements are written in place into a preallocated buffer (:py:attr:`actions`) that holds
+        the current placement of every environment, so sampling doesn't allocate full-size tensors.
+        Subclasses implement :py:meth:`_sample`, which fills an output buffer with the placements
+        of the requested environments
+
+        :param num_envs: Number of environments
+        :type num_envs: int
+        :param action_size: Size of the adversary action (placement)
+        :type action_size: int
+        :param device: Device on which the placements are allocated
+        :type device: torch.device
+        :param cfg: Strategy configuration (default: ``None``). Supported keys, used by the strategies that need them:
+                    ``adversary`` (adversary agent), ``max_episode_length`` (environment episode length),
+                    ``timesteps`` (training timesteps), ``regret_rollouts`` (episodes per regret estimate),
+                    ``regret_parallel`` (whether the regret rollouts run in parallel groups of environments)
+                    and ``positions`` (behavior cloning positions)
+        :type cfg: dict, optional
+        """
+        self.num_envs = num_envs
+        self.action_size = action_size
+        self.device = device
+        self.cfg = cfg if cfg is not None else {}
+
+        self.actions = torch.zeros((num_envs, action_size), device=device)
+        self._scratch = torch.zeros((num_envs, action_size), device=device)
+
+    def sample(
+        self,
+        env_ids: Optional[torch.Tensor] = None,
+        rand_state: Optional[torch.Tensor] = None,
+        timestep: int = 0,
+        rewards: Optional[torch.Tensor] = None,
+        regret_trials: int = 0,
+    ) -> torch.Tensor:
+        """Sample new placements for the given environments
+
+        :param env_ids: Environments to sample placements for (default: ``None``, all environments)
+        :type env_ids: torch.Tensor, optional
+        :param rand_state: Noise vectors the adversary is conditioned on, for all environments (default: ``None``)
+        :type rand_state: torch.Tensor, optional
+        :param timestep: Current training timestep (default: ``0``)
+        :type timestep: int, optional
+        :param rewards: Rewards of the last episode, for all environments (default: ``None``)
+        :type rewards: torch.Tensor, optional
+        :param regret_trials: Remaining replays of the current placement for regret estimation (default: ``0``)
+        :type regret_trials: int, optional
+
+        :return: Placements of all the environments (:py:attr:`actions`), updated in place
+        :rtype: torch.Tensor
+        """
+        if env_ids is None:
+            self._sample(self.actions, None, rand_state, timestep, rewards, regret_trials)
+        else:
+            output = self._scratch[: len(env_ids)]
+            self._sample(output, env_ids, rand_state, timestep, rewards, regret_trials)
+            self.actions[env_ids] = output
+        return self.actions
+
+    def _sample(
+        self,
+        output: torch.Tensor,
+        env_ids: Optional[torch.Tensor],
+        rand_state: Optional[torch.Tensor],
+        timestep: int,
+        rewards: Optional[torch.Tensor],
+        regret_trials: int,
+    ) -> None:
+        """Write the placements of the given environments into the output buffer
+
+        :param output: Output buffer. Shape is (number of requested environments, action size).
+                       When sampling for all environments, it is :py:attr:`actions` itself
+        :type output: torch.Tensor
+        :param env_ids: Environments to sample placements for (``None`` for all environments)
+        :type env_ids: torch.Tensor or None
+
+        See :py:meth:`sample` for the other parameters
+
+        :raises NotImplementedError: Not implemented
+        """
+        raise NotImplementedError
+
+    def _cfg(self, key: str):
+        """Get a required configuration value
+
+        :param key: Configuration key
+        :type key: str
+
+        :raises ValueError: If the key is not configured
+        """
+        if self.cfg.get(key) is None:
+            raise ValueError(f"The {type(self).__name__} positioning strategy requires the '{key}' configuration")
+        return self.cfg[key]
+
+
+@register_positioning_strategy("domain_rand")
+class DomainRandStrategy(PositioningStrategy):
+    def _sample(self, output, env_ids, rand_state, timestep, rewards, regret_trials) -> None:
+        # randomly sample every action dimension from -1 to 1
+        output.uniform_(-1, 1)
+
+
+@register_positioning_strategy("domain_rand_restricted")
+class DomainRandRestrictedStrategy(PositioningStrategy):
+    def _sample(self, output, env_ids, rand_state, timestep, rewards, regret_trials) -> None:
+        # randomly sample every action dimension from a subrange smaller than -1 to 1
+        output.uniform_(0, 1)
+        output[:, 0].mul_(2).sub_(1)  # y direction is stretched to range [-1,1], x direction is unchanged in [0,1]
+
+
+@register_positioning_strategy("boosting_adversary")
+class BoostingStrategy(PositioningStrategy):
+    def __init__(self, num_envs: int, action_size: int, device: torch.device, cfg: Optional[dict] = None) -> None:
+        """Boost the placements that the agent performs poorly on
+
+        Placements of environments whose reward is below the median are perturbed instead of resampled
+
+        See :py:class:`PositioningStrategy` for the parameters
+        """
+        super().__init__(num_envs, action_size, device, cfg)
+        self._noise = torch.zeros((num_envs, action_size), device=device)
+
+    def _sample(self, output, env_ids, rand_state, timestep, rewards, regret_trials) -> None:
+        noise = self._noise[: len(output)].uniform_(-1, 1)
+        if timestep > 0 and rewards is not None:
+            # perturb and re-learn from past placement if agent performed poorly
+            mask = (rewards < rewards.median()).view(-1, 1)
+            previous = self.actions
+            if env_ids is not None:
+                mask, previous = mask[env_ids], previous[env_ids]
+            torch.where(mask, previous + noise * 0.05, noise, out=output)
+        else:
+            output.copy_(noise)
+
+
+@register_positioning_strategy("pure_adversary")
+class PureAdversaryStrategy(PositioningStrategy):
+    def __init__(self, num_envs: int, action_size: int, device: torch.device, cfg: Optional[dict] = None) -> None:
+        """Sample placements from the adversary policy, updated every episode
+
+        The log probabilities of the last sampled adversary actions are kept in :py:attr:`log_prob`
+
+        See :py:class:`PositioningStrategy` for the parameters
+        """
+        super().__init__(num_envs, action_size, device, cfg)
+        self.adversary = self._cfg("adversary")
+        self.max_episode_length = self._cfg("max_episode_length")
+        self.timesteps = self.cfg.get("timesteps", 0)
+        self.episodes_per_update = 1
+        self.log_prob = None
+
+    def _act(self, rand_state: torch.Tensor, timestep: int) -> torch.Tensor:
+        """Compute the adversary policy's actions
+
+        :param rand_state: Noise vectors the adversary is conditioned on
+        :type rand_state: torch.Tensor
+        :param timestep: Current training timestep
+        :type timestep: int
+
+        :return: Actions
+        :rtype: torch.Tensor
+        """
+        adversary_timestep = (timestep + 1) // self.max_episode_length // self.episodes_per_update
+        adversary_timesteps = self.timesteps // self.max_episode_length // self.episodes_per_update
+
+        # pre interaction for the adversary
+        self.adversary.pre_interaction(timestep=adversary_timestep, timesteps=adversary_timesteps)
+
+        # choose an action from a purely adversarial network
+        with torch.no_grad():
+            actions, self.log_prob, _ = self.adversary.act(
+                rand_state, timestep=adversary_timestep, timesteps=adversary_timesteps
+            )
+        return actions
+
+    def _sample(self, output, env_ids, rand_state, timestep, rewards, regret_trials) -> None:
+        output.copy_(self._act(rand_state if env_ids is None else rand_state[env_ids], timestep))
+
+
+@register_positioning_strategy("regret_adversary")
+class RegretAdversaryStrategy(PureAdversaryStrategy):
+    def __init__(self, num_envs: int, action_size: int, device: torch.device, cfg: Optional[dict] = None) -> None:
+        """Sample placements from the adversary policy, each one evaluated for ``regret_rollouts`` episodes
+
+        With ``regret_parallel``, the rollouts of a placement run at the same time in a group of
+        ``regret_rollouts`` consecutive environments: the adversary acts once per group (``rand_state`` has
+        one row per group) and every environment of a group gets the group's placement.
+        Otherwise, the placement is kept (not resampled) while ``regret_trials`` is positive
+
+        See :py:class:`PositioningStrategy` for the parameters
+        """
+        super().__init__(num_envs, action_size, device, cfg)
+        self.regret_rollouts = self.cfg.get("regret_rollouts", 1)
+        self.regret_parallel = self.cfg.get("regret_parallel", False)
+        self.episodes_per_update = 1 if self.regret_parallel else self.regret_rollouts
+
+    def _sample(self, output, env_ids, rand_state, timestep, rewards, regret_trials) -> None:
+        if regret_trials > 0:
+            # keep the current placement
+            if env_ids is not None:
+                output.copy_(self.actions[env_ids])
+            return
+        if self.regret_parallel:
+            if env_ids is not None:
+                raise ValueError("Parallel regret estimation only supports sampling for all environments")
+            # every environment of a group gets the group's placement
+            actions = self._act(rand_state, timestep)
+            output.view(-1, self.regret_rollouts, self.action_size).copy_(actions.unsqueeze(1))
+        else:
+            output.copy_(self._act(rand_state if env_ids is None else rand_state[env_ids], timestep))
+
+
+@register_positioning_strategy("behavior_cloning")
+class BehaviorCloningStrategy(PositioningStrategy):
+    def __init__(self, num_envs: int, action_size: int, device: torch.device, cfg: Optional[dict] = None) -> None:
+        """Replay the placements of a behavior cloning dataset, one set of placements per episode
+
+        See :py:class:`PositioningStrategy` for the parameters
+        """
+        super().__init__(num_envs, action_size, device, cfg)
+        self.positions = self._cfg("positions")
+        self.max_episode_length = self._cfg("max_episode_length")
+
+    def _sample(self, output, env_ids, rand_state, timestep, rewards, regret_trials) -> None:
+        positions = torch.from_numpy(self.positions[(timestep + 1) // self.max_episode_length])
+        output.copy_(positions if env_ids is None else positions[env_ids.cpu()])
@@ -0,0 +1,224 @@
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+import json
+import os
+import queue
+import threading
+
+import numpy as np
+
+from skrl.utils.chunk_store import INDEX_FILENAME, ChunkedArrayReader, ChunkedArrayWriter
+
+
+METADATA_FILENAME = "metadata.json"
+
+
+class BCDatasetWriter:
+    def __init__(
+        self, directory: str, episodes_per_shard: int = 16, metadata: Optional[Mapping[str, Any]] = None
+    ) -> None:
+        """Writer of behavior cloning datasets: per-episode protagonist actions and adversary positions
+
+        Actions and positions are stored in separate sharded stores (``actions/`` and ``positions/``,
+        see :py:class:`skrl.utils.chunk_store.ChunkedArrayWriter`) where each item is an episode
+        and each shard (chunk) holds ``episodes_per_shard`` episodes. The metadata and the number of
+        complete episodes (with both actions and positions) are kept in ``metadata.json``
+
+        :param directory: Directory of the dataset. It will be created if it doesn't exist
+        :type directory: str
+        :param episodes_per_shard: Number of episodes per shard file (default: ``16``)
+        :type episodes_per_shard: int, optional
+        :param metadata: JSON-serializable metadata (e.g.: episode length, number of environments) (default: ``None``)
+        :type metadata: dict, optional
+
+        Example::
+
+            >>> writer = BCDatasetWriter("training_logs/bc_dataset", metadata={"max_episode_length": 250})
+            >>> writer.append_position(np.zeros((4, 21)))
+            >>> writer.append_actions(np.zeros((250, 4, 8)))
+            >>> writer.close()
+        """
+        self.directory = directory
+        self.metadata = dict(metadata or {})
+
+        # shards are only written when full (or when closing) since partial shards are rewritten as they grow
+        self._actions = ChunkedArrayWriter(
+            os.path.join(directory, "actions"), chunk_size=episodes_per_shard, flush_interval=0
+        )
+        self._positions = ChunkedArrayWriter(
+            os.path.join(directory, "positions"), chunk_size=episodes_per_shard, flush_interval=0
+        )
+        self._write_metadata()
+
+    def __len__(self) -> int:
+        """Number of complete episodes (with both actions and positions)
+
+        :return: Number of episodes
+        :rtype: int
+        """
+        return min(len(self._actions), len(self._positions))
+
+    def append_actions(self, actions: Sequence[np.ndarray]) -> None:
+        """Append the protagonist actions of an episode
+
+        :param actions: Actions of each step. Shape is (episode length, number of environments, action size)
+        :type actions: np.ndarray or sequence of np.ndarray
+        """
+        self._actions.append(np.asarray(actions))
+        self._write_metadata_on_shard_boundary()
+
+    def append_position(self, position: np.ndarray) -> None:
+        """Append the adversary positions (action) used in an episode
+
+        :param position: Positions. Shape is (number of environments, adversary action size)
+        :type position: np.ndarray
+        """
+        self._positions.append(position)
+        self._write_metadata_on_shard_boundary()
+
+    def close(self) -> None:
+        """Write any pending episode and the metadata to disk"""
+        self._actions.close()
+        self._positions.close()
+        self._write_metadata()
+
+    def _write_metadata_on_shard_boundary(self) -> None:
+        """Update the metadata when the episodes of a new shard have been written"""
+        if len(self) and not len(self) % self._actions.chunk_size:
+            self._write_metadata()
+
+    def _write_metadata(self) -> None:
+        """Write the metadata file atomically"""
+        path = os.path.join(self.directory, METADATA_FILENAME)
+        with open(f"{path}.tmp", "w") as file:
+            json.dump({**self.metadata, "num_episodes": len(self)}, file)
+        os.replace(f"{path}.tmp", path)
+
+
+class BCDatasetReader:
+    def __init__(self, directory: str) -> None:
+        """Reader of the datasets written by :py:class:`BCDatasetWriter`
+
+        Shards are memory-mapped, so only the requested episodes are read from disk
+
+        :param directory: Directory of the dataset
+        :type directory: str
+        """
+        self.directory = directory
+        with open(os.path.join(directory, METADATA_FILENAME), "r") as file:
+            self.metadata = json.load(file)
+        self._actions = ChunkedArrayReader(os.path.join(directory, "actions"))
+        self._positions = ChunkedArrayReader(os.path.join(directory, "positions"))
+
+    @staticmethod
+    def is_dataset(directory: Optional[str]) -> bool:
+        """Check whether a directory holds a dataset written by :py:class:`BCDatasetWriter`
+
+        :param directory: Directory to check
+        :type directory: str or None
+
+        :return: Whether the directory is a dataset
+        :rtype: bool
+        """
+        return (
+            directory is not None
+            and os.path.isfile(os.path.join(directory, METADATA_FILENAME))
+            and os.path.isfile(os.path.join(directory, "actions", INDEX_FILENAME))
+        )
+
+    def __len__(self) -> int:
+        """Number of complete episodes (with both actions and positions)
+
+        :return: Number of episodes
+        :rtype: int
+        """
+        return min(len(self._actions), len(self._positions))
+
+    def load_actions(self, episode: int) -> np.ndarray:
+        """Load (read from disk) the protagonist actions of an episode
+
+        :param episode: Episode index
+        :type episode: int
+
+        :return: Actions. Shape is (episode length, number of environments, action size)
+        :rtype: np.ndarray
+        """
+        return np.array(self._actions[episode])
+
+    def positions(self) -> np.ndarray:
+        """Load the adversary positions of all the episodes
+
+        :return: Positions. Shape is (number of episodes, number of environments, adversary action size)
+        :rtype: np.ndarray
+        """
+        return self._positions.to_numpy()
+
+
+class EpisodePrefetcher:
+    def __init__(self, load: Callable[[int], np.ndarray], start: int = 0, num_prefetch: int = 2) -> None:
+        """Load consecutive episodes in a background thread ahead of their use
+
+        :param load: Function that loads the data of the given episode
+        :type load: callable
+        :param start: Index of the first episode to load (default: ``0``)
+        :type start: int, optional
+        :param num_prefetch: Maximum number of episodes loaded ahead (default: ``2``)
+        :type num_prefetch: int, optional
+
+        Example::
+
+            >>> prefetcher = EpisodePrefetcher(BCDatasetReader("training_logs/bc_dataset").load_actions)
+            >>> actions = prefetcher.get(0)  # episode 1 is being loaded meanwhile
+            >>> prefetcher.close()
+        """
+        self._load = load
+        self._queue = queue.Queue(maxsize=num_prefetch)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._worker, args=(start,), daemon=True)
+        self._thread.start()
+
+    def get(self, episode: int) -> np.ndarray:
+        """Get the data of an episode, waiting for it to be loaded if it is not yet available
+
+        Episodes prior to the requested one that have not been retrieved are discarded
+
+        :param episode: Episode index. It must not be lower than the index of the last retrieved episode
+        :type episode: int
+
+        :raises ValueError: If the episode has already been discarded
+        :raises Exception: Any exception raised when loading the episode
+
+        :return: Episode data
+        :rtype: np.ndarray
+        """
+        while True:
+            index, data = self._queue.get()
+            if index > episode:
+                raise ValueError(f"Episode {episode} is no longer available (next available episode: {index})")
+            # the background thread stops at the first episode that fails to load
+            if isinstance(data, BaseException):
+                raise data
+            if index == episode:
+                return data
+
+    def close(self) -> None:
+        """Stop the background thread"""
+        self._stop.set()
+        # unblock the thread if it is waiting for a free slot
+        while self._thread.is_alive():
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._thread.join(timeout=0.01)
+
+    def _worker(self, episode: int) -> None:
+        """Load the episodes in order until stopped or until an episode fails to load"""
+        while not self._stop.is_set():
+            try:
+                data = self._load(episode)
+            except Exception as e:
+                self._queue.put((episode, e))
+                return
+            self._queue.put((episode, data))
+            episode += 1
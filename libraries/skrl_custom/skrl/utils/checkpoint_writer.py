@@ -0,0 +1,173 @@
+from typing import Any, Dict, Optional
+
+import collections
+import copy
+import os
+import queue
+import threading
+
+import torch
+
+
+class CheckpointWriter:
+    def __init__(self, asynchronous: bool = False, keep: int = 0) -> None:
+        """Checkpoint writer with atomic writes, retention of the most recent checkpoints and optional background writing
+
+        Checkpoints are written to a temporary file that is atomically renamed to the final path once complete,
+        so an interrupted write never leaves a truncated checkpoint behind.
+
+        In asynchronous mode, the data to save is snapshotted into host memory (pinned, for CUDA tensors) with
+        non-blocking copies and written (``torch.save``) from a background thread, so the caller only pays for
+        issuing the device-to-host copies. Writes are done in submission order
+
+        :param asynchronous: Whether to write the checkpoints from a background thread (default: ``False``)
+        :type asynchronous: bool, optional
+        :param keep: Number of most recent checkpoints to keep per group (default: ``0``, keep all).
+                     Only the checkpoints written by this writer are removed
+        :type keep: int, optional
+
+        :raises ValueError: If the number of checkpoints to keep is negative
+
+        Example::
+
+            >>> writer = CheckpointWriter(asynchronous=True, keep=3)
+            >>> writer.save({"policy": policy.state_dict()}, "checkpoints/agent_1000.pt", group="agent")
+            >>> writer.close()  # wait for the pending writes
+        """
+        if keep < 0:
+            raise ValueError(f"The number of checkpoints to keep must be non-negative (got {keep})")
+        self.asynchronous = asynchronous
+        self.keep = keep
+
+        self._groups: Dict[str, collections.deque] = collections.defaultdict(collections.deque)
+        self._last_events: Dict[torch.device, torch.cuda.Event] = {}
+
+        self._error: Optional[BaseException] = None
+        self._queue = None
+        self._thread = None
+        if self.asynchronous:
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+
+    def snapshot(self, data: Any) -> Any:
+        """Copy the data (e.g. a state dict) so that later changes of the source do not affect it
+
+        In asynchronous mode, tensors are copied into host memory (pinned, for CUDA tensors) without synchronizing
+        the host with the device. The copies are completed before any subsequent write. Otherwise, the data is
+        deep-copied (tensors stay on their devices)
+
+        :param data: Data to copy. Nested dictionaries, lists and tuples are traversed
+        :type data: Any
+
+        :return: Copy of the data
+        :rtype: Any
+        """
+        if not self.asynchronous:
+            return copy.deepcopy(data)
+        events = {}
+        data = self._snapshot(data, events)
+        # copies are issued on the current streams: recording after them covers every previous snapshot
+        for device in events:
+            event = torch.cuda.Event()
+            event.record(torch.cuda.current_stream(device))
+            self._last_events[device] = event
+        return data
+
+    def _snapshot(self, data: Any, events: Dict[torch.device, Any]) -> Any:
+        """Recursively copy the data into host memory"""
+        if isinstance(data, torch.Tensor):
+            data = data.detach()
+            if data.device.type != "cuda":
+                return data.clone()
+            events[data.device] = None
+            buffer = torch.empty(data.shape, dtype=data.dtype, pin_memory=True)
+            return buffer.copy_(data, non_blocking=True)
+        if isinstance(data, dict):
+            return type(data)((k, self._snapshot(v, events)) for k, v in data.items())
+        if isinstance(data, (list, tuple)):
+            return type(data)(self._snapshot(v, events) for v in data)
+        return copy.deepcopy(data)
+
+    def save(self, data: Any, path: str, group: Optional[str] = None, snapshot: bool = True) -> None:
+        """Save the data (``torch.save``) to the given path
+
+        :param data: Data to save
+        :type data: Any
+        :param path: Path of the checkpoint
+        :type path: str
+        :param group: Group of the checkpoint (e.g. ``"agent"``) whose most recent checkpoints are kept
+                      (default: ``None``, the checkpoint is never removed)
+        :type group: str, optional
+        :param snapshot: Whether to snapshot the data before saving it (default: ``True``).
+                         Disable it for data returned by :py:meth:`snapshot` and not modified afterwards
+        :type snapshot: bool, optional
+
+        :raises Exception: Any exception raised by a previous asynchronous write
+        """
+        if not self.asynchronous:
+            self._write(data, path, group)
+            return
+        self._raise_pending_error()
+        if snapshot:
+            data = self.snapshot(data)
+        self._queue.put((list(self._last_events.values()), data, path, group))
+
+    def synchronize(self) -> None:
+        """Wait until all the submitted checkpoints are written
+
+        :raises Exception: Any exception raised by an asynchronous write
+        """
+        if self._queue is not None:
+            self._queue.join()
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        """Wait for the pending writes and stop the background thread
+
+        :raises Exception: Any exception raised by an asynchronous write
+        """
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_pending_error()
+
+    def _write(self, data: Any, path: str, group: Optional[str]) -> None:
+        """Write the data to a temporary file, rename it to the final path and remove the oldest checkpoints"""
+        temporary_path = f"{path}.tmp"
+        torch.save(data, temporary_path)
+        os.replace(temporary_path, path)
+
+        if group is not None and self.keep:
+            paths = self._groups[group]
+            if path in paths:
+                paths.remove(path)
+            paths.append(path)
+            while len(paths) > self.keep:
+                old_path = paths.popleft()
+                if os.path.exists(old_path):
+                    os.remove(old_path)
+
+    def _raise_pending_error(self) -> None:
+        """Re-raise, in the caller thread, an exception raised in the background thread"""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _worker(self) -> None:
+        """Write the submitted checkpoints, in order"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            events, data, path, group = item
+            try:
+                for event in events:
+                    event.synchronize()
+                if self._error is None:
+                    self._write(data, path, group)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,249 @@
+from typing import Optional, Tuple, Union
+
+import json
+import os
+
+import numpy as np
+
+
+INDEX_FILENAME = "index.json"
+
+
+def _atomic_save(path: str, array: np.ndarray) -> None:
+    """Save a NumPy array to a .npy file, replacing any previous file atomically
+
+    :param path: Path of the .npy file
+    :type path: str
+    :param array: Array to save
+    :type array: np.ndarray
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        np.save(file, array)
+    os.replace(tmp_path, path)
+
+
+class ChunkedArrayWriter:
+    def __init__(self, directory: str, chunk_size: int = 64, flush_interval: int = 0) -> None:
+        """Appendable on-disk store of equally shaped arrays (items), split into fixed-size chunks
+
+        Items are buffered in a preallocated chunk that is written to disk as a ``.npy`` file
+        when it is full or when the store is flushed. An ``index.json`` file keeps track of the chunks,
+        the dtype and shape of the items and the number of items written so far.
+        Files are replaced atomically, so the store can be read (e.g. using :py:class:`ChunkedArrayReader`)
+        while it is still being written
+
+        :param directory: Directory where the chunks and the index are stored. It will be created if it doesn't exist
+        :type directory: str
+        :param chunk_size: Number of items per chunk (default: ``64``)
+        :type chunk_size: int, optional
+        :param flush_interval: Number of appended items between flushes of the partially filled chunk (default: ``0``).
+                               If less than or equal to 0, the store is only flushed when a chunk is full
+                               or when :py:meth:`flush` or :py:meth:`close` are called. Each flush rewrites the
+                               partially filled chunk, so small intervals put file I/O back on the caller's path
+        :type flush_interval: int, optional
+
+        :raises ValueError: If the chunk size is not positive
+
+        Example::
+
+            >>> writer = ChunkedArrayWriter("training_logs/adversary_action_log", chunk_size=16)
+            >>> writer.append(np.zeros((4, 21)))
+            >>> writer.close()
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"The chunk size must be positive (got {chunk_size})")
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.flush_interval = flush_interval
+
+        self._buffer = None
+        self._buffer_size = 0
+        self._unflushed = 0
+        self._chunks = []
+        self._num_items = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        """Number of items appended to the store
+
+        :return: Number of items
+        :rtype: int
+        """
+        return self._num_items
+
+    @property
+    def item_shape(self) -> Optional[Tuple[int]]:
+        """Shape of the items (``None`` until the first item is appended)"""
+        return None if self._buffer is None else self._buffer.shape[1:]
+
+    def append(self, item: np.ndarray) -> None:
+        """Append an item to the store
+
+        :param item: Item to append. All items must have the same shape
+        :type item: np.ndarray
+
+        :raises ValueError: If the shape of the item doesn't match the shape of the previous items
+        """
+        item = np.asarray(item)
+        if self._buffer is None:
+            self._buffer = np.empty((self.chunk_size, *item.shape), dtype=item.dtype)
+        elif item.shape != self._buffer.shape[1:]:
+            raise ValueError(f"Item shape {item.shape} doesn't match the store item shape {self._buffer.shape[1:]}")
+
+        self._buffer[self._buffer_size] = item
+        self._buffer_size += 1
+        self._num_items += 1
+        self._unflushed += 1
+
+        # write the full chunk and start a new one
+        if self._buffer_size == self.chunk_size:
+            self.flush()
+            self._buffer_size = 0
+        elif self.flush_interval > 0 and self._unflushed >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the current (partially filled) chunk and the index to disk"""
+        if not self._unflushed:
+            return
+        filename = f"chunk_{len(self._chunks):06d}.npy"
+        # the current chunk is written again (replaced) as it grows
+        if self._chunks and self._chunks[-1]["num_items"] < self.chunk_size:
+            filename = self._chunks.pop()["filename"]
+        _atomic_save(os.path.join(self.directory, filename), self._buffer[: self._buffer_size])
+        self._chunks.append({"filename": filename, "num_items": self._buffer_size})
+        self._write_index()
+        self._unflushed = 0
+
+    def close(self) -> None:
+        """Flush any pending item to disk"""
+        self.flush()
+
+    def _write_index(self) -> None:
+        """Write the index file atomically"""
+        index = {
+            "dtype": self._buffer.dtype.str,
+            "item_shape": list(self._buffer.shape[1:]),
+            "chunk_size": self.chunk_size,
+            "num_items": self._num_items,
+            "chunks": self._chunks,
+        }
+        path = os.path.join(self.directory, INDEX_FILENAME)
+        with open(f"{path}.tmp", "w") as file:
+            json.dump(index, file)
+        os.replace(f"{path}.tmp", path)
+
+
+class ChunkedArrayReader:
+    def __init__(self, directory: str) -> None:
+        """Reader of the stores written by :py:class:`ChunkedArrayWriter`
+
+        Chunks are memory-mapped, so only the accessed items are read from disk.
+        The index is loaded at construction time; call :py:meth:`refresh` to pick up
+        items written afterwards (e.g. while training is still running)
+
+        :param directory: Directory where the chunks and the index are stored
+        :type directory: str
+
+        Example::
+
+            >>> reader = ChunkedArrayReader("training_logs/adversary_action_log")
+            >>> len(reader), reader[-1].shape
+            (120, (4, 21))
+        """
+        self.directory = directory
+        self.refresh()
+
+    def __len__(self) -> int:
+        """Number of items in the store
+
+        :return: Number of items
+        :rtype: int
+        """
+        return self.index["num_items"]
+
+    def __getitem__(self, key: Union[int, slice]) -> np.ndarray:
+        """Get an item (integer key) or a stacked range of items (slice key)
+
+        :param key: Item index or slice
+        :type key: int or slice
+
+        :raises IndexError: If the index is out of range
+
+        :return: Item or stacked items
+        :rtype: np.ndarray
+        """
+        if isinstance(key, slice):
+            indexes = range(*key.indices(len(self)))
+            array = np.empty((len(indexes), *self.index["item_shape"]), dtype=np.dtype(self.index["dtype"]))
+            for i, index in enumerate(indexes):
+                array[i] = self[index]
+            return array
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError(f"Index out of range for a store with {len(self)} items")
+        return self._chunk(key // self.index["chunk_size"])[key % self.index["chunk_size"]]
+
+    def refresh(self) -> None:
+        """Reload the index from disk"""
+        path = os.path.join(self.directory, INDEX_FILENAME)
+        if os.path.exists(path):
+            with open(path, "r") as file:
+                self.index = json.load(file)
+        else:
+            self.index = {"dtype": "<f4", "item_shape": [], "chunk_size": 1, "num_items": 0, "chunks": []}
+        self._mmaps = {}
+
+    def _chunk(self, i: int) -> np.ndarray:
+        """Get the memory-mapped chunk
+
+        :param i: Chunk index
+        :type i: int
+
+        :return: Memory-mapped chunk
+        :rtype: np.ndarray
+        """
+        chunk = self.index["chunks"][i]
+        mmap = self._mmaps.get(i)
+        if mmap is None or len(mmap) != chunk["num_items"]:
+            mmap = np.load(os.path.join(self.directory, chunk["filename"]), mmap_mode="r")
+            self._mmaps[i] = mmap
+        return mmap
+
+    def to_numpy(self) -> np.ndarray:
+        """Load all the items in memory
+
+        :return: Stacked items. Shape is (number of items, item shape)
+        :rtype: np.ndarray
+        """
+        array = np.empty((len(self), *self.index["item_shape"]), dtype=np.dtype(self.index["dtype"]))
+        self._copy_to(array)
+        return array
+
+    def export_npy(self, path: str) -> None:
+        """Export all the items to a single ``.npy`` file, without loading them in memory at once
+
+        :param path: Path of the .npy file
+        :type path: str
+        """
+        array = np.lib.format.open_memmap(
+            path, mode="w+", dtype=np.dtype(self.index["dtype"]), shape=(len(self), *self.index["item_shape"])
+        )
+        self._copy_to(array)
+        array.flush()
+        del array
+
+    def _copy_to(self, array: np.ndarray) -> None:
+        """Copy the chunks, in order, to the given array
+
+        :param array: Destination array. Shape is (number of items, item shape)
+        :type array: np.ndarray
+        """
+        start = 0
+        for i, chunk in enumerate(self.index["chunks"]):
+            num_items = min(chunk["num_items"], len(self) - start)
+            array[start : start + num_items] = self._chunk(i)[:num_items]
+            start += num_items
@@ -0,0 +1,68 @@
+from typing import Any, Callable, Optional, Tuple
+
+import torch
+
+from skrl import logger
+
+
+class CompiledFunction:
+    def __init__(self, function: Callable, **compile_kwargs) -> None:
+        """Function compiled (``torch.compile``) for the tensor shapes of its first call, with eager fallback
+
+        The first call fixes the shapes of the tensor arguments. Later calls with the same shapes run the compiled
+        function, while calls with different shapes (e.g. a smaller last mini-batch) run the original (eager)
+        function, so shape changes never trigger a recompilation. If the compilation (or the first compiled call)
+        fails, a warning is logged and the original function is used from then on
+
+        :param function: Function to compile. Tensor arguments are passed positionally
+        :type function: callable
+        :param compile_kwargs: Keyword arguments of ``torch.compile`` (e.g. ``mode="reduce-overhead"`` to capture
+                               the function as a CUDA graph). ``dynamic`` defaults to ``False``
+        :type compile_kwargs: dict
+
+        Example::
+
+            >>> compiled_loss = CompiledFunction(loss_function)
+            >>> loss = compiled_loss(states, actions)  # compiled for these shapes
+            >>> loss = compiled_loss(states[:3], actions[:3])  # different shapes: eager
+        """
+        self.function = function
+        self.compile_kwargs = {"dynamic": False, **compile_kwargs}
+
+        self.shapes: Optional[Tuple[Any, ...]] = None
+        self.num_compiled_calls = 0
+        self.num_eager_calls = 0
+
+        self._compiled_function = None
+        self._failed = False
+
+    @staticmethod
+    def _shapes(args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        return tuple(
+            (arg.shape, arg.dtype, arg.device) if isinstance(arg, torch.Tensor) else type(arg) for arg in args
+        )
+
+    def __call__(self, *args) -> Any:
+        """Call the compiled function if the arguments have the captured shapes, otherwise the original one"""
+        shapes = self._shapes(args)
+        if self.shapes is None:
+            self.shapes = shapes
+        if self._failed or shapes != self.shapes:
+            self.num_eager_calls += 1
+            return self.function(*args)
+
+        if self._compiled_function is None:
+            try:
+                self._compiled_function = torch.compile(self.function, **self.compile_kwargs)
+                output = self._compiled_function(*args)
+            except Exception as e:
+                logger.warning(f"Unable to compile {getattr(self.function, '__name__', self.function)}: {e}")
+                logger.warning("Falling back to eager execution")
+                self._failed = True
+                self.num_eager_calls += 1
+                return self.function(*args)
+            self.num_compiled_calls += 1
+            return output
+
+        self.num_compiled_calls += 1
+        return self._compiled_function(*args)
@@ -0,0 +1,151 @@
+from typing import Callable, Dict, List, Optional
+
+import queue
+import threading
+
+import numpy as np
+import torch
+
+
+class AsyncHostCopier:
+    def __init__(self, num_buffers: int = 2) -> None:
+        """Non-blocking device-to-host copier for logging data
+
+        CUDA tensors are copied, on a side stream, into a rotating set of pinned (page-locked) host buffers
+        (one set per key) without synchronizing the host with the device. A background thread waits for each
+        copy to complete and then hands a NumPy copy of the data to the callback given at submission time.
+        Callbacks (and the functions submitted with :py:meth:`call`) are run in submission order.
+
+        For tensors that are not on a CUDA device, the data is copied synchronously and only the callback
+        is deferred to the background thread
+
+        :param num_buffers: Number of pinned buffers per key (default: ``2``, double buffering).
+                            If all the buffers of a key are in flight, :py:meth:`copy` waits for the oldest one
+        :type num_buffers: int, optional
+
+        :raises ValueError: If the number of buffers is not positive
+
+        Example::
+
+            >>> copier = AsyncHostCopier()
+            >>> copier.copy("success_map", infos["log"]["success_map"], writer.append)
+            >>> copier.close()  # wait for the pending copies and callbacks
+        """
+        if num_buffers <= 0:
+            raise ValueError(f"The number of buffers must be positive (got {num_buffers})")
+        self.num_buffers = num_buffers
+
+        self._streams: Dict[torch.device, torch.cuda.Stream] = {}
+        self._buffers: Dict[str, List[torch.Tensor]] = {}
+        self._free: Dict[str, List[threading.Event]] = {}
+        self._slots: Dict[str, int] = {}
+
+        self._error: Optional[BaseException] = None
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def copy(self, key: str, tensor: torch.Tensor, callback: Callable[[np.ndarray], None]) -> None:
+        """Schedule the copy of a tensor to host memory
+
+        :param key: Name of the copied data. Tensors submitted under the same key should have the same shape
+                    and dtype for their pinned buffers to be reused
+        :type key: str
+        :param tensor: Tensor to copy
+        :type tensor: torch.Tensor
+        :param callback: Function called, from the background thread, with the copied data
+        :type callback: callable
+        """
+        self._raise_pending_error()
+        tensor = tensor.detach()
+        if tensor.device.type != "cuda":
+            self._queue.put((None, None, callback, tensor.cpu().numpy().copy()))
+            return
+
+        # rotate over the key's pinned buffers, waiting until the next one has been consumed
+        buffers = self._buffers.get(key)
+        if buffers is None or buffers[0].shape != tensor.shape or buffers[0].dtype != tensor.dtype:
+            buffers = [torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True) for _ in range(self.num_buffers)]
+            self._buffers[key] = buffers
+            self._free[key] = [threading.Event() for _ in range(self.num_buffers)]
+            for event in self._free[key]:
+                event.set()
+            self._slots[key] = 0
+        slot = self._slots[key]
+        self._slots[key] = (slot + 1) % self.num_buffers
+        free = self._free[key][slot]
+        free.wait()
+        free.clear()
+
+        # issue the copy on the side stream once the tensor is ready,
+        # and keep later (possibly in-place) work on the current stream from running before it
+        current_stream = torch.cuda.current_stream(tensor.device)
+        stream = self._streams.get(tensor.device)
+        if stream is None:
+            stream = torch.cuda.Stream(tensor.device)
+            self._streams[tensor.device] = stream
+        stream.wait_stream(current_stream)
+        with torch.cuda.stream(stream):
+            buffers[slot].copy_(tensor, non_blocking=True)
+            tensor.record_stream(stream)
+            done = torch.cuda.Event()
+            done.record(stream)
+        current_stream.wait_stream(stream)
+
+        self._queue.put((done, free, callback, buffers[slot]))
+
+    def call(self, function: Callable[[], None]) -> None:
+        """Run a function in the background thread after all the previously submitted copies are done
+
+        :param function: Function to run
+        :type function: callable
+        """
+        self._raise_pending_error()
+        self._queue.put((None, None, function, None))
+
+    def synchronize(self) -> None:
+        """Wait until all the submitted copies and callbacks are done
+
+        :raises Exception: Any exception raised by a callback
+        """
+        self._queue.join()
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        """Wait for the pending copies and callbacks and stop the background thread
+
+        :raises Exception: Any exception raised by a callback
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_pending_error()
+
+    def _raise_pending_error(self) -> None:
+        """Re-raise, in the caller thread, an exception raised in the background thread"""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _worker(self) -> None:
+        """Complete the submitted copies and run the callbacks, in order"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            done, free, function, data = item
+            try:
+                if done is not None:
+                    done.synchronize()
+                    data = data.numpy().copy()
+                if free is not None:
+                    free.set()
+                if self._error is None:
+                    function() if data is None else function(data)
+            except BaseException as e:
+                if free is not None:
+                    free.set()
+                self._error = e
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,204 @@
+from typing import Dict, Optional, Union
+
+import torch
+
+
+def _initial_stats(device: Union[str, torch.device]) -> torch.Tensor:
+    """Statistics (sum, min, max, count) of a tag without accumulated elements"""
+    return torch.tensor([0, float("inf"), float("-inf"), 0], dtype=torch.float64, device=device)
+
+
+class MetricsAccumulator:
+    def __init__(self, device: Optional[Union[str, torch.device]] = None) -> None:
+        """Device-resident accumulator of scalar metrics
+
+        Each tag keeps a running sum, minimum, maximum and count as tensors on the device, so adding values
+        doesn't synchronize with the host. The statistics of all the tags are transferred to the host at once
+        when computed (e.g. when writing to TensorBoard)
+
+        :param device: Device on which the statistics are allocated (default: ``None``).
+                       If None, the device of the first added tensor is used
+        :type device: str or torch.device, optional
+
+        Example::
+
+            >>> accumulator = MetricsAccumulator(device="cuda:0")
+            >>> accumulator.add("Reward / Instantaneous reward", torch.rand(4096, 1, device="cuda:0"))
+            >>> accumulator.add("Loss / BC MSE Loss", 0.5)
+            >>> stats = accumulator.compute()  # single device-to-host transfer
+            >>> stats["Loss / BC MSE Loss"]
+            {'sum': 0.5, 'min': 0.5, 'max': 0.5, 'count': 1.0, 'mean': 0.5}
+        """
+        self.device = device
+        self._tags = {}
+        # rows: tags, columns: sum, min, max, count
+        self._stats = None
+
+    def __len__(self) -> int:
+        """Number of tags"""
+        return len(self._tags)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._tags
+
+    def _index(self, tag: str, device: torch.device) -> int:
+        """Get (or allocate) the row of the statistics of a tag
+
+        :param tag: Data identifier
+        :type tag: str
+        :param device: Device of the value being added
+        :type device: torch.device
+
+        :return: Row index
+        :rtype: int
+        """
+        index = self._tags.get(tag)
+        if index is None:
+            index = self._tags[tag] = len(self._tags)
+            if self._stats is None:
+                if self.device is None:
+                    self.device = device
+                self._stats = _initial_stats(self.device).unsqueeze(0)
+            else:
+                self._stats = torch.cat([self._stats, _initial_stats(self.device).unsqueeze(0)])
+        return index
+
+    def add(self, tag: str, value: Union[torch.Tensor, float], mask: Optional[torch.Tensor] = None) -> None:
+        """Accumulate the elements of a value
+
+        :param tag: Data identifier (e.g. 'Loss / policy loss')
+        :type tag: str
+        :param value: Value to accumulate. All the elements of a tensor are accumulated
+        :type value: torch.Tensor or float
+        :param mask: Boolean mask of the elements to accumulate, with the same number of elements
+                     as the value (default: ``None``, all the elements)
+        :type mask: torch.Tensor, optional
+        """
+        if not isinstance(value, torch.Tensor):
+            value = torch.tensor(float(value), device=self.device)
+        value = value.detach().reshape(-1).to(torch.float64)
+        index = self._index(tag, value.device)
+        stats = self._stats[index]
+        if mask is None:
+            stats[0] += value.sum()
+            stats[1] = torch.minimum(stats[1], value.min())
+            stats[2] = torch.maximum(stats[2], value.max())
+            stats[3] += value.numel()
+        else:
+            mask = mask.reshape(-1).to(torch.bool)
+            stats[0] += torch.where(mask, value, 0).sum()
+            stats[1] = torch.minimum(stats[1], torch.where(mask, value, float("inf")).min())
+            stats[2] = torch.maximum(stats[2], torch.where(mask, value, float("-inf")).max())
+            stats[3] += mask.sum()
+
+    def mean(self, tag: str) -> Optional[float]:
+        """Get the mean of the accumulated elements of a tag (this synchronizes with the device)
+
+        :param tag: Data identifier
+        :type tag: str
+
+        :return: Mean, or None if the tag has no accumulated elements
+        :rtype: float or None
+        """
+        index = self._tags.get(tag)
+        if index is None:
+            return None
+        total, count = self._stats[index, [0, 3]].tolist()
+        return total / count if count else None
+
+    def compute(self) -> Dict[str, Dict[str, float]]:
+        """Transfer the statistics of all the tags to the host
+
+        Tags without accumulated elements (e.g. everything masked out) are not returned
+
+        :return: Statistics (``sum``, ``min``, ``max``, ``count`` and ``mean``) of each tag
+        :rtype: dict
+        """
+        if self._stats is None:
+            return {}
+        stats = self._stats.tolist()
+        output = {}
+        for tag, index in self._tags.items():
+            total, minimum, maximum, count = stats[index]
+            if count:
+                output[tag] = {"sum": total, "min": minimum, "max": maximum, "count": count, "mean": total / count}
+        return output
+
+    def reset(self) -> None:
+        """Reset the statistics of all the tags (tags are kept, so no memory is reallocated)"""
+        if self._stats is not None:
+            self._stats.copy_(_initial_stats(self._stats.device).expand_as(self._stats))
+
+
+class RollingWindow:
+    def __init__(self, size: int = 100, device: Optional[Union[str, torch.device]] = None) -> None:
+        """Device-resident window of the last recorded values (e.g. the returns of the last 100 episodes)
+
+        Recording values doesn't synchronize with the host. The statistics of the window are transferred
+        to the host when computed (e.g. when writing to TensorBoard)
+
+        :param size: Maximum number of values in the window (default: ``100``)
+        :type size: int, optional
+        :param device: Device on which the window is allocated (default: ``None``).
+                       If None, the device of the first recorded tensor is used
+        :type device: str or torch.device, optional
+
+        Example::
+
+            >>> window = RollingWindow(size=100, device="cuda:0")
+            >>> window.extend(returns, mask=terminated)  # returns of the finished episodes
+            >>> stats = window.compute()  # single device-to-host transfer
+        """
+        self.size = size
+        self.device = device
+        # the last slot receives the values that are not recorded
+        self._values = None
+        self._position = None
+        self._count = None
+
+    def _allocate(self, device: torch.device) -> None:
+        if self.device is None:
+            self.device = device
+        self._values = torch.zeros(self.size + 1, dtype=torch.float64, device=self.device)
+        self._position = torch.zeros((), dtype=torch.int64, device=self.device)
+        self._count = torch.zeros((), dtype=torch.int64, device=self.device)
+
+    def extend(self, value: torch.Tensor, mask: Optional[torch.Tensor] = None) -> None:
+        """Record the elements of a value, in order, discarding the oldest ones beyond the window size
+
+        :param value: Value whose elements are recorded
+        :type value: torch.Tensor
+        :param mask: Boolean mask of the elements to record, with the same number of elements
+                     as the value (default: ``None``, all the elements)
+        :type mask: torch.Tensor, optional
+        """
+        value = value.detach().reshape(-1).to(torch.float64)
+        if self._values is None:
+            self._allocate(value.device)
+        mask = torch.ones_like(value, dtype=torch.bool) if mask is None else mask.reshape(-1).to(torch.bool)
+        # only the last recorded elements that fit in the window are written (so no slot is written twice)
+        ranks = torch.cumsum(mask, dim=0)
+        num_values = ranks[-1]
+        written = torch.logical_and(mask, num_values - ranks < self.size)
+        slots = torch.where(written, (self._position + ranks - 1) % self.size, self.size)
+        self._values.index_put_((slots,), value)
+        self._position.add_(num_values).remainder_(self.size)
+        self._count.add_(num_values).clamp_(max=self.size)
+
+    def compute(self) -> Optional[Dict[str, float]]:
+        """Transfer the statistics of the values in the window to the host
+
+        :return: Statistics (``min``, ``max``, ``count`` and ``mean``), or None if the window is empty
+        :rtype: dict or None
+        """
+        if self._values is None:
+            return None
+        valid = torch.arange(self.size + 1, device=self.device) < self._count
+        minimum = torch.where(valid, self._values, float("inf")).min()
+        maximum = torch.where(valid, self._values, float("-inf")).max()
+        total = torch.where(valid, self._values, 0).sum()
+        minimum, maximum, total, count = torch.stack([minimum, maximum, total, self._count.to(total.dtype)]).tolist()
+        if not count:
+            return None
+        return {"min": minimum, "max": maximum, "count": count, "mean": total / count}
+
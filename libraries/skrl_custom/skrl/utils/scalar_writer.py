@@ -0,0 +1,200 @@
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import csv
+import os
+import queue
+import threading
+
+
+class TensorBoardScalarSink:
+    def __init__(self, writer) -> None:
+        """Sink that writes the scalars as TensorBoard events
+
+        :param writer: TensorBoard writer (e.g. ``torch.utils.tensorboard.SummaryWriter``)
+        :type writer: Any object with the ``add_scalar``, ``flush`` and ``close`` methods
+        """
+        self.writer = writer
+
+    def write(self, scalars: Mapping[str, float], step: int) -> None:
+        """Write a batch of scalars
+
+        :param scalars: Scalar values indexed by tag
+        :type scalars: dict
+        :param step: Step (e.g. timestep) of the scalars
+        :type step: int
+        """
+        for tag, value in scalars.items():
+            self.writer.add_scalar(tag, value, step)
+
+    def flush(self) -> None:
+        """Flush the written scalars to disk"""
+        self.writer.flush()
+
+    def close(self) -> None:
+        """Flush the written scalars and close the sink"""
+        self.writer.close()
+
+
+class CSVScalarSink:
+    FILENAME = "scalars.csv"
+
+    def __init__(self, directory: str) -> None:
+        """Sink that appends the scalars to a ``scalars.csv`` file (``step,tag,value`` rows)
+
+        Each batch is flushed once written, so the file can be read while training is still running
+        (see :py:func:`read_scalars`) without parsing TensorBoard events
+
+        :param directory: Directory of the file (e.g. the experiment directory)
+        :type directory: str
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, self.FILENAME)
+        new_file = not os.path.exists(self.path)
+        self._file = open(self.path, "a", newline="")
+        self._writer = csv.writer(self._file)
+        if new_file:
+            self._writer.writerow(["step", "tag", "value"])
+
+    def write(self, scalars: Mapping[str, float], step: int) -> None:
+        """Write a batch of scalars
+
+        :param scalars: Scalar values indexed by tag
+        :type scalars: dict
+        :param step: Step (e.g. timestep) of the scalars
+        :type step: int
+        """
+        self._writer.writerows((step, tag, repr(float(value))) for tag, value in scalars.items())
+        self._file.flush()
+
+    def flush(self) -> None:
+        """Flush the written scalars to disk"""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush the written scalars and close the sink"""
+        self._file.close()
+
+
+def read_scalars(path: str) -> Dict[str, List[Tuple[int, float]]]:
+    """Read the scalars written by :py:class:`CSVScalarSink`
+
+    :param path: Path to the ``scalars.csv`` file or to its directory
+    :type path: str
+
+    :return: ``(step, value)`` pairs, in writing order, indexed by tag
+    :rtype: dict
+    """
+    if os.path.isdir(path):
+        path = os.path.join(path, CSVScalarSink.FILENAME)
+    scalars = {}
+    with open(path, newline="") as file:
+        for row in csv.DictReader(file):
+            # skip a partially written last row
+            try:
+                step, value = int(row["step"]), float(row["value"])
+            except (TypeError, ValueError):
+                continue
+            scalars.setdefault(row["tag"], []).append((step, value))
+    return scalars
+
+
+class ScalarWriter:
+    def __init__(self, sinks: Sequence, background: bool = False, max_queue_size: int = 16) -> None:
+        """Writer of already-reduced scalar batches (e.g. tracking data) to one or more sinks
+
+        In background mode, the batches are pushed into a bounded queue consumed by a writer thread, so the sinks
+        (e.g. TensorBoard protobuf serialization) do not run on the caller thread. If the queue is full,
+        :py:meth:`write` waits until the writer thread catches up
+
+        :param sinks: Sinks (e.g. :py:class:`TensorBoardScalarSink` or :py:class:`CSVScalarSink`)
+        :type sinks: sequence
+        :param background: Whether to write the batches from a background thread (default: ``False``)
+        :type background: bool, optional
+        :param max_queue_size: Maximum number of pending batches in background mode (default: ``16``)
+        :type max_queue_size: int, optional
+
+        :raises ValueError: If the maximum queue size is not positive
+
+        Example::
+
+            >>> writer = ScalarWriter([CSVScalarSink("runs/experiment")], background=True)
+            >>> writer.write({"Loss / Policy loss": 0.1, "Loss / Value loss": 2.5}, step=1000)
+            >>> writer.close()  # write the pending batches and close the sinks
+        """
+        if max_queue_size <= 0:
+            raise ValueError(f"The maximum queue size must be positive (got {max_queue_size})")
+        self.sinks = list(sinks)
+        self.background = background
+
+        self._error: Optional[BaseException] = None
+        self._queue = None
+        self._thread = None
+        if self.background:
+            self._queue = queue.Queue(maxsize=max_queue_size)
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+
+    def write(self, scalars: Mapping[str, float], step: int) -> None:
+        """Write a batch of scalars to the sinks
+
+        :param scalars: Scalar values indexed by tag
+        :type scalars: dict
+        :param step: Step (e.g. timestep) of the scalars
+        :type step: int
+
+        :raises Exception: Any exception raised by a sink in the background thread
+        """
+        if not self.background:
+            self._write(scalars, step)
+            return
+        self._raise_pending_error()
+        self._queue.put((dict(scalars), step))
+
+    def flush(self) -> None:
+        """Wait until all the pending batches are written and flush the sinks
+
+        :raises Exception: Any exception raised by a sink in the background thread
+        """
+        if self._queue is not None:
+            self._queue.join()
+            self._raise_pending_error()
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        """Write the pending batches, stop the background thread and close the sinks
+
+        :raises Exception: Any exception raised by a sink in the background thread
+        """
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        for sink in self.sinks:
+            sink.close()
+        self._raise_pending_error()
+
+    def _write(self, scalars: Mapping[str, float], step: int) -> None:
+        """Write a batch of scalars to every sink"""
+        for sink in self.sinks:
+            sink.write(scalars, step)
+
+    def _raise_pending_error(self) -> None:
+        """Re-raise, in the caller thread, an exception raised in the background thread"""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _worker(self) -> None:
+        """Write the submitted batches, in order"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            try:
+                if self._error is None:
+                    self._write(*item)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
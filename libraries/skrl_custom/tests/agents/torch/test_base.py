@@ -0,0 +1,39 @@
+import pytest
+
+import collections
+
+import torch
+
+from skrl.agents.torch import Agent
+
+
+def test_episode_statistics(capsys):
+    num_envs, num_steps = 3, 40
+    agent = Agent(models={}, memory=None, device="cpu", cfg={"experiment": {"write_interval": 1}})
+
+    # the total rewards and timesteps of the last 100 finished episodes, regardless of when they were written
+    expected_rewards = collections.deque(maxlen=100)
+    expected_timesteps = collections.deque(maxlen=100)
+    cumulative_rewards = torch.zeros(num_envs, 1)
+    cumulative_timesteps = torch.zeros(num_envs, 1)
+    for timestep in range(num_steps):
+        rewards = torch.rand(num_envs, 1)
+        terminated = torch.rand(num_envs, 1) > 0.9
+        truncated = torch.full((num_envs, 1), timestep % 10 == 9)
+        agent.record_transition(None, None, rewards, None, terminated, truncated, {}, timestep, num_steps)
+
+        cumulative_rewards += rewards
+        cumulative_timesteps += 1
+        finished = (terminated | truncated).view(-1)
+        expected_rewards.extend(cumulative_rewards[finished].view(-1).tolist())
+        expected_timesteps.extend(cumulative_timesteps[finished].view(-1).tolist())
+        cumulative_rewards[finished] = 0
+        cumulative_timesteps[finished] = 0
+
+    rewards_stats = agent._track_rewards.compute()
+    timesteps_stats = agent._track_timesteps.compute()
+    assert rewards_stats["count"] == len(expected_rewards)
+    assert rewards_stats["mean"] == pytest.approx(sum(expected_rewards) / len(expected_rewards))
+    assert rewards_stats["max"] == pytest.approx(max(expected_rewards))
+    assert timesteps_stats["min"] == min(expected_timesteps)
+    assert timesteps_stats["max"] == max(expected_timesteps)
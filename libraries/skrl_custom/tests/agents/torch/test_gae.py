@@ -0,0 +1,45 @@
+import hypothesis
+import hypothesis.strategies as st
+import pytest
+
+import torch
+
+from skrl.agents.torch.ppo.gae import compute_advantages, gae_loop, gae_scan
+
+
+@hypothesis.given(
+    memory_size=st.integers(min_value=1, max_value=40),
+    num_envs=st.integers(min_value=1, max_value=8),
+    discount_factor=st.floats(min_value=0, max_value=1),
+    lambda_coefficient=st.floats(min_value=0, max_value=1),
+    done_probability=st.floats(min_value=0, max_value=1),
+)
+@hypothesis.settings(
+    suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture],
+    deadline=None,
+    max_examples=50,
+)
+def test_scan(capsys, memory_size, num_envs, discount_factor, lambda_coefficient, done_probability):
+    rewards = torch.randn(memory_size, num_envs, 1)
+    values = torch.randn(memory_size, num_envs, 1)
+    dones = torch.rand(memory_size, num_envs, 1) < done_probability
+    next_values = torch.randn(num_envs, 1)
+
+    expected = gae_loop(rewards, dones, values, next_values, discount_factor, lambda_coefficient)
+    advantages = gae_scan(rewards, dones, values, next_values, discount_factor, lambda_coefficient)
+    assert torch.allclose(advantages, expected, atol=1e-5)
+
+    # scalar next values (e.g. no next states)
+    expected = gae_loop(rewards, dones, values, 0, discount_factor, lambda_coefficient)
+    advantages = gae_scan(rewards, dones, values, 0, discount_factor, lambda_coefficient)
+    assert torch.allclose(advantages, expected, atol=1e-5)
+
+
+def test_method(capsys):
+    rewards, values = torch.randn(4, 2, 1), torch.randn(4, 2, 1)
+    dones = torch.zeros(4, 2, 1, dtype=torch.bool)
+    for method in ["loop", "scan"]:
+        advantages = compute_advantages(rewards, dones, values, 0, method=method)
+        assert advantages.shape == rewards.shape
+    with pytest.raises(ValueError):
+        compute_advantages(rewards, dones, values, 0, method="unknown")
@@ -46,8 +46,10 @@ def _check_agent_config(config, default_config):
     rollouts=st.integers(min_value=1, max_value=5),
     learning_epochs=st.integers(min_value=1, max_value=5),
     mini_batches=st.integers(min_value=1, max_value=5),
+    shuffle_mini_batches=st.booleans(),
     discount_factor=st.floats(min_value=0, max_value=1),
     lambda_=st.floats(min_value=0, max_value=1),
+    gae_method=st.sampled_from(["loop", "scan"]),
     learning_rate=st.floats(min_value=1.0e-10, max_value=1),
     learning_rate_scheduler=st.one_of(st.none(), st.just(KLAdaptiveLR), st.just(torch.optim.lr_scheduler.ConstantLR)),
     learning_rate_scheduler_kwargs_value=st.floats(min_value=0.1, max_value=1),
@@ -65,6 +67,7 @@ def _check_agent_config(config, default_config):
     rewards_shaper=st.one_of(st.none(), st.just(lambda rewards, *args, **kwargs: 0.5 * rewards)),
     time_limit_bootstrap=st.booleans(),
     mixed_precision=st.booleans(),
+    compile_update=st.just(False),
 )
 @hypothesis.settings(
     suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture],
@@ -85,8 +88,10 @@ def test_agent(
     rollouts,
     learning_epochs,
     mini_batches,
+    shuffle_mini_batches,
     discount_factor,
     lambda_,
+    gae_method,
     learning_rate,
     learning_rate_scheduler,
     learning_rate_scheduler_kwargs_value,
@@ -104,6 +109,7 @@ def test_agent(
     rewards_shaper,
     time_limit_bootstrap,
     mixed_precision,
+    compile_update,
 ):
     # check device availability
     if not is_device_available(device, backend="torch"):
@@ -189,8 +195,10 @@ def test_agent(
         "rollouts": rollouts,
         "learning_epochs": learning_epochs,
         "mini_batches": mini_batches,
+        "shuffle_mini_batches": shuffle_mini_batches,
         "discount_factor": discount_factor,
         "lambda": lambda_,
+        "gae_method": gae_method,
         "learning_rate": learning_rate,
         "learning_rate_scheduler": learning_rate_scheduler,
         "learning_rate_scheduler_kwargs": {},
@@ -198,6 +206,7 @@ def test_agent(
         "state_preprocessor_kwargs": {"size": env.observation_space, "device": env.device},
         "value_preprocessor": value_preprocessor,
         "value_preprocessor_kwargs": {"size": 1, "device": env.device},
+        "fold_state_preprocessor": state_preprocessor is not None,
         "random_timesteps": random_timesteps,
         "learning_starts": learning_starts,
         "grad_norm_clip": grad_norm_clip,
@@ -210,12 +219,18 @@ def test_agent(
         "rewards_shaper": rewards_shaper,
         "time_limit_bootstrap": time_limit_bootstrap,
         "mixed_precision": get_test_mixed_precision(mixed_precision),
+        "compile_update": compile_update,
+        "compile_update_kwargs": {},
         "experiment": {
             "directory": "",
             "experiment_name": "",
             "write_interval": 0,
+            "tracking_formats": ["tensorboard"],
+            "background_tracking": False,
             "checkpoint_interval": 0,
             "store_separately": False,
+            "async_checkpoints": False,
+            "keep_checkpoints": 0,
             "wandb": False,
             "wandb_kwargs": {},
         },
@@ -255,3 +270,81 @@ def test_agent(
                 raise e
     else:
         trainer.train()
+
+
+def test_compiled_update(capsys):
+    num_envs, rollouts, timesteps = 4, 4, 8
+    observation_space = gymnasium.spaces.Box(low=-1, high=1, shape=(5,))
+    action_space = gymnasium.spaces.Box(low=-1, high=1, shape=(3,))
+
+    network = [{"name": "net", "input": "STATES", "layers": [32], "activations": "elu"}]
+    models = {
+        "policy": gaussian_model(
+            observation_space=observation_space,
+            action_space=action_space,
+            device="cpu",
+            network=network,
+            output="ACTIONS",
+        ),
+        "value": deterministic_model(
+            observation_space=observation_space,
+            action_space=action_space,
+            device="cpu",
+            network=network,
+            output="ONE",
+        ),
+    }
+    memory = RandomMemory(memory_size=rollouts, num_envs=num_envs, device="cpu")
+
+    cfg = {
+        "rollouts": rollouts,
+        "learning_epochs": 2,
+        "mini_batches": 2,
+        "compile_update": True,
+        "experiment": {"write_interval": 0, "checkpoint_interval": 0},
+    }
+    agent = Agent(
+        models=models,
+        memory=memory,
+        cfg=cfg,
+        observation_space=observation_space,
+        action_space=action_space,
+        device="cpu",
+    )
+    agent.init()
+
+    # interact with random observations (two rollouts, so two updates)
+    states = torch.rand(num_envs, 5)
+    for timestep in range(timesteps):
+        agent.pre_interaction(timestep=timestep, timesteps=timesteps)
+        with torch.no_grad():
+            actions = agent.act(states, timestep=timestep, timesteps=timesteps)[0]
+        next_states = torch.rand(num_envs, 5)
+        agent.record_transition(
+            states=states,
+            actions=actions,
+            rewards=torch.rand(num_envs, 1),
+            next_states=next_states,
+            terminated=torch.zeros(num_envs, 1, dtype=torch.bool),
+            truncated=torch.zeros(num_envs, 1, dtype=torch.bool),
+            infos={},
+            timestep=timestep,
+            timesteps=timesteps,
+        )
+        agent.post_interaction(timestep=timestep, timesteps=timesteps)
+        states = next_states
+
+    # the fixed-shape mini-batches of the updates (2 updates x 2 epochs x 2 mini-batches) run the compiled losses
+    compiled_losses = agent._mini_batch_losses
+    assert compiled_losses.num_compiled_calls == 2 * 2 * 2 and compiled_losses.num_eager_calls == 0
+
+    # the compiled losses match the eager ones
+    batch = memory.sample_all(names=agent._tensors_names, mini_batches=2)[0]
+    for compiled_loss, eager_loss in zip(compiled_losses(*batch), agent._compute_losses(*batch)):
+        assert torch.allclose(torch.as_tensor(compiled_loss), torch.as_tensor(eager_loss), atol=1e-5)
+
+    # a mini-batch of another shape falls back to the eager losses
+    smaller_batch = [tensor[:3] for tensor in batch]
+    for compiled_loss, eager_loss in zip(compiled_losses(*smaller_batch), agent._compute_losses(*smaller_batch)):
+        assert torch.allclose(torch.as_tensor(compiled_loss), torch.as_tensor(eager_loss), atol=1e-5)
+    assert compiled_losses.num_eager_calls == 1
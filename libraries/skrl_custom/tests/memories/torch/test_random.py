@@ -0,0 +1,47 @@
+import hypothesis
+import hypothesis.strategies as st
+
+import torch
+
+from skrl.memories.torch import RandomMemory
+
+
+@hypothesis.given(
+    memory_size=st.integers(min_value=1, max_value=10),
+    num_envs=st.integers(min_value=1, max_value=5),
+    mini_batches=st.integers(min_value=1, max_value=5),
+)
+@hypothesis.settings(
+    suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture],
+    deadline=None,
+    phases=[hypothesis.Phase.explicit, hypothesis.Phase.reuse, hypothesis.Phase.generate],
+)
+def test_sample_shuffled(capsys, memory_size, num_envs, mini_batches):
+    hypothesis.assume(memory_size * num_envs >= mini_batches)
+    memory = RandomMemory(memory_size=memory_size, num_envs=num_envs, device="cpu")
+    memory.create_tensor("states", size=3)
+    memory.create_tensor("terminated", size=1, dtype=torch.bool)
+    size = memory_size * num_envs
+    memory.get_tensor_by_name("states").copy_(torch.arange(size * 3, dtype=torch.float32).view(memory_size, num_envs, 3))
+    memory.get_tensor_by_name("terminated").copy_((torch.arange(size) % 2 == 0).view(memory_size, num_envs, 1))
+
+    batch_size = size // mini_batches
+    buffers = None
+    for _ in range(2):
+        batches = memory.sample_shuffled(names=["states", "terminated"], mini_batches=mini_batches)
+        assert len(batches) == mini_batches
+        for states, terminated in batches:
+            assert states.shape == (batch_size, 3) and terminated.shape == (batch_size, 1)
+            assert terminated.dtype == torch.bool
+            # rows are gathered consistently across the tensors
+            indexes = (states[:, 0] / 3).long()
+            assert torch.equal(terminated[:, 0], indexes % 2 == 0)
+        # samples are not repeated
+        indexes = torch.cat([states[:, 0] for states, _ in batches])
+        assert len(torch.unique(indexes)) == batch_size * mini_batches
+        # buffers are reused
+        data_ptrs = [states.data_ptr() for states, _ in batches]
+        if buffers is not None:
+            assert data_ptrs == buffers
+        buffers = data_ptrs
+    assert torch.equal(memory.get_sampling_indexes(), (indexes / 3).long())
@@ -0,0 +1,159 @@
+import hypothesis
+import hypothesis.strategies as st
+import pytest
+
+import torch
+
+from skrl.memories.torch import RandomMemory
+from skrl.memories.torch.storage import BitCodec, CastCodec, QuantizedCodec, create_storage_codec
+
+
+@hypothesis.given(
+    num_envs=st.integers(min_value=1, max_value=20),
+    size=st.integers(min_value=1, max_value=3),
+)
+@hypothesis.settings(
+    suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture],
+    deadline=None,
+    phases=[hypothesis.Phase.explicit, hypothesis.Phase.reuse, hypothesis.Phase.generate],
+)
+def test_codecs(capsys, num_envs, size):
+    # bits
+    codec = BitCodec()
+    assert codec.storage_shape((num_envs, size)) == ((num_envs * size + 7) // 8,)
+    tensor = torch.rand(4, num_envs, size) > 0.5
+    storage = codec.encode(tensor)
+    assert storage.dtype == torch.uint8 and storage.shape == (4, (num_envs * size + 7) // 8)
+    assert torch.equal(codec.decode(storage), tensor)
+
+    # uint8
+    codec = QuantizedCodec()
+    codec.storage_shape((num_envs, size))
+    tensor = torch.randint(0, 256, (4, num_envs, size)).float()
+    assert torch.equal(codec.decode(codec.encode(tensor)), tensor)
+    codec = QuantizedCodec(low=-1.0, high=1.0)
+    tensor = torch.rand(4, num_envs, size) * 2 - 1
+    assert torch.allclose(codec.decode(codec.encode(tensor)), tensor, atol=1 / 255)
+
+    # float16 / bfloat16
+    tensor = torch.randn(4, num_envs, size)
+    for dtype in [torch.float16, torch.bfloat16]:
+        codec = CastCodec(dtype)
+        assert codec.encode(tensor).dtype == dtype
+        assert torch.allclose(codec.decode(codec.encode(tensor)), tensor, rtol=1e-2, atol=1e-3)
+
+
+def test_create_storage_codec(capsys):
+    assert isinstance(create_storage_codec("bits"), BitCodec)
+    assert create_storage_codec("bfloat16").storage_dtype == torch.bfloat16
+    codec = create_storage_codec({"dtype": "uint8", "low": 0.0, "high": 1.0})
+    assert isinstance(codec, QuantizedCodec) and codec.high == 1.0
+    with pytest.raises(ValueError):
+        create_storage_codec("int4")
+
+
+@pytest.mark.parametrize("num_envs", [1, 3, 8])
+def test_memory(capsys, num_envs):
+    storage_dtypes = {"states": "uint8", "values": "bfloat16", "terminated": "bits"}
+    memories = [
+        RandomMemory(memory_size=6, num_envs=num_envs, device="cpu"),
+        RandomMemory(memory_size=6, num_envs=num_envs, device="cpu", storage_dtypes=storage_dtypes),
+    ]
+    for memory in memories:
+        memory.create_tensor("states", size=4)
+        memory.create_tensor("values", size=1)
+        memory.create_tensor("terminated", size=1, dtype=torch.bool)
+    compact = memories[1]
+    assert compact.get_tensor_by_name("states").dtype == torch.float32
+    assert compact.tensors["states"].dtype == torch.uint8
+    assert compact.tensors["values"].dtype == torch.bfloat16
+    assert compact.tensors["terminated"].numel() == 6 * ((num_envs + 7) // 8)
+
+    # record samples (full rows and, for multiple environments, partial rows)
+    for _ in range(6):
+        samples = {
+            "states": torch.randint(0, 256, (num_envs, 4)).float(),
+            "values": torch.randn(num_envs, 1),
+            "terminated": torch.rand(num_envs, 1) > 0.5,
+        }
+        if num_envs > 1:
+            for memory in memories:
+                memory.add_samples(**{k: v[:1] for k, v in samples.items()})
+                memory.add_samples(**{k: v[1:] for k, v in samples.items()})
+        else:
+            for memory in memories:
+                memory.add_samples(**samples)
+    for memory in memories:
+        assert memory.filled
+
+    # compare the sampled (decoded) data
+    names = ["states", "values", "terminated"]
+    expected = memories[0].sample_all(names=names, mini_batches=2)
+    for (states, values, terminated), (expected_states, expected_values, expected_terminated) in zip(
+        compact.sample_all(names=names, mini_batches=2), expected
+    ):
+        assert torch.equal(states, expected_states)
+        assert torch.allclose(values, expected_values, rtol=1e-2, atol=1e-2)
+        assert torch.equal(terminated, expected_terminated)
+    indexes = torch.tensor([0, 5, 2])
+    assert torch.equal(
+        compact.sample_by_index(names=["terminated"], indexes=indexes)[0][0],
+        memories[0].sample_by_index(names=["terminated"], indexes=indexes)[0][0],
+    )
+
+    # shuffled sampling
+    states, terminated = compact.sample_shuffled(names=["states", "terminated"])[0]
+    assert torch.equal(terminated, memories[0].get_tensor_by_name("terminated", keepdim=False)[compact.sampling_indexes])
+    assert torch.equal(states, memories[0].get_tensor_by_name("states", keepdim=False)[compact.sampling_indexes])
+
+    # set tensors
+    values = torch.randn(6, num_envs, 1)
+    compact.set_tensor_by_name("values", values)
+    assert torch.allclose(compact.get_tensor_by_name("values"), values, rtol=1e-2, atol=1e-2)
+
+
+@pytest.mark.parametrize("storage_dtypes", [None, {"states": "bfloat16"}])
+def test_share_next_states(capsys, storage_dtypes):
+    num_envs, memory_size = 3, 4
+    memories = [
+        RandomMemory(memory_size=memory_size, num_envs=num_envs, device="cpu"),
+        RandomMemory(
+            memory_size=memory_size,
+            num_envs=num_envs,
+            device="cpu",
+            storage_dtypes=storage_dtypes,
+            share_next_states=True,
+        ),
+    ]
+    for memory in memories:
+        memory.create_tensor("states", size=2)
+        memory.create_tensor("next_states", size=2)
+    shared = memories[1]
+    assert "next_states" not in shared.tensors and "next_states" in shared.get_tensor_names()
+
+    # continuous observations, except for a reset of the environment 1 after the step 2
+    observations = torch.arange((2 * memory_size + 1) * num_envs * 2, dtype=torch.float32).view(-1, num_envs, 2)
+    for step in range(2 * memory_size):
+        states, next_states = observations[step], observations[step + 1].clone()
+        if step == 2:
+            next_states[1] = -1
+        for memory in memories:
+            memory.add_samples(states=states, next_states=next_states)
+        assert torch.equal(shared.get_last_next_states(), next_states)
+
+        # the next states are the following states, except at the flagged resets
+        expected = memories[0].get_tensor_by_name("next_states", keepdim=False)[: len(shared)]
+        reset = shared.get_tensor_by_name("next_states_reset", keepdim=False)[: len(shared)].view(-1)
+        assert reset.sum().item() == (1 if 3 <= step < 2 + memory_size else 0)
+        assert torch.equal(shared.get_tensor_by_name("next_states", keepdim=False)[: len(shared)][~reset], expected[~reset])
+
+    indexes = torch.tensor([11, 0, 5])
+    assert torch.equal(
+        shared.sample_by_index(names=["next_states"], indexes=indexes)[0][0],
+        memories[0].sample_by_index(names=["next_states"], indexes=indexes)[0][0],
+    )
+    (next_states,) = shared.sample_shuffled(names=["next_states"])[0]
+    assert torch.equal(next_states, expected[shared.sampling_indexes])
+
+    with pytest.raises(ValueError):
+        shared.add_samples(states=observations[0][:1], next_states=observations[1][:1])
@@ -0,0 +1,70 @@
+import pytest
+
+import copy
+
+import torch
+
+from skrl.resources.preprocessors.torch import RunningStandardScaler
+
+
+def _reference(scaler, x):
+    # standardization of the original (unfused) implementation
+    mean, var = torch.mean(x, dim=0), torch.var(x, dim=0)
+    delta = mean - scaler.running_mean
+    total_count = scaler.current_count + x.shape[0]
+    M2 = (
+        scaler.running_variance * scaler.current_count
+        + var * x.shape[0]
+        + delta**2 * scaler.current_count * x.shape[0] / total_count
+    )
+    running_mean = scaler.running_mean + delta * x.shape[0] / total_count
+    running_variance = M2 / total_count
+    return torch.clamp(
+        (x - running_mean.float()) / (torch.sqrt(running_variance.float()) + scaler.epsilon),
+        min=-scaler.clip_threshold,
+        max=scaler.clip_threshold,
+    )
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_update_and_normalize(capsys, fused):
+    scaler = RunningStandardScaler(size=3, device="cpu", fused=fused)
+    for i in range(3):
+        x = 10 * torch.randn(64, 3) + i
+        expected = _reference(scaler, x)
+        assert torch.allclose(scaler(x, train=True), expected, atol=1e-5)
+    # 3-dimensional data
+    x = torch.randn(4, 16, 3)
+    expected = _reference(copy.deepcopy(scaler), x.view(-1, 3)).view(4, 16, 3)
+    assert torch.allclose(scaler(x, train=True), expected, atol=1e-5)
+    assert scaler.current_count.item() == 1 + 3 * 64 + 64
+
+
+def test_fold(capsys):
+    scaler = RunningStandardScaler(size=3, device="cpu", clip_threshold=2.0)
+    scaler(5 * torch.randn(128, 3) + 1, train=True)
+    model = torch.nn.Sequential(torch.nn.Linear(3, 8), torch.nn.ELU(), torch.nn.Linear(8, 2))
+
+    # inputs within and outside the clipping range
+    x = 10 * torch.randn(32, 3)
+    expected = model(scaler(x))
+    with scaler.folded(model) as preprocessor:
+        assert not isinstance(model[0], torch.nn.Linear)
+        assert torch.allclose(model(preprocessor(x)), expected, atol=1e-5)
+    assert isinstance(model[0], torch.nn.Linear)
+
+    # the folded layer is cached until the statistics or the parameters change
+    folded = scaler.fold(model[0])
+    assert scaler.fold(model[0]) is folded
+    with torch.no_grad():
+        model[0].weight.mul_(2)
+    assert scaler.fold(model[0]) is not folded
+    folded = scaler.fold(model[0])
+    scaler(torch.randn(16, 3), train=True)
+    assert scaler.fold(model[0]) is not folded
+    expected = model(scaler(x))
+    with scaler.folded(model) as preprocessor:
+        assert torch.allclose(model(preprocessor(x)), expected, atol=1e-5)
+
+    with pytest.raises(ValueError):
+        scaler.fold(torch.nn.Linear(4, 2))
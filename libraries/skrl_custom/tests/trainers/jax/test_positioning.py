@@ -0,0 +1,88 @@
+import pytest
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+
+from skrl.trainers.jax.positioning import (
+    POSITIONING_STRATEGIES,
+    PositioningStrategy,
+    create_positioning_strategy,
+    register_positioning_strategy,
+)
+
+
+class _Adversary:
+    def __init__(self, action_size):
+        self.action_size = action_size
+        self.timesteps = []
+
+    def pre_interaction(self, timestep, timesteps):
+        self.timesteps.append((timestep, timesteps))
+
+    def act(self, states, timestep, timesteps):
+        return jnp.repeat(states[:, :1], self.action_size, axis=1), None, {}
+
+
+def test_registry(capsys):
+    for name in ["domain_rand", "domain_rand_restricted", "boosting_adversary", "pure_adversary", "regret_adversary"]:
+        assert name in POSITIONING_STRATEGIES
+    with pytest.raises(ValueError):
+        create_positioning_strategy("invalid", num_envs=4, action_size=3)
+    with pytest.raises(ValueError):
+        register_positioning_strategy("domain_rand")(PositioningStrategy)
+    with pytest.raises(ValueError):
+        create_positioning_strategy("pure_adversary", num_envs=4, action_size=3)
+
+
+@pytest.mark.parametrize("name", ["domain_rand", "domain_rand_restricted", "boosting_adversary"])
+def test_random_strategies(capsys, name):
+    strategy = create_positioning_strategy(name, num_envs=8, action_size=6, cfg={"key": jax.random.PRNGKey(0)})
+    actions = strategy.sample()
+    assert actions is strategy.actions
+    assert actions.shape == (8, 6)
+    assert actions.min() >= -1 and actions.max() <= 1
+    if name == "domain_rand_restricted":
+        assert actions[:, 1:].min() >= 0
+    # a new key is used for every sample
+    assert not jnp.array_equal(strategy.sample(), actions)
+
+
+def test_boosting_strategy(capsys):
+    strategy = create_positioning_strategy("boosting_adversary", num_envs=4, action_size=3)
+    previous = strategy.sample()
+    rewards = jnp.array([[0.0], [1.0], [2.0], [3.0]])
+    actions = strategy.sample(timestep=1, rewards=rewards)
+    # placements below the median reward are perturbed
+    assert jnp.abs(actions[0] - previous[0]).max() <= 0.05 + 1e-6
+
+
+def test_adversary_strategies(capsys):
+    adversary = _Adversary(action_size=3)
+    cfg = {"adversary": adversary, "max_episode_length": 10, "timesteps": 100, "regret_rollouts": 2}
+
+    strategy = create_positioning_strategy("pure_adversary", num_envs=4, action_size=3, cfg=cfg)
+    rand_state = jnp.repeat(jnp.arange(4, dtype=jnp.float32).reshape(-1, 1), 2, axis=1)
+    assert jnp.array_equal(strategy.sample(rand_state=rand_state, timestep=9)[:, 0], jnp.arange(4))
+    assert adversary.timesteps[-1] == (1, 10)
+
+    strategy = create_positioning_strategy("regret_adversary", num_envs=4, action_size=3, cfg=cfg)
+    strategy.sample(rand_state=rand_state, timestep=19)
+    assert adversary.timesteps[-1] == (1, 5)
+    previous = strategy.actions
+    assert jnp.array_equal(strategy.sample(rand_state=-rand_state, regret_trials=1), previous)
+
+    # parallel regret estimation: one placement per group of environments
+    cfg["regret_parallel"] = True
+    strategy = create_positioning_strategy("regret_adversary", num_envs=4, action_size=3, cfg=cfg)
+    actions = strategy.sample(rand_state=rand_state[:2], timestep=9)
+    assert jnp.array_equal(actions[:, 0], jnp.array([0.0, 0.0, 1.0, 1.0]))
+    assert adversary.timesteps[-1] == (1, 10)
+
+
+def test_behavior_cloning_strategy(capsys):
+    positions = np.random.rand(3, 4, 2).astype(np.float32)
+    cfg = {"positions": positions, "max_episode_length": 10}
+    strategy = create_positioning_strategy("behavior_cloning", num_envs=4, action_size=2, cfg=cfg)
+    assert np.array_equal(np.asarray(strategy.sample(timestep=0)), positions[0])
+    assert np.array_equal(np.asarray(strategy.sample(timestep=9)), positions[1])
@@ -0,0 +1,82 @@
+import pytest
+
+import torch
+
+from skrl.agents.torch.ppo import PPO
+from skrl.memories.torch import RandomMemory
+from skrl.trainers.torch.adversary_population import AdversaryPopulation
+from skrl.trainers.torch.base import SharedModel
+
+
+def _adversary(num_envs):
+    model = SharedModel(4, 6, device="cpu")
+    agent = PPO(
+        models={"policy": model, "value": model},
+        memory=RandomMemory(num_envs=num_envs, memory_size=2, device="cpu"),
+        observation_space=4,
+        action_space=6,
+        device="cpu",
+        cfg={"rollouts": 1, "learning_starts": 1, "experiment": {"write_interval": 0, "checkpoint_interval": 0}},
+    )
+    agent.init()
+    return agent
+
+
+def test_population(capsys):
+    members = [_adversary(num_envs=5) for _ in range(3)]
+    population = AdversaryPopulation(members)
+    assert population.num_envs == 15
+    assert population.scopes == [(0, 5), (5, 10), (10, 15)]
+
+    states = torch.randn(15, 4)
+    with torch.no_grad():
+        actions, log_prob, outputs = population.act(states, timestep=0, timesteps=10)
+    assert actions.shape == (15, 6) and log_prob.shape == (15, 1)
+
+    # the vectorized forward pass matches each member's policy on its slice
+    for member, (start, stop) in zip(members, population.scopes):
+        with torch.no_grad():
+            mean_actions, _, _ = member.policy.compute({"states": states[start:stop]}, role="policy")
+            _, member_log_prob, _ = member.policy.act(
+                {"states": states[start:stop], "taken_actions": actions[start:stop]}, role="policy"
+            )
+        assert torch.allclose(outputs["mean_actions"][start:stop], mean_actions, atol=1e-6)
+        assert torch.allclose(log_prob[start:stop], member_log_prob, atol=1e-5)
+
+    # each member records (and learns from) its own slice
+    for timestep in range(3):
+        with torch.no_grad():
+            actions, _, _ = population.act(states, timestep=timestep, timesteps=10)
+        population.record_transition(
+            states=states,
+            actions=actions,
+            rewards=torch.randn(15, 1),
+            next_states=states,
+            terminated=torch.ones(15, 1),
+            truncated=torch.ones(15, 1),
+            infos={},
+            timestep=timestep,
+            timesteps=10,
+        )
+        for member, (start, stop) in zip(members, population.scopes):
+            assert torch.equal(member.memory.get_tensor_by_name("actions")[timestep % 2], actions[start:stop])
+        population.post_interaction(timestep=timestep, timesteps=10)
+
+
+def test_errors(capsys):
+    with pytest.raises(ValueError):
+        AdversaryPopulation([])
+    with pytest.raises(ValueError):
+        AdversaryPopulation([_adversary(num_envs=5), _adversary(num_envs=4)])
+
+
+def test_state_dict(capsys):
+    population = AdversaryPopulation([_adversary(num_envs=2) for _ in range(2)])
+    other = AdversaryPopulation([_adversary(num_envs=2) for _ in range(2)])
+    state_dict = population.state_dict()
+    assert list(state_dict) == ["0", "1"] and "policy" in state_dict["0"]
+
+    other.load_state_dict(state_dict)
+    for member, other_member in zip(population.members, other.members):
+        for parameter, other_parameter in zip(member.policy.parameters(), other_member.policy.parameters()):
+            assert torch.equal(parameter, other_parameter)
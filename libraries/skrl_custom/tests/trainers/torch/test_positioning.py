@@ -0,0 +1,120 @@
+import pytest
+
+import numpy as np
+import torch
+
+from skrl.trainers.torch.positioning import (
+    POSITIONING_STRATEGIES,
+    PositioningStrategy,
+    create_positioning_strategy,
+    register_positioning_strategy,
+)
+
+
+class _Adversary:
+    def __init__(self, action_size):
+        self.action_size = action_size
+        self.timesteps = []
+
+    def pre_interaction(self, timestep, timesteps):
+        self.timesteps.append((timestep, timesteps))
+
+    def act(self, states, timestep, timesteps):
+        return states[:, :1].repeat(1, self.action_size), -states[:, :1], {}
+
+
+def test_registry(capsys):
+    for name in ["domain_rand", "domain_rand_restricted", "boosting_adversary", "pure_adversary", "regret_adversary"]:
+        assert name in POSITIONING_STRATEGIES
+    with pytest.raises(ValueError):
+        create_positioning_strategy("invalid", num_envs=4, action_size=3, device="cpu")
+    with pytest.raises(ValueError):
+        register_positioning_strategy("domain_rand")(PositioningStrategy)
+    with pytest.raises(ValueError):
+        create_positioning_strategy("pure_adversary", num_envs=4, action_size=3, device="cpu")
+
+
+@pytest.mark.parametrize("name", ["domain_rand", "domain_rand_restricted", "boosting_adversary"])
+def test_random_strategies(capsys, name):
+    strategy = create_positioning_strategy(name, num_envs=8, action_size=6, device="cpu")
+    actions = strategy.sample()
+    assert actions is strategy.actions
+    assert actions.shape == (8, 6)
+    assert actions.min() >= -1 and actions.max() <= 1
+    if name == "domain_rand_restricted":
+        assert actions[:, 1:].min() >= 0
+
+    # partial sampling only updates the given environments
+    previous = actions.clone()
+    env_ids = torch.tensor([1, 5])
+    strategy.sample(env_ids, timestep=1, rewards=torch.arange(8, dtype=torch.float32).view(-1, 1))
+    mask = torch.ones(8, dtype=torch.bool)
+    mask[env_ids] = False
+    assert torch.equal(strategy.actions[mask], previous[mask])
+
+
+def test_boosting_strategy(capsys):
+    strategy = create_positioning_strategy("boosting_adversary", num_envs=4, action_size=3, device="cpu")
+    previous = strategy.sample().clone()
+    rewards = torch.tensor([[0.0], [1.0], [2.0], [3.0]])
+    actions = strategy.sample(timestep=1, rewards=rewards)
+    # placements below the median reward are perturbed
+    assert (actions[0] - previous[0]).abs().max() <= 0.05 + 1e-6
+
+
+def test_adversary_strategies(capsys):
+    adversary = _Adversary(action_size=3)
+    cfg = {"adversary": adversary, "max_episode_length": 10, "timesteps": 100, "regret_rollouts": 2}
+
+    strategy = create_positioning_strategy("pure_adversary", num_envs=4, action_size=3, device="cpu", cfg=cfg)
+    rand_state = torch.arange(4, dtype=torch.float32).view(-1, 1).repeat(1, 2)
+    assert torch.equal(strategy.sample(rand_state=rand_state, timestep=9)[:, 0], torch.arange(4, dtype=torch.float32))
+    assert adversary.timesteps[-1] == (1, 10)
+    # the log probabilities of the sampled placements, for the requested environments
+    strategy.sample(torch.tensor([1, 3]), rand_state=rand_state, timestep=9)
+    assert torch.equal(strategy.log_prob, -rand_state[[1, 3], :1])
+
+    strategy = create_positioning_strategy("regret_adversary", num_envs=4, action_size=3, device="cpu", cfg=cfg)
+    strategy.sample(rand_state=rand_state, timestep=19)
+    assert adversary.timesteps[-1] == (1, 5)
+    previous = strategy.actions.clone()
+    assert torch.equal(strategy.sample(rand_state=-rand_state, regret_trials=1), previous)
+
+    # parallel regret estimation: one placement per group of environments
+    cfg["regret_parallel"] = True
+    strategy = create_positioning_strategy("regret_adversary", num_envs=4, action_size=3, device="cpu", cfg=cfg)
+    actions = strategy.sample(rand_state=rand_state[:2], timestep=9)
+    assert torch.equal(actions[:, 0], torch.tensor([0.0, 0.0, 1.0, 1.0]))
+    assert adversary.timesteps[-1] == (1, 10)
+    with pytest.raises(ValueError):
+        strategy.sample(torch.tensor([0]), rand_state=rand_state[:2])
+
+
+def test_parallel_regret_strategy(capsys):
+    class _GroupAdversary(_Adversary):
+        def act(self, states, timestep, timesteps):
+            # a different value for each group and action dimension
+            actions = states[:, :1] * 10 + torch.arange(self.action_size, dtype=torch.float32)
+            return actions, None, {}
+
+    cfg = {"adversary": _GroupAdversary(action_size=3), "max_episode_length": 10, "regret_rollouts": 3}
+    cfg["regret_parallel"] = True
+    strategy = create_positioning_strategy("regret_adversary", num_envs=6, action_size=3, device="cpu", cfg=cfg)
+    rand_state = torch.tensor([[1.0], [2.0]])
+    actions = strategy.sample(rand_state=rand_state, timestep=9)
+    assert actions is strategy.actions
+    # each group of regret_rollouts consecutive environments gets its group's placement
+    expected = torch.tensor([[10.0, 11.0, 12.0]] * 3 + [[20.0, 21.0, 22.0]] * 3)
+    assert torch.equal(actions, expected)
+    # the placements are kept during the regret trials
+    assert torch.equal(strategy.sample(rand_state=-rand_state, timestep=19, regret_trials=1), expected)
+
+
+def test_behavior_cloning_strategy(capsys):
+    positions = np.random.rand(3, 4, 2).astype(np.float32)
+    cfg = {"positions": positions, "max_episode_length": 10}
+    strategy = create_positioning_strategy("behavior_cloning", num_envs=4, action_size=2, device="cpu", cfg=cfg)
+    assert np.array_equal(strategy.sample(timestep=0).numpy(), positions[0])
+    assert np.array_equal(strategy.sample(timestep=9).numpy(), positions[1])
+    strategy.sample(torch.tensor([2]), timestep=19)
+    assert np.array_equal(strategy.actions[2].numpy(), positions[2][2])
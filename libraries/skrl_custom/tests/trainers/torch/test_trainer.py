@@ -0,0 +1,147 @@
+import os
+import types
+
+import gymnasium
+
+import numpy as np
+import torch
+
+from skrl.agents.torch.ppo import PPO
+from skrl.envs.wrappers.torch import wrap_env
+from skrl.memories.torch import RandomMemory
+from skrl.trainers.torch import SequentialTrainer
+from skrl.trainers.torch.base import SharedModel
+
+
+class _AdversarialEnv:
+    def __init__(self, num_envs, episode_lengths, positioning_strategy="pure_adversary", async_reset=False):
+        """Stand-in for the adversarial Isaac Lab environment
+
+        Environment ``i`` ends its episodes every ``episode_lengths[i]`` steps. With asynchronous resets, the finished
+        environments are reset (and their placements queried) right away, otherwise once all of them have finished
+        """
+        self.num_envs = num_envs
+        self.device = "cpu"
+        self.max_episode_length = int(max(episode_lengths))
+        self.num_clutter_objects = 1
+        self.cfg = types.SimpleNamespace(
+            positioning_strategy=positioning_strategy,
+            train_mode="train",
+            train_actions_path=None,
+            train_positions_path=None,
+            async_reset=async_reset,
+        )
+        self.single_observation_space = {"policy": gymnasium.spaces.Box(-1, 1, (3,))}
+        self.single_action_space = gymnasium.spaces.Box(-1, 1, (2,))
+        self.adversary_action = torch.zeros((num_envs, (self.num_clutter_objects + 1) * 3))
+        self.adversary_action_sampler = None
+        self.unwrapped = self
+        self.env = self
+
+        self.episode_lengths = torch.tensor(episode_lengths)
+        self.episode_length_buf = torch.zeros(num_envs, dtype=torch.long)
+        self.reset_env_ids = []
+        self.placements = []
+        self.rewards = []
+
+    def reset(self):
+        self._reset_idx(torch.arange(self.num_envs))
+        return {"policy": torch.rand(self.num_envs, 3)}, {}
+
+    def step(self, actions):
+        self.episode_length_buf += 1
+        rewards = torch.rand(self.num_envs)
+        self.rewards.append(rewards)
+        done = self.episode_length_buf >= self.episode_lengths
+        reset_env_ids = done.nonzero(as_tuple=False).squeeze(-1)
+        extras = {}
+        if len(reset_env_ids) == self.num_envs or (self.cfg.async_reset and len(reset_env_ids)):
+            extras["log"] = {"success_map": rewards[reset_env_ids] > 0.5}
+            self._reset_idx(reset_env_ids)
+        return {"policy": torch.rand(self.num_envs, 3)}, rewards, done, torch.zeros_like(done), extras
+
+    def close(self):
+        pass
+
+    def _reset_idx(self, env_ids):
+        self.reset_env_ids.append(env_ids)
+        self.episode_length_buf[env_ids] = 0
+        if self.adversary_action_sampler is not None:
+            self.adversary_action[env_ids] = self.adversary_action_sampler(env_ids)
+        self.placements.append(self.adversary_action.clone())
+
+
+def _trainer(env, directory, timesteps, **cfg):
+    env = wrap_env(env, wrapper="isaaclab")
+    model = SharedModel(3, 2, device="cpu")
+    agent = PPO(
+        models={"policy": model, "value": model},
+        memory=RandomMemory(num_envs=env.num_envs, memory_size=4, device="cpu"),
+        observation_space=env.observation_space,
+        action_space=env.action_space,
+        device="cpu",
+        cfg={"rollouts": 4, "experiment": {"directory": str(directory), "write_interval": 0, "checkpoint_interval": 0}},
+    )
+    cfg.update({"timesteps": timesteps, "headless": True, "disable_progressbar": True, "close_environment_at_exit": False})
+    return SequentialTrainer(env=env, agents=agent, cfg=cfg)
+
+
+def test_async_reset(capsys, tmp_path):
+    env = _AdversarialEnv(num_envs=4, episode_lengths=[2, 3, 4, 3], async_reset=True)
+    trainer = _trainer(env, tmp_path, timesteps=12)
+    trainer.train()
+
+    # the environments are reset in part, as soon as their episodes end
+    assert any(0 < len(env_ids) < env.num_envs for env_ids in env.reset_env_ids)
+
+    # every finished episode is queued, in the order the episodes finish, with the placement it started with
+    finished_placements = []
+    placements = env.placements[0].clone()
+    for env_ids, next_placements in zip(env.reset_env_ids[1:], env.placements[1:]):
+        finished_placements.extend(placements[env_ids])
+        placements[env_ids] = next_placements[env_ids]
+    assert len(finished_placements) == 6 + 4 + 3 + 4
+
+    # the adversary records the queued placements num_envs at a time, with the log probabilities
+    # of the placements when they were sampled (and not the ones of its last sampled placements)
+    memory = trainer.adversary.memory
+    num_records = len(finished_placements) // env.num_envs
+    assert memory.memory_index == num_records
+    actions = memory.get_tensor_by_name("actions")[:num_records].view(num_records * env.num_envs, -1)
+    assert torch.equal(actions, torch.stack(finished_placements[: len(actions)]))
+    states = memory.get_tensor_by_name("states")[:num_records].view(len(actions), -1)
+    with torch.no_grad():
+        _, log_prob, _ = trainer.adversary.policy.act({"states": states, "taken_actions": actions}, role="policy")
+    assert torch.allclose(memory.get_tensor_by_name("log_prob")[:num_records].view(-1, 1), log_prob, atol=1e-5)
+
+
+def test_parallel_regret(capsys, tmp_path):
+    num_envs, max_episode_length, num_episodes = 10, 4, 3
+    env = _AdversarialEnv(num_envs, [max_episode_length] * num_envs, positioning_strategy="regret_adversary")
+    trainer = _trainer(env, tmp_path, timesteps=max_episode_length * num_episodes, regret_parallel=True)
+    trainer.train()
+    regret_rollouts, num_groups = trainer.regret_rollouts, num_envs // trainer.regret_rollouts
+
+    memory = trainer.adversary.memory
+    assert memory.memory_index == num_episodes
+    expected_rewards = []
+    for episode in range(num_episodes):
+        # every environment of a group runs the placement the adversary sampled for the group
+        placements = env.placements[episode].view(num_groups, regret_rollouts, -1)
+        assert torch.equal(placements, placements[:, :1].expand_as(placements))
+        assert torch.equal(memory.get_tensor_by_name("actions")[episode], placements[:, 0])
+
+        # regret of each group: max minus mean of the (negated) discounted episode rewards of its environments,
+        # up to the second last step of the episode, minus the range penalty of the placement
+        episode_rewards = torch.zeros(num_envs)
+        for rewards in env.rewards[episode * max_episode_length : (episode + 1) * max_episode_length - 1]:
+            episode_rewards = 0.98 * episode_rewards + rewards
+        grouped_rewards = -episode_rewards.view(num_groups, regret_rollouts)
+        range_penalty = torch.clamp(placements[:, 0] ** 2 - 1, min=0).sum(dim=1)
+        expected_rewards.append(grouped_rewards.amax(dim=1) - grouped_rewards.mean(dim=1) - range_penalty)
+    expected_rewards = torch.stack(expected_rewards)
+    assert torch.allclose(memory.get_tensor_by_name("rewards")[:num_episodes].squeeze(-1), expected_rewards, atol=1e-5)
+
+    # the logged adversary rewards are the recorded ones
+    adversary_reward_log = np.load(os.path.join(trainer.agents.experiment_dir, "training_logs", "adversary_reward_log.npy"))
+    assert np.allclose(adversary_reward_log, expected_rewards.numpy(), atol=1e-5)
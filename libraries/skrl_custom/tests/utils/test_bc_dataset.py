@@ -0,0 +1,44 @@
+import pytest
+
+import numpy as np
+
+from skrl.utils.bc_dataset import BCDatasetReader, BCDatasetWriter, EpisodePrefetcher
+
+
+def test_write_and_read(capsys, tmp_path):
+    directory = str(tmp_path / "bc_dataset")
+    actions = np.random.rand(7, 5, 4, 3).astype(np.float32)
+    positions = np.random.rand(8, 4, 6).astype(np.float32)
+
+    assert not BCDatasetReader.is_dataset(directory)
+    writer = BCDatasetWriter(directory, episodes_per_shard=3, metadata={"max_episode_length": 5})
+    for i in range(8):
+        writer.append_position(positions[i])
+        if i < 7:
+            writer.append_actions(list(actions[i]))
+    writer.close()
+    assert len(writer) == 7
+
+    assert BCDatasetReader.is_dataset(directory)
+    reader = BCDatasetReader(directory)
+    assert len(reader) == 7
+    assert reader.metadata == {"max_episode_length": 5, "num_episodes": 7}
+    assert np.array_equal(reader.positions(), positions)
+    for i in range(7):
+        assert np.array_equal(reader.load_actions(i), actions[i])
+
+
+def test_prefetcher(capsys):
+    prefetcher = EpisodePrefetcher(lambda episode: np.full((2,), episode), start=1, num_prefetch=2)
+    assert np.array_equal(prefetcher.get(1), [1, 1])
+    assert np.array_equal(prefetcher.get(3), [3, 3])  # skip episode 2
+    with pytest.raises(ValueError):
+        prefetcher.get(2)
+    prefetcher.close()
+
+
+def test_prefetcher_load_error(capsys, tmp_path):
+    prefetcher = EpisodePrefetcher(lambda episode: np.load(str(tmp_path / f"{episode}.npy")))
+    with pytest.raises(FileNotFoundError):
+        prefetcher.get(0)
+    prefetcher.close()
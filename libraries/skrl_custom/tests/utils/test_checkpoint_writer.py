@@ -0,0 +1,60 @@
+import pytest
+
+import os
+
+import torch
+
+from skrl.utils.checkpoint_writer import CheckpointWriter
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_save(capsys, tmp_path, asynchronous):
+    writer = CheckpointWriter(asynchronous=asynchronous, keep=2)
+    model = torch.nn.Linear(3, 2)
+    optimizer = torch.optim.Adam(model.parameters())
+    model(torch.randn(4, 3)).sum().backward()
+    optimizer.step()
+
+    for timestep in range(4):
+        with torch.no_grad():
+            model.weight.fill_(timestep)
+        state = {"model": model.state_dict(), "optimizer": optimizer.state_dict()}
+        writer.save(state, str(tmp_path / f"agent_{timestep}.pt"), group="agent")
+        # later changes do not affect the written checkpoint
+        with torch.no_grad():
+            model.weight.fill_(-1)
+    writer.save({"step": 1}, str(tmp_path / "best_agent.pt"))
+    writer.synchronize()
+
+    # only the most recent checkpoints of the group are kept (and no temporary files are left)
+    assert sorted(os.listdir(tmp_path)) == ["agent_2.pt", "agent_3.pt", "best_agent.pt"]
+    for timestep in [2, 3]:
+        state = torch.load(tmp_path / f"agent_{timestep}.pt", weights_only=False)
+        assert torch.all(state["model"]["weight"] == timestep)
+        assert state["optimizer"]["param_groups"] == optimizer.state_dict()["param_groups"]
+    writer.close()
+
+
+def test_snapshot(capsys, tmp_path):
+    writer = CheckpointWriter(asynchronous=True)
+    tensor = torch.zeros(3)
+    snapshot = writer.snapshot({"tensor": tensor, "values": [tensor, 1]})
+    tensor.fill_(1)
+    writer.save(snapshot, str(tmp_path / "best.pt"), snapshot=False)
+    writer.close()
+    state = torch.load(tmp_path / "best.pt", weights_only=False)
+    assert torch.all(state["tensor"] == 0) and torch.all(state["values"][0] == 0) and state["values"][1] == 1
+
+
+def test_errors(capsys, tmp_path):
+    with pytest.raises(ValueError):
+        CheckpointWriter(keep=-1)
+
+    # errors of the background thread are raised in the caller thread
+    writer = CheckpointWriter(asynchronous=True)
+    writer.save({}, str(tmp_path / "missing" / "agent.pt"))
+    with pytest.raises(Exception):
+        writer.synchronize()
+    writer.save({}, str(tmp_path / "agent.pt"))
+    writer.close()
+    assert os.listdir(tmp_path) == ["agent.pt"]
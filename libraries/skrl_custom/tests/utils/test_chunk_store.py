@@ -0,0 +1,71 @@
+import hypothesis
+import hypothesis.strategies as st
+import pytest
+
+import numpy as np
+
+from skrl.utils.chunk_store import ChunkedArrayReader, ChunkedArrayWriter
+
+
+@hypothesis.given(
+    num_items=st.integers(min_value=0, max_value=20),
+    chunk_size=st.integers(min_value=1, max_value=8),
+    flush_interval=st.integers(min_value=0, max_value=3),
+)
+@hypothesis.settings(
+    suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture],
+    deadline=None,
+    max_examples=25,
+)
+def test_append_and_read(capsys, tmp_path_factory, num_items, chunk_size, flush_interval):
+    directory = str(tmp_path_factory.mktemp("store"))
+    items = np.random.rand(num_items, 3, 2).astype(np.float32)
+
+    writer = ChunkedArrayWriter(directory, chunk_size=chunk_size, flush_interval=flush_interval)
+    for item in items:
+        writer.append(item)
+    writer.close()
+
+    reader = ChunkedArrayReader(directory)
+    assert len(reader) == len(writer) == num_items
+    assert np.array_equal(reader.to_numpy().reshape(items.shape), items)
+    assert np.array_equal(reader[:].reshape(items.shape), items)
+    if num_items:
+        assert np.array_equal(reader[-1], items[-1])
+
+
+def test_read_while_writing(capsys, tmp_path):
+    writer = ChunkedArrayWriter(str(tmp_path), chunk_size=4, flush_interval=1)
+    reader = ChunkedArrayReader(str(tmp_path))
+    assert len(reader) == 0
+
+    for i in range(6):
+        writer.append(np.full((2,), i, dtype=np.int64))
+        reader.refresh()
+        assert len(reader) == i + 1
+        assert np.array_equal(reader[i], [i, i])
+
+
+def test_export_npy(capsys, tmp_path):
+    items = np.arange(30).reshape(10, 3)
+    writer = ChunkedArrayWriter(str(tmp_path / "store"), chunk_size=3, flush_interval=0)
+    for item in items:
+        writer.append(item)
+    writer.close()
+
+    ChunkedArrayReader(str(tmp_path / "store")).export_npy(str(tmp_path / "store.npy"))
+    assert np.array_equal(np.load(str(tmp_path / "store.npy")), items)
+
+
+def test_errors(capsys, tmp_path):
+    with pytest.raises(ValueError):
+        ChunkedArrayWriter(str(tmp_path), chunk_size=0)
+
+    writer = ChunkedArrayWriter(str(tmp_path))
+    writer.append(np.zeros((2,)))
+    with pytest.raises(ValueError):
+        writer.append(np.zeros((3,)))
+    writer.close()
+
+    with pytest.raises(IndexError):
+        ChunkedArrayReader(str(tmp_path))[1]
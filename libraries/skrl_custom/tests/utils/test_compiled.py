@@ -0,0 +1,44 @@
+import torch
+
+from skrl.utils.compiled import CompiledFunction
+
+
+def test_shape_fallback(capsys):
+    def function(x, y):
+        return (x * y).sin().sum(dim=-1)
+
+    compiled = CompiledFunction(function)
+    x, y = torch.randn(8, 3), torch.randn(8, 3)
+    for _ in range(2):
+        assert torch.allclose(compiled(x, y), function(x, y))
+    assert compiled.num_compiled_calls == 2
+
+    # different shapes run eagerly
+    assert torch.allclose(compiled(x[:5], y[:5]), function(x[:5], y[:5]))
+    assert compiled.num_compiled_calls == 2 and compiled.num_eager_calls == 1
+
+
+def test_gradients(capsys):
+    layer = torch.nn.Linear(3, 1)
+
+    def loss(x):
+        return layer(x).pow(2).mean()
+
+    compiled = CompiledFunction(loss)
+    x = torch.randn(8, 3)
+    compiled(x).backward()
+    compiled_grad = layer.weight.grad.clone()
+    layer.zero_grad()
+    loss(x).backward()
+    assert torch.allclose(compiled_grad, layer.weight.grad, atol=1e-6)
+
+
+def test_compilation_failure(capsys):
+    def function(x):
+        return x + 1
+
+    compiled = CompiledFunction(function, backend="unknown_backend")
+    assert torch.equal(compiled(torch.zeros(2)), torch.ones(2))
+    assert compiled.num_eager_calls == 1 and compiled.num_compiled_calls == 0
+    assert torch.equal(compiled(torch.zeros(2)), torch.ones(2))
+    assert compiled.num_eager_calls == 2
@@ -0,0 +1,41 @@
+import pytest
+
+import numpy as np
+import torch
+
+from skrl.utils.host_copy import AsyncHostCopier
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_copy(capsys, device):
+    if device.startswith("cuda") and not torch.cuda.is_available():
+        pytest.skip("CUDA is not available")
+
+    copier = AsyncHostCopier(num_buffers=2)
+    tensor = torch.zeros((4, 3), device=device)
+    copies, calls = [], []
+    for i in range(5):
+        tensor.fill_(i)  # in-place updates after the submission must not affect the copy
+        copier.copy("tensor", tensor, copies.append)
+        copier.call(lambda: calls.append(len(copies)))
+    copier.close()
+
+    assert len(copies) == 5
+    for i, array in enumerate(copies):
+        assert isinstance(array, np.ndarray)
+        assert np.array_equal(array, np.full((4, 3), i, dtype=np.float32))
+    assert calls == [1, 2, 3, 4, 5]
+
+
+def test_errors(capsys):
+    with pytest.raises(ValueError):
+        AsyncHostCopier(num_buffers=0)
+
+    def callback(array):
+        raise RuntimeError("callback error")
+
+    copier = AsyncHostCopier()
+    copier.copy("tensor", torch.zeros(2), callback)
+    with pytest.raises(RuntimeError):
+        copier.synchronize()
+    copier.close()
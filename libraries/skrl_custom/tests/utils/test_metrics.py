@@ -0,0 +1,87 @@
+import hypothesis
+import hypothesis.strategies as st
+import pytest
+
+import collections
+
+import numpy as np
+import torch
+
+from skrl.utils.metrics import MetricsAccumulator, RollingWindow
+
+
+@hypothesis.given(
+    num_steps=st.integers(min_value=1, max_value=10),
+    num_envs=st.integers(min_value=1, max_value=16),
+)
+@hypothesis.settings(
+    suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture],
+    deadline=None,
+    max_examples=25,
+)
+def test_accumulate(capsys, num_steps, num_envs):
+    values = torch.randn(num_steps, num_envs, 1)
+    masks = torch.rand(num_steps, num_envs, 1) > 0.5
+
+    accumulator = MetricsAccumulator(device="cpu")
+    for value, mask in zip(values, masks):
+        accumulator.add("value", value)
+        accumulator.add("masked", value, mask=mask)
+        accumulator.add("scalar", float(value[0]))
+    stats = accumulator.compute()
+
+    assert len(accumulator) == 3 and "value" in accumulator
+    assert stats["value"]["count"] == num_steps * num_envs
+    assert stats["value"]["min"] == pytest.approx(values.min().item())
+    assert stats["value"]["max"] == pytest.approx(values.max().item())
+    assert stats["value"]["mean"] == pytest.approx(values.double().mean().item())
+    assert stats["scalar"]["mean"] == pytest.approx(np.mean(values[:, 0, 0].tolist()))
+    if masks.any():
+        assert stats["masked"]["count"] == masks.sum().item()
+        assert stats["masked"]["min"] == pytest.approx(values[masks].min().item())
+        assert stats["masked"]["max"] == pytest.approx(values[masks].max().item())
+        assert accumulator.mean("masked") == pytest.approx(values[masks].double().mean().item())
+    else:
+        assert "masked" not in stats
+        assert accumulator.mean("masked") is None
+
+
+def test_reset(capsys):
+    accumulator = MetricsAccumulator()
+    assert accumulator.compute() == {}
+    accumulator.add("value", torch.tensor([1.0, 2.0]))
+    accumulator.reset()
+    assert accumulator.compute() == {}
+    accumulator.add("value", torch.tensor([3.0]))
+    assert accumulator.compute()["value"] == {"sum": 3.0, "min": 3.0, "max": 3.0, "count": 1.0, "mean": 3.0}
+    assert accumulator.mean("missing") is None
+
+
+@hypothesis.given(
+    num_steps=st.integers(min_value=1, max_value=10),
+    num_envs=st.integers(min_value=1, max_value=16),
+    size=st.integers(min_value=1, max_value=20),
+)
+@hypothesis.settings(
+    suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture],
+    deadline=None,
+    max_examples=25,
+)
+def test_rolling_window(capsys, num_steps, num_envs, size):
+    values = torch.randn(num_steps, num_envs, 1)
+    masks = torch.rand(num_steps, num_envs, 1) > 0.5
+
+    window = RollingWindow(size=size, device="cpu")
+    assert window.compute() is None
+    expected = collections.deque(maxlen=size)
+    for value, mask in zip(values, masks):
+        window.extend(value, mask=mask)
+        expected.extend(value[mask].tolist())
+        stats = window.compute()
+        if expected:
+            assert stats["count"] == len(expected)
+            assert stats["min"] == pytest.approx(min(expected))
+            assert stats["max"] == pytest.approx(max(expected))
+            assert stats["mean"] == pytest.approx(np.mean(expected))
+        else:
+            assert stats is None
@@ -0,0 +1,60 @@
+import pytest
+
+import os
+
+from skrl.utils.scalar_writer import CSVScalarSink, ScalarWriter, read_scalars
+
+
+class _ListSink:
+    def __init__(self):
+        self.batches = []
+        self.closed = False
+
+    def write(self, scalars, step):
+        if "error" in scalars:
+            raise RuntimeError("sink error")
+        self.batches.append((step, dict(scalars)))
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_writer(capsys, tmp_path, background):
+    sink = _ListSink()
+    writer = ScalarWriter([sink, CSVScalarSink(str(tmp_path))], background=background, max_queue_size=2)
+    for step in range(10):
+        writer.write({"Loss / Policy loss": step / 10, "Reward / Total reward (mean)": -step}, step)
+    writer.flush()
+    assert [step for step, _ in sink.batches] == list(range(10))
+
+    # the CSV file can be read while the writer is open
+    scalars = read_scalars(str(tmp_path))
+    assert scalars["Loss / Policy loss"] == [(step, step / 10) for step in range(10)]
+    assert scalars["Reward / Total reward (mean)"][-1] == (9, -9.0)
+    writer.close()
+    assert sink.closed
+
+
+def test_partial_row(capsys, tmp_path):
+    sink = CSVScalarSink(str(tmp_path))
+    sink.write({"a": 1.0}, 1)
+    sink.close()
+    with open(os.path.join(tmp_path, "scalars.csv"), "a") as file:
+        file.write("2,a")
+    assert read_scalars(os.path.join(tmp_path, "scalars.csv")) == {"a": [(1, 1.0)]}
+
+
+def test_errors(capsys):
+    with pytest.raises(ValueError):
+        ScalarWriter([], max_queue_size=0)
+
+    # errors of the background thread are raised in the caller thread
+    writer = ScalarWriter([_ListSink()], background=True)
+    writer.write({"error": 0.0}, 0)
+    with pytest.raises(RuntimeError):
+        writer.flush()
+    writer.close()
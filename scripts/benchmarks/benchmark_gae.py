@@ -0,0 +1,72 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the GAE computation methods of the skrl PPO agent.
+
+It compares the reversed loop over the rollouts ("loop") with the parallel scan ("scan") on synthetic rollouts
+and does not require the simulator.
+
+.. code-block:: bash
+
+    python scripts/benchmarks/benchmark_gae.py --num_envs 4096 --rollouts 16 64 256 --device cuda:0
+
+"""
+
+import argparse
+import time
+import torch
+
+from skrl.agents.torch.ppo.gae import compute_advantages
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the GAE computation methods.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument("--rollouts", type=int, nargs="+", default=[16, 64, 256], help="Rollout lengths to benchmark.")
+parser.add_argument("--done_probability", type=float, default=0.01, help="Probability of an episode end per step.")
+parser.add_argument("--num_iterations", type=int, default=50, help="Number of timed iterations.")
+parser.add_argument("--device", type=str, default="cuda:0" if torch.cuda.is_available() else "cpu", help="Device.")
+args_cli = parser.parse_args()
+
+
+def benchmark(rollouts: int, method: str) -> tuple[float, float]:
+    """Time a GAE computation method.
+
+    Returns:
+        The mean time per call (in milliseconds) and the maximum absolute difference with the loop method.
+    """
+    device = torch.device(args_cli.device)
+    rewards = torch.randn(rollouts, args_cli.num_envs, 1, device=device)
+    values = torch.randn(rollouts, args_cli.num_envs, 1, device=device)
+    dones = torch.rand(rollouts, args_cli.num_envs, 1, device=device) < args_cli.done_probability
+    next_values = torch.randn(args_cli.num_envs, 1, device=device)
+    kwargs = dict(rewards=rewards, dones=dones, values=values, next_values=next_values)
+
+    expected = compute_advantages(**kwargs, method="loop")
+    # warm up
+    for _ in range(3):
+        advantages = compute_advantages(**kwargs, method=method)
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    start = time.perf_counter()
+    for _ in range(args_cli.num_iterations):
+        compute_advantages(**kwargs, method=method)
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    elapsed = (time.perf_counter() - start) / args_cli.num_iterations
+    return 1000 * elapsed, (advantages - expected).abs().max().item()
+
+
+def main():
+    print(f"[INFO] GAE benchmark: {args_cli.num_envs} environments on {args_cli.device}")
+    print(f"{'rollouts':>10} {'method':>12} {'time (ms)':>12} {'speedup':>10} {'max error':>12}")
+    for rollouts in args_cli.rollouts:
+        loop_time, _ = benchmark(rollouts, "loop")
+        print(f"{rollouts:>10} {'loop':>12} {loop_time:>12.3f} {1.0:>10.2f} {0.0:>12.2e}")
+        scan_time, error = benchmark(rollouts, "scan")
+        print(f"{rollouts:>10} {'scan':>12} {scan_time:>12.3f} {loop_time / scan_time:>10.2f} {error:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the eager and compiled mini-batch update of the skrl PPO agent.
+
+It times the PPO update (``compile_update`` disabled and enabled) of the adversary model (32-unit shared MLP)
+on synthetic rollouts. It does not require the simulator and runs on CPU.
+
+.. code-block:: bash
+
+    python scripts/benchmarks/benchmark_ppo_update.py --num_envs 64 --rollouts 25 --device cpu
+
+"""
+
+import argparse
+import copy
+import time
+import torch
+
+from skrl.agents.torch.ppo import PPO
+from skrl.memories.torch import RandomMemory
+from skrl.trainers.torch.base import SharedModel
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the eager and compiled PPO updates.")
+parser.add_argument("--num_envs", type=int, default=64, help="Number of environments.")
+parser.add_argument("--rollouts", type=int, default=25, help="Number of rollouts per update.")
+parser.add_argument("--learning_epochs", type=int, default=8, help="Number of learning epochs per update.")
+parser.add_argument("--mini_batches", type=int, default=4, help="Number of mini-batches per learning epoch.")
+parser.add_argument("--num_observations", type=int, default=4, help="Size of the observations.")
+parser.add_argument("--num_actions", type=int, default=12, help="Size of the actions.")
+parser.add_argument("--num_updates", type=int, default=20, help="Number of timed updates.")
+parser.add_argument("--compile_mode", type=str, default=None, help="torch.compile mode (e.g. reduce-overhead).")
+parser.add_argument("--device", type=str, default="cpu", help="Device.")
+args_cli = parser.parse_args()
+
+
+def create_agent(model: SharedModel, compile_update: bool) -> PPO:
+    """Create a PPO agent with a copy of the model and a memory filled with synthetic transitions."""
+    model = copy.deepcopy(model)
+    cfg = {
+        "rollouts": args_cli.rollouts,
+        "learning_epochs": args_cli.learning_epochs,
+        "mini_batches": args_cli.mini_batches,
+        "compile_update": compile_update,
+        "compile_update_kwargs": {"mode": args_cli.compile_mode} if args_cli.compile_mode else {},
+        "experiment": {"write_interval": 0, "checkpoint_interval": 0},
+    }
+    agent = PPO(
+        models={"policy": model, "value": model},
+        memory=RandomMemory(num_envs=args_cli.num_envs, memory_size=args_cli.rollouts, device=args_cli.device),
+        observation_space=args_cli.num_observations,
+        action_space=args_cli.num_actions,
+        device=args_cli.device,
+        cfg=cfg,
+    )
+    agent.init()
+    agent.set_mode("train")
+
+    generator = torch.Generator(device=args_cli.device).manual_seed(0)
+    shape = (args_cli.rollouts, args_cli.num_envs)
+    for name, size in [("states", args_cli.num_observations), ("actions", args_cli.num_actions)]:
+        agent.memory.get_tensor_by_name(name).copy_(torch.randn(*shape, size, generator=generator, device=args_cli.device))
+    for name in ["rewards", "log_prob", "values"]:
+        agent.memory.get_tensor_by_name(name).copy_(torch.randn(*shape, 1, generator=generator, device=args_cli.device))
+    agent.memory.filled = True
+    agent._current_next_states = torch.randn(args_cli.num_envs, args_cli.num_observations, device=args_cli.device)
+    return agent
+
+
+def benchmark(agent: PPO) -> float:
+    """Time the agent's update.
+
+    Returns:
+        The mean time per update (in milliseconds).
+    """
+    device = torch.device(args_cli.device)
+    # warm up (compilation)
+    for _ in range(2):
+        agent._update(0, 1)
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    start = time.perf_counter()
+    for _ in range(args_cli.num_updates):
+        agent._update(0, 1)
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    return 1000 * (time.perf_counter() - start) / args_cli.num_updates
+
+
+def main():
+    model = SharedModel(args_cli.num_observations, args_cli.num_actions, device=args_cli.device)
+    batch_size = args_cli.num_envs * args_cli.rollouts // args_cli.mini_batches
+    print(f"[INFO] PPO update benchmark: mini-batches of {batch_size} samples on {args_cli.device}")
+
+    eager_agent = create_agent(model, compile_update=False)
+    compiled_agent = create_agent(model, compile_update=True)
+    eager_time = benchmark(eager_agent)
+    compiled_time = benchmark(compiled_agent)
+
+    compiled = compiled_agent._mini_batch_losses
+    print(f"{'update':>10} {'time (ms)':>12} {'speedup':>10}")
+    print(f"{'eager':>10} {eager_time:>12.3f} {1.0:>10.2f}")
+    print(f"{'compiled':>10} {compiled_time:>12.3f} {eager_time / compiled_time:>10.2f}")
+    print(f"[INFO] Compiled mini-batches: {compiled.num_compiled_calls} (eager fallbacks: {compiled.num_eager_calls})")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ import os
 
 from isaacsim.benchmark.services import BaseIsaacBenchmark
 from isaacsim.benchmark.services.metrics.measurements import DictMeasurement, ListMeasurement, SingleMeasurement
+from skrl.utils.scalar_writer import read_scalars
 from tensorboard.backend.event_processing import event_accumulator
 
 
@@ -16,9 +17,15 @@ def parse_tf_logs(log_dir: str):
     """Search for the latest tfevents file in log_dir folder and returns
     the tensorboard logs in a dictionary.
 
+    If the folder contains a ``scalars.csv`` file (skrl CSV tracking format), it is read instead,
+    which avoids loading the tfevents file.
+
     Args:
         log_dir: directory used to search for tfevents files
     """
+    csv_file = os.path.join(log_dir, "scalars.csv")
+    if os.path.isfile(csv_file):
+        return {tag: [value for _, value in values] for tag, values in read_scalars(csv_file).items()}
 
     # search log directory for latest log file
     list_of_files = glob.glob(f"{log_dir}/events*")  # * means all if need specific format then *.csv
@@ -11,6 +11,7 @@ from datetime import datetime
 from math import isclose
 
 import ray
+from skrl.utils.scalar_writer import read_scalars
 from tensorboard.backend.event_processing.directory_watcher import DirectoryDeletedError
 from tensorboard.backend.event_processing.event_accumulator import EventAccumulator
 
@@ -19,6 +20,9 @@ def load_tensorboard_logs(directory: str) -> dict:
     """From a tensorboard directory, get the latest scalar values. If the logs can't be
     found, check the summaries sublevel.
 
+    A ``scalars.csv`` file (skrl CSV tracking format) in the directory is read instead of the
+    tensorboard events, if available.
+
     Args:
         directory: The directory of the tensorboard logging.
 
@@ -26,6 +30,14 @@ def load_tensorboard_logs(directory: str) -> dict:
         The latest available scalar values.
     """
 
+    # latest value of each tag of the CSV tracking format
+    try:
+        scalars = {tag: values[-1][1] for tag, values in read_scalars(directory).items()}
+    except OSError:
+        scalars = {}
+    if scalars:
+        return scalars
+
     # Initialize the event accumulator with a size guidance for only the latest entry
     def get_latest_scalars(path: str) -> dict:
         event_acc = EventAccumulator(path, size_guidance={"scalars": 1})
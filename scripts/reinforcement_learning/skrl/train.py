@@ -61,17 +61,73 @@ parser.add_argument(
     choices=["train", "bc_datacollect", "bc_train"],
     help="Running mode to execute in."
 )
+parser.add_argument(
+    "--async_reset",
+    action="store_true",
+    default=False,
+    help="Reset each environment as soon as it terminates, instead of waiting for all of them."
+)
+parser.add_argument(
+    "--regret_parallel",
+    action="store_true",
+    default=False,
+    help="Estimate regret from parallel rollouts of each placement in groups of environments, instead of sequential episodes."
+)
+parser.add_argument(
+    "--adversary_compile_update",
+    action="store_true",
+    default=False,
+    help="Compile (torch.compile) the adversary's PPO mini-batch update, falling back to eager execution on shape changes."
+)
+parser.add_argument(
+    "--jax_adversarial_training",
+    action="store_true",
+    default=False,
+    help="Experimental: run the adversarial training loop with the JAX trainers (--ml_framework jax or jax-numpy)."
+)
+parser.add_argument(
+    "--adversary_population_size",
+    type=int,
+    default=1,
+    help="Number of adversary policies, each one placing the objects of its own slice of the environments."
+)
+parser.add_argument(
+    "--async_checkpoints",
+    action="store_true",
+    default=False,
+    help="Write the checkpoints from a background thread, from snapshots in pinned host memory."
+)
+parser.add_argument(
+    "--keep_checkpoints",
+    type=int,
+    default=0,
+    help="Number of most recent checkpoints to keep (0 keeps all of them)."
+)
+parser.add_argument(
+    "--tracking_formats",
+    type=str,
+    nargs="+",
+    default=["tensorboard"],
+    choices=["tensorboard", "csv"],
+    help="Formats of the tracking data: TensorBoard events and/or a scalars.csv file in the experiment directory."
+)
+parser.add_argument(
+    "--background_tracking",
+    action="store_true",
+    default=False,
+    help="Write the tracking data from a background thread (bounded queue) instead of the training thread."
+)
 parser.add_argument(
     "--train_actions_path",
     type=str,
     default=None,
-    help="Folder path of actions."
+    help="Folder path of actions (bc_dataset directory or per-episode action logs)."
 )
 parser.add_argument(
     "--train_positions_path",
     type=str,
     default=None,
-    help="Folder path of positions."
+    help="Folder path of positions (defaults to the positions of the bc_dataset, if any)."
 )
 
 # append AppLauncher cli args
@@ -148,6 +204,14 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
     if args_cli.max_iterations:
         agent_cfg["trainer"]["timesteps"] = args_cli.max_iterations * agent_cfg["agent"]["rollouts"]
     agent_cfg["trainer"]["close_environment_at_exit"] = False
+    agent_cfg["trainer"]["regret_parallel"] = args_cli.regret_parallel
+    agent_cfg["trainer"]["adversary_population_size"] = args_cli.adversary_population_size
+    agent_cfg["trainer"]["adversary_compile_update"] = args_cli.adversary_compile_update
+    agent_cfg["trainer"]["adversarial_training"] = args_cli.jax_adversarial_training
+    agent_cfg["agent"]["experiment"]["async_checkpoints"] = args_cli.async_checkpoints
+    agent_cfg["agent"]["experiment"]["keep_checkpoints"] = args_cli.keep_checkpoints
+    agent_cfg["agent"]["experiment"]["tracking_formats"] = args_cli.tracking_formats
+    agent_cfg["agent"]["experiment"]["background_tracking"] = args_cli.background_tracking
     # configure the ML framework into the global skrl variable
     if args_cli.ml_framework.startswith("jax"):
         skrl.config.jax.backend = "jax" if args_cli.ml_framework == "jax" else "numpy"
@@ -167,6 +231,8 @@ def main(env_cfg: ManagerBasedRLEnvCfg | DirectRLEnvCfg | DirectMARLEnvCfg, agen
         env_cfg.positioning_strategy = args_cli.positioning
     if hasattr(env_cfg, "train_mode"):
         env_cfg.train_mode = args_cli.train_mode
+    if hasattr(env_cfg, "async_reset"):
+        env_cfg.async_reset = args_cli.async_reset
     if hasattr(env_cfg, "train_actions_path"):
         env_cfg.train_actions_path = args_cli.train_actions_path
     if hasattr(env_cfg, "train_positions_path"):
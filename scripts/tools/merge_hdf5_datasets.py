@@ -4,8 +4,6 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import argparse
-import h5py
-import os
 
 parser = argparse.ArgumentParser(description="Merge a set of HDF5 datasets.")
 parser.add_argument(
@@ -19,28 +17,16 @@ parser.add_argument("--output_file", type=str, default="merged_dataset.hdf5", he
 
 args_cli = parser.parse_args()
 
+"""Rest everything follows."""
 
-def merge_datasets():
-    for filepath in args_cli.input_files:
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"The dataset file {filepath} does not exist.")
-
-    with h5py.File(args_cli.output_file, "w") as output:
-        episode_idx = 0
-        copy_attributes = True
+from isaaclab.utils.datasets import merge_hdf5_datasets
 
-        for filepath in args_cli.input_files:
 
-            with h5py.File(filepath, "r") as input:
-                for episode, data in input["data"].items():
-                    input.copy(f"data/{episode}", output, f"data/demo_{episode_idx}")
-                    episode_idx += 1
-
-                if copy_attributes:
-                    output["data"].attrs["env_args"] = input["data"].attrs["env_args"]
-                    copy_attributes = False
+def merge_datasets():
+    # the episode groups are copied without decoding their chunks, and the merged file gets an episode index
+    num_episodes = merge_hdf5_datasets(args_cli.input_files, args_cli.output_file)
 
-    print(f"Merged dataset saved to {args_cli.output_file}")
+    print(f"Merged dataset of {num_episodes} episodes saved to {args_cli.output_file}")
 
 
 if __name__ == "__main__":
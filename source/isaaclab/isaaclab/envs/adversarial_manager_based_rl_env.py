@@ -10,13 +10,14 @@ import gymnasium as gym
 import math
 import numpy as np
 import torch
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from typing import Any, ClassVar
 
 from isaaclab.managers import CommandManager, CurriculumManager, RewardManager, TerminationManager
 
 from .adversarial_manager_based_rl_env_cfg import AdversarialManagerBasedRLEnvCfg
 from .manager_based_rl_env import ManagerBasedRLEnv
+from .utils.placement import SettledPoseCache, footprint_radius, resolve_placement_overlaps
 
 
 # Amplitude of the cube position (to scale a value between -1 and 1)
@@ -37,6 +38,90 @@ class AdversarialManagerBasedRLEnv(ManagerBasedRLEnv):
             self.device
         )
 
+        # optional callback returning the adversary actions of the environments being reset (asynchronous resets)
+        self.adversary_action_sampler: Callable[[torch.Tensor], torch.Tensor] | None = None
+
+        # resolve the adversarially placed objects once, so that resets do not parse asset names
+        self._init_adversarial_buffers()
+
+    def _init_adversarial_buffers(self):
+        """Precompute the object-index mapping and the buffers used by :meth:`adversarial_reset`.
+
+        Objects are either standalone rigid objects (one write per asset) or members of a rigid object
+        collection, in which case all of them are written to the simulation in a single batched call.
+        """
+        # catch both "object" and "clutter_object<i>"
+        def _object_idx(asset_name: str) -> int:
+            return int(asset_name.split("clutter_object")[-1]) if "clutter_object" in asset_name else 0
+
+        object_ids = []
+        default_pos = []
+        radii = []
+        # -- standalone rigid objects
+        self._adversarial_assets = []
+        for asset_name, rigid_object in self.scene.rigid_objects.items():
+            if "object" in asset_name:
+                self._adversarial_assets.append(rigid_object)
+                object_ids.append(_object_idx(asset_name))
+                default_pos.append(rigid_object.data.default_root_state[:, :3])
+                radii.append(footprint_radius(rigid_object.cfg.spawn))
+        # -- rigid object collections: (collection, indices inside the collection, columns in the pose buffer)
+        self._adversarial_collections = []
+        for collection in self.scene.rigid_object_collections.values():
+            names = [name for name in collection.object_names if "object" in name]
+            if not names:
+                continue
+            local_ids = [collection.object_names.index(name) for name in names]
+            columns = torch.arange(len(object_ids), len(object_ids) + len(names), device=self.device)
+            self._adversarial_collections.append(
+                (collection, torch.tensor(local_ids, dtype=torch.long, device=self.device), columns)
+            )
+            object_ids.extend(_object_idx(name) for name in names)
+            default_pos.extend(collection.data.default_object_state[:, local_ids, :3].unbind(dim=1))
+            radii.extend(footprint_radius(collection.cfg.rigid_objects[name].spawn) for name in names)
+        num_objects = len(object_ids)
+        # column of the (num_clutter_objects + 1, 3) adversary action that drives each object
+        self._adversarial_object_ids = torch.tensor(object_ids, dtype=torch.long, device=self.device)
+
+        # default positions of all objects in the world frame: (num_envs, num_objects, 3)
+        self._adversarial_default_pos = torch.zeros((self.num_envs, num_objects, 3), device=self.device)
+        if num_objects:
+            self._adversarial_default_pos[:] = torch.stack(default_pos, dim=1) + self.scene.env_origins.unsqueeze(1)
+
+        # affine map from a clamped adversary action to a position offset (the z offset is taken in absolute value)
+        self._adversarial_position_scale = torch.tensor(
+            [cube_position_ampl_x, cube_position_ampl_y, cube_position_ampl_z], device=self.device
+        )
+        self._adversarial_position_bias = torch.tensor([0.0, 0.0, 0.1], device=self.device)
+
+        # footprint radius of each object, used to push apart overlapping placements
+        self._adversarial_footprint_radius = torch.tensor(
+            [self.cfg.placement_default_radius if radius is None else radius for radius in radii], device=self.device
+        )
+
+        # pose buffer with identity orientations and zero velocities, reused by every reset
+        self._adversarial_root_pose = torch.zeros((self.num_envs, num_objects, 7), device=self.device)
+        self._adversarial_root_pose[..., 3] = 1.0
+        self._adversarial_root_velocity = torch.zeros((self.num_envs, num_objects, 6), device=self.device)
+        self._target_object_pose = torch.tensor([0.5, 0, 0.35, 1, 0, 0, 0], device=self.device)
+
+        # resting poses of previous placements, restored instead of dropping the objects (relative to env origins)
+        self._settled_pose_cache = None
+        self._settle_step_counter = 0
+        if self.cfg.settled_pose_cache_size > 0:
+            if self.cfg.settled_pose_cache_size < self.num_envs:
+                raise ValueError(
+                    f"The settled pose cache size ({self.cfg.settled_pose_cache_size}) must be at least the number"
+                    f" of environments ({self.num_envs})"
+                )
+            self._settled_pose_cache = SettledPoseCache(
+                capacity=self.cfg.settled_pose_cache_size,
+                key_size=self.adversary_action.shape[-1],
+                num_objects=num_objects,
+                resolution=self.cfg.settled_pose_resolution,
+                device=self.device,
+            )
+
     def step(self, action: torch.Tensor) -> VecEnvStepReturn:
         """Execute one time-step of the environment's dynamics and reset terminated environments.
 
@@ -46,7 +131,8 @@ class AdversarialManagerBasedRLEnv(ManagerBasedRLEnv):
         2. Perform physics stepping.
         3. Perform rendering if gui is enabled.
         4. Update the environment counters and compute the rewards and terminations.
-        5. Reset the environments that terminated.
+        5. Reset the environments that terminated. Unless :attr:`AdversarialManagerBasedRLEnvCfg.async_reset` is
+           enabled, this only happens once all environments have terminated.
         6. Compute the observations.
         7. Return the observations, rewards, resets and extras.
 
@@ -86,12 +172,16 @@ class AdversarialManagerBasedRLEnv(ManagerBasedRLEnv):
         # -- update env counters (used for curriculum generation)
         self.episode_length_buf += 1  # step in current episode (per env)
         self.common_step_counter += 1  # total step (common for all envs)
+        self._settle_step_counter += 1
         # -- check terminations
         self.reset_buf = self.termination_manager.compute()
         self.reset_terminated = self.termination_manager.terminated
         self.reset_time_outs = self.termination_manager.time_outs
         # -- reward computation
         self.reward_buf = self.reward_manager.compute(dt=self.step_dt)
+        # -- cache the resting poses of the placements that have settled
+        if self._settled_pose_cache is not None:
+            self._cache_settled_poses()
 
         if len(self.recorder_manager.active_terms) > 0:
             # update observations for recording if needed
@@ -100,7 +190,7 @@ class AdversarialManagerBasedRLEnv(ManagerBasedRLEnv):
 
         # -- reset envs that terminated/timed-out and log the episode information
         reset_env_ids = self.reset_buf.nonzero(as_tuple=False).squeeze(-1)
-        if len(reset_env_ids) == self.num_envs:
+        if len(reset_env_ids) == self.num_envs or (self.cfg.async_reset and len(reset_env_ids) > 0):
             # trigger recorder terms for pre-reset calls
             self.recorder_manager.record_pre_reset(reset_env_ids)
 
@@ -135,6 +225,12 @@ class AdversarialManagerBasedRLEnv(ManagerBasedRLEnv):
             env_ids: List of environment ids which must be reset
         """
         super()._reset_idx(env_ids)
+        # the episode step of all the environments, once they are reset together (see :meth:`_cache_settled_poses`)
+        if len(env_ids) == self.num_envs:
+            self._settle_step_counter = 0
+        # query the placements of the reset environments, if they are sampled per environment
+        if self.adversary_action_sampler is not None:
+            self.adversary_action[env_ids] = self.adversary_action_sampler(env_ids)
         self.adversarial_reset(env_ids)
 
         # import environment types
@@ -169,41 +265,88 @@ class AdversarialManagerBasedRLEnv(ManagerBasedRLEnv):
         Returns:
             np.ndarray: The initial observation.
         """
-        adversary_pos = self.adversary_action[reset_env_ids]
-        adversary_pos = torch.clamp(adversary_pos, -1, 1)
+        # compute the poses of all objects in one pass: (len(reset_env_ids), num_objects, 7)
+        root_pose = self.compute_adversarial_poses(reset_env_ids)
+        root_velocity = self._adversarial_root_velocity[: len(reset_env_ids)]
+
+        # Restore the resting poses of the cached placements, instead of dropping their objects
+        if self._settled_pose_cache is not None:
+            hit, cached_pose = self._settled_pose_cache.lookup(self.adversary_action[reset_env_ids])
+            cached_pose[..., :3] += self.scene.env_origins[reset_env_ids].unsqueeze(1)
+            root_pose = torch.where(hit.view(-1, 1, 1), cached_pose, root_pose)
 
         # Reset command manager object pose
-        target_object_pose = torch.tensor([0.5, 0, 0.35, 1, 0, 0, 0]).to(self.device)
-        self.command_manager._terms["object_pose"].pose_command_b[:] = target_object_pose
-
-        # Reset clutter object positions adversarially
-        for asset_name, rigid_object in self.scene._rigid_objects.items():
-            # catch both "object" and "clutter_object<i>"
-            if "object" in asset_name: 
-                object_idx = int(asset_name.split("clutter_object")[-1]) if "clutter_object" in asset_name else 0
-                clutter_obj_state = rigid_object.data.default_root_state[
-                    reset_env_ids
-                ].clone()  # get states of only envs we want to reset
-                clutter_obj_state[:, 0:3] += self.scene.env_origins[reset_env_ids]                
-
-                # Set position to the adversary position
-                root_pose = clutter_obj_state[:, :7]
-                root_pose[:,:3] += torch.stack(
-                    [
-                        adversary_pos[:, object_idx * 3] * cube_position_ampl_x,
-                        adversary_pos[:, object_idx * 3 + 1] * cube_position_ampl_y,
-                        torch.abs(adversary_pos[:, object_idx * 3 + 2]) * cube_position_ampl_z + 0.1,
-                    ],
-                    dim=-1,
-                ).to(root_pose.device)
-
-                # Set rotation quaternion to identity
-                root_pose[:,3:] = torch.tensor([1, 0, 0, 0]).to(root_pose.device)
-
-                # Set velocity to 0
-                root_velocity = clutter_obj_state[:, 7:] * 0.0
-
-                # Write to sim
-                rigid_object.write_root_link_pose_to_sim(root_pose, env_ids=reset_env_ids)
-                rigid_object.write_root_com_velocity_to_sim(root_velocity, env_ids=reset_env_ids)
+        self.command_manager._terms["object_pose"].pose_command_b[:] = self._target_object_pose
+
+        # Write to sim
+        for i, rigid_object in enumerate(self._adversarial_assets):
+            rigid_object.write_root_link_pose_to_sim(root_pose[:, i], env_ids=reset_env_ids)
+            rigid_object.write_root_com_velocity_to_sim(root_velocity[:, i], env_ids=reset_env_ids)
+        if self._adversarial_collections:
+            env_ids = torch.as_tensor(reset_env_ids, dtype=torch.long, device=self.device)
+            for collection, local_ids, columns in self._adversarial_collections:
+                collection.write_object_link_pose_to_sim(root_pose[:, columns], env_ids=env_ids, object_ids=local_ids)
+                collection.write_object_com_velocity_to_sim(
+                    root_velocity[:, columns], env_ids=env_ids, object_ids=local_ids
+                )
         self.scene.write_data_to_sim()
+
+    def compute_adversarial_poses(self, env_ids: Sequence[int]) -> torch.Tensor:
+        """Compute the root poses of the adversarially placed objects from :attr:`adversary_action`.
+
+        Args:
+            env_ids: Environment indices to compute the poses for.
+
+        Returns:
+            The root poses in the simulation frame. Shape is (len(env_ids), num_objects, 7).
+        """
+        adversary_pos = torch.clamp(self.adversary_action[env_ids], -1, 1).view(-1, self.num_clutter_objects + 1, 3)
+        offsets = adversary_pos[:, self._adversarial_object_ids] * self._adversarial_position_scale
+        offsets[..., 2].abs_()
+        default_pos = self._adversarial_default_pos[env_ids]
+        positions = default_pos + offsets + self._adversarial_position_bias
+
+        # Push apart interpenetrating objects, without leaving the range of the adversary positions
+        if self.cfg.placement_relaxation_iterations > 0:
+            resolve_placement_overlaps(
+                positions,
+                self._adversarial_footprint_radius,
+                num_iterations=self.cfg.placement_relaxation_iterations,
+                margin=self.cfg.placement_margin,
+                lower=default_pos[..., :2] - self._adversarial_position_scale[:2],
+                upper=default_pos[..., :2] + self._adversarial_position_scale[:2],
+            )
+
+        # Set position to the adversary position, rotation quaternion to identity
+        self._adversarial_root_pose[env_ids, :, :3] = positions
+        return self._adversarial_root_pose[env_ids]
+
+    def _cache_settled_poses(self):
+        """Insert the poses of the objects in the settled pose cache, for the environments that have just settled.
+
+        An environment is considered settled :attr:`AdversarialManagerBasedRLEnvCfg.settle_steps` steps after its
+        reset, if all its placed objects are (almost) at rest. With synchronous resets, all the environments reach
+        that step together, which is tracked on the host, so nothing is done at the other steps. With asynchronous
+        resets, only the environments at that step are gathered.
+        """
+        if self.cfg.async_reset:
+            env_ids = (self.episode_length_buf == self.cfg.settle_steps).nonzero(as_tuple=False).squeeze(-1)
+            if len(env_ids) == 0:
+                return
+        elif self._settle_step_counter == self.cfg.settle_steps:
+            env_ids = slice(None)
+        else:
+            return
+
+        # link states of the placed objects: (len(env_ids), num_objects, 13)
+        states = [asset.data.root_link_state_w[env_ids].unsqueeze(1) for asset in self._adversarial_assets]
+        for collection, local_ids, _ in self._adversarial_collections:
+            states.append(collection.data.object_link_state_w[env_ids][:, local_ids])
+        states = torch.cat(states, dim=1)
+
+        speed = torch.linalg.vector_norm(states[..., 7:], dim=-1)
+        settled = torch.all(speed < self.cfg.settle_velocity_threshold, dim=-1)
+        poses = states[..., :7].clone()
+        poses[..., :3] -= self.scene.env_origins[env_ids].unsqueeze(1)
+        self._settled_pose_cache.insert(self.adversary_action[env_ids], poses, mask=settled)
+
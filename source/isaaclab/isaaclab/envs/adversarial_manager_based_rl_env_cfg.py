@@ -21,3 +21,25 @@ class AdversarialManagerBasedRLEnvCfg(ManagerBasedRLEnvCfg):
     train_mode: str = "train"
     train_actions_path: str | None = None
     train_positions_path: str | None = None # Not currently used
+
+    # Reset each environment as soon as it terminates, instead of waiting for all of them to terminate
+    async_reset: bool = False
+
+    # Relaxation iterations to push apart overlapping object placements before writing them to sim (0 disables it).
+    # Opt-in: enabling it changes the placements, so earlier runs and placement logs no longer reproduce
+    placement_relaxation_iterations: int = 0
+    # Minimum gap between the footprints of two placed objects (m)
+    placement_margin: float = 0.005
+    # Footprint radius of placed objects that are not primitive shapes, e.g. the 0.8-scaled DexCube (m)
+    placement_default_radius: float = 0.035
+
+    # Size of the cache of resting poses keyed by quantized adversary action (0 disables it, otherwise >= num_envs).
+    # Cached placements are restored at rest instead of dropping the objects from above the table
+    settled_pose_cache_size: int = 0
+    # Quantization step of the adversary action for the cache keys
+    settled_pose_resolution: float = 0.05
+    # Steps after a reset at which the poses of the objects are cached, if they are at rest. There is no
+    # dedicated settle pass: the poses are cached opportunistically, during the episodes, at this step
+    settle_steps: int = 10
+    # Maximum linear and angular speed of an object at rest
+    settle_velocity_threshold: float = 0.01
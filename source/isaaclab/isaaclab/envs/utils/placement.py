@@ -0,0 +1,210 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Utilities to place objects without interpenetration."""
+
+from __future__ import annotations
+
+import math
+import torch
+
+from isaaclab.sim.spawners.shapes import CapsuleCfg, ConeCfg, CuboidCfg, CylinderCfg, SphereCfg
+
+
+def footprint_radius(spawn_cfg: object) -> float | None:
+    """Radius of the circle that bounds the footprint (projection on the xy-plane) of a primitive shape.
+
+    Args:
+        spawn_cfg: Spawner configuration of the object.
+
+    Returns:
+        The footprint radius. None if the size of the spawned object is not known (e.g. USD files).
+    """
+    if isinstance(spawn_cfg, SphereCfg):
+        return spawn_cfg.radius
+    if isinstance(spawn_cfg, CuboidCfg):
+        return 0.5 * math.hypot(spawn_cfg.size[0], spawn_cfg.size[1])
+    if isinstance(spawn_cfg, (CylinderCfg, CapsuleCfg, ConeCfg)):
+        if spawn_cfg.axis == "Z":
+            return spawn_cfg.radius
+        # lying along the x/y-axis: the footprint is a rectangle (cylinder, cone) or a stadium (capsule)
+        if isinstance(spawn_cfg, CapsuleCfg):
+            return 0.5 * spawn_cfg.height + spawn_cfg.radius
+        return math.hypot(0.5 * spawn_cfg.height, spawn_cfg.radius)
+    return None
+
+
+def resolve_placement_overlaps(
+    positions: torch.Tensor,
+    radii: torch.Tensor,
+    num_iterations: int = 4,
+    margin: float = 0.0,
+    lower: torch.Tensor | None = None,
+    upper: torch.Tensor | None = None,
+) -> torch.Tensor:
+    """Push apart the objects whose footprints overlap, for a batch of placements.
+
+    Objects are approximated by circles on the xy-plane. Each relaxation iteration computes all pairwise
+    overlaps at once and moves both objects of an overlapping pair half of the overlap away from each other
+    (objects at the same position are separated along the x-axis). Positions are then clamped to the bounds,
+    if given. Overlaps may remain if the number of iterations is too small or the bounds are too tight.
+
+    Args:
+        positions: Positions of the objects, modified in place (only the x and y coordinates).
+            Shape is (batch_size, num_objects, D), with D >= 2.
+        radii: Footprint radius of each object. Shape is (num_objects,).
+        num_iterations: Number of relaxation iterations. Defaults to 4.
+        margin: Minimum gap between two footprints. Defaults to 0.0.
+        lower: Lower bounds of the xy-positions. Shape is broadcastable to (batch_size, num_objects, 2).
+            Defaults to None (unbounded).
+        upper: Upper bounds of the xy-positions. Shape is broadcastable to (batch_size, num_objects, 2).
+            Defaults to None (unbounded).
+
+    Returns:
+        The positions (same tensor as the input).
+    """
+    num_objects = positions.shape[-2]
+    if num_objects < 2:
+        return positions
+    xy = positions[..., :2]
+
+    # minimum distance between the centers of each pair of objects: (num_objects, num_objects)
+    min_distance = radii.unsqueeze(-1) + radii.unsqueeze(-2) + margin
+    min_distance.fill_diagonal_(0.0)
+    # separation direction of objects at the same position: object i is pushed to +x from object j if i > j
+    index = torch.arange(num_objects, device=positions.device)
+    fallback = torch.zeros((num_objects, num_objects, 2), device=positions.device)
+    fallback[..., 0] = torch.sign(index.unsqueeze(-1) - index.unsqueeze(-2)).float()
+
+    for _ in range(num_iterations):
+        # pairwise offsets and distances: (batch_size, num_objects, num_objects, [2])
+        delta = xy.unsqueeze(-2) - xy.unsqueeze(-3)
+        distance = torch.linalg.vector_norm(delta, dim=-1, keepdim=True)
+        direction = torch.where(distance > 1e-6, delta / distance.clamp_min(1e-6), fallback)
+        overlap = (min_distance - distance.squeeze(-1)).clamp_min_(0.0)
+        xy += 0.5 * (overlap.unsqueeze(-1) * direction).sum(dim=-2)
+        if lower is not None or upper is not None:
+            xy.copy_(torch.clamp(xy, lower, upper))
+    return positions
+
+
+class SettledPoseCache:
+    """Fixed-size, device-resident cache of the resting poses of placed objects.
+
+    Entries are keyed by the adversary action quantized to a given resolution, so that close placements share
+    the same resting poses. Keys are hashed and matched on the device, without host synchronizations.
+    When the cache is full, inserting evicts the least recently used entries.
+    """
+
+    def __init__(self, capacity: int, key_size: int, num_objects: int, resolution: float, device: str):
+        """Initialize the cache.
+
+        Args:
+            capacity: Maximum number of entries.
+            key_size: Size of the adversary action.
+            num_objects: Number of placed objects.
+            resolution: Quantization step of the adversary action.
+            device: Device on which the cache is allocated.
+        """
+        self.capacity = capacity
+        self.resolution = resolution
+        self.device = device
+
+        # the extra (last) slot receives the writes of the masked-out insertions and is never valid
+        self._keys = torch.zeros((capacity + 1, key_size), dtype=torch.long, device=device)
+        self._hashes = torch.zeros(capacity + 1, dtype=torch.long, device=device)
+        self._valid = torch.zeros(capacity + 1, dtype=torch.bool, device=device)
+        self._last_used = torch.zeros(capacity + 1, dtype=torch.long, device=device)
+        self._poses = torch.zeros((capacity + 1, num_objects, 7), device=device)
+        self._clock = 0
+        # random odd multipliers for hashing the quantized keys
+        generator = torch.Generator().manual_seed(0)
+        self._hash_weights = (torch.randint(0, 2**62, (key_size,), generator=generator) * 2 + 1).to(device)
+
+    def __len__(self) -> int:
+        """Number of valid entries (this synchronizes with the device)."""
+        return int(self._valid.sum().item())
+
+    def clear(self):
+        """Remove all the entries."""
+        self._valid.zero_()
+
+    def lookup(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Look up the resting poses of a batch of placements.
+
+        Args:
+            actions: Adversary actions. Shape is (batch_size, key_size).
+
+        Returns:
+            A tuple containing a mask of the cache hits, with shape (batch_size,), and the cached poses,
+            with shape (batch_size, num_objects, 7) (the poses of the misses are undefined).
+        """
+        keys, hashes = self._quantize(actions)
+        hit, slots = self._find(keys, hashes)
+        # refresh the recently used entries (misses touch the never valid extra slot)
+        self._clock += 1
+        self._last_used[torch.where(hit, slots, self.capacity)] = self._clock
+        return hit, self._poses[slots]
+
+    def insert(self, actions: torch.Tensor, poses: torch.Tensor, mask: torch.Tensor | None = None):
+        """Insert (or update) the resting poses of a batch of placements.
+
+        Placements of the batch with equal (quantized) keys fill a single entry, with the poses of the first one.
+
+        Args:
+            actions: Adversary actions. Shape is (batch_size, key_size), with batch_size <= capacity.
+            poses: Resting poses. Shape is (batch_size, num_objects, 7).
+            mask: Placements to insert. Shape is (batch_size,). Defaults to None (all of them).
+        """
+        keys, hashes = self._quantize(actions)
+        if mask is None:
+            mask = torch.ones(len(actions), dtype=torch.bool, device=self.device)
+        # only the first of the placements with equal keys is inserted, so that they don't fill several entries
+        mask = mask & ~self._duplicates(keys, hashes, mask)
+        hit, slots = self._find(keys, hashes)
+        miss = mask & ~hit
+        # new keys replace the least recently used entries (invalid entries first),
+        # except the extra slot and the entries updated by this insertion
+        age = torch.where(self._valid, self._last_used, -1)
+        age[torch.where(hit, slots, self.capacity)] = torch.iinfo(torch.long).max
+        age[self.capacity] = torch.iinfo(torch.long).max
+        lru_slots = torch.topk(age, k=len(actions), largest=False).indices
+        # each new key takes the next of these entries, by its rank among the new keys of the batch
+        miss_rank = torch.clamp(torch.cumsum(miss.long(), dim=0) - 1, min=0)
+        slots = torch.where(hit, slots, lru_slots[miss_rank])
+        slots = torch.where(mask, slots, self.capacity)
+
+        self._clock += 1
+        self._keys[slots] = keys
+        self._hashes[slots] = hashes
+        self._poses[slots] = poses
+        self._last_used[slots] = self._clock
+        self._valid[slots] = True
+        self._valid[-1] = False
+
+    def _quantize(self, actions: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Quantize and hash adversary actions."""
+        keys = torch.round(torch.clamp(actions, -1, 1) / self.resolution).long()
+        return keys, (keys * self._hash_weights).sum(dim=-1)
+
+    def _duplicates(self, keys: torch.Tensor, hashes: torch.Tensor, mask: torch.Tensor) -> torch.Tensor:
+        """Flag the masked keys that are equal to a previous masked key of the batch."""
+        # sort by hash, with the masked keys first (and in batch order) among equal hashes
+        order = torch.argsort((~mask).long(), stable=True)
+        order = order[torch.argsort(hashes[order], stable=True)]
+        sorted_keys, sorted_mask = keys[order], mask[order]
+        duplicates = torch.zeros_like(mask)
+        duplicates[order[1:]] = (
+            sorted_mask[1:] & sorted_mask[:-1] & (sorted_keys[1:] == sorted_keys[:-1]).all(dim=-1)
+        )
+        return duplicates
+
+    def _find(self, keys: torch.Tensor, hashes: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Find the slots of the given keys."""
+        matches = (hashes.unsqueeze(-1) == self._hashes.unsqueeze(0)) & self._valid.unsqueeze(0)
+        slots = torch.argmax(matches.int(), dim=-1)
+        # compare the full keys to rule out hash collisions
+        hit = matches.any(dim=-1) & (self._keys[slots] == keys).all(dim=-1)
+        return hit, slots
@@ -29,6 +29,6 @@ from .manager_term_cfg import (
 )
 from .observation_manager import ObservationManager
 from .recorder_manager import DatasetExportMode, RecorderManager, RecorderManagerBaseCfg, RecorderTerm
-from .reward_manager import RewardManager
+from .reward_manager import RewardManager, shared_quantity
 from .scene_entity_cfg import SceneEntityCfg
 from .termination_manager import TerminationManager
@@ -15,7 +15,7 @@ from prettytable import PrettyTable
 from typing import TYPE_CHECKING
 
 from isaaclab.utils import configclass
-from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+from isaaclab.utils.datasets import EpisodeBuffer, EpisodeData, HDF5DatasetFileHandler
 
 from .manager_base import ManagerBase, ManagerTermBase
 from .manager_term_cfg import RecorderTermCfg
@@ -39,6 +39,14 @@ class RecorderManagerBaseCfg:
 
     dataset_file_handler_class_type: type = HDF5DatasetFileHandler
 
+    dataset_file_handler_kwargs: dict = dict()
+    """Keyword arguments of the dataset file handler class. Defaults to an empty dictionary.
+
+    For example, ``{"chunk_length": 64, "compression": "gzip"}`` for :class:`~isaaclab.utils.datasets.HDF5DatasetFileHandler`
+    or, in addition, ``{"flush_interval": 16}`` for :class:`~isaaclab.utils.datasets.AsyncHDF5DatasetFileHandler`,
+    which writes the episodes from a background thread.
+    """
+
     dataset_export_dir_path: str = "/tmp/isaaclab/logs"
     """The directory path where the recorded datasets are exported."""
 
@@ -51,6 +59,23 @@ class RecorderManagerBaseCfg:
     export_in_record_pre_reset: bool = True
     """Whether to export episodes in the record_pre_reset call."""
 
+    use_episode_buffer: bool = False
+    """Whether to record the episodes into preallocated per-environment buffers. Defaults to False.
+
+    If True, the episodes are recorded into an :class:`~isaaclab.utils.datasets.EpisodeBuffer`: the values
+    of all the environments are written with one indexed copy per key and step, and the episodes are only
+    sliced out of the buffers when they are exported or requested. Otherwise, each episode is an
+    :class:`~isaaclab.utils.datasets.EpisodeData` that grows its tensors on every step.
+    """
+
+    episode_buffer_length: int | None = None
+    """Initial number of values of a key per episode the buffers hold when :attr:`use_episode_buffer` is True.
+    Defaults to None.
+
+    If None, the environment's maximum episode length plus one (for the values recorded at reset) is used.
+    If an episode records more values for a key (e.g. without time-out termination), the buffer of the key grows.
+    """
+
 
 class RecorderTerm(ManagerTermBase):
     """Base class for recorder terms.
@@ -153,21 +178,34 @@ class RecorderManager(ManagerBase):
 
         # create episode data buffer indexed by environment id
         self._episodes: dict[int, EpisodeData] = dict()
-        for env_id in range(env.num_envs):
-            self._episodes[env_id] = EpisodeData()
+        self._episode_buffer: EpisodeBuffer | None = None
+        if cfg.use_episode_buffer:
+            episode_buffer_length = cfg.episode_buffer_length
+            if episode_buffer_length is None:
+                if not hasattr(env, "max_episode_length"):
+                    raise ValueError(
+                        "The episode buffer length must be set for environments without a maximum episode length."
+                    )
+                episode_buffer_length = env.max_episode_length + 1
+            self._episode_buffer = EpisodeBuffer(env.num_envs, episode_buffer_length, env.device)
+        else:
+            for env_id in range(env.num_envs):
+                self._episodes[env_id] = EpisodeData()
 
         env_name = getattr(env.cfg, "env_name", None)
 
         self._dataset_file_handler = None
         if cfg.dataset_export_mode != DatasetExportMode.EXPORT_NONE:
-            self._dataset_file_handler = cfg.dataset_file_handler_class_type()
+            self._dataset_file_handler = cfg.dataset_file_handler_class_type(**cfg.dataset_file_handler_kwargs)
             self._dataset_file_handler.create(
                 os.path.join(cfg.dataset_export_dir_path, cfg.dataset_filename), env_name=env_name
             )
 
         self._failed_episode_dataset_file_handler = None
         if cfg.dataset_export_mode == DatasetExportMode.EXPORT_SUCCEEDED_FAILED_IN_SEPARATE_FILES:
-            self._failed_episode_dataset_file_handler = cfg.dataset_file_handler_class_type()
+            self._failed_episode_dataset_file_handler = cfg.dataset_file_handler_class_type(
+                **cfg.dataset_file_handler_kwargs
+            )
             self._failed_episode_dataset_file_handler.create(
                 os.path.join(cfg.dataset_export_dir_path, f"{cfg.dataset_filename}_failed"), env_name=env_name
             )
@@ -268,6 +306,9 @@ class RecorderManager(ManagerBase):
         for term in self._terms.values():
             term.reset(env_ids=env_ids)
 
+        if self._episode_buffer is not None:
+            self._episode_buffer.reset(env_ids)
+            return {}
         for env_id in env_ids:
             self._episodes[env_id] = EpisodeData()
 
@@ -283,6 +324,8 @@ class RecorderManager(ManagerBase):
         Returns:
             The episode data for the given environment id.
         """
+        if self._episode_buffer is not None:
+            return self._episode_buffer.get_episode(env_id)
         return self._episodes.get(env_id, EpisodeData())
 
     def add_to_episodes(self, key: str, value: torch.Tensor | dict, env_ids: Sequence[int] | None = None):
@@ -303,6 +346,10 @@ class RecorderManager(ManagerBase):
         # resolve environment ids
         if key is None:
             return
+        # write the values of all the environments at once (nested keys are resolved by the buffer)
+        if self._episode_buffer is not None:
+            self._episode_buffer.add(key, value, env_ids)
+            return
         if env_ids is None:
             env_ids = list(range(self._env.num_envs))
         if isinstance(env_ids, torch.Tensor):
@@ -330,6 +377,10 @@ class RecorderManager(ManagerBase):
         if len(self.active_terms) == 0:
             return
 
+        if self._episode_buffer is not None:
+            self._episode_buffer.set_success(env_ids, success_values)
+            return
+
         # resolve environment ids
         if env_ids is None:
             env_ids = list(range(self._env.num_envs))
@@ -418,6 +469,12 @@ class RecorderManager(ManagerBase):
         if isinstance(env_ids, torch.Tensor):
             env_ids = env_ids.tolist()
 
+        # slice the finished episodes out of the preallocated buffers
+        if self._episode_buffer is not None:
+            for episode in self._episode_buffer.get_episodes(env_ids):
+                self._episodes[episode.env_id] = episode
+            self._episode_buffer.reset(env_ids)
+
         # Export episode data through dataset exporter
         need_to_flush = False
         for env_id in env_ids:
@@ -444,7 +501,10 @@ class RecorderManager(ManagerBase):
                 else:
                     self._exported_failed_episode_count[env_id] = self._exported_failed_episode_count.get(env_id, 0) + 1
             # Reset the episode buffer for the given environment after export
-            self._episodes[env_id] = EpisodeData()
+            if self._episode_buffer is not None:
+                self._episodes.pop(env_id, None)
+            else:
+                self._episodes[env_id] = EpisodeData()
 
         if need_to_flush:
             if self._dataset_file_handler is not None:
@@ -467,10 +527,13 @@ class RecorderManager(ManagerBase):
             # skip non-term settings
             if term_name in [
                 "dataset_file_handler_class_type",
+                "dataset_file_handler_kwargs",
                 "dataset_filename",
                 "dataset_export_dir_path",
                 "dataset_export_mode",
                 "export_in_record_pre_reset",
+                "use_episode_buffer",
+                "episode_buffer_length",
             ]:
                 continue
             # check if term config is None
@@ -7,8 +7,9 @@
 
 from __future__ import annotations
 
+import functools
 import torch
-from collections.abc import Sequence
+from collections.abc import Callable, Hashable, Sequence
 from prettytable import PrettyTable
 from typing import TYPE_CHECKING
 
@@ -56,20 +57,26 @@ class RewardManager(ManagerBase):
         super().__init__(cfg, env)
 
         # prepare extra info to store individual reward term information
-        self._episode_sums = dict()
-        for term_name in self._term_names:
-            self._episode_sums[term_name] = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
-        
+        # note: the columns of the buffers are the terms, in the order of the term names
+        self._episode_sums = torch.zeros((self.num_envs, len(self._term_names)), dtype=torch.float, device=self.device)
         # prepare extra info to store last reward term information
-        self._last_episode = dict()
-        for term_name in self._term_names:
-            self._last_episode[term_name] = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
-        
+        self._last_episode = torch.zeros_like(self._episode_sums)
+
         # create buffer for managing reward per environment
         self._reward_buf = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
 
         # Buffer which stores the current step reward for each term for each environment
         self._step_reward = torch.zeros((self.num_envs, len(self._term_names)), dtype=torch.float, device=self.device)
+        # buffer which stores the current step (unweighted) value of each term for each environment
+        self._term_values = torch.zeros_like(self._step_reward)
+        # weights of the terms, updated when the weights of the term configurations change
+        self._term_weight_values: list[float] = list()
+        self._term_weights = torch.zeros(len(self._term_names), dtype=torch.float, device=self.device)
+        self._update_term_weights()
+
+        # quantities shared by the terms, computed once per step (see :meth:`get_shared_quantity`)
+        self._shared_quantities: dict[Hashable, torch.Tensor] = dict()
+        self._is_computing = False
 
     def __str__(self) -> str:
         """Returns: A string representation for reward manager."""
@@ -117,20 +124,20 @@ class RewardManager(ManagerBase):
         # resolve environment ids
         if env_ids is None:
             env_ids = slice(None)
-        
+
         # store information
         extras = {}
-        for key in self._episode_sums.keys():
+        # r_1 + r_2 + ... + r_n
+        episodic_sum_avgs = torch.mean(self._episode_sums[env_ids], dim=0) / self._env.max_episode_length_s
+        last_episode = self._last_episode[env_ids]
+        for index, name in enumerate(self._term_names):
             # store episode sum information
-            # r_1 + r_2 + ... + r_n
-            episodic_sum_avg = torch.mean(self._episode_sums[key][env_ids])
-            extras["Episode_Reward/" + key] = episodic_sum_avg / self._env.max_episode_length_s
-            # reset episodic sum
-            self._episode_sums[key][env_ids] = 0.0
-
+            extras["Episode_Reward/" + name] = episodic_sum_avgs[index]
             # store last episode information
-            extras["Last_Reward/" + key] = self._last_episode[key][env_ids]
-        
+            extras["Last_Reward/" + name] = last_episode[:, index]
+        # reset episodic sum
+        self._episode_sums[env_ids] = 0.0
+
         # reset all the reward terms
         for term_cfg in self._class_term_cfgs:
             term_cfg.func.reset(env_ids=env_ids)
@@ -143,33 +150,64 @@ class RewardManager(ManagerBase):
         This function calls each reward term managed by the class and adds them to compute the net
         reward signal. It also updates the episodic sums corresponding to individual reward terms.
 
+        The values of the terms are stored in the columns of a single buffer, so the weighting, the net reward
+        and the episodic sums are computed with a few operations over all the terms. The quantities shared by
+        the terms (see :meth:`get_shared_quantity`) are computed once per call.
+
         Args:
             dt: The time-step interval of the environment.
 
         Returns:
             The net reward signal of shape (num_envs,).
         """
-        # reset computation
-        self._reward_buf[:] = 0.0
-        # iterate over all the reward terms
-        for name, term_cfg in zip(self._term_names, self._term_cfgs):
-            # skip if weight is zero (kind of a micro-optimization)
-            if term_cfg.weight == 0.0:
-                continue
-            # compute term's value
-            value = term_cfg.func(self._env, **term_cfg.params) * term_cfg.weight * dt
-            # update total reward
-            self._reward_buf += value
-            # update episodic sum
-            self._episode_sums[name] += value
-            # update last episode
-            self._last_episode[name] = value
-
-            # Update current reward for this step.
-            self._step_reward[:, self._term_names.index(name)] = value / dt
+        # update the weights if they have been modified
+        self._update_term_weights()
+        self._shared_quantities.clear()
+        self._is_computing = True
+        try:
+            # iterate over all the reward terms
+            for index, (weight, term_cfg) in enumerate(zip(self._term_weight_values, self._term_cfgs)):
+                # skip if weight is zero (kind of a micro-optimization)
+                if weight == 0.0:
+                    continue
+                # compute term's value
+                self._term_values[:, index] = term_cfg.func(self._env, **term_cfg.params)
+        finally:
+            self._is_computing = False
+            self._shared_quantities.clear()
+
+        # Update current reward for this step.
+        torch.mul(self._term_values, self._term_weights, out=self._step_reward)
+        # update last episode
+        # note: a new tensor, since the logged values of the last reset may be views of the previous one
+        self._last_episode = self._step_reward * dt
+        # update episodic sum
+        self._episode_sums += self._last_episode
+        # update total reward
+        torch.sum(self._last_episode, dim=1, out=self._reward_buf)
 
         return self._reward_buf
 
+    def get_shared_quantity(self, key: Hashable, func: Callable[[], torch.Tensor]) -> torch.Tensor:
+        """Gets a quantity shared by reward terms, computed once per step.
+
+        While the reward terms are computed (see :meth:`compute`), the quantity is computed by the first term
+        requesting it and the next terms get the same tensor. Otherwise, the quantity is always computed. Reward
+        terms usually request the quantities through functions decorated with :func:`shared_quantity`.
+
+        Args:
+            key: The key of the quantity. It should identify the quantity and its parameters.
+            func: The function computing the quantity.
+
+        Returns:
+            The quantity.
+        """
+        if not self._is_computing:
+            return func()
+        if key not in self._shared_quantities:
+            self._shared_quantities[key] = func()
+        return self._shared_quantities[key]
+
     """
     Operations - Term settings.
     """
@@ -188,6 +226,7 @@ class RewardManager(ManagerBase):
             raise ValueError(f"Reward term '{term_name}' not found.")
         # set the configuration
         self._term_cfgs[self._term_names.index(term_name)] = cfg
+        self._update_term_weights()
 
     def get_term_cfg(self, term_name: str) -> RewardTermCfg:
         """Gets the configuration for the specified term.
@@ -226,6 +265,18 @@ class RewardManager(ManagerBase):
     Helper functions.
     """
 
+    def _update_term_weights(self):
+        """Update the weights tensor if the weights of the term configurations have changed."""
+        term_weight_values = [float(term_cfg.weight) for term_cfg in self._term_cfgs]
+        if term_weight_values == self._term_weight_values:
+            return
+        self._term_weight_values = term_weight_values
+        self._term_weights[:] = torch.tensor(term_weight_values, dtype=torch.float)
+        # the skipped terms don't contribute to the reward
+        for index, weight in enumerate(term_weight_values):
+            if weight == 0.0:
+                self._term_values[:, index] = 0.0
+
     def _prepare_terms(self):
         # check if config is dict already
         if isinstance(self.cfg, dict):
@@ -257,3 +308,36 @@ class RewardManager(ManagerBase):
             # check if the term is a class
             if isinstance(term_cfg.func, ManagerTermBase):
                 self._class_term_cfgs.append(term_cfg)
+
+
+def shared_quantity(func: Callable[..., torch.Tensor]) -> Callable[..., torch.Tensor]:
+    """Decorator for the functions computing quantities shared by reward terms.
+
+    The decorated function is called at most once per step for each set of arguments: reward terms calling
+    it with the same arguments while the rewards are computed get the same tensor (see
+    :meth:`RewardManager.get_shared_quantity`). The arguments, except for the environment, must be hashable
+    (e.g. the names of the assets instead of their :class:`SceneEntityCfg`).
+
+    Example:
+
+    .. code-block:: python
+
+        @shared_quantity
+        def object_height(env: ManagerBasedRLEnv, object_name: str) -> torch.Tensor:
+            return env.scene[object_name].data.root_pos_w[:, 2]
+
+    Args:
+        func: The function computing the quantity. Its first argument is the environment.
+
+    Returns:
+        The decorated function.
+    """
+
+    @functools.wraps(func)
+    def wrapper(env: ManagerBasedRLEnv, *args) -> torch.Tensor:
+        reward_manager: RewardManager | None = getattr(env, "reward_manager", None)
+        if reward_manager is None:
+            return func(env, *args)
+        return reward_manager.get_shared_quantity((func, *args), lambda: func(env, *args))
+
+    return wrapper
@@ -7,6 +7,10 @@
 Submodule for datasets classes and methods.
 """
 
+from .async_hdf5_dataset_file_handler import AsyncHDF5DatasetFileHandler
 from .dataset_file_handler_base import DatasetFileHandlerBase
+from .episode_buffer import EpisodeBuffer
 from .episode_data import EpisodeData
 from .hdf5_dataset_file_handler import HDF5DatasetFileHandler
+from .hdf5_dataset_merger import EPISODE_INDEX_GROUP, merge_hdf5_datasets
+from .lazy_episode_data import LazyDatasetDict, LazyEpisodeData
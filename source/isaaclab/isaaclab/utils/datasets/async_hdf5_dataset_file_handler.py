@@ -0,0 +1,175 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import queue
+import threading
+import torch
+
+from .episode_data import EpisodeData
+from .hdf5_dataset_file_handler import HDF5DatasetFileHandler
+
+
+class AsyncHDF5DatasetFileHandler(HDF5DatasetFileHandler):
+    """HDF5 dataset file handler that writes the episodes from a background thread.
+
+    :meth:`write_episode` only issues non-blocking copies of the episode's tensors into pinned (page-locked)
+    host memory and submits the copies to a bounded queue. A writer thread waits for the copies to complete,
+    writes the episode groups (with the configured chunking and compression) and flushes the file every
+    ``flush_interval`` episodes. :meth:`flush` doesn't wait for the disk either (the writer thread follows its
+    own flush cadence), so exporting episodes (e.g. in :meth:`~isaaclab.managers.RecorderManager.export_episodes`)
+    never blocks on file I/O. Use :meth:`synchronize` to wait until all the submitted episodes are on disk.
+
+    The episode names (``demo_<count>``) are assigned, and :attr:`demo_count` is incremented, when the episodes
+    are submitted. CPU tensors are not copied: they must not be modified in place after being submitted.
+    Errors raised by the writer thread are re-raised by the next call to :meth:`write_episode`,
+    :meth:`synchronize` or :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        chunk_length: int | None = 64,
+        compression: str | None = "lzf",
+        compression_opts=None,
+        max_queue_size: int = 64,
+        flush_interval: int = 16,
+    ):
+        """Initializes the asynchronous HDF5 dataset file handler.
+
+        Args:
+            chunk_length: Number of samples (first dimension) per chunk of the written datasets. Defaults to 64.
+            compression: Compression filter of the written datasets (e.g. "gzip" or "lzf"). Defaults to "lzf".
+            compression_opts: Options of the compression filter (e.g. the gzip level). Defaults to None.
+            max_queue_size: Maximum number of submitted episodes waiting to be written. If the queue is full,
+                :meth:`write_episode` waits until the writer thread catches up. Defaults to 64.
+            flush_interval: Number of written episodes between two flushes of the file. Defaults to 16.
+
+        Raises:
+            ValueError: If the maximum queue size or the flush interval is less than one.
+        """
+        super().__init__(chunk_length=chunk_length, compression=compression, compression_opts=compression_opts)
+        if max_queue_size < 1:
+            raise ValueError(f"The maximum queue size should be greater than zero. However, it is set to {max_queue_size}!")
+        if flush_interval < 1:
+            raise ValueError(f"The flush interval should be greater than zero. However, it is set to {flush_interval}!")
+        self._max_queue_size = max_queue_size
+        self._flush_interval = flush_interval
+
+        self._queue = None
+        self._thread = None
+        self._error = None
+        self._num_unflushed_episodes = 0
+
+    """
+    Operations.
+    """
+
+    def write_episode(self, episode: EpisodeData):
+        """Submit an episode to be written to the dataset.
+
+        Args:
+            episode: The episode data to add.
+        """
+        self._raise_if_not_initialized()
+        self._raise_pending_error()
+        if episode.is_empty():
+            return
+        self._start_writer()
+
+        # copy the tensors to host memory without synchronizing the host with the devices
+        events = {}
+        data = self._copy_to_host(episode.data, events)
+        for device in events:
+            events[device] = torch.cuda.Event()
+            events[device].record(torch.cuda.current_stream(device))
+
+        self._queue.put((f"demo_{self._demo_count}", data, episode.seed, episode.success, list(events.values())))
+        self._demo_count += 1
+
+    def flush(self):
+        """Check for writer thread errors without waiting for the disk.
+
+        The writer thread flushes the file every ``flush_interval`` episodes (see :meth:`synchronize`).
+        """
+        self._raise_if_not_initialized()
+        self._raise_pending_error()
+
+    def synchronize(self):
+        """Wait until all the submitted episodes are written and flushed to disk."""
+        self._raise_if_not_initialized()
+        if self._thread is not None:
+            self._queue.put("flush")
+            self._queue.join()
+        else:
+            super().flush()
+        self._raise_pending_error()
+
+    def close(self):
+        """Write the pending episodes, stop the writer thread and close the dataset file handler."""
+        if self._thread is not None:
+            if self._thread.is_alive():
+                self._queue.put(None)
+                self._thread.join()
+            self._thread = None
+        super().close()
+        self._raise_pending_error()
+
+    """
+    Helper functions.
+    """
+
+    def _start_writer(self):
+        """Start the writer thread, if not already started."""
+        if self._thread is None:
+            self._queue = queue.Queue(maxsize=self._max_queue_size)
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+
+    def _copy_to_host(self, data: dict | torch.Tensor, events: dict) -> dict | torch.Tensor:
+        """Recursively copy the (nested) episode data to host memory.
+
+        CUDA tensors are copied into pinned buffers, served by torch's caching host allocator.
+        """
+        if isinstance(data, dict):
+            return {key: self._copy_to_host(value, events) for key, value in data.items()}
+        if data.device.type != "cuda":
+            return data
+        events[data.device] = None
+        buffer = torch.empty(data.shape, dtype=data.dtype, pin_memory=True)
+        return buffer.copy_(data, non_blocking=True)
+
+    def _raise_pending_error(self):
+        """Re-raise, in the caller thread, an exception raised in the writer thread."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _worker(self):
+        """Write the submitted episodes, in order."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    if self._num_unflushed_episodes:
+                        self._hdf5_file_stream.flush()
+                    return
+                if self._error is not None:
+                    continue
+                if item == "flush":
+                    if self._num_unflushed_episodes:
+                        self._hdf5_file_stream.flush()
+                        self._num_unflushed_episodes = 0
+                    continue
+                name, data, seed, success, events = item
+                for event in events:
+                    event.synchronize()
+                self._write_episode_group(name, data, seed, success, lambda value: value.cpu().numpy())
+                self._num_unflushed_episodes += 1
+                if self._num_unflushed_episodes >= self._flush_interval:
+                    self._hdf5_file_stream.flush()
+                    self._num_unflushed_episodes = 0
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
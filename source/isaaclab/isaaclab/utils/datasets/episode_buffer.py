@@ -0,0 +1,226 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import torch
+from collections.abc import Sequence
+
+from .episode_data import EpisodeData
+
+
+class EpisodeBuffer:
+    """Preallocated buffer of the ongoing episodes of all the environments.
+
+    Unlike :class:`EpisodeData`, which grows each of its tensors with one concatenation per added value,
+    this class stores the values of each key in a preallocated buffer of shape (num_envs, capacity, ...).
+    The buffer of a key is allocated when the key is first added, with the shape and data type of its values.
+    Adding the values of a key for a batch of environments is a single indexed copy into the buffer, and the
+    episodes are only sliced out of the buffers when they are requested (e.g. for export) through
+    :meth:`get_episode` or :meth:`get_episodes`.
+
+    If an episode gets more values for a key than the capacity of its buffer, the buffer of the key is
+    doubled in size, so that no value is lost.
+    """
+
+    def __init__(self, num_envs: int, capacity: int, device: str):
+        """Initialize the episode buffer.
+
+        Args:
+            num_envs: The number of environments.
+            capacity: The initial number of values of a key per episode the buffers can hold. The minimum
+                allowed value is 1.
+            device: The device of the buffers.
+
+        Raises:
+            ValueError: If the capacity is less than one.
+        """
+        if capacity < 1:
+            raise ValueError(f"The episode buffer capacity should be greater than zero. However, it is set to {capacity}!")
+        self._num_envs = num_envs
+        self._capacity = capacity
+        self._device = device
+        self._ALL_INDICES = torch.arange(num_envs, device=device)
+
+        # buffers and number of values added since the last reset, indexed by key
+        self._buffers: dict[str, torch.Tensor] = dict()
+        self._lengths: dict[str, torch.Tensor] = dict()
+        # upper bounds of the lengths (on the host), so that the buffers are not checked for overflow on every add
+        self._length_bounds: dict[str, int] = dict()
+        # task success of each environment's episode (only meaningful when it has been set)
+        self._success = torch.zeros(num_envs, dtype=torch.bool, device=device)
+        self._success_set = torch.zeros(num_envs, dtype=torch.bool, device=device)
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """The number of environments."""
+        return self._num_envs
+
+    @property
+    def capacity(self) -> int:
+        """The initial number of values of a key per episode the buffers can hold."""
+        return self._capacity
+
+    @property
+    def device(self) -> str:
+        """The device of the buffers."""
+        return self._device
+
+    @property
+    def keys(self) -> list[str]:
+        """The recorded keys. Nested keys are separated by '/'."""
+        return list(self._buffers.keys())
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Discard the episodes of the given environments.
+
+        The buffers are not cleared: their values are overwritten by the next episodes.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        if env_ids is None:
+            for key in self._length_bounds:
+                self._length_bounds[key] = 0
+        env_ids = self._resolve_env_ids(env_ids)
+        for lengths in self._lengths.values():
+            lengths[env_ids] = 0
+        self._success[env_ids] = False
+        self._success_set[env_ids] = False
+
+    def add(self, key: str, value: torch.Tensor | dict, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Add the values of a key to the episodes of the given environments.
+
+        Args:
+            key: The key name. The key can be nested by using the "/" character. For example: "obs/joint_pos".
+            value: The values of tensor type or of dict type. The shape of a tensor is (len(env_ids), ...).
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                self.add(f"{key}/{sub_key}", sub_value, env_ids)
+            return
+
+        env_ids = self._resolve_env_ids(env_ids)
+        if key not in self._buffers:
+            self._buffers[key] = torch.zeros(
+                (self._num_envs, self._capacity, *value.shape[1:]), dtype=value.dtype, device=self._device
+            )
+            self._lengths[key] = torch.zeros(self._num_envs, dtype=torch.long, device=self._device)
+            self._length_bounds[key] = 0
+        lengths = self._lengths[key]
+        if self._length_bounds[key] >= self._buffers[key].shape[1]:
+            # the episodes may be full: get their actual maximum length (this synchronizes with the device)
+            self._length_bounds[key] = int(lengths.max().item())
+            if self._length_bounds[key] >= self._buffers[key].shape[1]:
+                self._grow(key)
+        # single indexed copy of the values of all the given environments
+        self._buffers[key][env_ids, lengths[env_ids]] = value.to(self._device)
+        lengths[env_ids] += 1
+        self._length_bounds[key] += 1
+
+    def set_success(self, env_ids: Sequence[int] | torch.Tensor | None, success_values: torch.Tensor):
+        """Set the task success values of the episodes of the given environments.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+            success_values: The task success values. The shape of the tensor is (len(env_ids),) or (len(env_ids), 1).
+        """
+        env_ids = self._resolve_env_ids(env_ids)
+        self._success[env_ids] = success_values.view(-1).to(device=self._device, dtype=torch.bool)
+        self._success_set[env_ids] = True
+
+    def is_empty(self, env_id: int) -> bool:
+        """Check if the episode of the given environment is empty.
+
+        Args:
+            env_id: The environment id.
+
+        Returns:
+            True if no value has been added to the episode since the last reset.
+        """
+        return not any(lengths[env_id].item() for lengths in self._lengths.values())
+
+    def get_episode(self, env_id: int) -> EpisodeData:
+        """Slice out the episode of the given environment.
+
+        Args:
+            env_id: The environment id.
+
+        Returns:
+            A copy of the episode data of the given environment.
+        """
+        return self.get_episodes([env_id])[0]
+
+    def get_episodes(self, env_ids: Sequence[int] | torch.Tensor | None = None) -> list[EpisodeData]:
+        """Slice out the episodes of the given environments.
+
+        The lengths and success values of all the requested episodes are copied to the host at once.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+
+        Returns:
+            Copies of the episode data of the given environments, in the order of the environment ids.
+            An episode without values is empty (see :meth:`EpisodeData.is_empty`).
+        """
+        if env_ids is None:
+            env_ids = list(range(self._num_envs))
+        if isinstance(env_ids, torch.Tensor):
+            env_ids = env_ids.tolist()
+        index = torch.tensor(env_ids, dtype=torch.long, device=self._device)
+        lengths = {key: self._lengths[key][index].tolist() for key in self._buffers}
+        success = self._success[index].tolist()
+        success_set = self._success_set[index].tolist()
+
+        episodes = []
+        for i, env_id in enumerate(env_ids):
+            episode = EpisodeData()
+            episode.env_id = env_id
+            if success_set[i]:
+                episode.success = success[i]
+            for key, buffer in self._buffers.items():
+                length = lengths[key][i]
+                if not length:
+                    continue
+                self._set_nested(episode.data, key, buffer[env_id, :length].clone())
+            episodes.append(episode)
+        return episodes
+
+    """
+    Helper functions.
+    """
+
+    def _grow(self, key: str):
+        """Double the capacity of the buffer of a key, keeping its values."""
+        buffer = self._buffers[key]
+        self._buffers[key] = torch.zeros(
+            (self._num_envs, 2 * buffer.shape[1], *buffer.shape[2:]), dtype=buffer.dtype, device=self._device
+        )
+        self._buffers[key][:, : buffer.shape[1]] = buffer
+
+    def _resolve_env_ids(self, env_ids: Sequence[int] | torch.Tensor | None) -> torch.Tensor:
+        """Convert the environment ids to an index tensor on the buffers' device."""
+        if env_ids is None:
+            return self._ALL_INDICES
+        if isinstance(env_ids, torch.Tensor):
+            return env_ids.to(device=self._device, dtype=torch.long)
+        return torch.tensor(env_ids, dtype=torch.long, device=self._device)
+
+    @staticmethod
+    def _set_nested(data: dict, key: str, value: torch.Tensor):
+        """Set a value in a nested dictionary given its '/'-separated key."""
+        sub_keys = key.split("/")
+        for sub_key in sub_keys[:-1]:
+            data = data.setdefault(sub_key, dict())
+        data[sub_keys[-1]] = value
@@ -8,21 +8,45 @@ import json
 import numpy as np
 import os
 import torch
+from collections import OrderedDict
 from collections.abc import Iterable
 
 from .dataset_file_handler_base import DatasetFileHandlerBase
 from .episode_data import EpisodeData
+from .hdf5_dataset_merger import EPISODE_INDEX_GROUP
+from .lazy_episode_data import LazyDatasetDict, LazyEpisodeData
 
 
 class HDF5DatasetFileHandler(DatasetFileHandlerBase):
     """HDF5 dataset file handler for storing and loading episode data."""
 
-    def __init__(self):
-        """Initializes the HDF5 dataset file handler."""
+    def __init__(
+        self,
+        chunk_length: int | None = None,
+        compression: str | None = None,
+        compression_opts=None,
+        episode_cache_size: int = 0,
+    ):
+        """Initializes the HDF5 dataset file handler.
+
+        Args:
+            chunk_length: Number of samples (first dimension) per chunk of the written datasets. Defaults to None,
+                in which case the datasets are contiguous, or chunked automatically by h5py if compressed.
+            compression: Compression filter of the written datasets (e.g. "gzip" or "lzf"). Defaults to None,
+                in which case the datasets are not compressed.
+            compression_opts: Options of the compression filter (e.g. the gzip level). Defaults to None.
+            episode_cache_size: Number of the most recently loaded lazy episodes whose loaded datasets are kept
+                (see :meth:`load_episode`). Defaults to 0, in which case the lazy episodes share nothing.
+        """
         self._hdf5_file_stream = None
         self._hdf5_data_group = None
         self._demo_count = 0
         self._env_args = {}
+        self._chunk_length = chunk_length
+        self._compression = compression
+        self._compression_opts = compression_opts
+        self._episode_cache_size = episode_cache_size
+        self._episode_cache: OrderedDict[tuple[str, str], LazyDatasetDict] = OrderedDict()
 
     def open(self, file_path: str, mode: str = "r"):
         """Open an existing dataset file."""
@@ -86,6 +110,36 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         self._raise_if_not_initialized()
         return self._hdf5_data_group.keys()
 
+    def get_episode_index(self) -> dict[str, np.ndarray]:
+        """Get the names, number of samples and success values of the episodes in the file.
+
+        The values are read from the episode index written by
+        :func:`~isaaclab.utils.datasets.merge_hdf5_datasets` if the file has one. Otherwise, they are read from
+        the attributes of every episode group.
+
+        Returns:
+            The ``demo_keys`` (names), ``num_samples`` and ``success`` (1 or 0, or -1 for the episodes without
+            a success value) of the episodes, in the order of :meth:`get_episode_names`.
+        """
+        self._raise_if_not_initialized()
+        if EPISODE_INDEX_GROUP in self._hdf5_file_stream:
+            index_group = self._hdf5_file_stream[EPISODE_INDEX_GROUP]
+            return {
+                "demo_keys": index_group["demo_keys"].asstr()[()],
+                "num_samples": index_group["num_samples"][()],
+                "success": index_group["success"][()],
+            }
+        demo_keys, num_samples, success = [], [], []
+        for episode_name, episode_group in self._hdf5_data_group.items():
+            demo_keys.append(episode_name)
+            num_samples.append(episode_group.attrs.get("num_samples", 0))
+            success.append(int(episode_group.attrs["success"]) if "success" in episode_group.attrs else -1)
+        return {
+            "demo_keys": np.array(demo_keys, dtype=object),
+            "num_samples": np.array(num_samples, dtype=np.int64),
+            "success": np.array(success, dtype=np.int8),
+        }
+
     def get_num_episodes(self) -> int:
         """Get number of episodes in the file."""
         return self._demo_count
@@ -99,11 +153,27 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
     Operations.
     """
 
-    def load_episode(self, episode_name: str, device: str) -> EpisodeData | None:
-        """Load episode data from the file."""
+    def load_episode(self, episode_name: str, device: str, lazy: bool = False) -> EpisodeData | None:
+        """Load episode data from the file.
+
+        Args:
+            episode_name: The name of the episode (e.g. "demo_0").
+            device: The device of the loaded tensors.
+            lazy: Whether to return a :class:`LazyEpisodeData` view of the episode, whose datasets are only
+                loaded when accessed, instead of loading all the datasets. Lazy episodes are only valid while the
+                file is open. Defaults to False.
+
+        Returns:
+            The episode data, or None if the file has no episode of the given name.
+        """
         self._raise_if_not_initialized()
         if episode_name not in self._hdf5_data_group:
             return None
+        if lazy:
+            episode = LazyEpisodeData(self._get_lazy_episode_group(episode_name, device))
+            episode.env_id = self.get_env_name()
+            return episode
+
         episode = EpisodeData()
         h5_episode_group = self._hdf5_data_group[episode_name]
 
@@ -142,19 +212,53 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
             return
 
         # create episode group based on demo count
-        h5_episode_group = self._hdf5_data_group.create_group(f"demo_{self._demo_count}")
+        self._write_episode_group(
+            f"demo_{self._demo_count}", episode.data, episode.seed, episode.success, lambda value: value.cpu().numpy()
+        )
+
+        # increment total demo counts
+        self._demo_count += 1
+
+    def flush(self):
+        """Flush the episode data to disk."""
+        self._raise_if_not_initialized()
+
+        self._hdf5_file_stream.flush()
+
+    def close(self):
+        """Close the dataset file handler."""
+        self._episode_cache.clear()
+        if self._hdf5_file_stream is not None:
+            self._hdf5_file_stream.close()
+            self._hdf5_file_stream = None
+
+    """
+    Helper functions.
+    """
+
+    def _write_episode_group(self, name: str, data: dict, seed, success, to_numpy):
+        """Write the data of an episode to a new episode group.
+
+        Args:
+            name: The name of the episode group (e.g. "demo_0").
+            data: The episode data. A (nested) dictionary of tensors.
+            seed: The random number generator seed of the episode, or None.
+            success: The success value of the episode, or None.
+            to_numpy: The function that converts a tensor of the data to a numpy array.
+        """
+        h5_episode_group = self._hdf5_data_group.create_group(name)
 
         # store number of steps taken
-        if "actions" in episode.data:
-            h5_episode_group.attrs["num_samples"] = len(episode.data["actions"])
+        if "actions" in data:
+            h5_episode_group.attrs["num_samples"] = len(data["actions"])
         else:
             h5_episode_group.attrs["num_samples"] = 0
 
-        if episode.seed is not None:
-            h5_episode_group.attrs["seed"] = episode.seed
+        if seed is not None:
+            h5_episode_group.attrs["seed"] = seed
 
-        if episode.success is not None:
-            h5_episode_group.attrs["success"] = episode.success
+        if success is not None:
+            h5_episode_group.attrs["success"] = success
 
         def create_dataset_helper(group, key, value):
             """Helper method to create dataset that contains recursive dict objects."""
@@ -163,28 +267,41 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
                 for sub_key, sub_value in value.items():
                     create_dataset_helper(key_group, sub_key, sub_value)
             else:
-                group.create_dataset(key, data=value.cpu().numpy())
+                self._create_dataset(group, key, to_numpy(value))
 
-        for key, value in episode.data.items():
+        for key, value in data.items():
             create_dataset_helper(h5_episode_group, key, value)
 
         # increment total step counts
         self._hdf5_data_group.attrs["total"] += h5_episode_group.attrs["num_samples"]
 
-        # increment total demo counts
-        self._demo_count += 1
-
-    def flush(self):
-        """Flush the episode data to disk."""
-        self._raise_if_not_initialized()
-
-        self._hdf5_file_stream.flush()
-
-    def close(self):
-        """Close the dataset file handler."""
-        if self._hdf5_file_stream is not None:
-            self._hdf5_file_stream.close()
-            self._hdf5_file_stream = None
+    def _create_dataset(self, group: h5py.Group, key: str, array: np.ndarray):
+        """Create a dataset with the configured chunking and compression."""
+        chunks = None
+        if self._chunk_length is not None and array.ndim > 0 and len(array):
+            chunks = (min(self._chunk_length, len(array)), *array.shape[1:])
+        elif self._compression is not None and array.ndim > 0 and array.size:
+            chunks = True
+        group.create_dataset(
+            key,
+            data=array,
+            chunks=chunks,
+            compression=self._compression if chunks is not None else None,
+            compression_opts=self._compression_opts if chunks is not None else None,
+        )
+
+    def _get_lazy_episode_group(self, episode_name: str, device: str) -> LazyDatasetDict:
+        """Get the view of an episode group, from the cache of the most recently loaded episodes if possible."""
+        cache_key = (episode_name, str(device))
+        if cache_key in self._episode_cache:
+            self._episode_cache.move_to_end(cache_key)
+            return self._episode_cache[cache_key]
+        group = LazyDatasetDict(self._hdf5_data_group[episode_name], device)
+        if self._episode_cache_size > 0:
+            self._episode_cache[cache_key] = group
+            if len(self._episode_cache) > self._episode_cache_size:
+                self._episode_cache.popitem(last=False)
+        return group
 
     def _raise_if_not_initialized(self):
         """Raise an error if the dataset file handler is not initialized."""
@@ -0,0 +1,103 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Merging of HDF5 demo datasets.
+
+The episode groups of the input files are copied with :meth:`h5py.Group.copy` (``H5Ocopy``), which copies the
+stored chunks of the datasets, with their filter pipeline, without decoding them. The merged file also gets an
+episode index (see :data:`EPISODE_INDEX_GROUP`) which lets readers select episodes without opening every episode
+group.
+"""
+
+from __future__ import annotations
+
+import h5py
+import numpy as np
+import os
+from collections.abc import Sequence
+
+EPISODE_INDEX_GROUP = "index"
+"""Name of the top-level group of the episode index.
+
+The group has one entry per episode of the ``data`` group, in the same order, in the datasets:
+
+* ``demo_keys``: the names of the episode groups (e.g. "demo_0").
+* ``num_samples``: the ``num_samples`` attributes of the episodes.
+* ``success``: the ``success`` attributes of the episodes (1 or 0), or -1 for episodes without one.
+* ``source_files`` and ``source_demo_keys``: the input file and the name of the episode it was merged from.
+"""
+
+
+def merge_hdf5_datasets(input_files: Sequence[str], output_file: str) -> int:
+    """Merge the episodes of HDF5 demo datasets into a new file.
+
+    The episodes are renamed ``demo_<index>``, in the order of the input files and, within a file, in the order
+    of their groups. The environment arguments of the merged file are the ones of the first input file.
+
+    Args:
+        input_files: The paths of the files to merge.
+        output_file: The path of the merged file. It is overwritten if it exists.
+
+    Returns:
+        The number of merged episodes.
+
+    Raises:
+        FileNotFoundError: If an input file does not exist.
+    """
+    for file_path in input_files:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"The dataset file {file_path} does not exist.")
+
+    with h5py.File(output_file, "w") as output:
+        data_group = output.create_group("data")
+
+        index = {"demo_keys": [], "num_samples": [], "success": [], "source_files": [], "source_demo_keys": []}
+        for file_path in input_files:
+            with h5py.File(file_path, "r") as input:
+                if "env_args" not in data_group.attrs and "env_args" in input["data"].attrs:
+                    data_group.attrs["env_args"] = input["data"].attrs["env_args"]
+
+                for episode_name, input_group in input["data"].items():
+                    demo_key = f"demo_{len(index['demo_keys'])}"
+                    input.copy(input_group, data_group, demo_key)
+
+                    num_samples = _read_scalar_attr(input_group, "num_samples")
+                    if num_samples is None:
+                        num_samples = len(input_group["actions"]) if "actions" in input_group else 0
+                        data_group[demo_key].attrs["num_samples"] = num_samples
+                    success = _read_scalar_attr(input_group, "success")
+                    index["demo_keys"].append(demo_key)
+                    index["num_samples"].append(int(num_samples))
+                    index["success"].append(-1 if success is None else int(success))
+                    index["source_files"].append(os.path.abspath(file_path))
+                    index["source_demo_keys"].append(episode_name)
+
+        data_group.attrs["total"] = sum(index["num_samples"])
+        _write_episode_index(output, index)
+
+    return len(index["demo_keys"])
+
+
+def _read_scalar_attr(group: h5py.Group, name: str) -> np.ndarray | None:
+    """Read a scalar attribute of a group through the low-level API, which is faster than the attribute manager."""
+    if not h5py.h5a.exists(group.id, name.encode()):
+        return None
+    attr = h5py.h5a.open(group.id, name.encode())
+    value = np.empty(attr.shape, dtype=attr.dtype)
+    attr.read(value)
+    return value
+
+
+def _write_episode_index(output: h5py.File, index: dict[str, list]):
+    """Write the episode index group (see :data:`EPISODE_INDEX_GROUP`)."""
+    index_group = output.create_group(EPISODE_INDEX_GROUP)
+    string_dtype = h5py.string_dtype()
+    index_group.create_dataset("demo_keys", data=np.array(index["demo_keys"], dtype=object), dtype=string_dtype)
+    index_group.create_dataset("num_samples", data=np.array(index["num_samples"], dtype=np.int64))
+    index_group.create_dataset("success", data=np.array(index["success"], dtype=np.int8))
+    index_group.create_dataset("source_files", data=np.array(index["source_files"], dtype=object), dtype=string_dtype)
+    index_group.create_dataset(
+        "source_demo_keys", data=np.array(index["source_demo_keys"], dtype=object), dtype=string_dtype
+    )
@@ -0,0 +1,258 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import h5py
+import numpy as np
+import torch
+from collections.abc import Iterator, Mapping
+
+from .episode_data import EpisodeData
+
+
+class LazyDatasetDict(Mapping):
+    """Read-only dictionary view of an HDF5 episode group whose datasets are loaded on demand.
+
+    Accessing a key of a sub-group returns the view of the sub-group, and accessing a key of a dataset loads
+    the whole dataset into a tensor on the target device. Loaded tensors are kept, so each dataset is read at
+    most once. :meth:`read` only loads the requested rows of a dataset from the file.
+
+    Contiguous, uncompressed datasets of files opened in read-only mode are read through a read-only
+    :class:`numpy.memmap` of their file region instead of the HDF5 library.
+    """
+
+    def __init__(self, group: h5py.Group, device: str):
+        """Initializes the view.
+
+        Args:
+            group: The HDF5 group of the episode (or of one of its sub-groups).
+            device: The device of the loaded tensors.
+        """
+        self._group = group
+        self._device = device
+        self._keys = list(group.keys())
+        self._loaded: dict[str, torch.Tensor | LazyDatasetDict] = dict()
+        self._memmaps: dict[str, np.memmap | None] = dict()
+
+    """
+    Properties.
+    """
+
+    @property
+    def attrs(self) -> h5py.AttributeManager:
+        """The attributes of the HDF5 group."""
+        return self._group.attrs
+
+    @property
+    def device(self) -> str:
+        """The device of the loaded tensors."""
+        return self._device
+
+    """
+    Mapping interface.
+    """
+
+    def __getitem__(self, key: str) -> torch.Tensor | LazyDatasetDict:
+        if key not in self._loaded:
+            if key not in self._keys:
+                raise KeyError(key)
+            if not self._group.id.valid:
+                raise RuntimeError(f"Cannot load '{key}': the dataset file of the lazy episode data is closed.")
+            item = self._group[key]
+            if isinstance(item, h5py.Group):
+                self._loaded[key] = LazyDatasetDict(item, self._device)
+            else:
+                self._loaded[key] = self._to_tensor(self._read_array(key, item, ()))
+        return self._loaded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    """
+    Operations.
+    """
+
+    def is_loaded(self, key: str) -> bool:
+        """Check if a key has already been loaded.
+
+        Args:
+            key: The key name. The key can be nested by using the "/" character. For example: "obs/joint_pos".
+
+        Returns:
+            True if the dataset of the key has been loaded (or the view of the sub-group has been created).
+        """
+        parent, sub_key = self._resolve(key)
+        return parent is not None and sub_key in parent._loaded
+
+    def read(self, key: str, index=()) -> torch.Tensor:
+        """Read some rows of a dataset, without loading the whole dataset.
+
+        If the dataset has already been loaded, the loaded tensor is indexed instead.
+
+        Args:
+            key: The key name of the dataset. The key can be nested by using the "/" character.
+            index: The index of the rows to read (e.g. an integer or a slice). Defaults to (), in which case
+                the whole dataset is read (but not kept).
+
+        Returns:
+            The read rows.
+
+        Raises:
+            KeyError: If the key is not a dataset of the group.
+            RuntimeError: If the dataset is not loaded and the dataset file is closed.
+        """
+        parent, sub_key = self._resolve(key)
+        if parent is None or sub_key not in parent:
+            raise KeyError(key)
+        if sub_key in parent._loaded:
+            value = parent._loaded[sub_key]
+            if isinstance(value, LazyDatasetDict):
+                raise KeyError(f"{key} is a group")
+            return value[index]
+        if not parent._group.id.valid:
+            raise RuntimeError(f"Cannot read '{key}': the dataset file of the lazy episode data is closed.")
+        item = parent._group[sub_key]
+        if isinstance(item, h5py.Group):
+            raise KeyError(f"{key} is a group")
+        return parent._to_tensor(parent._read_array(sub_key, item, index))
+
+    def num_samples(self, key: str) -> int:
+        """Get the length (first dimension) of a dataset, without loading it.
+
+        Args:
+            key: The key name of the dataset. The key can be nested by using the "/" character.
+
+        Returns:
+            The length of the dataset.
+        """
+        parent, sub_key = self._resolve(key)
+        if parent is None or sub_key not in parent:
+            raise KeyError(key)
+        return len(parent._group[sub_key])
+
+    """
+    Helper functions.
+    """
+
+    def _resolve(self, key: str) -> tuple[LazyDatasetDict | None, str]:
+        """Get the view of the parent group of a nested key and the last sub-key."""
+        sub_keys = key.split("/")
+        parent = self
+        for sub_key in sub_keys[:-1]:
+            if sub_key not in parent:
+                return None, sub_keys[-1]
+            parent = parent[sub_key]
+            if not isinstance(parent, LazyDatasetDict):
+                return None, sub_keys[-1]
+        return parent, sub_keys[-1]
+
+    def _read_array(self, key: str, dataset: h5py.Dataset, index) -> np.ndarray:
+        """Read the rows of a dataset, through its memory map if possible."""
+        if key not in self._memmaps:
+            self._memmaps[key] = self._create_memmap(dataset)
+        memmap = self._memmaps[key]
+        if memmap is not None:
+            return np.array(memmap[index])
+        return np.asarray(dataset[index])
+
+    @staticmethod
+    def _create_memmap(dataset: h5py.Dataset) -> np.memmap | None:
+        """Map the file region of a contiguous, uncompressed dataset of a read-only file."""
+        if (
+            dataset.file.mode != "r"
+            or dataset.file.driver != "sec2"
+            or dataset.chunks is not None
+            or dataset.compression is not None
+            or dataset.dtype.kind not in "biuf"
+            or dataset.size == 0
+        ):
+            return None
+        offset = dataset.id.get_offset()
+        if offset is None:
+            return None
+        return np.memmap(dataset.file.filename, mode="r", dtype=dataset.dtype, offset=offset, shape=dataset.shape)
+
+    def _to_tensor(self, array: np.ndarray) -> torch.Tensor:
+        """Convert a read array to a tensor on the target device."""
+        return torch.from_numpy(np.asarray(array)).to(self._device)
+
+
+class LazyEpisodeData(EpisodeData):
+    """Read-only episode data backed by the datasets of an HDF5 episode group.
+
+    The :attr:`data` of the episode is a :class:`LazyDatasetDict`: the datasets are only loaded when accessed
+    (e.g. the actions by :meth:`get_next_action`, the states by :meth:`get_next_state`), and :meth:`read` loads
+    only some rows of a dataset. Episodes are created by
+    :meth:`~isaaclab.utils.datasets.HDF5DatasetFileHandler.load_episode` with ``lazy=True``, and are only valid
+    while the dataset file is open.
+    """
+
+    def __init__(self, data: LazyDatasetDict):
+        """Initializes the lazy episode data.
+
+        Args:
+            data: The view of the HDF5 episode group. It can be shared with other episodes of the same group.
+        """
+        super().__init__()
+        self._data = data
+        if "seed" in data.attrs:
+            self._seed = data.attrs["seed"]
+        if "success" in data.attrs:
+            self._success = data.attrs["success"]
+
+    def is_empty(self):
+        """Check if the episode data is empty."""
+        return len(self._data) == 0
+
+    def add(self, key: str, value: torch.Tensor | dict):
+        """Lazy episode data is read-only.
+
+        Raises:
+            RuntimeError: Always.
+        """
+        raise RuntimeError("Lazy episode data is read-only. Load the episode with lazy=False to modify it.")
+
+    def read(self, key: str, index=()) -> torch.Tensor:
+        """Read some rows of a dataset of the episode, without loading the whole dataset.
+
+        Args:
+            key: The key name of the dataset. The key can be nested by using the "/" character.
+                For example: "obs/joint_pos".
+            index: The index of the rows to read (e.g. an integer or a slice). Defaults to (), in which case
+                the whole dataset is read (but not kept).
+
+        Returns:
+            The read rows.
+        """
+        return self._data.read(key, index)
+
+    def get_state(self, state_index) -> dict | None:
+        """Get the state of the specified index from the dataset."""
+        if "states" not in self._data:
+            return None
+
+        def get_state_helper(states, state_index) -> dict | torch.Tensor | None:
+            if isinstance(states, Mapping):
+                output_state = dict()
+                for key, value in states.items():
+                    output_state[key] = get_state_helper(value, state_index)
+                    if output_state[key] is None:
+                        return None
+            elif isinstance(states, torch.Tensor):
+                if state_index >= len(states):
+                    return None
+                output_state = states[state_index]
+            else:
+                raise ValueError(f"Invalid state type: {type(states)}")
+            return output_state
+
+        return get_state_helper(self._data["states"], state_index)
@@ -0,0 +1,127 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import math
+import torch
+import unittest
+
+import isaaclab.sim as sim_utils
+from isaaclab.envs.utils.placement import SettledPoseCache, footprint_radius, resolve_placement_overlaps
+
+
+class TestPlacementUtils(unittest.TestCase):
+    """Test for placement utils' functions"""
+
+    def test_footprint_radius(self):
+        self.assertAlmostEqual(footprint_radius(sim_utils.CuboidCfg(size=(0.1, 0.1, 0.1))), 0.05 * math.sqrt(2))
+        self.assertAlmostEqual(footprint_radius(sim_utils.CylinderCfg(radius=0.03, height=0.1)), 0.03)
+        self.assertAlmostEqual(footprint_radius(sim_utils.CapsuleCfg(radius=0.03, height=0.1)), 0.03)
+        self.assertAlmostEqual(footprint_radius(sim_utils.CapsuleCfg(radius=0.03, height=0.1, axis="X")), 0.08)
+        self.assertIsNone(footprint_radius(sim_utils.UsdFileCfg(usd_path="object.usd")))
+
+    def test_resolve_placement_overlaps(self):
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                radii = torch.tensor([0.07, 0.03, 0.03, 0.035], device=device)
+                positions = torch.rand((64, 4, 3), device=device) * 0.2
+                positions[:, 1] = positions[:, 0]  # coincident objects
+                z = positions[..., 2].clone()
+                lower = torch.tensor([-0.5, -0.5], device=device)
+                upper = torch.tensor([0.7, 0.7], device=device)
+
+                output = resolve_placement_overlaps(positions, radii, num_iterations=32, lower=lower, upper=upper)
+                self.assertIs(output, positions)
+                # no overlaps, heights unchanged and positions within bounds
+                distance = torch.cdist(positions[..., :2], positions[..., :2])
+                min_distance = radii.unsqueeze(-1) + radii.unsqueeze(-2)
+                min_distance.fill_diagonal_(0.0)
+                self.assertTrue(torch.all(distance >= min_distance - 1e-4))
+                torch.testing.assert_close(positions[..., 2], z)
+                self.assertTrue(torch.all(positions[..., :2] >= lower) and torch.all(positions[..., :2] <= upper))
+
+    def test_settled_pose_cache(self):
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                cache = SettledPoseCache(capacity=4, key_size=6, num_objects=2, resolution=0.1, device=device)
+                # actions on the quantization grid, so that small perturbations do not change their keys
+                actions = torch.randint(-10, 11, (3, 6), device=device) * 0.1
+                poses = torch.rand((3, 2, 7), device=device)
+                hit, _ = cache.lookup(actions)
+                self.assertFalse(torch.any(hit))
+
+                # masked insertion and lookup of close (same quantized) actions
+                cache.insert(actions, poses, mask=torch.tensor([True, True, False], device=device))
+                self.assertEqual(len(cache), 2)
+                hit, cached_poses = cache.lookup(actions + 0.01)
+                self.assertEqual(hit.tolist(), [True, True, False])
+                torch.testing.assert_close(cached_poses[:2], poses[:2])
+
+                # the least recently used entry is evicted first
+                cache.lookup(actions[:1])
+                other_actions = torch.randint(-10, 11, (3, 6), device=device) * 0.1
+                cache.insert(other_actions, torch.zeros((3, 2, 7), device=device))
+                self.assertEqual(len(cache), 4)
+                hit, _ = cache.lookup(torch.cat([actions[:2], other_actions]))
+                self.assertEqual(hit.tolist(), [True, False, True, True, True])
+
+    def test_settled_pose_cache_duplicates(self):
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                cache = SettledPoseCache(capacity=4, key_size=6, num_objects=2, resolution=0.1, device=device)
+                actions = torch.randint(-10, 11, (2, 6), device=device) * 0.1
+                actions[1, 0] = -actions[0, 0] + 0.1  # distinct keys
+                poses = torch.rand((5, 2, 7), device=device)
+
+                # placements with equal keys fill a single entry, with the pose of the first inserted one
+                batch = actions[[0, 1, 0, 0, 1]] + 0.01 * torch.rand((5, 6), device=device)
+                cache.insert(batch, poses, mask=torch.tensor([False, True, True, True, True], device=device))
+                self.assertEqual(len(cache), 2)
+                hit, cached_poses = cache.lookup(actions)
+                self.assertEqual(hit.tolist(), [True, True])
+                torch.testing.assert_close(cached_poses, poses[[2, 1]])
+
+                # equal keys of a batch update the existing entry once
+                cache.insert(batch, poses.flip(0))
+                self.assertEqual(len(cache), 2)
+                _, cached_poses = cache.lookup(actions)
+                torch.testing.assert_close(cached_poses, poses.flip(0)[[0, 1]])
+
+    def test_settled_pose_cache_mixed_batch(self):
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                cache = SettledPoseCache(capacity=4, key_size=1, num_objects=1, resolution=0.1, device=device)
+                actions = torch.tensor([[0.1], [0.2], [0.5], [0.6]], device=device)
+                poses = torch.rand((4, 1, 7), device=device)
+                cache.insert(actions[:2], poses[:2])
+
+                # the new keys of a batch with cache hits fill the free entries, without evicting the hit ones
+                cache.insert(actions, poses)
+                self.assertEqual(len(cache), 4)
+                hit, cached_poses = cache.lookup(actions)
+                self.assertEqual(hit.tolist(), [True, True, True, True])
+                torch.testing.assert_close(cached_poses, poses)
+
+                # when the cache is full, the new keys evict the least recently used entries, one each
+                cache.lookup(actions[2:])
+                other_actions = torch.tensor([[-0.3], [-0.4]], device=device)
+                cache.insert(torch.cat([actions[2:], other_actions]), torch.rand((4, 1, 7), device=device))
+                self.assertEqual(len(cache), 4)
+                hit, _ = cache.lookup(torch.cat([actions, other_actions]))
+                self.assertEqual(hit.tolist(), [False, False, True, True, True, True])
+
+
+if __name__ == "__main__":
+    run_tests()
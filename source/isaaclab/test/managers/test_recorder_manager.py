@@ -157,6 +157,40 @@ class TestRecorderManager(unittest.TestCase):
                     episode = recorder_manager.get_episode(env_id)
                     self.assertEqual(episode.data["record_post_reset"].shape, (1, 3))
 
+    def test_record_episode_buffer(self):
+        """Test the recording of the data into preallocated episode buffers."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                env = create_dummy_env(device)
+                cfg = self.create_dummy_recorder_manager_cfg()
+                cfg.use_episode_buffer = True
+                cfg.episode_buffer_length = 4
+                # create recorder manager
+                recorder_manager = RecorderManager(cfg, env)
+
+                # record the step data
+                for _ in range(3):
+                    recorder_manager.record_pre_step()
+                    recorder_manager.record_post_step()
+
+                # check the recorded data
+                for env_id in range(env.num_envs):
+                    episode = recorder_manager.get_episode(env_id)
+                    self.assertEqual(episode.data["record_pre_step"].shape, (3, 4))
+                    self.assertEqual(episode.data["record_post_step"].shape, (3, 5))
+
+                # Trigger pre-reset callbacks which then export and clean the episode data
+                recorder_manager.record_pre_reset(env_ids=None)
+                self.assertEqual(recorder_manager.exported_failed_episode_count, env.num_envs)
+                for env_id in range(env.num_envs):
+                    episode = recorder_manager.get_episode(env_id)
+                    self.assertTrue(episode.is_empty())
+
+                recorder_manager.record_post_reset(env_ids=None)
+                for env_id in range(env.num_envs):
+                    episode = recorder_manager.get_episode(env_id)
+                    self.assertEqual(episode.data["record_post_reset"].shape, (1, 3))
+
 
 if __name__ == "__main__":
     run_tests()
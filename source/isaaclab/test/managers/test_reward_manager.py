@@ -15,8 +15,9 @@ simulation_app = AppLauncher(headless=True).app
 import torch
 import unittest
 from collections import namedtuple
+from types import SimpleNamespace
 
-from isaaclab.managers import RewardManager, RewardTermCfg
+from isaaclab.managers import RewardManager, RewardTermCfg, shared_quantity
 from isaaclab.utils import configclass
 
 
@@ -124,6 +125,34 @@ class TestRewardManager(unittest.TestCase):
         self.assertEqual(float(rewards[0]), expected_reward)
         self.assertEqual(tuple(rewards.shape), (self.env.num_envs,))
 
+    def test_compute_shared_quantity(self):
+        """Test that a quantity shared by reward terms is computed once per step."""
+        num_calls = []
+
+        @shared_quantity
+        def grilled_chicken_count(env, sauce: str):
+            num_calls.append(sauce)
+            return torch.arange(env.num_envs, dtype=torch.float, device=env.device)
+
+        def grilled_chicken_with_sauce(env, sauce: str, scale: float):
+            return grilled_chicken_count(env, sauce) * scale
+
+        env = SimpleNamespace(num_envs=self.env.num_envs, dt=self.env.dt, device=self.env.device)
+        cfg = {
+            "term_1": RewardTermCfg(func=grilled_chicken_with_sauce, weight=2.0, params={"sauce": "bbq", "scale": 1.0}),
+            "term_2": RewardTermCfg(func=grilled_chicken_with_sauce, weight=1.0, params={"sauce": "bbq", "scale": 3.0}),
+        }
+        env.reward_manager = RewardManager(cfg, env)
+        # compute expected reward
+        expected_reward = torch.arange(env.num_envs, dtype=torch.float) * (2.0 + 3.0) * env.dt
+        # compute reward using manager
+        rewards = env.reward_manager.compute(dt=env.dt)
+        torch.testing.assert_close(rewards, expected_reward)
+        self.assertEqual(num_calls, ["bbq"])
+        # the quantity is not cached outside of the reward computation
+        grilled_chicken_count(env, "bbq")
+        self.assertEqual(num_calls, ["bbq", "bbq"])
+
     def test_config_empty(self):
         """Test the creation of reward manager with empty config."""
         self.rew_man = RewardManager(None, self.env)
@@ -0,0 +1,124 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import h5py
+import os
+import shutil
+import tempfile
+import torch
+import unittest
+import uuid
+
+from isaaclab.utils.datasets import AsyncHDF5DatasetFileHandler, EpisodeData, HDF5DatasetFileHandler
+
+
+def create_test_episode(device):
+    """create a test episode with dummy data."""
+    test_episode = EpisodeData()
+
+    test_episode.seed = 0
+    test_episode.success = True
+
+    test_episode.add("initial_state", torch.tensor([1, 2, 3], device=device))
+
+    test_episode.add("actions", torch.tensor([1, 2, 3], device=device))
+    test_episode.add("actions", torch.tensor([4, 5, 6], device=device))
+    test_episode.add("actions", torch.tensor([7, 8, 9], device=device))
+
+    test_episode.add("obs/policy/term1", torch.tensor([1, 2, 3, 4, 5], device=device))
+    test_episode.add("obs/policy/term1", torch.tensor([6, 7, 8, 9, 10], device=device))
+    test_episode.add("obs/policy/term1", torch.tensor([11, 12, 13, 14, 15], device=device))
+
+    return test_episode
+
+
+class TestAsyncHDF5DatasetFileHandler(unittest.TestCase):
+    """Test asynchronous HDF5 dataset filer handler implementation."""
+
+    """
+    Test cases for AsyncHDF5DatasetFileHandler class.
+    """
+
+    def setUp(self):
+        # create a temporary directory to store the test datasets
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        # delete the temporary directory after the test
+        shutil.rmtree(self.temp_dir)
+
+    def test_invalid_arguments(self):
+        """Test that the queue size and the flush interval must be positive."""
+        with self.assertRaises(ValueError):
+            AsyncHDF5DatasetFileHandler(max_queue_size=0)
+        with self.assertRaises(ValueError):
+            AsyncHDF5DatasetFileHandler(flush_interval=0)
+
+    def test_write_and_load_episodes(self):
+        """Test writing episodes from the background thread and loading them back."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+                dataset_file_handler = AsyncHDF5DatasetFileHandler(max_queue_size=2, flush_interval=3)
+                dataset_file_handler.create(dataset_file_path, "test_env_name")
+
+                test_episode = create_test_episode(device)
+
+                # submit more episodes than the queue size
+                for _ in range(5):
+                    dataset_file_handler.write_episode(test_episode)
+                    dataset_file_handler.flush()
+                # the episodes are counted when submitted
+                self.assertEqual(dataset_file_handler.get_num_episodes(), 5)
+
+                dataset_file_handler.synchronize()
+                dataset_file_handler.close()
+
+                # load the episodes with the synchronous handler
+                dataset_file_handler = HDF5DatasetFileHandler()
+                dataset_file_handler.open(dataset_file_path)
+
+                loaded_episode_names = list(dataset_file_handler.get_episode_names())
+                self.assertEqual(loaded_episode_names, [f"demo_{i}" for i in range(5)])
+
+                for episode_name in loaded_episode_names:
+                    loaded_episode = dataset_file_handler.load_episode(episode_name, device=device)
+                    self.assertEqual(loaded_episode.seed, test_episode.seed)
+                    self.assertEqual(loaded_episode.success, test_episode.success)
+
+                    self.assertTrue(torch.equal(loaded_episode.get_initial_state(), test_episode.get_initial_state()))
+
+                    for action in test_episode.data["actions"]:
+                        self.assertTrue(torch.equal(loaded_episode.get_next_action(), action))
+
+                dataset_file_handler.close()
+
+    def test_chunked_and_compressed_datasets(self):
+        """Test the chunking and compression settings of the written datasets."""
+        dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+        dataset_file_handler = AsyncHDF5DatasetFileHandler(chunk_length=2, compression="gzip", compression_opts=4)
+        dataset_file_handler.create(dataset_file_path, "test_env_name")
+        dataset_file_handler.write_episode(create_test_episode("cpu"))
+        dataset_file_handler.close()
+
+        with h5py.File(dataset_file_path, "r") as hdf5_file:
+            actions = hdf5_file["data/demo_0/actions"]
+            self.assertEqual(actions.chunks, (2, 3))
+            self.assertEqual(actions.compression, "gzip")
+            self.assertEqual(actions.compression_opts, 4)
+            self.assertEqual(hdf5_file["data"].attrs["total"], 3)
+
+
+if __name__ == "__main__":
+    run_tests()
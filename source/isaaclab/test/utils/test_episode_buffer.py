@@ -0,0 +1,81 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import torch
+import unittest
+
+from isaaclab.utils.datasets import EpisodeBuffer
+
+
+class TestEpisodeBuffer(unittest.TestCase):
+    """Test EpisodeBuffer implementation."""
+
+    def test_add(self):
+        """Test adding the values of all the environments and of some of them."""
+        for device in ("cuda:0", "cpu"):
+            with self.subTest(device=device):
+                buffer = EpisodeBuffer(num_envs=4, capacity=8, device=device)
+                for step in range(3):
+                    buffer.add("obs/joint_pos", torch.full((4, 2), float(step), device=device))
+                buffer.add("initial_state", torch.ones(2, 3, device=device), env_ids=[1, 3])
+
+                episodes = buffer.get_episodes()
+                self.assertEqual(len(episodes), 4)
+                for env_id, episode in enumerate(episodes):
+                    self.assertEqual(episode.env_id, env_id)
+                    expected = torch.arange(3, dtype=torch.float32, device=device).unsqueeze(1).repeat(1, 2)
+                    self.assertTrue(torch.equal(episode.data["obs"]["joint_pos"], expected))
+                    self.assertEqual("initial_state" in episode.data, env_id in [1, 3])
+
+    def test_grow(self):
+        """Test that the buffers grow, keeping all the values, when an episode exceeds the capacity."""
+        buffer = EpisodeBuffer(num_envs=2, capacity=3, device="cpu")
+        buffer.add("initial_state", torch.zeros(2, 1))
+        for step in range(7):
+            buffer.add("actions", torch.full((2, 1), float(step)))
+            # the episode of the second environment restarts (without host-side reset of the lengths)
+            if step == 1:
+                buffer.reset([1])
+        episodes = buffer.get_episodes()
+        self.assertTrue(torch.equal(episodes[0].data["actions"].view(-1), torch.arange(7, dtype=torch.float32)))
+        self.assertTrue(torch.equal(episodes[1].data["actions"].view(-1), torch.arange(2, 7, dtype=torch.float32)))
+        self.assertEqual(episodes[0].data["initial_state"].shape, (1, 1))
+
+    def test_reset_and_success(self):
+        """Test resetting the episodes and setting their success values."""
+        buffer = EpisodeBuffer(num_envs=3, capacity=4, device="cpu")
+        buffer.add("actions", torch.zeros(3, 2))
+        buffer.set_success([0, 2], torch.tensor([[True], [False]]))
+        episodes = buffer.get_episodes()
+        self.assertEqual([episode.success for episode in episodes], [True, None, False])
+
+        buffer.reset([0])
+        self.assertTrue(buffer.is_empty(0))
+        self.assertFalse(buffer.is_empty(1))
+        self.assertTrue(buffer.get_episode(0).is_empty())
+        self.assertIsNone(buffer.get_episode(0).success)
+
+        # the episode starts over at the beginning of the buffer
+        buffer.add("actions", torch.ones(1, 2), env_ids=torch.tensor([0]))
+        self.assertTrue(torch.equal(buffer.get_episode(0).data["actions"], torch.ones(1, 2)))
+        self.assertEqual(buffer.get_episode(1).data["actions"].shape, (1, 2))
+
+    def test_invalid_capacity(self):
+        """Test that a capacity less than one is rejected."""
+        with self.assertRaises(ValueError):
+            EpisodeBuffer(num_envs=2, capacity=0, device="cpu")
+
+
+if __name__ == "__main__":
+    run_tests()
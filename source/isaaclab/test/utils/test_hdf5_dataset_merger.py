@@ -0,0 +1,113 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import h5py
+import numpy as np
+import os
+import shutil
+import tempfile
+import torch
+import unittest
+
+from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler, merge_hdf5_datasets
+
+
+def create_test_episode(num_steps, success):
+    """create a test episode with dummy data."""
+    test_episode = EpisodeData()
+
+    test_episode.seed = 0
+    test_episode.success = success
+
+    test_episode.add("initial_state", torch.tensor([1, 2, 3]))
+    for i in range(num_steps):
+        test_episode.add("actions", torch.rand(3))
+        test_episode.add("obs/policy/term1", torch.tensor([1, 2, 3, 4, 5]) + i)
+
+    return test_episode
+
+
+class TestHDF5DatasetMerger(unittest.TestCase):
+    """Test HDF5 dataset merging implementation."""
+
+    """
+    Test cases for merge_hdf5_datasets function.
+    """
+
+    def setUp(self):
+        # create a temporary directory to store the test datasets
+        self.temp_dir = tempfile.mkdtemp()
+
+        # create a chunked, compressed dataset file and a contiguous one
+        self.input_files = []
+        for file_index, kwargs in enumerate(({"chunk_length": 4, "compression": "gzip"}, {})):
+            dataset_file_path = os.path.join(self.temp_dir, f"input_{file_index}.hdf5")
+            dataset_file_handler = HDF5DatasetFileHandler(**kwargs)
+            dataset_file_handler.create(dataset_file_path, f"test_env_name_{file_index}")
+            dataset_file_handler.write_episode(create_test_episode(5 + file_index, True))
+            dataset_file_handler.write_episode(create_test_episode(7 + file_index, False))
+            dataset_file_handler.close()
+            self.input_files.append(dataset_file_path)
+
+    def tearDown(self):
+        # delete the temporary directory after the test
+        shutil.rmtree(self.temp_dir)
+
+    def test_missing_input_file(self):
+        """Test merging a file that does not exist."""
+        with self.assertRaises(FileNotFoundError):
+            merge_hdf5_datasets([os.path.join(self.temp_dir, "missing.hdf5")], os.path.join(self.temp_dir, "out.hdf5"))
+
+    def test_merge(self):
+        """Test merging the episodes and the episode index."""
+        output_file_path = os.path.join(self.temp_dir, "merged.hdf5")
+        num_episodes = merge_hdf5_datasets(self.input_files, output_file_path)
+        self.assertEqual(num_episodes, 4)
+
+        with h5py.File(output_file_path, "r") as output_file:
+            self.assertEqual(output_file["data"].attrs["total"], 5 + 7 + 6 + 8)
+            self.assertIn("test_env_name_0", output_file["data"].attrs["env_args"])
+
+            demo_index = 0
+            for input_file_path in self.input_files:
+                with h5py.File(input_file_path, "r") as input_file:
+                    for input_group in input_file["data"].values():
+                        output_group = output_file[f"data/demo_{demo_index}"]
+                        self.assertEqual(dict(output_group.attrs), dict(input_group.attrs))
+                        for key in ("initial_state", "actions", "obs/policy/term1"):
+                            input_dataset, output_dataset = input_group[key], output_group[key]
+                            self.assertTrue(np.array_equal(output_dataset[()], input_dataset[()]))
+                            self.assertEqual(output_dataset.chunks, input_dataset.chunks)
+                            self.assertEqual(output_dataset.compression, input_dataset.compression)
+                            # the chunks are copied without being decoded
+                            if input_dataset.chunks is not None:
+                                chunk_offset = (0,) * input_dataset.ndim
+                                self.assertEqual(
+                                    output_dataset.id.read_direct_chunk(chunk_offset),
+                                    input_dataset.id.read_direct_chunk(chunk_offset),
+                                )
+                        demo_index += 1
+
+        # the episode index is read without opening the episode groups
+        dataset_file_handler = HDF5DatasetFileHandler()
+        dataset_file_handler.open(output_file_path)
+        episode_index = dataset_file_handler.get_episode_index()
+        self.assertEqual(list(episode_index["demo_keys"]), [f"demo_{i}" for i in range(4)])
+        self.assertEqual(list(episode_index["num_samples"]), [5, 7, 6, 8])
+        self.assertEqual(list(episode_index["success"]), [1, 0, 1, 0])
+        dataset_file_handler.close()
+
+
+if __name__ == "__main__":
+    run_tests()
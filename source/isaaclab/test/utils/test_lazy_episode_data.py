@@ -0,0 +1,147 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher, run_tests
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import os
+import shutil
+import tempfile
+import torch
+import unittest
+import uuid
+
+from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler, LazyEpisodeData
+
+
+def create_test_episode(device):
+    """create a test episode with dummy data."""
+    test_episode = EpisodeData()
+
+    test_episode.seed = 0
+    test_episode.success = True
+
+    test_episode.add("initial_state", torch.tensor([1, 2, 3], device=device))
+
+    for i in range(4):
+        test_episode.add("actions", torch.tensor([1.0, 2.0, 3.0], device=device) + i)
+        test_episode.add("obs/policy/term1", torch.tensor([1, 2, 3, 4, 5], device=device) + i)
+        test_episode.add("states/articulation/robot/joint_pos", torch.tensor([0.1, 0.2], device=device) + i)
+
+    return test_episode
+
+
+class TestLazyEpisodeData(unittest.TestCase):
+    """Test lazy episode data implementation."""
+
+    """
+    Test cases for LazyEpisodeData class.
+    """
+
+    def setUp(self):
+        # create a temporary directory to store the test datasets
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        # delete the temporary directory after the test
+        shutil.rmtree(self.temp_dir)
+
+    def _create_dataset_file(self, device, **kwargs) -> str:
+        """Write two test episodes to a new dataset file."""
+        dataset_file_path = os.path.join(self.temp_dir, f"{uuid.uuid4()}.hdf5")
+        dataset_file_handler = HDF5DatasetFileHandler(**kwargs)
+        dataset_file_handler.create(dataset_file_path, "test_env_name")
+        dataset_file_handler.write_episode(create_test_episode(device))
+        dataset_file_handler.write_episode(create_test_episode(device))
+        dataset_file_handler.close()
+        return dataset_file_path
+
+    def test_load_on_demand(self):
+        """Test that the datasets are only loaded when accessed, and match the eagerly loaded ones."""
+        for device in ("cuda:0", "cpu"):
+            # contiguous (memory-mapped) and chunked, compressed datasets
+            for kwargs in ({}, {"chunk_length": 2, "compression": "gzip"}):
+                with self.subTest(device=device, kwargs=kwargs):
+                    test_episode = create_test_episode(device)
+                    dataset_file_handler = HDF5DatasetFileHandler()
+                    dataset_file_handler.open(self._create_dataset_file(device, **kwargs))
+
+                    episode = dataset_file_handler.load_episode("demo_0", device, lazy=True)
+                    self.assertIsInstance(episode, LazyEpisodeData)
+                    self.assertFalse(episode.is_empty())
+                    self.assertEqual(episode.env_id, "test_env_name")
+                    self.assertEqual(episode.seed, test_episode.seed)
+                    self.assertEqual(episode.success, test_episode.success)
+                    self.assertEqual(set(episode.data.keys()), {"initial_state", "actions", "obs", "states"})
+                    self.assertFalse(episode.data.is_loaded("actions"))
+
+                    # slice-wise reads don't load the dataset
+                    actions = test_episode.data["actions"]
+                    self.assertTrue(torch.equal(episode.read("actions", slice(1, 3)), actions[1:3]))
+                    term1 = test_episode.data["obs"]["policy"]["term1"]
+                    self.assertTrue(torch.equal(episode.read("obs/policy/term1", 2), term1[2]))
+                    self.assertFalse(episode.data.is_loaded("actions"))
+
+                    self.assertTrue(torch.equal(episode.get_initial_state(), test_episode.get_initial_state()))
+                    for action in test_episode.data["actions"]:
+                        self.assertTrue(torch.equal(episode.get_next_action(), action))
+                    self.assertIsNone(episode.get_next_action())
+                    self.assertTrue(episode.data.is_loaded("actions"))
+                    self.assertFalse(episode.data.is_loaded("obs/policy/term1"))
+
+                    state = episode.get_state(2)
+                    expected_state = test_episode.get_state(2)
+                    self.assertTrue(
+                        torch.equal(
+                            state["articulation"]["robot"]["joint_pos"],
+                            expected_state["articulation"]["robot"]["joint_pos"],
+                        )
+                    )
+                    self.assertIsNone(episode.get_state(4))
+
+                    with self.assertRaises(RuntimeError):
+                        episode.add("actions", torch.zeros(3, device=device))
+
+                    dataset_file_handler.close()
+
+                    # the loaded datasets remain available once the file is closed, the others cannot be loaded
+                    self.assertTrue(torch.equal(episode.data["actions"], actions))
+                    with self.assertRaises(RuntimeError):
+                        episode.data["obs"]["policy"]["term1"]
+                    with self.assertRaises(RuntimeError):
+                        episode.read("obs/policy/term1", 0)
+
+    def test_episode_cache(self):
+        """Test that the most recently loaded lazy episodes share their loaded datasets."""
+        dataset_file_handler = HDF5DatasetFileHandler(episode_cache_size=1)
+        dataset_file_handler.open(self._create_dataset_file("cpu"))
+
+        episode = dataset_file_handler.load_episode("demo_0", "cpu", lazy=True)
+        episode.get_next_action()
+
+        # the cached episode shares the loaded datasets, but not the replay indices
+        cached_episode = dataset_file_handler.load_episode("demo_0", "cpu", lazy=True)
+        self.assertIs(cached_episode.data, episode.data)
+        self.assertTrue(cached_episode.data.is_loaded("actions"))
+        self.assertEqual(cached_episode.next_action_index, 0)
+
+        # loading another episode evicts the least recently loaded one
+        dataset_file_handler.load_episode("demo_1", "cpu", lazy=True)
+        evicted_episode = dataset_file_handler.load_episode("demo_0", "cpu", lazy=True)
+        self.assertIsNot(evicted_episode.data, episode.data)
+
+        self.assertIsNone(dataset_file_handler.load_episode("demo_2", "cpu", lazy=True))
+
+        dataset_file_handler.close()
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,88 @@
+# Copyright (c) 2024-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+import os
+import shutil
+import tempfile
+import torch
+import unittest
+from types import SimpleNamespace
+
+from isaaclab_mimic.datagen.datagen_info_pool import DataGenInfoPool
+
+from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+
+EEF_NAME = "franka"
+NUM_STEPS = 6
+
+
+def create_test_episode(grasp_step):
+    """Create a test episode with the datagen info of a two-subtask demo."""
+    test_episode = EpisodeData()
+    test_episode.seed = 0
+    test_episode.success = True
+
+    for i in range(NUM_STEPS):
+        test_episode.add("actions", torch.full((7,), float(i)))
+        test_episode.add(f"obs/datagen_info/eef_pose/{EEF_NAME}", torch.eye(4) + i)
+        test_episode.add(f"obs/datagen_info/target_eef_pose/{EEF_NAME}", torch.eye(4) - i)
+        test_episode.add("obs/datagen_info/object_pose/cube", torch.eye(4) * i)
+        test_episode.add("obs/datagen_info/subtask_term_signals/grasp", torch.tensor([float(i >= grasp_step)]))
+
+    return test_episode
+
+
+class TestDataGenInfoPool(unittest.TestCase):
+    """Test the DataGenInfoPool class."""
+
+    def setUp(self):
+        # create a temporary directory to store the test datasets
+        self.temp_dir = tempfile.mkdtemp()
+
+        subtask_configs = [
+            SimpleNamespace(subtask_term_signal="grasp", subtask_term_offset_range=(0, 0)),
+            SimpleNamespace(subtask_term_signal=None, subtask_term_offset_range=(0, 0)),
+        ]
+        env_cfg = SimpleNamespace(subtask_configs={EEF_NAME: subtask_configs})
+        # the last action dimension is the gripper action
+        self.env = SimpleNamespace(
+            cfg=env_cfg, actions_to_gripper_actions=lambda actions: {EEF_NAME: actions[:, -1:]}
+        )
+
+    def tearDown(self):
+        # delete the temporary directory after the test
+        shutil.rmtree(self.temp_dir)
+
+    def test_load_from_dataset_file(self):
+        """Test loading the datagen infos and the subtask indices of the demos of a dataset file."""
+        dataset_file_path = os.path.join(self.temp_dir, "dataset.hdf5")
+        dataset_file_handler = HDF5DatasetFileHandler()
+        dataset_file_handler.create(dataset_file_path, "test_env_name")
+        for grasp_step in (2, 3, 4):
+            dataset_file_handler.write_episode(create_test_episode(grasp_step))
+        dataset_file_handler.close()
+
+        datagen_info_pool = DataGenInfoPool(self.env, self.env.cfg, "cpu")
+        datagen_info_pool.load_from_dataset_file(dataset_file_path, select_demo_keys=["demo_0", "demo_2"])
+
+        self.assertEqual(datagen_info_pool.num_datagen_infos, 2)
+        self.assertEqual(datagen_info_pool.subtask_indices, [[[0, 3], [3, NUM_STEPS]], [[0, 5], [5, NUM_STEPS]]])
+
+        test_episode = create_test_episode(2)
+        datagen_info = datagen_info_pool.datagen_infos[0]
+        expected_datagen_info = test_episode.data["obs"]["datagen_info"]
+        self.assertTrue(torch.equal(datagen_info.eef_pose, expected_datagen_info["eef_pose"][EEF_NAME]))
+        self.assertTrue(torch.equal(datagen_info.target_eef_pose, expected_datagen_info["target_eef_pose"][EEF_NAME]))
+        self.assertTrue(torch.equal(datagen_info.object_poses["cube"], expected_datagen_info["object_pose"]["cube"]))
+        self.assertTrue(torch.equal(datagen_info.gripper_action, test_episode.data["actions"][:, -1:]))
+
+
+if __name__ == "__main__":
+    unittest.main()
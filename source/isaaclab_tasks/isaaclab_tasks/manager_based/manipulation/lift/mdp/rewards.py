@@ -9,7 +9,7 @@ import torch
 from typing import TYPE_CHECKING
 
 from isaaclab.assets import RigidObject
-from isaaclab.managers import SceneEntityCfg
+from isaaclab.managers import SceneEntityCfg, shared_quantity
 from isaaclab.sensors import FrameTransformer
 from isaaclab.utils.math import combine_frame_transforms
 
@@ -17,12 +17,44 @@ if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
 
 
+@shared_quantity
+def _object_lifted_mask(env: ManagerBasedRLEnv, minimal_height: float, object_name: str) -> torch.Tensor:
+    """Whether the object is lifted above the minimal height: (num_envs,)."""
+    object: RigidObject = env.scene[object_name]
+    return object.data.root_pos_w[:, 2] > minimal_height
+
+
+@shared_quantity
+def _object_ee_distance(env: ManagerBasedRLEnv, object_name: str, ee_frame_name: str) -> torch.Tensor:
+    """Distance of the end-effector to the object: (num_envs,)."""
+    # extract the used quantities (to enable type-hinting)
+    object: RigidObject = env.scene[object_name]
+    ee_frame: FrameTransformer = env.scene[ee_frame_name]
+    # Target object position: (num_envs, 3)
+    cube_pos_w = object.data.root_pos_w
+    # End-effector position: (num_envs, 3)
+    ee_w = ee_frame.data.target_pos_w[..., 0, :]
+    return torch.norm(cube_pos_w - ee_w, dim=1)
+
+
+@shared_quantity
+def _object_goal_distance(env: ManagerBasedRLEnv, command_name: str, robot_name: str, object_name: str) -> torch.Tensor:
+    """Distance of the object to the goal position: (num_envs,)."""
+    # extract the used quantities (to enable type-hinting)
+    robot: RigidObject = env.scene[robot_name]
+    object: RigidObject = env.scene[object_name]
+    command = env.command_manager.get_command(command_name)
+    # compute the desired position in the world frame
+    des_pos_b = command[:, :3]
+    des_pos_w, _ = combine_frame_transforms(robot.data.root_state_w[:, :3], robot.data.root_state_w[:, 3:7], des_pos_b)
+    return torch.norm(des_pos_w - object.data.root_pos_w[:, :3], dim=1)
+
+
 def object_is_lifted(
     env: ManagerBasedRLEnv, minimal_height: float, object_cfg: SceneEntityCfg = SceneEntityCfg("object")
 ) -> torch.Tensor:
     """Reward the agent for lifting the object above the minimal height."""
-    object: RigidObject = env.scene[object_cfg.name]
-    return torch.where(object.data.root_pos_w[:, 2] > minimal_height, 1.0, 0.0)
+    return torch.where(_object_lifted_mask(env, minimal_height, object_cfg.name), 1.0, 0.0)
 
 
 def object_ee_distance(
@@ -32,15 +64,8 @@ def object_ee_distance(
     ee_frame_cfg: SceneEntityCfg = SceneEntityCfg("ee_frame"),
 ) -> torch.Tensor:
     """Reward the agent for reaching the object using tanh-kernel."""
-    # extract the used quantities (to enable type-hinting)
-    object: RigidObject = env.scene[object_cfg.name]
-    ee_frame: FrameTransformer = env.scene[ee_frame_cfg.name]
-    # Target object position: (num_envs, 3)
-    cube_pos_w = object.data.root_pos_w
-    # End-effector position: (num_envs, 3)
-    ee_w = ee_frame.data.target_pos_w[..., 0, :]
     # Distance of the end-effector to the object: (num_envs,)
-    object_ee_distance = torch.norm(cube_pos_w - ee_w, dim=1)
+    object_ee_distance = _object_ee_distance(env, object_cfg.name, ee_frame_cfg.name)
 
     return 1 - torch.tanh(object_ee_distance / std)
 
@@ -53,18 +78,14 @@ def object_goal_distance(
     robot_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
     object_cfg: SceneEntityCfg = SceneEntityCfg("object"),
 ) -> torch.Tensor:
-    """Reward the agent for tracking the goal pose using tanh-kernel."""
-    # extract the used quantities (to enable type-hinting)
-    robot: RigidObject = env.scene[robot_cfg.name]
-    object: RigidObject = env.scene[object_cfg.name]
-    command = env.command_manager.get_command(command_name)
-    # compute the desired position in the world frame
-    des_pos_b = command[:, :3]
-    des_pos_w, _ = combine_frame_transforms(robot.data.root_state_w[:, :3], robot.data.root_state_w[:, 3:7], des_pos_b)
-    # distance of the end-effector to the object: (num_envs,)
-    distance = torch.norm(des_pos_w - object.data.root_pos_w[:, :3], dim=1)
+    """Reward the agent for tracking the goal pose using tanh-kernel.
+
+    The distance and the lifted mask are shared with the other terms (e.g. of another ``std``) in a step.
+    """
+    # distance of the object to the goal: (num_envs,)
+    distance = _object_goal_distance(env, command_name, robot_cfg.name, object_cfg.name)
     # rewarded if the object is lifted above the threshold
-    return (object.data.root_pos_w[:, 2] > minimal_height) * (1 - torch.tanh(distance / std))
+    return _object_lifted_mask(env, minimal_height, object_cfg.name) * (1 - torch.tanh(distance / std))
 
 
 def rew_root_height_below_minimum(